@@ -1,6 +1,11 @@
 """LangGraph Director Agent - 스크립트 분석 및 콘티 블록 자동 생성"""
+import asyncio
+import functools
+import inspect
 import logging
-from typing import TypedDict, List, Dict, Any, Optional, TYPE_CHECKING
+import time
+import weakref
+from typing import TypedDict, List, Dict, Any, Optional, Callable, TYPE_CHECKING
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -21,13 +26,14 @@ logger = logging.getLogger(__name__)
 class DirectorState(TypedDict):
     """Director Agent 상태"""
     script: str
-    campaign_concept: Dict[str, str]  # {gender, tone, style, platform}
+    campaign_concept: Dict[str, str]  # {gender, tone, style, platform, voice_id(선택)}
     target_duration: int
     keywords: List[str]
     visual_concepts: List[Dict[str, Any]]
     storyboard_blocks: List[Dict[str, Any]]
     background_suggestions: List[Dict[str, Any]]
     transition_effects: List[str]
+    node_latencies: Dict[str, float]  # 노드별 소요 시간 (초)
     error: Optional[str]
 
 
@@ -149,9 +155,178 @@ JSON 형식으로 반환:
 """
 
 
+FUSED_BLOCK_PROMPT = """
+다음 스크립트 블록의 키워드, 비주얼 컨셉, 배경 추천을 한 번에 생성하세요.
+
+**스크립트:** {script}
+**캠페인 컨셉:**
+- 성별: {gender}
+- 톤: {tone}
+- 스타일: {style}
+- 플랫폼: {platform}
+
+**감정:** {emotion}
+
+다음 JSON 형식으로 반환:
+{{
+  "keywords": ["키워드1", "키워드2", "키워드3"],
+  "visual_concept": {{
+    "mood": "energetic | calm | serious | playful | inspiring",
+    "color_tone": "bright | dark | warm | cool | neutral",
+    "background_style": "modern | vintage | natural | abstract | minimal",
+    "background_prompt": "DALL-E 프롬프트 (영문, 50자 이내)",
+    "transition_from_previous": "fade | slide | dissolve | zoom | none"
+  }},
+  "background_suggestions": {{
+    "suggestions": [
+      {{
+        "type": "ai_generated | stock | solid_color",
+        "priority": 1,
+        "prompt": "DALL-E 프롬프트 (type=ai_generated일 때)",
+        "search_keywords": ["키워드1", "키워드2"] (type=stock일 때),
+        "color_hex": "#RRGGBB" (type=solid_color일 때),
+        "rationale": "추천 이유"
+      }}
+    ]
+  }}
+}}
+
+**중요:**
+- keywords는 명사, 동사, 형용사 중심 3~5개
+- background_prompt는 영문으로 작성
+- 배경 추천 우선순위: AI 이미지 생성 → 스톡 검색 → 단색 배경
+"""
+
+
+# ==================== 공유 LLM 클라이언트 / 블록 fan-out ====================
+
+
+# 블록 단위 LLM 호출 동시 실행 수 런타임 override (None 이면 settings.DIRECTOR_BLOCK_LLM_CONCURRENCY)
+BLOCK_LLM_CONCURRENCY: Optional[int] = None
+
+# 이벤트 루프별 클라이언트 — storyboard_tasks 는 작업마다 asyncio.run() 으로 새 루프를 만들므로
+# 닫힌 루프에 묶인 async 커넥션 풀을 재사용하지 않도록 실행 중인 루프 단위로 캐시
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[float, ChatOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_llm_clients: Dict[float, ChatOpenAI] = {}  # 실행 중인 루프 없음 (동기 invoke 전용)
+
+
+def _get_llm(temperature: float) -> ChatOpenAI:
+    """온도별 공유 ChatOpenAI 클라이언트 (노드마다 새로 만들지 않음, 이벤트 루프 단위)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    clients = _sync_llm_clients if loop is None else _llm_clients.setdefault(loop, {})
+
+    llm = clients.get(temperature)
+    if llm is None:
+        settings = get_settings()
+        llm = ChatOpenAI(
+            model="gpt-4",
+            temperature=temperature,
+            openai_api_key=settings.OPENAI_API_KEY
+        )
+        clients[temperature] = llm
+    return llm
+
+
+def _block_concurrency() -> int:
+    if BLOCK_LLM_CONCURRENCY is not None:
+        return BLOCK_LLM_CONCURRENCY
+    return get_settings().DIRECTOR_BLOCK_LLM_CONCURRENCY
+
+
+async def _ainvoke_json(llm: ChatOpenAI, prompt: str) -> Any:
+    """Director 시스템 프롬프트 + 사용자 프롬프트 비동기 호출 → JSON 파싱"""
+    messages = [
+        SystemMessage(content=DIRECTOR_SYSTEM_PROMPT),
+        HumanMessage(content=prompt)
+    ]
+    response = await llm.ainvoke(messages)
+    return json.loads(response.content)
+
+
+async def _fan_out_blocks(
+    blocks: List[Dict[str, Any]],
+    worker: Callable[[Dict[str, Any]], Any],
+    concurrency: Optional[int] = None,
+) -> List[Any]:
+    """블록별 코루틴을 동시 실행 수 제한 하에 실행 (결과는 블록 순서 유지, 기본 제한은 호출 시점에 조회)"""
+    if concurrency is None:
+        concurrency = _block_concurrency()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(block: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await worker(block)
+
+    return await asyncio.gather(*(run(block) for block in blocks))
+
+
+def _timed_node(name: str):
+    """노드 소요 시간을 state["node_latencies"]에 기록하는 데코레이터 (sync/async 공용)"""
+
+    def record(state: DirectorState, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        latencies = state.get("node_latencies") or {}
+        latencies[name] = round(elapsed, 3)
+        state["node_latencies"] = latencies
+        logger.info(f"⏱️ Director node '{name}' took {elapsed:.2f}s")
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(state: DirectorState) -> DirectorState:
+                started = time.perf_counter()
+                result = await func(state)
+                record(result, started)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(state: DirectorState) -> DirectorState:
+            started = time.perf_counter()
+            result = func(state)
+            record(result, started)
+            return result
+        return wrapper
+
+    return decorator
+
+
+def _campaign_fields(state: DirectorState) -> Dict[str, str]:
+    concept = state["campaign_concept"]
+    return {
+        "gender": concept.get("gender", "neutral"),
+        "tone": concept.get("tone", "professional"),
+        "style": concept.get("style", "modern"),
+        "platform": concept.get("platform", "YouTube"),
+    }
+
+
+def _apply_visual_concept(block: Dict[str, Any], visual_concept: Dict[str, Any]) -> None:
+    block["visual_concept"] = visual_concept
+    block["background_prompt"] = visual_concept.get("background_prompt")
+    block["transition_effect"] = visual_concept.get("transition_from_previous", "fade")
+
+
+def _apply_background(block: Dict[str, Any], suggestions: Dict[str, Any]) -> None:
+    # 1순위 추천을 블록에 적용
+    top_suggestion = suggestions.get("suggestions", [])[0] if suggestions.get("suggestions") else None
+    if top_suggestion:
+        block["background_type"] = top_suggestion["type"]
+        if top_suggestion["type"] == "ai_generated":
+            block["background_prompt"] = top_suggestion.get("prompt")
+        elif top_suggestion["type"] == "stock":
+            block["background_prompt"] = ", ".join(top_suggestion.get("search_keywords", []))
+
+
 # ==================== Agent Nodes ====================
 
 
+@_timed_node("analyze_script")
 def analyze_script(state: DirectorState) -> DirectorState:
     """
     스크립트 의미 분석 및 블록 분할
@@ -162,12 +337,7 @@ def analyze_script(state: DirectorState) -> DirectorState:
     logger.info("Analyzing script...")
 
     try:
-        settings = get_settings()
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.7,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        llm = _get_llm(0.7)
 
         prompt = SCRIPT_ANALYSIS_PROMPT.format(
             script=state["script"],
@@ -207,7 +377,11 @@ def analyze_script(state: DirectorState) -> DirectorState:
                 if last_char not in ['.', '!', '?', '。', '！', '？']:
                     logger.warning(f"⚠️ Block {block['order']} 스크립트가 끊겨 있을 수 있음: '{script_text[:50]}...'")
 
-            predicted_duration = duration_calc.calculate(script_text)
+            predicted_duration = duration_calc.calculate(
+                script_text,
+                voice_id=state["campaign_concept"].get("voice_id"),
+                platform=state["campaign_concept"].get("platform"),
+            )
 
             storyboard_blocks.append({
                 "order": block["order"],
@@ -243,37 +417,29 @@ def analyze_script(state: DirectorState) -> DirectorState:
     return state
 
 
-def extract_keywords(state: DirectorState) -> DirectorState:
+@_timed_node("extract_keywords")
+async def extract_keywords(state: DirectorState) -> DirectorState:
     """
     각 블록에서 핵심 키워드 추출
 
     명사, 동사, 형용사 중심으로 키워드를 추출합니다.
+    블록별 호출은 동시 실행 (DIRECTOR_BLOCK_LLM_CONCURRENCY).
     """
     logger.info("Extracting keywords...")
 
     try:
-        settings = get_settings()
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.5,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        llm = _get_llm(0.5)
 
-        for block in state["storyboard_blocks"]:
+        async def extract(block: Dict[str, Any]) -> None:
             prompt = KEYWORD_EXTRACTION_PROMPT.format(
                 script=block["script"],
                 emotion=block.get("emotion", "neutral")
             )
-
-            messages = [
-                SystemMessage(content=DIRECTOR_SYSTEM_PROMPT),
-                HumanMessage(content=prompt)
-            ]
-
-            response = llm.invoke(messages)
-            keywords = json.loads(response.content)
+            keywords = await _ainvoke_json(llm, prompt)
             block["keywords"] = keywords if isinstance(keywords, list) else []
 
+        await _fan_out_blocks(state["storyboard_blocks"], extract)
+
         logger.info("Keywords extracted for all blocks")
 
     except Exception as e:
@@ -283,7 +449,8 @@ def extract_keywords(state: DirectorState) -> DirectorState:
     return state
 
 
-def generate_visual_concepts(state: DirectorState) -> DirectorState:
+@_timed_node("generate_visual_concepts")
+async def generate_visual_concepts(state: DirectorState) -> DirectorState:
     """
     각 블록의 비주얼 컨셉 생성
 
@@ -292,35 +459,19 @@ def generate_visual_concepts(state: DirectorState) -> DirectorState:
     logger.info("Generating visual concepts...")
 
     try:
-        settings = get_settings()
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.7,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        llm = _get_llm(0.7)
+        campaign = _campaign_fields(state)
 
-        for block in state["storyboard_blocks"]:
+        async def conceive(block: Dict[str, Any]) -> None:
             prompt = VISUAL_CONCEPT_PROMPT.format(
                 script=block["script"],
-                gender=state["campaign_concept"].get("gender", "neutral"),
-                tone=state["campaign_concept"].get("tone", "professional"),
-                style=state["campaign_concept"].get("style", "modern"),
-                platform=state["campaign_concept"].get("platform", "YouTube"),
                 emotion=block.get("emotion", "neutral"),
-                keywords=", ".join(block["keywords"])
+                keywords=", ".join(block["keywords"]),
+                **campaign
             )
+            _apply_visual_concept(block, await _ainvoke_json(llm, prompt))
 
-            messages = [
-                SystemMessage(content=DIRECTOR_SYSTEM_PROMPT),
-                HumanMessage(content=prompt)
-            ]
-
-            response = llm.invoke(messages)
-            visual_concept = json.loads(response.content)
-
-            block["visual_concept"] = visual_concept
-            block["background_prompt"] = visual_concept.get("background_prompt")
-            block["transition_effect"] = visual_concept.get("transition_from_previous", "fade")
+        await _fan_out_blocks(state["storyboard_blocks"], conceive)
 
         logger.info("Visual concepts generated for all blocks")
 
@@ -331,7 +482,8 @@ def generate_visual_concepts(state: DirectorState) -> DirectorState:
     return state
 
 
-def suggest_backgrounds(state: DirectorState) -> DirectorState:
+@_timed_node("suggest_backgrounds")
+async def suggest_backgrounds(state: DirectorState) -> DirectorState:
     """
     배경 자동 추천
 
@@ -342,50 +494,66 @@ def suggest_backgrounds(state: DirectorState) -> DirectorState:
     logger.info("Suggesting backgrounds...")
 
     try:
-        settings = get_settings()
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.7,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
-
-        background_suggestions = []
+        llm = _get_llm(0.7)
 
-        for block in state["storyboard_blocks"]:
+        async def suggest(block: Dict[str, Any]) -> Dict[str, Any]:
             prompt = BACKGROUND_SUGGESTION_PROMPT.format(
                 visual_concept=json.dumps(block["visual_concept"], ensure_ascii=False),
                 keywords=", ".join(block["keywords"])
             )
+            suggestions = await _ainvoke_json(llm, prompt)
+            _apply_background(block, suggestions)
+            return suggestions
 
-            messages = [
-                SystemMessage(content=DIRECTOR_SYSTEM_PROMPT),
-                HumanMessage(content=prompt)
-            ]
+        state["background_suggestions"] = await _fan_out_blocks(state["storyboard_blocks"], suggest)
+        logger.info("Background suggestions generated for all blocks")
 
-            response = llm.invoke(messages)
-            suggestions = json.loads(response.content)
+    except Exception as e:
+        logger.error(f"Background suggestion failed: {e}")
+        state["error"] = f"배경 추천 실패: {str(e)}"
 
-            # 1순위 추천을 블록에 적용
-            top_suggestion = suggestions.get("suggestions", [])[0] if suggestions.get("suggestions") else None
-            if top_suggestion:
-                block["background_type"] = top_suggestion["type"]
-                if top_suggestion["type"] == "ai_generated":
-                    block["background_prompt"] = top_suggestion.get("prompt")
-                elif top_suggestion["type"] == "stock":
-                    block["background_prompt"] = ", ".join(top_suggestion.get("search_keywords", []))
+    return state
 
-            background_suggestions.append(suggestions)
 
-        state["background_suggestions"] = background_suggestions
-        logger.info("Background suggestions generated for all blocks")
+@_timed_node("direct_blocks")
+async def direct_blocks(state: DirectorState) -> DirectorState:
+    """
+    블록당 1회 호출로 키워드 + 비주얼 컨셉 + 배경 추천 생성 (fused 모드)
+
+    extract_keywords → generate_visual_concepts → suggest_backgrounds 3단계를
+    하나의 구조화 응답으로 대체해 블록당 LLM 호출을 3회 → 1회로 줄입니다.
+    """
+    logger.info("Directing blocks (fused)...")
+
+    try:
+        llm = _get_llm(0.7)
+        campaign = _campaign_fields(state)
+
+        async def direct(block: Dict[str, Any]) -> Dict[str, Any]:
+            prompt = FUSED_BLOCK_PROMPT.format(
+                script=block["script"],
+                emotion=block.get("emotion", "neutral"),
+                **campaign
+            )
+            result = await _ainvoke_json(llm, prompt)
+            keywords = result.get("keywords")
+            block["keywords"] = keywords if isinstance(keywords, list) else []
+            _apply_visual_concept(block, result.get("visual_concept") or {})
+            suggestions = result.get("background_suggestions") or {}
+            _apply_background(block, suggestions)
+            return suggestions
+
+        state["background_suggestions"] = await _fan_out_blocks(state["storyboard_blocks"], direct)
+        logger.info("Blocks directed (fused) for all blocks")
 
     except Exception as e:
-        logger.error(f"Background suggestion failed: {e}")
-        state["error"] = f"배경 추천 실패: {str(e)}"
+        logger.error(f"Fused block direction failed: {e}")
+        state["error"] = f"블록 연출 생성 실패: {str(e)}"
 
     return state
 
 
+@_timed_node("assign_transitions")
 def assign_transitions(state: DirectorState) -> DirectorState:
     """
     전환 효과 자동 배정
@@ -435,10 +603,15 @@ def assign_transitions(state: DirectorState) -> DirectorState:
 # ==================== LangGraph 구성 ====================
 
 
-def create_director_graph() -> StateGraph:
+def create_director_graph(fused: bool = False) -> StateGraph:
     """
     Director Agent LangGraph 생성
 
+    블록 단위 노드는 async 이므로 그래프는 ainvoke 로 실행해야 합니다.
+
+    Args:
+        fused: True면 키워드/비주얼/배경 3노드 대신 블록당 1회 호출(direct_blocks)
+
     Returns:
         컴파일된 LangGraph
     """
@@ -446,19 +619,24 @@ def create_director_graph() -> StateGraph:
 
     # 노드 추가
     workflow.add_node("analyze_script", analyze_script)
-    workflow.add_node("extract_keywords", extract_keywords)
-    workflow.add_node("generate_visual_concepts", generate_visual_concepts)
-    workflow.add_node("suggest_backgrounds", suggest_backgrounds)
     workflow.add_node("assign_transitions", assign_transitions)
 
     # 시작점 설정
     workflow.set_entry_point("analyze_script")
 
-    # 엣지 연결 (순차 실행)
-    workflow.add_edge("analyze_script", "extract_keywords")
-    workflow.add_edge("extract_keywords", "generate_visual_concepts")
-    workflow.add_edge("generate_visual_concepts", "suggest_backgrounds")
-    workflow.add_edge("suggest_backgrounds", "assign_transitions")
+    # 엣지 연결 (순차 실행, 각 노드 안에서 블록 병렬)
+    if fused:
+        workflow.add_node("direct_blocks", direct_blocks)
+        workflow.add_edge("analyze_script", "direct_blocks")
+        workflow.add_edge("direct_blocks", "assign_transitions")
+    else:
+        workflow.add_node("extract_keywords", extract_keywords)
+        workflow.add_node("generate_visual_concepts", generate_visual_concepts)
+        workflow.add_node("suggest_backgrounds", suggest_backgrounds)
+        workflow.add_edge("analyze_script", "extract_keywords")
+        workflow.add_edge("extract_keywords", "generate_visual_concepts")
+        workflow.add_edge("generate_visual_concepts", "suggest_backgrounds")
+        workflow.add_edge("suggest_backgrounds", "assign_transitions")
     workflow.add_edge("assign_transitions", END)
 
     return workflow.compile()
@@ -467,7 +645,7 @@ def create_director_graph() -> StateGraph:
 # ==================== Director Agent 인스턴스 ====================
 
 
-_director_graph = None
+_director_graphs: Dict[bool, Any] = {}
 
 
 # ==================== Phase A 통합 진입점 (ISS-153) ====================
@@ -541,15 +719,21 @@ class DirectorAgent:
         return output
 
 
-def get_director_graph() -> StateGraph:
+def get_director_graph(fused: Optional[bool] = None) -> StateGraph:
     """
     Director Agent 싱글톤 인스턴스 반환
 
+    Args:
+        fused: 블록당 단일 호출 모드 (None이면 settings.DIRECTOR_FUSED_BLOCK_CALLS)
+
     Returns:
-        컴파일된 Director Graph
+        컴파일된 Director Graph (ainvoke 로 실행)
     """
-    global _director_graph
-    if _director_graph is None:
-        _director_graph = create_director_graph()
-        logger.info("Director Agent initialized")
-    return _director_graph
+    if fused is None:
+        fused = get_settings().DIRECTOR_FUSED_BLOCK_CALLS
+    graph = _director_graphs.get(fused)
+    if graph is None:
+        graph = create_director_graph(fused=fused)
+        _director_graphs[fused] = graph
+        logger.info(f"Director Agent initialized (fused={fused})")
+    return graph
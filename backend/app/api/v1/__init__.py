@@ -1,83 +1,90 @@
-"""API v1 라우터"""
-from fastapi import APIRouter
+"""API v1 라우터
 
-# ⚠️ Auth 임시 비활성화 (FastAPI Security 파라미터 호환성 문제)
-# from .auth import router as auth_router
-# from .thumbnail_learner import router as thumbnail_router
-from .writer import router as writer_router
-from .continuity import router as continuity_router
-from .performance import router as performance_router
-from .audio import router as audio_router
-from .voice import router as voice_router
-from .sheets import router as sheets_router
-from .director import router as director_router
-from .projects import router as projects_router
-from .lipsync import router as lipsync_router
-from .costs import router as costs_router
-from .video import router as video_router
-from .media import router as media_router
-from .websocket import router as websocket_router
-from .editor import router as editor_router
-from .bgm import router as bgm_router
-from .presets import router as presets_router
-from .presentation import router as presentation_router
-from .campaigns import router as campaigns_router
-from .clients import router as clients_router
-from .templates import router as templates_router
-from .content_schedule import router as content_schedule_router
-from .storyboard import router as storyboard_router
-# ⚠️ Backgrounds 임시 비활성화 (UTF-8 인코딩 문제)
-# from .backgrounds import router as backgrounds_router
-from .ab_tests import router as ab_tests_router
-from .remotion import router as remotion_router
-from .render import router as render_router
-from .strategy import router as strategy_router
-from .produce import router as produce_router
-from .publish import router as publish_router
-from .cache import router as cache_router
-from .whisper_timing import router as whisper_timing_router
-from .auth import router as auth_router
-from .billing import router as billing_router
-from .webhooks import router as webhooks_router
-from .brand_templates import router as brand_templates_router
+라우터 모듈은 import 하지 않고 RouterSpec 으로만 선언한다 (app.core.lazy_router 가 첫 요청 시 로딩).
+paths 는 라우터가 담당하는 경로 prefix — 라우터에 새 최상위 경로를 추가하면 여기에도 추가할 것
+(tests/test_lazy_router.py 가 선언과 실제 라우트 경로 일치를 검사).
+"""
+from typing import TYPE_CHECKING, Any
 
-router = APIRouter()
+from app.core.lazy_router import RouterSpec
 
-# 서브 라우터 등록
-router.include_router(auth_router, tags=["Authentication"])
-# router.include_router(thumbnail_router, prefix="/thumbnails", tags=["Thumbnail Learning"])
-router.include_router(performance_router, prefix="/performance", tags=["Performance Tracking"])
-router.include_router(audio_router, prefix="/audio", tags=["Zero-Fault Audio"])
-router.include_router(voice_router, prefix="/voice", tags=["Voice Cloning"])
-router.include_router(sheets_router, tags=["Google Sheets"])
-router.include_router(writer_router, tags=["Writer Agent"])
-router.include_router(director_router, tags=["Director Agent"])
-router.include_router(continuity_router, tags=["Continuity Agent"])
-router.include_router(projects_router, tags=["Project Management"])
-router.include_router(lipsync_router, tags=["Lipsync"])
-router.include_router(costs_router, tags=["Cost Tracking"])
-router.include_router(video_router, prefix="/video", tags=["Video Rendering"])
-router.include_router(media_router, prefix="/media", tags=["Media Optimization"])
-router.include_router(editor_router, tags=["Video Editor"])
-router.include_router(bgm_router, tags=["BGM Editor"])
-router.include_router(presets_router, tags=["Custom Presets"])
-router.include_router(websocket_router, prefix="/ws", tags=["WebSocket"])
-router.include_router(presentation_router, prefix="/presentations", tags=["Presentations"])
-router.include_router(campaigns_router, tags=["Campaigns"])
-router.include_router(clients_router, tags=["Client Management"])
-router.include_router(templates_router, tags=["Templates"])
-router.include_router(content_schedule_router, tags=["Content Schedule"])
-router.include_router(storyboard_router, tags=["Storyboard"])
-# ⚠️ Backgrounds 임시 비활성화
-# router.include_router(backgrounds_router, tags=["Backgrounds"])
-router.include_router(ab_tests_router, tags=["A/B Tests"])
-router.include_router(remotion_router, tags=["Remotion Rendering"])
-router.include_router(strategy_router)
-router.include_router(produce_router)
-router.include_router(publish_router)
-router.include_router(render_router, tags=["Multi-format Render"])
-router.include_router(whisper_timing_router, prefix="/whisper", tags=["Whisper Timing"])
-router.include_router(cache_router, prefix="/cache", tags=["Cache Management"])
-router.include_router(billing_router, tags=["Billing & Subscription"])
-router.include_router(webhooks_router, tags=["Webhooks"])
-router.include_router(brand_templates_router, prefix="/brand-templates", tags=["Brand Templates"])
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+
+
+def _spec(name: str, *paths: str, prefix: str = "", tags: Any = None) -> RouterSpec:
+    return RouterSpec(
+        module=f"{__name__}.{name}",
+        paths=paths or (prefix,),
+        prefix=prefix,
+        tags=tuple(tags) if tags else None,
+    )
+
+
+# 서브 라우터 (등록 순서 = 매칭 우선순위)
+ROUTER_SPECS = [
+    _spec("auth", "/auth", tags=["Authentication"]),
+    # ⚠️ Thumbnail 임시 비활성화
+    # _spec("thumbnail_learner", prefix="/thumbnails", tags=["Thumbnail Learning"]),
+    _spec("performance", prefix="/performance", tags=["Performance Tracking"]),
+    _spec("audio", prefix="/audio", tags=["Zero-Fault Audio"]),
+    _spec("voice", prefix="/voice", tags=["Voice Cloning"]),
+    _spec("sheets", "/sheets", tags=["Google Sheets"]),
+    _spec("writer", "/writer", tags=["Writer Agent"]),
+    _spec("director", "/director", tags=["Director Agent"]),
+    _spec("continuity", "/continuity", tags=["Continuity Agent"]),
+    _spec("projects", "/projects", "/sections", "/users", tags=["Project Management"]),
+    _spec("lipsync", "/lipsync", tags=["Lipsync"]),
+    _spec("costs", "/costs", tags=["Cost Tracking"]),
+    _spec("video", prefix="/video", tags=["Video Rendering"]),
+    _spec("media", prefix="/media", tags=["Media Optimization"]),
+    _spec("editor", "/projects", "/sections", tags=["Video Editor"]),
+    _spec("bgm", "/projects", tags=["BGM Editor"]),
+    _spec("presets", "/presets", tags=["Custom Presets"]),
+    _spec("websocket", prefix="/ws", tags=["WebSocket"]),
+    _spec("presentation", prefix="/presentations", tags=["Presentations"]),
+    _spec("campaigns", "/campaigns", tags=["Campaigns"]),
+    _spec("clients", "/clients", tags=["Client Management"]),
+    _spec("templates", "/templates", tags=["Templates"]),
+    _spec("content_schedule", "/content-schedule", tags=["Content Schedule"]),
+    _spec("storyboard", "/storyboard", tags=["Storyboard"]),
+    # ⚠️ Backgrounds 임시 비활성화 (UTF-8 인코딩 문제)
+    # _spec("backgrounds", "/backgrounds", tags=["Backgrounds"]),
+    _spec("ab_tests", "/ab-tests", tags=["A/B Tests"]),
+    _spec("remotion", "/remotion", tags=["Remotion Rendering"]),
+    _spec("strategy", "/strategy"),
+    _spec("produce", "/produce"),
+    _spec("publish", "/publish"),
+    _spec("render", "/render", tags=["Multi-format Render"]),
+    _spec("whisper_timing", prefix="/whisper", tags=["Whisper Timing"]),
+    _spec("cache", prefix="/cache", tags=["Cache Management"]),
+    _spec("billing", "/billing", tags=["Billing & Subscription"]),
+    _spec("webhooks", "/webhooks", tags=["Webhooks"]),
+    _spec("brand_templates", prefix="/brand-templates", tags=["Brand Templates"]),
+]
+
+
+def build_router() -> "APIRouter":
+    """모든 서브 라우터를 즉시 import 해 하나의 APIRouter 로 (스크립트/테스트용)"""
+    import importlib
+
+    from fastapi import APIRouter
+
+    router = APIRouter()
+    for spec in ROUTER_SPECS:
+        module = importlib.import_module(spec.module)
+        router.include_router(
+            getattr(module, spec.attr),
+            prefix=spec.prefix,
+            tags=list(spec.tags) if spec.tags else None,
+        )
+    return router
+
+
+def __getattr__(name: str) -> Any:
+    # 하위 호환: `from app.api.v1 import router` (전체 즉시 로딩)
+    if name == "router":
+        router = build_router()
+        globals()["router"] = router
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -25,6 +25,7 @@ class AudioGenerateRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="사용자 ID")
     accuracy_threshold: float = Field(0.95, ge=0.0, le=1.0, description="정확도 임계값")
     max_attempts: int = Field(5, ge=1, le=10, description="최대 재시도 횟수")
+    sentence_mode: bool = Field(False, description="문장 단위 Zero-Fault 검증 (실패 문장만 재생성)")
 
 
 class BatchAudioGenerateRequest(BaseModel):
@@ -48,38 +49,64 @@ async def generate_audio(request: AudioGenerateRequest):
     try:
         logger.info(f"Starting audio generation for text: {request.text[:50]}... voice={request.voice_id}")
 
-        from app.services.tts_service import get_tts_service
-        tts = get_tts_service()
+        if request.sentence_mode:
+            # 문장 단위 Zero-Fault Loop — TTS → STT 검증, 임계값 미달 문장만 재생성
+            from app.services.audio_correction_loop import get_audio_correction_loop
 
-        # 직접 생성
-        audio_bytes = await tts.generate_audio(
-            text=request.text,
-            voice_id=request.voice_id,
-        )
-
-        # 파일 저장 — voice_id 포함하여 음성별 파일 구분
-        import hashlib
-        from pathlib import Path
-        voice_key = request.voice_id or "default"
-        content_hash = hashlib.md5(f"{request.text}:{voice_key}".encode()).hexdigest()[:8]
-        output_dir = Path(__file__).resolve().parents[3] / "outputs" / "audio"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"tts_{content_hash}.mp3"
-        output_path.write_bytes(audio_bytes)
+            result = await get_audio_correction_loop().generate_verified_audio(
+                text=request.text,
+                voice_id=request.voice_id,
+                language=request.language,
+                save_file=True,
+                sentence_mode=True,
+            )
+            audio_result = {
+                "status": "SUCCESS",
+                "audio_path": result.get("audio_path"),
+                "attempts": result.get("attempts", 1),
+                "final_similarity": result.get("final_similarity"),
+                "mode": result.get("mode", "full"),
+                "word_timestamps": result.get("word_timestamps"),
+                "word_timestamps_source": result.get("word_timestamps_source"),
+            }
+            logger.info(
+                f"Verified audio generated ({audio_result['mode']}): {audio_result['audio_path']} "
+                f"status={result['status']}, similarity={result['final_similarity']:.2%}"
+            )
+        else:
+            from app.services.tts_service import get_tts_service
+            tts = get_tts_service()
+
+            # 직접 생성
+            audio_bytes = await tts.generate_audio(
+                text=request.text,
+                voice_id=request.voice_id,
+            )
 
-        logger.info(f"Audio generated: {output_path} ({len(audio_bytes)} bytes)")
+            # 파일 저장 — voice_id 포함하여 음성별 파일 구분
+            import hashlib
+            from pathlib import Path
+            voice_key = request.voice_id or "default"
+            content_hash = hashlib.md5(f"{request.text}:{voice_key}".encode()).hexdigest()[:8]
+            output_dir = Path(__file__).resolve().parents[3] / "outputs" / "audio"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_path = output_dir / f"tts_{content_hash}.mp3"
+            output_path.write_bytes(audio_bytes)
+
+            logger.info(f"Audio generated: {output_path} ({len(audio_bytes)} bytes)")
+            audio_result = {
+                "status": "SUCCESS",
+                "audio_path": str(output_path),
+                "attempts": 1,
+                "final_similarity": 1.0,
+            }
 
         # Redis에 결과 캐싱 (status/download 엔드포인트용)
         import json
         try:
             import redis
             r = redis.from_url("redis://localhost:6379/0")
-            r.setex(f"audio_result:{task_id}", 3600, json.dumps({
-                "status": "SUCCESS",
-                "audio_path": str(output_path),
-                "attempts": 1,
-                "final_similarity": 1.0,
-            }))
+            r.setex(f"audio_result:{task_id}", 3600, json.dumps(audio_result))
         except Exception:
             pass
 
@@ -120,6 +147,9 @@ async def get_task_status(task_id: str):
                         "original_text": None,
                         "normalized_text": None,
                         "normalization_mappings": {},
+                        "mode": data.get("mode", "full"),
+                        "word_timestamps": data.get("word_timestamps"),
+                        "word_timestamps_source": data.get("word_timestamps_source"),
                     }
                 }
         except Exception:
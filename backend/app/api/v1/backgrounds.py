@@ -196,11 +196,10 @@ async def search_unsplash_images(
 @router.post("/select-auto")
 async def select_background_auto(request: SelectBackgroundRequest):
     """
-    **배경 자동 선택 API (3단계 우선순위)**
+    **배경 자동 선택 API (우선순위 로직)**
 
-    1순위: 캠페인 리소스 라이브러리 (TODO)
-    2순위: DALL-E AI 이미지 생성
-    3순위: Unsplash 스톡 이미지
+    1순위: DALL-E AI 이미지 생성
+    2순위: Unsplash 스톡 이미지 (prefer_ai=False면 순서 변경)
     Fallback: 단색 배경
 
     **요청 필드**:
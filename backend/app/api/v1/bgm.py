@@ -18,6 +18,8 @@ from app.models.neo4j_models import (
     BGMInfoResponse
 )
 from app.core.config import get_settings
+from app.services.streaming_io import StreamSizeLimitError, save_upload
+from app.validators.security_validators import MAX_FILE_SIZE
 
 settings = get_settings()
 router = APIRouter()
@@ -245,9 +247,7 @@ async def upload_project_bgm(
 
         bgm_file_path = bgm_dir / f"{project_id}_bgm{file_extension}"
 
-        with open(bgm_file_path, "wb") as f:
-            content = await bgm_file.read()
-            f.write(content)
+        await save_upload(bgm_file, bgm_file_path, max_bytes=MAX_FILE_SIZE["audio"])
 
         logger.info(f"BGM file uploaded: {bgm_file_path}")
 
@@ -292,6 +292,8 @@ async def upload_project_bgm(
 
     except HTTPException:
         raise
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to upload BGM: {e}", exc_info=True)
         raise HTTPException(
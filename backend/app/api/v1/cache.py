@@ -10,6 +10,8 @@ from app.services.cache_service import (
     invalidate_content_cache,
     invalidate_writer_cache
 )
+from app.services.llm_response_cache import get_llm_response_cache
+from app.services.render_artifact_cache import get_render_artifact_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -52,6 +54,32 @@ async def get_cache_stats():
     )
 
 
+@router.get("/render-artifacts/stats")
+async def get_render_artifact_stats():
+    """
+    렌더 중간 산출물 캐시 통계 조회
+
+    **응답**:
+    - stages: 단계별 hits / misses / hit_rate (%)
+    - store_bytes: 저장소 사용량 (바이트, 첫 저장 전에는 null)
+    - max_bytes: 저장소 최대 크기
+    """
+    return get_render_artifact_cache().get_stats()
+
+
+@router.get("/llm-responses/stats")
+async def get_llm_response_stats():
+    """
+    LLM 응답 캐시 통계 조회
+
+    **응답**:
+    - tasks: task별 hits / misses / hit_rate (%) / saved_usd
+    - entries: 저장된 응답 수
+    - cached_tasks: 캐시 대상 task 목록 (llm_profile cache_ttl_seconds 설정)
+    """
+    return get_llm_response_cache().get_stats()
+
+
 @router.post("/invalidate")
 async def invalidate_cache(request: CacheInvalidateRequest):
     """
@@ -24,6 +24,8 @@ from app.models.campaign import (
     CampaignStatus
 )
 from app.services.cloudinary_service import get_cloudinary_service
+from app.services.streaming_io import StreamSizeLimitError, save_upload
+from app.validators.security_validators import MAX_FILE_SIZE
 from app.db.sqlite_client import get_campaign_db, get_content_schedule_db
 
 router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
@@ -451,13 +453,13 @@ async def _upload_resource_file(
     import tempfile
     from pathlib import Path
 
-    # 파일 임시 저장
+    # 파일 임시 저장 (청크 스트리밍)
     with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-        contents = await file.read()
-        tmp.write(contents)
         tmp_path = tmp.name
 
     try:
+        await save_upload(file, tmp_path, max_bytes=MAX_FILE_SIZE["video"])
+
         cloudinary_service = get_cloudinary_service()
 
         # Cloudinary 업로드
@@ -480,6 +482,9 @@ async def _upload_resource_file(
             "format": result.get("format")
         }
 
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
     finally:
         # 임시 파일 삭제
         Path(tmp_path).unlink(missing_ok=True)
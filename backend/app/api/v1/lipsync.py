@@ -8,6 +8,8 @@ import uuid
 import logging
 
 from app.tasks.video_tasks import generate_lipsync_task, check_lipsync_quality_task
+from app.services.streaming_io import StreamSizeLimitError, save_upload
+from app.validators.security_validators import MAX_FILE_SIZE
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/lipsync", tags=["lipsync"])
@@ -120,16 +122,15 @@ async def create_lipsync(
 
     # 파일 저장
     try:
-        with open(video_path, "wb") as f:
-            content = await video.read()
-            f.write(content)
-            logger.info(f"Video saved: {video_path} ({len(content)} bytes)")
+        saved = await save_upload(video, video_path, max_bytes=MAX_FILE_SIZE["video"])
+        logger.info(f"Video saved: {video_path} ({saved.size} bytes)")
 
-        with open(audio_path, "wb") as f:
-            content = await audio.read()
-            f.write(content)
-            logger.info(f"Audio saved: {audio_path} ({len(content)} bytes)")
+        saved = await save_upload(audio, audio_path, max_bytes=MAX_FILE_SIZE["audio"])
+        logger.info(f"Audio saved: {audio_path} ({saved.size} bytes)")
 
+    except StreamSizeLimitError as e:
+        video_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"File save failed: {e}")
         raise HTTPException(status_code=500, detail=f"File save failed: {str(e)}")
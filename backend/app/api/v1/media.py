@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 
 from app.services.cloudinary_service import get_cloudinary_service, PLATFORM_TRANSFORMATIONS
+from app.services.streaming_io import StreamSizeLimitError, save_upload
+from app.validators.security_validators import MAX_FILE_SIZE
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -96,7 +98,7 @@ async def upload_video(
     영상 업로드
 
     **지원 포맷**: MP4, MOV, AVI, MKV 등
-    **최대 크기**: 100MB (Free tier 기준)
+    **최대 크기**: 500MB (청크 스트리밍 저장 후 Cloudinary 청크 업로드, 플랜 한도는 별도)
 
     **자동 변환**:
     - 1920x1080 해상도로 사전 변환
@@ -109,11 +111,9 @@ async def upload_video(
         temp_path = Path(service.output_dir) / f"temp_{file.filename}"
         temp_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(temp_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        saved = await save_upload(file, temp_path, max_bytes=MAX_FILE_SIZE["video"])
 
-        logger.info(f"Uploading video: {file.filename} ({len(content) / 1024 / 1024:.2f} MB)")
+        logger.info(f"Uploading video: {file.filename} ({saved.size_mb:.2f} MB)")
 
         # Cloudinary 업로드
         result = await service.upload_video(
@@ -129,6 +129,8 @@ async def upload_video(
 
         return VideoUploadResponse(**result)
 
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Video upload failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -159,11 +161,9 @@ async def upload_image(
         temp_path = Path(service.output_dir) / f"temp_{file.filename}"
         temp_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(temp_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        saved = await save_upload(file, temp_path, max_bytes=MAX_FILE_SIZE["image"])
 
-        logger.info(f"Uploading image: {file.filename} ({len(content) / 1024:.2f} KB)")
+        logger.info(f"Uploading image: {file.filename} ({saved.size / 1024:.2f} KB)")
 
         # Cloudinary 업로드
         result = await service.upload_image(
@@ -179,6 +179,8 @@ async def upload_image(
 
         return ImageUploadResponse(**result)
 
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Image upload failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,7 +4,7 @@ import logging
 import re
 import tempfile
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Query
 from fastapi.responses import FileResponse
 from typing import Optional, List
 import uuid
@@ -26,7 +26,12 @@ from app.models.presentation import (
     PresentationStatus,
     PresentationModel
 )
+from app.models.pagination import decode_cursor, next_cursor
 from app.services.pdf_to_slides_service import get_pdf_to_slides_service
+from app.services.pdf_ingest_pipeline import get_pdf_ingest_pipeline
+from app.services.presentation_store import PresentationConflictError, get_presentation_store
+from app.services.streaming_io import StreamSizeLimitError
+from app.validators.security_validators import MAX_FILE_SIZE
 from app.services.slide_to_script_converter import SlideToScriptConverter
 from app.services.tts_service import get_tts_service
 from app.services.stt_service import get_stt_service
@@ -47,9 +52,6 @@ try:
 except ImportError:
     generate_presentation_video_task = None
 
-# In-memory presentation store (replaces Neo4j for local dev)
-_presentations: dict = {}
-
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -155,6 +157,28 @@ def _generate_title_image(
     img.save(output_path, "PNG")
 
 
+# 저장소는 동기 sqlite — 조회/갱신은 워커 스레드에서 실행해 이벤트 루프를 막지 않는다
+
+async def _load_presentation(presentation_id: str, include_slides: bool = True) -> dict:
+    """저장소에서 프리젠테이션 조회 (없으면 404)"""
+    record = await asyncio.to_thread(
+        get_presentation_store().get, presentation_id, include_slides=include_slides
+    )
+    if record is None:
+        raise HTTPException(status_code=404, detail="Presentation not found")
+    return record
+
+
+async def _save_presentation(presentation_id: str, changes: dict, expected_version: int) -> dict:
+    """조회 시점 version 기준으로 갱신 (다른 요청이 먼저 바꿨으면 409)"""
+    try:
+        return await asyncio.to_thread(
+            get_presentation_store().update, presentation_id, changes, expected_version=expected_version
+        )
+    except PresentationConflictError as e:
+        raise HTTPException(status_code=409, detail=f"Presentation was modified concurrently: {e}")
+
+
 def _draw_centered_text(draw, text: str, font, color, canvas_width: int, y: int) -> None:
     """텍스트를 수평 중앙 정렬로 그린다."""
     try:
@@ -223,8 +247,70 @@ async def _generate_segment_video(
         raise RuntimeError(f"FFmpeg segment failed: {result.stderr[-400:]}")
 
 
+async def _ingest_presentation(presentation_id: str, pdf_path: str, dpi: int, lang: str) -> None:
+    """백그라운드 PDF 인제스트: 페이지 완료 시마다 진행률 갱신, 끝나면 슬라이드 목록 저장"""
+    store = get_presentation_store()
+    record = await asyncio.to_thread(store.get, presentation_id, include_slides=False)
+    if record is None:
+        return
+    ingest = dict(record["metadata"]["ingest"])
+    ingesting = [PresentationStatus.INGESTING.value]
+
+    async def on_page(page, processed: int, total: int) -> None:
+        ingest["processed_pages"] = processed
+        await asyncio.to_thread(
+            store.update, presentation_id, {"metadata": {"ingest": dict(ingest)}}, expected_status=ingesting
+        )
+
+    try:
+        pages = await get_pdf_ingest_pipeline().run(
+            pdf_path,
+            dpi=dpi,
+            lang=lang,
+            total_pages=ingest["total_pages"],
+            on_page=on_page
+        )
+        slides_data = [
+            SlideInfo(
+                slide_number=page.page_number,
+                image_path=page.image_path,
+                ocr_text=page.ocr_text
+            ).model_dump()
+            for page in pages
+        ]
+        await asyncio.to_thread(
+            store.update,
+            presentation_id,
+            {
+                "slides_data": slides_data,
+                "total_slides": len(pages),
+                "status": PresentationStatus.UPLOADED.value,
+            },
+            expected_status=ingesting
+        )
+        logger.info(f"Presentation ingested: {presentation_id} ({len(pages)} slides)")
+
+    except (KeyError, PresentationConflictError) as e:
+        # 인제스트 도중 만료/삭제됨
+        logger.warning(f"Presentation ingest discarded: {presentation_id}: {e}")
+
+    except Exception as e:
+        logger.error(f"Presentation ingest failed: {presentation_id}: {e}")
+        ingest["error"] = str(e)
+        try:
+            await asyncio.to_thread(
+                store.update,
+                presentation_id,
+                {"status": PresentationStatus.FAILED.value, "metadata": {"ingest": ingest}},
+                expected_status=ingesting
+            )
+        except (KeyError, PresentationConflictError):
+            pass
+
+
 @router.post("/upload", response_model=PresentationUploadResponse)
 async def upload_presentation(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="PDF 파일"),
     project_id: str = Form(..., description="프로젝트 ID"),
     dpi: int = Form(200, description="슬라이드 이미지 해상도 (DPI)"),
@@ -232,92 +318,75 @@ async def upload_presentation(
     template_id: Optional[str] = Form(None, description="브랜드 템플릿 ID (인트로/아웃트로 적용)"),
 ):
     """
-    1. PDF 업로드 및 처리
+    1. PDF 업로드 (슬라이드 변환은 백그라운드)
 
     **워크플로우**:
-    1. PDF 파일 저장
-    2. PDF를 개별 슬라이드 이미지로 변환
-    3. OCR로 텍스트 추출 (선택적)
-    4. Neo4j에 프리젠테이션 생성
+    1. PDF 파일 저장 + 페이지 수 확인 → 즉시 응답 (status=ingesting)
+    2. 백그라운드: 페이지 범위 병렬 래스터화 → 리사이즈/PNG → OCR
+    3. 완료 시 status=uploaded, 슬라이드 목록은 상세 조회로 확인
 
-    **출력**: presentation_id, 슬라이드 목록
+    진행률: `GET /{presentation_id}/ingest-status`
+
+    **출력**: presentation_id, 총 슬라이드 수 (slides 는 빈 목록)
     """
     try:
         from urllib.parse import unquote
-        
-        logger.info(f"Uploading presentation PDF: {file.filename}, project_id: {project_id}")
 
-        # PDF 파일 읽기
-        pdf_bytes = await file.read()
+        logger.info(f"Uploading presentation PDF: {file.filename}, project_id: {project_id}")
 
-        # PDF 저장
+        # PDF 저장 (청크 스트리밍)
         pdf_service = get_pdf_to_slides_service()
         # UTF-8 URL 인코딩된 파일명 복호화
         decoded_filename = unquote(file.filename)
-        
+
         pdf_path = await pdf_service.save_uploaded_pdf(
-            file_data=pdf_bytes,
+            upload=file,
             user_id=project_id,
-            original_filename=decoded_filename
+            original_filename=decoded_filename,
+            max_bytes=MAX_FILE_SIZE["document"]
         )
 
-        # PDF → 슬라이드 이미지 변환
-        image_paths = await pdf_service.convert_pdf_to_images(
-            pdf_path=pdf_path,
-            dpi=dpi
-        )
-
-        # OCR 텍스트 추출
-        ocr_texts = await pdf_service.extract_text_from_slides(
-            image_paths=image_paths,
-            lang=lang
-        )
-
-        # 슬라이드 정보 생성
-        slides = []
-        for i, image_path in enumerate(image_paths, start=1):
-            slides.append(
-                SlideInfo(
-                    slide_number=i,
-                    image_path=image_path,
-                    ocr_text=ocr_texts[i - 1] if i - 1 < len(ocr_texts) else None
-                )
-            )
+        # 페이지 수만 확인 (래스터화 없음)
+        pipeline = get_pdf_ingest_pipeline()
+        total_pages = await pipeline.count_pages(pdf_path)
 
         # 프리젠테이션 ID 생성
         presentation_id = f"pres_{uuid.uuid4().hex[:12]}"
 
-        # In-memory 저장 (로컬 개발용, 프로덕션은 Neo4j)
-        import datetime
-        _presentations[presentation_id] = {
+        # 공유 저장소에 기록 (모든 워커에서 조회 가능)
+        await asyncio.to_thread(get_presentation_store().create, {
             "presentation_id": presentation_id,
             "project_id": project_id,
             "pdf_path": pdf_path,
-            "total_slides": len(slides),
-            "slides_data": [slide.model_dump() for slide in slides],
-            "status": PresentationStatus.UPLOADED.value,
+            "total_slides": total_pages,
+            "slides_data": [],
+            "status": PresentationStatus.INGESTING.value,
             "full_script": None,
             "audio_path": None,
             "video_path": None,
             "template_id": template_id,
-            "created_at": datetime.datetime.now().isoformat(),
-            "updated_at": datetime.datetime.now().isoformat(),
-            "metadata": {},
-        }
+            "metadata": {
+                "ingest": {"total_pages": total_pages, "processed_pages": 0, "error": None}
+            },
+        })
+
+        background_tasks.add_task(_ingest_presentation, presentation_id, pdf_path, dpi, lang)
 
         logger.info(
             f"Presentation uploaded: {presentation_id}, "
-            f"total_slides: {len(slides)}"
+            f"total_slides: {total_pages} (ingest scheduled)"
         )
 
         return PresentationUploadResponse(
             presentation_id=presentation_id,
             pdf_path=pdf_path,
-            total_slides=len(slides),
-            slides=slides,
-            status=PresentationStatus.UPLOADED
+            total_slides=total_pages,
+            slides=[],
+            status=PresentationStatus.INGESTING
         )
 
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Presentation upload failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -328,14 +397,13 @@ async def generate_script(
     presentation_id: str,
     request: GenerateScriptRequest
 ):
-    """2. 나레이션 스크립트 생성 (인메모리)"""
+    """2. 나레이션 스크립트 생성"""
     try:
         logger.info(f"Generating script for presentation: {presentation_id}")
 
-        if presentation_id not in _presentations:
-            raise HTTPException(status_code=404, detail="Presentation not found")
-
-        presentation_data = _presentations[presentation_id]
+        presentation_data = await _load_presentation(presentation_id)
+        if presentation_data["status"] == PresentationStatus.INGESTING.value:
+            raise HTTPException(status_code=409, detail="Slides are still being processed")
 
         # SlideData 모델로 변환
         from app.services.slide_to_script_converter import SlideData, ToneType
@@ -351,7 +419,7 @@ async def generate_script(
                 content=content,
             ))
 
-        converter = SlideToScriptConverter()
+        converter = SlideToScriptConverter(voice_id=request.voice_id)
         script_result = await converter.convert_slides_to_script(
             slides=slide_models,
             tone=ToneType(request.tone or "professional"),
@@ -373,12 +441,11 @@ async def generate_script(
                 )
             )
 
-        # 인메모리 업데이트
-        import datetime
-        _presentations[presentation_id]["full_script"] = script_result.full_script
-        _presentations[presentation_id]["slides_data"] = [s.model_dump() for s in slides_with_script]
-        _presentations[presentation_id]["status"] = PresentationStatus.SCRIPT_GENERATED.value
-        _presentations[presentation_id]["updated_at"] = datetime.datetime.now().isoformat()
+        await _save_presentation(presentation_id, {
+            "full_script": script_result.full_script,
+            "slides_data": [s.model_dump() for s in slides_with_script],
+            "status": PresentationStatus.SCRIPT_GENERATED.value,
+        }, expected_version=presentation_data["version"])
 
         logger.info(f"Script generated: {presentation_id}, total_duration: {script_result.total_duration:.1f}s")
 
@@ -402,14 +469,11 @@ async def generate_audio(
     presentation_id: str,
     request: GenerateAudioRequest
 ):
-    """3. TTS 오디오 생성 (인메모리 + CosyVoice/OpenAI)"""
+    """3. TTS 오디오 생성 (CosyVoice/OpenAI)"""
     try:
         logger.info(f"Generating audio for presentation: {presentation_id}")
 
-        if presentation_id not in _presentations:
-            raise HTTPException(status_code=404, detail="Presentation not found")
-
-        presentation_data = _presentations[presentation_id]
+        presentation_data = await _load_presentation(presentation_id)
 
         script = request.script or presentation_data.get("full_script")
         if not script:
@@ -447,12 +511,11 @@ async def generate_audio(
             # 오디오 길이를 스크립트 기반으로 추정 (한국어 ~4자/초)
             whisper_result["duration"] = len(script) / 4.0
 
-        # 인메모리 업데이트
-        import datetime
-        _presentations[presentation_id]["audio_path"] = audio_path
-        _presentations[presentation_id]["status"] = PresentationStatus.AUDIO_GENERATED.value
-        _presentations[presentation_id]["updated_at"] = datetime.datetime.now().isoformat()
-        _presentations[presentation_id]["metadata"]["whisper_result"] = whisper_result
+        await _save_presentation(presentation_id, {
+            "audio_path": audio_path,
+            "status": PresentationStatus.AUDIO_GENERATED.value,
+            "metadata": {"whisper_result": whisper_result},
+        }, expected_version=presentation_data["version"])
 
         logger.info(f"Audio generated: {presentation_id}, duration: {whisper_result['duration']:.1f}s")
 
@@ -477,14 +540,11 @@ async def analyze_timing(
     presentation_id: str,
     request: AnalyzeTimingRequest
 ):
-    """4. 슬라이드 타이밍 분석 (인메모리 — 스크립트 기반 균등 분배)"""
+    """4. 슬라이드 타이밍 분석 (스크립트 기반 균등 분배)"""
     try:
         logger.info(f"Analyzing timing for presentation: {presentation_id}")
 
-        if presentation_id not in _presentations:
-            raise HTTPException(status_code=404, detail="Presentation not found")
-
-        presentation_data = _presentations[presentation_id]
+        presentation_data = await _load_presentation(presentation_id)
         slides_data = presentation_data["slides_data"]
 
         # 스크립트 기반 타이밍 계산 (글자 수 비례 배분)
@@ -516,11 +576,10 @@ async def analyze_timing(
 
         total_duration = round(current_time, 1)
 
-        # 인메모리 업데이트
-        import datetime
-        _presentations[presentation_id]["slides_data"] = [s.model_dump() for s in slides_with_timing]
-        _presentations[presentation_id]["status"] = PresentationStatus.TIMING_ANALYZED.value
-        _presentations[presentation_id]["updated_at"] = datetime.datetime.now().isoformat()
+        await _save_presentation(presentation_id, {
+            "slides_data": [s.model_dump() for s in slides_with_timing],
+            "status": PresentationStatus.TIMING_ANALYZED.value,
+        }, expected_version=presentation_data["version"])
 
         logger.info(f"Timing analyzed: {presentation_id}, total_duration: {total_duration:.1f}s")
 
@@ -543,17 +602,13 @@ async def generate_video(
     presentation_id: str,
     request: GenerateVideoRequest
 ):
-    """5. FFmpeg 영상 생성 (동기 — 인메모리, 인트로/아웃트로 지원)"""
+    """5. FFmpeg 영상 생성 (동기, 인트로/아웃트로 지원)"""
     import subprocess
-    import datetime
 
     try:
         logger.info(f"Starting video generation for presentation: {presentation_id}")
 
-        if presentation_id not in _presentations:
-            raise HTTPException(status_code=404, detail="Presentation not found")
-
-        pdata = _presentations[presentation_id]
+        pdata = await _load_presentation(presentation_id)
 
         if not pdata.get("audio_path"):
             raise HTTPException(status_code=400, detail="Audio not generated.")
@@ -757,10 +812,10 @@ async def generate_video(
             if seg and seg != str(output_path):
                 Path(seg).unlink(missing_ok=True)
 
-        # 인메모리 업데이트
-        _presentations[presentation_id]["video_path"] = str(output_path)
-        _presentations[presentation_id]["status"] = PresentationStatus.VIDEO_READY.value
-        _presentations[presentation_id]["updated_at"] = datetime.datetime.now().isoformat()
+        await _save_presentation(presentation_id, {
+            "video_path": str(output_path),
+            "status": PresentationStatus.VIDEO_READY.value,
+        }, expected_version=pdata["version"])
 
         file_size = output_path.stat().st_size / 1024 / 1024
         logger.info(f"Video generated: {output_path} ({file_size:.1f}MB)")
@@ -780,14 +835,28 @@ async def generate_video(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{presentation_id}/ingest-status")
+async def get_ingest_status(presentation_id: str):
+    """1-1. PDF 인제스트 진행률 (페이지 단위)"""
+    p = await _load_presentation(presentation_id, include_slides=False)
+    ingest = p.get("metadata", {}).get("ingest") or {}
+    total = ingest.get("total_pages") or p["total_slides"]
+    processed = ingest.get("processed_pages", total)
+    return {
+        "presentation_id": presentation_id,
+        "status": p["status"],
+        "total_pages": total,
+        "processed_pages": processed,
+        "progress": round(processed / total, 4) if total else 1.0,
+        "error": ingest.get("error"),
+    }
+
+
 @router.get("/{presentation_id}", response_model=PresentationDetailResponse)
 async def get_presentation(presentation_id: str):
-    """6. 프리젠테이션 상세 조회 (인메모리)"""
+    """6. 프리젠테이션 상세 조회"""
     try:
-        if presentation_id not in _presentations:
-            raise HTTPException(status_code=404, detail="Presentation not found")
-
-        p = _presentations[presentation_id]
+        p = await _load_presentation(presentation_id)
         slides = [SlideInfo(**s) for s in p.get("slides_data", [])]
 
         return PresentationDetailResponse(
@@ -815,71 +884,54 @@ async def get_presentation(presentation_id: str):
 @router.get("/projects/{project_id}/presentations", response_model=PresentationListResponse)
 async def list_presentations(
     project_id: str,
-    page: int = 1,
-    page_size: int = 20
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)")
 ):
     """
     7. 프로젝트의 프리젠테이션 목록
 
-    **출력**: 프리젠테이션 목록 (페이지네이션)
+    **출력**: 프리젠테이션 목록 (최신순, page 또는 cursor 페이지네이션)
     """
     try:
-        neo4j_client = get_neo4j_client()
-
-        # 전체 개수 조회
-        count_query = """
-        MATCH (project:Project {project_id: $project_id})-[:HAS_PRESENTATION]->(p:Presentation)
-        RETURN count(p) as total
-        """
-        count_result = neo4j_client.execute_query(
-            query=count_query,
-            parameters={"project_id": project_id}
-        )
-        total = count_result[0]["total"] if count_result else 0
-
-        # 목록 조회
-        skip = (page - 1) * page_size
-        list_query = """
-        MATCH (project:Project {project_id: $project_id})-[:HAS_PRESENTATION]->(p:Presentation)
-        RETURN p
-        ORDER BY p.created_at DESC
-        SKIP $skip
-        LIMIT $limit
-        """
-        result = neo4j_client.execute_query(
-            query=list_query,
-            parameters={
-                "project_id": project_id,
-                "skip": skip,
-                "limit": page_size
-            }
+        keyset = None
+        if cursor:
+            try:
+                keyset = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        # 헤더만 조회 (slides_data 압축 해제 없음, 썸네일은 저장 시 계산된 컬럼)
+        store = get_presentation_store()
+        page_items = await asyncio.to_thread(
+            store.list_by_project,
+            project_id, limit=page_size, skip=(page - 1) * page_size, cursor=keyset
         )
+        total = await asyncio.to_thread(store.count_by_project, project_id)
 
-        presentations = []
-        for record in result:
-            p = record["p"]
-            # 첫 슬라이드 썸네일
-            thumbnail_url = None
-            if p.get("slides_data") and len(p["slides_data"]) > 0:
-                thumbnail_url = p["slides_data"][0].get("image_path")
-
-            presentations.append({
+        presentations = [
+            {
                 "presentation_id": p["presentation_id"],
                 "project_id": p["project_id"],
                 "total_slides": p["total_slides"],
                 "status": p["status"],
                 "created_at": p["created_at"],
                 "updated_at": p["updated_at"],
-                "thumbnail_url": thumbnail_url
-            })
+                "thumbnail_url": p["thumbnail_url"]
+            }
+            for p in page_items
+        ]
 
         return PresentationListResponse(
             presentations=presentations,
             total=total,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor(page_items, page_size, "presentation_id")
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list presentations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,7 +7,7 @@ REALPLAN.md Phase 1.2 & 1.3 구현:
 """
 from typing import List, Optional
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -21,6 +21,12 @@ from app.models.neo4j_models import (
     ProjectSectionsResponse,
     SectionType
 )
+from app.models.pagination import COUNT_CACHE_TTL_SECONDS, next_cursor
+from app.services.cache_service import (
+    get_cache_service,
+    invalidate_project_count_cache,
+    project_count_cache_key,
+)
 from app.services.neo4j_client import get_neo4j_client
 from app.services.section_service import get_section_service
 from app.tasks.audio_tasks import generate_verified_audio_task
@@ -68,6 +74,7 @@ class ProjectListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 None)")
 
 
 # ==================== Helper Functions ====================
@@ -78,6 +85,21 @@ def get_crud_manager() -> Neo4jCRUDManager:
     return Neo4jCRUDManager(client)
 
 
+def count_user_projects_cached(
+    crud: Neo4jCRUDManager,
+    user_id: str,
+    status: Optional[ProjectStatus] = None
+) -> int:
+    """사용자 프로젝트 개수 (Redis 캐시, 생성/수정/삭제 시 무효화)"""
+    cache = get_cache_service()
+    key = project_count_cache_key(user_id, status.value if status else None)
+    total = cache.get(key)
+    if total is None:
+        total = crud.count_user_projects(user_id, status=status)
+        cache.set(key, total, ttl=COUNT_CACHE_TTL_SECONDS)
+    return total
+
+
 # ==================== API Endpoints ====================
 
 @router.post("/projects", response_model=ProjectResponse, status_code=201)
@@ -136,6 +158,7 @@ async def create_project(request: ProjectCreateRequest):
                 detail="Failed to create project"
             )
 
+        invalidate_project_count_cache(request.user_id)
         return ProjectResponse(**result)
 
     except HTTPException:
@@ -184,19 +207,21 @@ async def list_user_projects(
     user_id: str,
     status: Optional[ProjectStatus] = Query(None, description="프로젝트 상태 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(20, ge=1, le=100, description="페이지 크기")
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)")
 ):
     """
     **사용자 프로젝트 목록 조회**
 
-    특정 사용자의 모든 프로젝트를 조회합니다.
+    특정 사용자의 프로젝트를 최신순으로 조회합니다. 페이지 범위만 DB에서 가져옵니다.
 
     - **user_id**: 사용자 ID (필수)
     - **status**: 상태 필터 (draft, script_ready, production, published, archived)
     - **page**: 페이지 번호 (기본: 1)
     - **page_size**: 페이지당 항목 수 (기본: 20, 최대: 100)
+    - **cursor**: 다음 페이지 cursor (keyset 페이지네이션, 깊은 페이지에서 권장)
 
-    **반환값**: 프로젝트 목록 및 페이징 정보
+    **반환값**: 프로젝트 목록, 전체 개수, 다음 페이지 cursor
     """
     try:
         crud = get_crud_manager()
@@ -209,21 +234,23 @@ async def list_user_projects(
                 detail=f"User not found: {user_id}"
             )
 
-        # 프로젝트 목록 조회 (페이징 없이 전체 조회)
-        all_projects = crud.get_user_projects(user_id, status=status)
-
-        # 페이징 처리
-        total = len(all_projects)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-
-        paginated_projects = all_projects[start_idx:end_idx]
+        try:
+            projects = crud.get_user_projects(
+                user_id,
+                status=status,
+                skip=0 if cursor else (page - 1) * page_size,
+                limit=page_size,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         return ProjectListResponse(
-            projects=[ProjectResponse(**p) for p in paginated_projects],
-            total=total,
+            projects=[ProjectResponse(**p) for p in projects],
+            total=count_user_projects_cached(crud, user_id, status),
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor(projects, page_size, "project_id")
         )
 
     except HTTPException:
@@ -285,6 +312,9 @@ async def update_project(project_id: str, request: ProjectUpdateRequest):
             if "status" in updates:
                 status_value = updates.pop("status")
                 crud.update_project_status(project_id, ProjectStatus(status_value))
+                owner_id = crud.get_project_owner_id(project_id)
+                if owner_id:
+                    invalidate_project_count_cache(owner_id)
 
             # 나머지 필드 업데이트
             if updates:
@@ -337,6 +367,9 @@ async def delete_project(project_id: str):
                 detail=f"Project not found: {project_id}"
             )
 
+        # 삭제 후에는 OWNS 관계가 사라지므로 소유자를 먼저 조회 (개수 캐시 무효화용)
+        owner_id = crud.get_project_owner_id(project_id)
+
         # 프로젝트 삭제 (CASCADE)
         success = crud.delete_project(project_id)
 
@@ -346,6 +379,8 @@ async def delete_project(project_id: str):
                 detail="Failed to delete project"
             )
 
+        if owner_id:
+            invalidate_project_count_cache(owner_id)
         return None  # 204 No Content
 
     except HTTPException:
@@ -415,13 +450,21 @@ async def create_project_script(project_id: str, request: dict):
 
 
 @router.get("/projects/{project_id}/scripts", response_model=List[dict])
-async def get_project_scripts(project_id: str):
+async def get_project_scripts(
+    project_id: str,
+    response: Response,
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="최대 개수 (미지정 시 전체)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor 헤더 값 (지정 시 offset 무시)")
+):
     """
     **프로젝트 스크립트 조회**
 
-    프로젝트에 속한 모든 스크립트(초안 3종)를 조회합니다.
+    프로젝트에 속한 스크립트(초안 3종)를 버전 내림차순으로 조회합니다.
 
     - **project_id**: 프로젝트 ID
+    - **offset** / **limit**: 페이지 범위 (지정 시 `X-Total-Count` 헤더에 전체 개수)
+    - **cursor**: keyset 페이지네이션 (다음 페이지가 있으면 `X-Next-Cursor` 헤더로 반환)
 
     **반환값**: 스크립트 목록
     """
@@ -436,7 +479,21 @@ async def get_project_scripts(project_id: str):
                 detail=f"Project not found: {project_id}"
             )
 
-        scripts = crud.get_project_scripts(project_id)
+        try:
+            scripts = crud.get_project_scripts(
+                project_id,
+                skip=0 if cursor else offset,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if limit is not None:
+            response.headers["X-Total-Count"] = str(crud.count_project_scripts(project_id))
+            cursor_value = next_cursor(scripts, limit, "script_id", sort_field="version")
+            if cursor_value:
+                response.headers["X-Next-Cursor"] = cursor_value
         return scripts
 
     except HTTPException:
@@ -449,13 +506,21 @@ async def get_project_scripts(project_id: str):
 
 
 @router.get("/projects/{project_id}/videos", response_model=List[dict])
-async def get_project_videos(project_id: str):
+async def get_project_videos(
+    project_id: str,
+    response: Response,
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="최대 개수 (미지정 시 전체)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor 헤더 값 (지정 시 offset 무시)")
+):
     """
     **프로젝트 비디오 조회**
 
-    프로젝트에 속한 모든 생성된 비디오를 조회합니다.
+    프로젝트에 속한 생성된 비디오를 최신순으로 조회합니다.
 
     - **project_id**: 프로젝트 ID
+    - **offset** / **limit**: 페이지 범위 (지정 시 `X-Total-Count` 헤더에 전체 개수)
+    - **cursor**: keyset 페이지네이션 (다음 페이지가 있으면 `X-Next-Cursor` 헤더로 반환)
 
     **반환값**: 비디오 목록
     """
@@ -470,7 +535,21 @@ async def get_project_videos(project_id: str):
                 detail=f"Project not found: {project_id}"
             )
 
-        videos = crud.get_project_videos(project_id)
+        try:
+            videos = crud.get_project_videos(
+                project_id,
+                skip=0 if cursor else offset,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if limit is not None:
+            response.headers["X-Total-Count"] = str(crud.count_project_videos(project_id))
+            cursor_value = next_cursor(videos, limit, "video_id")
+            if cursor_value:
+                response.headers["X-Next-Cursor"] = cursor_value
         return videos
 
     except HTTPException:
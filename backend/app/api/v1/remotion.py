@@ -46,6 +46,10 @@ class RenderRequest(BaseModel):
         "OmniVibeComposition",
         description="Remotion composition ID"
     )
+    platforms: Optional[List[str]] = Field(
+        None,
+        description="멀티포맷 출력 플랫폼 (예: [\"YouTube\", \"TikTok\"]) — 마스터 1회 렌더 후 트랜스코딩"
+    )
 
     class Config:
         schema_extra = {
@@ -147,7 +151,8 @@ async def render_video_with_remotion(request: RenderRequest):
             storyboard_blocks=request.storyboard_blocks,
             campaign_concept=request.campaign_concept,
             audio_url=request.audio_url,
-            composition_id=request.composition_id
+            composition_id=request.composition_id,
+            platforms=request.platforms
         )
 
         return RenderResponse(
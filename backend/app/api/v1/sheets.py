@@ -302,6 +302,48 @@ async def get_schedule(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/schedule/{spreadsheet_id}/changes")
+async def get_schedule_changes(
+    spreadsheet_id: str,
+    sheet_name: str = "스케줄",
+    key_columns: Optional[str] = None
+):
+    """
+    마지막 폴링 이후 추가/변경된 스케줄 행만 조회
+
+    시트 리비전이 그대로면 Sheets API를 호출하지 않습니다.
+    캠페인 폴링 → 스크립트 생성은 changed 행만 처리하면 됩니다.
+
+    Args:
+        spreadsheet_id: 스프레드시트 ID
+        sheet_name: 시트 이름 (기본값: '스케줄')
+        key_columns: 행 식별 컬럼 (콤마 구분, 기본값: '캠페인명,소제목')
+    """
+    sheets_service = get_sheets_service()
+
+    if not sheets_service.is_available():
+        raise HTTPException(status_code=503, detail="Google Sheets service not available")
+
+    try:
+        changes = await sheets_service.get_schedule_changes(
+            spreadsheet_id,
+            sheet_name,
+            key_columns=[c.strip() for c in key_columns.split(",") if c.strip()] if key_columns else None
+        )
+
+        return {
+            "success": True,
+            "revision": changes.revision,
+            "total_items": changes.total_rows,
+            "changed": changes.changed,
+            "removed": changes.removed
+        }
+
+    except Exception as e:
+        logger.error(f"Error reading schedule changes: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/campaign/{spreadsheet_id}/{campaign_name}")
 async def get_campaign_contents(
     spreadsheet_id: str,
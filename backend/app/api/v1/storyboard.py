@@ -103,11 +103,12 @@ async def generate_storyboard(
                 "storyboard_blocks": [],
                 "background_suggestions": [],
                 "transition_effects": [],
+                "node_latencies": {},
                 "error": None
             }
 
             # Director Agent 실행
-            result = director_graph.invoke(initial_state)
+            result = await director_graph.ainvoke(initial_state)
 
             if result.get("error"):
                 raise HTTPException(
@@ -5,6 +5,8 @@ from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
 from pydantic import BaseModel, Field
 
 from app.services.voice_cloning_service import get_voice_cloning_service
+from app.services.streaming_io import StreamSizeLimitError
+from app.validators.security_validators import MAX_FILE_SIZE
 from app.services.neo4j_client import Neo4jClient
 
 router = APIRouter(prefix="/voice", tags=["Voice Cloning"])
@@ -99,14 +101,12 @@ async def clone_voice(
             # Voice Cloning 서비스 가져오기
             vc_service = get_voice_cloning_service()
 
-            # 업로드된 파일 읽기
-            file_data = await audio_file.read()
-
-            # 파일 저장
+            # 파일 저장 (청크 스트리밍)
             file_path = await vc_service.save_uploaded_file(
-                file_data=file_data,
+                upload=audio_file,
                 user_id=user_id,
-                original_filename=audio_file.filename
+                original_filename=audio_file.filename,
+                max_bytes=MAX_FILE_SIZE["audio"]
             )
 
             logger.info(f"Uploaded file saved: {file_path}")
@@ -161,6 +161,11 @@ async def clone_voice(
 
         except HTTPException:
             raise
+        except StreamSizeLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=str(e)
+            )
         except Exception as e:
             logger.error(f"Voice cloning failed: {str(e)}")
             raise HTTPException(
@@ -364,12 +369,12 @@ async def validate_audio(
     try:
         vc_service = get_voice_cloning_service()
 
-        # 임시 파일 저장
-        file_data = await audio_file.read()
+        # 임시 파일 저장 (청크 스트리밍)
         temp_path = await vc_service.save_uploaded_file(
-            file_data=file_data,
+            upload=audio_file,
             user_id="temp",
-            original_filename=audio_file.filename
+            original_filename=audio_file.filename,
+            max_bytes=MAX_FILE_SIZE["audio"]
         )
 
         # 검증
@@ -381,6 +386,11 @@ async def validate_audio(
 
         return AudioValidationResponse(**validation)
 
+    except StreamSizeLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Audio validation failed: {str(e)}")
         raise HTTPException(
@@ -110,7 +110,7 @@ async def websocket_endpoint(
 
     try:
         # 연결 확인 메시지
-        await websocket.send_json({
+        manager.send_to_client(websocket, {
             "type": "connected",
             "project_id": project_id,
             "message": "WebSocket connected successfully",
@@ -123,7 +123,7 @@ async def websocket_endpoint(
 
             # ping-pong for keep-alive
             if data == "ping":
-                await websocket.send_json({
+                manager.send_to_client(websocket, {
                     "type": "pong",
                     "timestamp": manager.active_connections.get(project_id, set()).__len__()
                 })
@@ -7,6 +7,8 @@ from pydantic import BaseModel, Field
 from typing import Optional
 
 from app.services.stt_service import STTService
+from app.services.streaming_io import StreamSizeLimitError, save_upload
+from app.validators.security_validators import MAX_FILE_SIZE
 from app.services.whisper_timestamp_service import (
     extract_word_timestamps,
     map_timestamps_to_blocks,
@@ -62,9 +64,8 @@ async def extract_timing(
         # 임시 파일 저장
         suffix = os.path.splitext(audio.filename or ".mp3")[1]
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await audio.read()
-            tmp.write(content)
             tmp_path = tmp.name
+        await save_upload(audio, tmp_path, max_bytes=MAX_FILE_SIZE["audio"])
 
         # Whisper STT (word-level timestamps)
         stt = STTService()
@@ -122,6 +123,8 @@ async def extract_timing(
 
     except HTTPException:
         raise
+    except StreamSizeLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Whisper timing extraction failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"타이밍 추출 실패: {str(e)}")
@@ -24,6 +24,7 @@ class ScriptGenerationRequest(BaseModel):
     campaign_name: str
     topic: str
     platform: str = "YouTube"  # YouTube, Instagram, TikTok
+    voice_id: Optional[str] = None  # 나레이션 음성 (분량 예측 보정)
 
 
 class ScriptGenerationResponse(BaseModel):
@@ -73,7 +74,8 @@ async def generate_script(request: ScriptGenerationRequest):
             spreadsheet_id=request.spreadsheet_id,
             campaign_name=request.campaign_name,
             topic=request.topic,
-            platform=request.platform
+            platform=request.platform,
+            voice_id=request.voice_id
         )
 
         if not result.get("success"):
@@ -120,6 +122,8 @@ class DurationCalculateRequest(BaseModel):
     """시간 계산 요청"""
     text: str
     language: str = "ko"  # ko, en, ja, zh
+    voice_id: Optional[str] = None  # 음성별 보정 계수
+    platform: Optional[str] = None  # 플랫폼별 보정 계수
 
 
 class DurationCalculateResponse(BaseModel):
@@ -136,6 +140,8 @@ class WordCountEstimateRequest(BaseModel):
     target_duration: float  # 목표 시간 (초)
     language: str = "ko"
     margin: float = 0.1  # 오차 범위 (기본 10%)
+    voice_id: Optional[str] = None
+    platform: Optional[str] = None
 
 
 class WordCountEstimateResponse(BaseModel):
@@ -176,7 +182,11 @@ async def calculate_script_duration(request: DurationCalculateRequest):
     try:
         lang = Language(request.language)
         calculator = get_duration_calculator(lang)
-        result = calculator.calculate(request.text)
+        result = calculator.calculate(
+            request.text,
+            voice_id=request.voice_id,
+            platform=request.platform
+        )
 
         return DurationCalculateResponse(**result)
 
@@ -226,7 +236,9 @@ async def estimate_required_word_count(request: WordCountEstimateRequest):
         calculator = get_duration_calculator(lang)
         result = calculator.estimate_for_target_duration(
             target_duration=request.target_duration,
-            margin=request.margin
+            margin=request.margin,
+            voice_id=request.voice_id,
+            platform=request.platform
         )
 
         return WordCountEstimateResponse(**result)
@@ -4,7 +4,6 @@ from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.auth.jwt import verify_access_token  # 새로운 JWT 모듈
 from app.models.user import UserRole, UserCRUD
-from app.services.neo4j_client import get_neo4j_client
 
 # HTTP Bearer 스키마 (Authorization: Bearer <token>)
 security = HTTPBearer()
@@ -45,7 +44,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Neo4j에서 사용자 조회
+    # Neo4j에서 사용자 조회 (neo4j 드라이버는 첫 인증 요청 시 로딩 — 앱 기동 import 에서 제외)
+    from app.services.neo4j_client import get_neo4j_client
+
     neo4j_client = get_neo4j_client()
     user_crud = UserCRUD(neo4j_client)
 
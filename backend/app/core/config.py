@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     # Google
     GOOGLE_VEO_API_KEY: str
     GOOGLE_SHEETS_CREDENTIALS_PATH: str
+    SHEETS_CACHE_DIR: str = "./outputs/.cache/sheets"  # 시트 리비전/내용 해시 캐시 + 변경 행 추적 상태
     YOUTUBE_API_KEY: str
 
     # Neo4j
@@ -47,6 +48,10 @@ class Settings(BaseSettings):
     PINECONE_API_KEY: str
     PINECONE_ENVIRONMENT: str
     PINECONE_INDEX_NAME: str = "omnivibe-thumbnails"
+    # 벡터 인덱스 백엔드: "pinecone" (원격) | "local" (memmap + IVF, 오프라인/테스트)
+    VECTOR_INDEX_BACKEND: str = "pinecone"
+    VECTOR_INDEX_DIR: str = "./outputs/.index/vectors"
+    VECTOR_INDEX_NPROBE: int = 16
 
     # Cloudinary
     CLOUDINARY_CLOUD_NAME: str
@@ -100,6 +105,68 @@ class Settings(BaseSettings):
     # CORS (콤마 구분 다중 도메인 지원)
     CORS_ORIGINS: str = "http://localhost:3020,http://localhost:3030,http://localhost:3000,http://localhost:4024"
 
+    # Media Probe 캐시 (ffprobe 결과 공유)
+    MEDIA_PROBE_CACHE_DIR: str = "./outputs/.cache/probe"
+    MEDIA_PROBE_MEMORY_ENTRIES: int = 1024
+
+    # 렌더 중간 산출물 캐시 (증분 재렌더링)
+    RENDER_CACHE_ENABLED: bool = True
+    RENDER_CACHE_DIR: str = "./outputs/.cache/artifacts"
+    RENDER_CACHE_MAX_BYTES: int = 20 * 1024 ** 3  # 20 GB
+
+    # 세그먼트 병렬 인코딩 (긴 영상 자막 burn / 플랫폼 최적화)
+    PARALLEL_ENCODE_ENABLED: bool = True
+    PARALLEL_ENCODE_MIN_SECONDS: float = 600.0  # 이 길이 이상일 때만 병렬 모드
+    PARALLEL_ENCODE_WORKERS: int = 0  # 0이면 CPU 코어 수 기준 자동
+    PARALLEL_ENCODE_SEGMENT_SECONDS: float = 60.0
+
+    # 멀티포맷 렌더 — 마스터 1회 렌더 후 포맷별 crop/scale 병렬 트랜스코딩
+    RENDER_MASTER_MAX_SCALE: float = 2.0  # 세로(9:16) 크롭이 업스케일되지 않도록 키우는 상한
+    RENDER_TRANSCODE_WORKERS: int = 0  # 0이면 포맷 수 기준 자동
+
+    # 상주 Remotion 렌더 서버 (frontend: npm run render-server) — 미기동 시 npx CLI fallback
+    REMOTION_RENDER_SERVER_ENABLED: bool = True
+    REMOTION_RENDER_SOCKET: str = "/tmp/omnivibe-remotion.sock"
+
+    # 배치 영상 생성 — chord 로 분산된 하위 작업의 테넌트당 동시 실행 수 (0 = 제한 없음)
+    BATCH_VIDEO_TENANT_CONCURRENCY: int = 2
+
+    # Director Agent — 블록당 키워드/비주얼/배경을 1회 LLM 호출로 생성
+    DIRECTOR_FUSED_BLOCK_CALLS: bool = False
+    DIRECTOR_BLOCK_LLM_CONCURRENCY: int = 6  # 블록 단위 LLM 호출 동시 실행 수 (OpenAI rate limit 고려)
+
+    # LLM 응답 캐시 (llm_profile 프리셋 cache_ttl_seconds 설정 task만)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "./outputs/.cache/llm_responses.sqlite3"
+    LLM_CACHE_MAX_ENTRIES: int = 50_000
+
+    # PDF 인제스트 — 페이지 범위 단위 프로세스 풀 래스터화 + OCR
+    PDF_INGEST_WORKERS: int = 0  # 0 = min(4, CPU 수)
+    PDF_INGEST_PAGES_PER_TASK: int = 4
+    PDF_INGEST_MAX_WIDTH: int = 1920
+
+    # 프리젠테이션 상태 저장소 (워커 간 공유 SQLite)
+    PRESENTATION_STORE_PATH: str = "./outputs/.state/presentations.sqlite3"
+    PRESENTATION_UPLOAD_TTL_HOURS: int = 24  # 스크립트 생성 전 단계에서 방치된 업로드 만료
+
+    # 다국어 자막 — 1회 전사 후 언어별 번역/SRT·VTT 병렬 생성 (원본 세그먼트 해시 캐시)
+    SUBTITLE_TRANSLATION_CONCURRENCY: int = 4  # 동시 번역 요청 수 (모든 언어 합산)
+    SUBTITLE_CACHE_DIR: str = "./outputs/.cache/subtitles"
+
+    # 감사 로그 — 요청 경로는 큐 적재만, 백그라운드 UNWIND 배치 기록 (그래프 장애 시 로컬 스풀)
+    AUDIT_FLUSH_BATCH_SIZE: int = 100
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 2.0
+    AUDIT_QUEUE_MAX_SIZE: int = 10_000
+    AUDIT_SPOOL_PATH: str = "./outputs/.state/audit_spool.jsonl"
+
+    # WebSocket 진행률 fan-out — 클라이언트별 송신 큐 상한 / 전송 제한 시간 (초과 시 축출)
+    WS_CLIENT_QUEUE_SIZE: int = 64
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0
+
+    # API 라우터 지연 로딩 — 첫 요청 시 해당 경로의 라우터(+서비스 의존성)만 import
+    LAZY_ROUTER_LOADING: bool = True
+    ROUTER_PRELOAD_ON_STARTUP: bool = False  # True 면 기동 직후 백그라운드 스레드에서 전체 로딩
+
     # 알림 설정 (선택) — 설정 시 Celery 실패/API 지연 경고 발송
     SLACK_WEBHOOK_URL: str | None = None    # Slack Incoming Webhook URL
     ALERT_API_P95_MS:  int        = 5000    # API P95 경고 임계값 (ms)
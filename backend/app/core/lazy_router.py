@@ -0,0 +1,166 @@
+"""
+Lazy Router — 라우터 모듈을 첫 요청 시점에 import 하는 지연 로딩
+
+배경:
+    - main.py 가 모든 라우터 모듈을 import → pydub, LangGraph, OpenAI 클라이언트, Neo4j 드라이버 등
+      서비스 의존성이 첫 요청 전에 전부 로딩됨
+    - API 레플리카 스케일아웃 / 워커 재시작마다 이 import 비용을 기동 시간으로 지불
+
+방식:
+    - 라우터는 RouterSpec(모듈 경로 + 담당 경로 prefix)으로만 선언 (모듈 import 없음)
+    - LazyRouterMiddleware 가 요청 경로를 담당하는 라우터만 워커 스레드에서 import 후 등록
+      (선언되지 않은 경로 / OpenAPI 스키마 요청은 전체 로딩 → 404 판정 전 라우트 누락 없음)
+    - 등록 순서는 로딩 순서와 무관하게 항상 선언 순서 (겹치는 경로의 매칭 우선순위 보존)
+    - 라우트 리스트는 통째로 재바인딩 → 진행 중인 요청 매칭은 이전 리스트로 안전하게 계속
+
+사용 예시:
+    loader = LazyRouterLoader(app, ROUTER_SPECS, mount_prefix="/api/v1")
+    app.add_middleware(LazyRouterMiddleware, loader=loader)
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter, FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """지연 로딩 라우터 선언"""
+    module: str                          # 예: "app.api.v1.audio"
+    paths: Tuple[str, ...]               # 담당 경로 prefix (mount_prefix 기준, 라우터 내부 prefix 포함)
+    prefix: str = ""                     # include_router prefix
+    tags: Optional[Tuple[str, ...]] = None
+    attr: str = "router"
+
+    @property
+    def name(self) -> str:
+        return self.module.rsplit(".", 1)[-1]
+
+    def owns(self, subpath: str) -> bool:
+        return any(subpath == p or subpath.startswith(p.rstrip("/") + "/") for p in self.paths)
+
+
+class LazyRouterLoader:
+    """RouterSpec 목록을 필요한 만큼만 import 해 앱에 등록"""
+
+    def __init__(self, app: FastAPI, specs: Sequence[RouterSpec], mount_prefix: str = ""):
+        """
+        Args:
+            app: 라우트를 등록할 FastAPI 앱
+            specs: 라우터 선언 (등록 순서 = 선언 순서)
+            mount_prefix: 모든 라우터 공통 prefix (예: "/api/v1")
+        """
+        self.app = app
+        self.specs = list(specs)
+        self.mount_prefix = mount_prefix.rstrip("/")
+
+        self._routes: Dict[str, List[Any]] = {}
+        self._installed: set = set()
+        self._load_seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()  # 워커 스레드 / 프리로드 스레드 간 중복 import 방지
+
+    @property
+    def fully_loaded(self) -> bool:
+        return len(self._routes) == len(self.specs)
+
+    def specs_for_path(self, path: str) -> List[RouterSpec]:
+        """요청 경로 처리에 필요한 (아직 로딩되지 않은) 라우터"""
+        if path == self.app.openapi_url:
+            wanted = self.specs
+        elif path == self.mount_prefix or path.startswith(self.mount_prefix + "/"):
+            subpath = path[len(self.mount_prefix):] or "/"
+            # 어떤 선언에도 속하지 않는 경로 → 전체 로딩 후 라우터가 404 판정
+            wanted = [spec for spec in self.specs if spec.owns(subpath)] or self.specs
+        else:
+            return []
+        return [spec for spec in wanted if spec.module not in self._routes]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 로딩
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _build(self, spec: RouterSpec) -> List[Any]:
+        module = importlib.import_module(spec.module)
+        holder = APIRouter()
+        holder.include_router(
+            getattr(module, spec.attr),
+            prefix=self.mount_prefix + spec.prefix,
+            tags=list(spec.tags) if spec.tags else None,
+        )
+        return holder.routes
+
+    def load(self, specs: Optional[Iterable[RouterSpec]] = None) -> int:
+        """라우터 import + 등록 (이미 로딩된 것은 건너뜀). 새로 로딩한 개수 반환"""
+        pending = [spec for spec in (self.specs if specs is None else specs) if spec.module not in self._routes]
+        if not pending:
+            return 0
+
+        loaded = 0
+        with self._lock:
+            try:
+                for spec in pending:
+                    if spec.module in self._routes:
+                        continue
+                    started = time.perf_counter()
+                    self._routes[spec.module] = self._build(spec)
+                    elapsed = time.perf_counter() - started
+                    self._load_seconds[spec.name] = round(elapsed, 4)
+                    loaded += 1
+                    logger.info(f"Loaded router {spec.name} in {elapsed:.3f}s")
+            finally:
+                if loaded:
+                    self._install()
+        return loaded
+
+    def _install(self) -> None:
+        lazy_routes = [route for spec in self.specs for route in self._routes.get(spec.module, ())]
+        base_routes = [route for route in self.app.router.routes if id(route) not in self._installed]
+        self._installed = {id(route) for route in lazy_routes}
+        # 재바인딩 (in-place 수정 아님) — 동시에 매칭 중인 요청은 이전 리스트를 끝까지 순회
+        self.app.router.routes = base_routes + lazy_routes
+        self.app.openapi_schema = None
+
+    def start_preload(self) -> threading.Thread:
+        """남은 라우터를 백그라운드 스레드에서 로딩 (요청 수신은 즉시 시작)"""
+        thread = threading.Thread(target=self._preload, name="router-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _preload(self) -> None:
+        try:
+            count = self.load()
+            logger.info(f"Preloaded {count} routers ({sum(self._load_seconds.values()):.2f}s total)")
+        except Exception as e:
+            logger.error(f"Router preload failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": len(self._routes),
+            "total": len(self.specs),
+            "load_seconds": dict(self._load_seconds),
+        }
+
+
+class LazyRouterMiddleware:
+    """요청 경로 담당 라우터를 라우팅 전에 로딩하는 ASGI 미들웨어 (HTTP + WebSocket)"""
+
+    def __init__(self, app: Any, loader: LazyRouterLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] in ("http", "websocket") and not self.loader.fully_loaded:
+            specs = self.loader.specs_for_path(scope["path"])
+            if specs:
+                # import 는 이벤트 루프 밖에서 — 다른 요청 처리를 막지 않음
+                await asyncio.to_thread(self.loader.load, specs)
+        await self.app(scope, receive, send)
@@ -17,7 +17,8 @@ except ImportError:
 
 from app.core.config import get_settings
 from app.core.secrets import initialize_secrets
-from app.api.v1 import router as api_v1_router
+from app.api.v1 import ROUTER_SPECS as API_V1_ROUTER_SPECS
+from app.core.lazy_router import LazyRouterLoader, LazyRouterMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 from app.middleware.quota import QuotaMiddleware
@@ -164,8 +165,12 @@ register_error_handlers(app)
 
 logger.info("Security, Quota middleware and global error handlers initialized")
 
-# API 라우터 등록
-app.include_router(api_v1_router, prefix="/api/v1")
+# API 라우터 등록 (지연 로딩 — 요청 경로를 담당하는 라우터와 그 서비스 의존성만 첫 요청 시 import)
+api_v1_loader = LazyRouterLoader(app, API_V1_ROUTER_SPECS, mount_prefix="/api/v1")
+if settings.LAZY_ROUTER_LOADING:
+    app.add_middleware(LazyRouterMiddleware, loader=api_v1_loader)
+else:
+    api_v1_loader.load()
 
 # 정적 파일 마운트 (outputs 디렉토리)
 import os
@@ -173,6 +178,40 @@ os.makedirs("outputs", exist_ok=True)
 app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
 
 
+@app.on_event("startup")
+async def preload_api_routers():
+    """ROUTER_PRELOAD_ON_STARTUP — 요청 수신은 바로 시작하고 남은 라우터는 백그라운드에서 로딩"""
+    if settings.LAZY_ROUTER_LOADING and settings.ROUTER_PRELOAD_ON_STARTUP:
+        api_v1_loader.start_preload()
+
+
+@app.on_event("startup")
+async def warm_start_duration_model():
+    """시간 예측 모델을 저장된 학습 통계로 초기화 (요청 경로에서 DB 조회 없음)"""
+    import asyncio
+    from app.services.duration_model import get_duration_model
+
+    await asyncio.to_thread(get_duration_model)
+
+
+@app.on_event("shutdown")
+async def flush_duration_model():
+    """대기 중인 시간 예측 학습 데이터 기록"""
+    import asyncio
+    from app.services.duration_model import get_duration_model
+
+    await asyncio.to_thread(get_duration_model().stop)
+
+
+@app.on_event("shutdown")
+async def flush_audit_events():
+    """대기 중인 감사 로그 기록"""
+    import asyncio
+    from app.services.audit_writer import get_audit_writer
+
+    await asyncio.to_thread(get_audit_writer().stop)
+
+
 # 커스텀 Swagger UI (Stripe 스타일)
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
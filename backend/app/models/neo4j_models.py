@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from enum import Enum
 import uuid
 
+from app.models.pagination import decode_cursor
+
 
 # ==================== Enums ====================
 
@@ -838,15 +840,101 @@ class Neo4jCRUDManager:
             return row
         return None
 
-    def get_user_projects(self, user_id: str, status: Optional[ProjectStatus] = None) -> List[Dict]:
-        """사용자의 프로젝트 목록 조회"""
+    def get_project_owner_id(self, project_id: str) -> Optional[str]:
+        """프로젝트 소유자 user_id (OWNS 관계가 없으면 None)"""
         query = """
-        MATCH (u:User {user_id: $user_id})-[:OWNS]->(proj:Project)
+        MATCH (u:User)-[:OWNS]->(proj:Project {project_id: $project_id})
+        RETURN u.user_id as user_id
+        LIMIT 1
+        """
+        result = self.client.query(query, {"project_id": project_id})
+        return result[0]["user_id"] if result else None
+
+    @staticmethod
+    def _keyset_clause(
+        alias: str,
+        id_field: str,
+        cursor: Optional[str],
+        params: Dict,
+        sort_field: str = "created_at"
+    ) -> str:
         """
+        cursor 이후 항목만 남기는 WHERE 조건 (정렬 키: sort_field DESC, id DESC)
+
+        sort_field 가 created_at 이 아니면 정수 정렬 값 (스크립트 version)
 
+        Raises:
+            ValueError: 잘못된 cursor
+        """
+        if not cursor:
+            return ""
+        if sort_field != "created_at":
+            params["cursor_sort"], params["cursor_id"] = decode_cursor(cursor, sort_type=int)
+            return (
+                f"({alias}.{sort_field} < $cursor_sort "
+                f"OR ({alias}.{sort_field} = $cursor_sort "
+                f"AND {alias}.{id_field} < $cursor_id))"
+            )
+        params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+        return (
+            f"({alias}.created_at < datetime($cursor_created_at) "
+            f"OR ({alias}.created_at = datetime($cursor_created_at) "
+            f"AND {alias}.{id_field} < $cursor_id))"
+        )
+
+    @staticmethod
+    def _page_clause(skip: int, limit: Optional[int], params: Dict) -> str:
+        """SKIP/LIMIT 절 (limit 미지정 시 전체)"""
+        clause = ""
+        if skip:
+            clause += "SKIP $skip "
+            params["skip"] = skip
+        if limit is not None:
+            clause += "LIMIT $limit "
+            params["limit"] = limit
+        return clause
+
+    def get_user_projects(
+        self,
+        user_id: str,
+        status: Optional[ProjectStatus] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        사용자의 프로젝트 목록 조회 (최신순)
+
+        페이지 범위는 Neo4j 에서 잘라서 가져온다. cursor 가 있으면 keyset, 없으면 SKIP/LIMIT.
+
+        Args:
+            user_id: 사용자 ID
+            status: 상태 필터
+            skip: 건너뛸 개수 (cursor 와 함께 쓰지 않음)
+            limit: 최대 개수 (None 이면 전체)
+            cursor: 직전 페이지의 next_cursor
+        """
+        params: Dict[str, Any] = {"user_id": user_id}
+        conditions = []
         if status:
-            query += "WHERE proj.status = $status "
+            conditions.append("proj.status = $status")
+            params["status"] = status.value
+        keyset = self._keyset_clause("proj", "project_id", cursor, params)
+        if keyset:
+            conditions.append(keyset)
 
+        query = """
+        MATCH (u:User {user_id: $user_id})-[:OWNS]->(proj:Project)
+        """
+        if conditions:
+            query += "WHERE " + " AND ".join(conditions) + " "
+
+        # 페이지 범위를 먼저 자른 뒤 페르소나 조인 (페이지 밖 프로젝트는 조인하지 않음)
+        query += """
+        WITH proj
+        ORDER BY proj.created_at DESC, proj.project_id DESC
+        """
+        query += self._page_clause(skip, limit, params)
         query += """
         OPTIONAL MATCH (proj)-[:USES_PERSONA]->(p:Persona)
         RETURN proj.project_id as project_id,
@@ -857,13 +945,9 @@ class Neo4jCRUDManager:
                proj.created_at as created_at,
                proj.updated_at as updated_at,
                p.persona_id as persona_id
-        ORDER BY proj.created_at DESC
+        ORDER BY proj.created_at DESC, proj.project_id DESC
         """
 
-        params = {"user_id": user_id}
-        if status:
-            params["status"] = status.value
-
         results = self.client.query(query, params)
         # Neo4j DateTime을 Python datetime으로 변환
         for row in results:
@@ -873,6 +957,20 @@ class Neo4jCRUDManager:
                 row['updated_at'] = row['updated_at'].to_native()
         return results
 
+    def count_user_projects(self, user_id: str, status: Optional[ProjectStatus] = None) -> int:
+        """사용자의 프로젝트 개수 (노드 속성을 읽지 않는 count 전용 쿼리)"""
+        query = """
+        MATCH (u:User {user_id: $user_id})-[:OWNS]->(proj:Project)
+        """
+        params: Dict[str, Any] = {"user_id": user_id}
+        if status:
+            query += "WHERE proj.status = $status "
+            params["status"] = status.value
+        query += "RETURN count(proj) as total"
+
+        result = self.client.query(query, params)
+        return result[0]["total"] if result else 0
+
     def update_project_status(self, project_id: str, status: ProjectStatus) -> bool:
         """프로젝트 상태 업데이트"""
         query = """
@@ -929,10 +1027,30 @@ class Neo4jCRUDManager:
             return row
         return {}
 
-    def get_project_scripts(self, project_id: str) -> List[Dict]:
-        """프로젝트의 모든 스크립트 조회"""
+    def get_project_scripts(
+        self,
+        project_id: str,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        프로젝트의 스크립트 조회 (버전 내림차순)
+
+        Args:
+            project_id: 프로젝트 ID
+            skip: 건너뛸 개수 (cursor 와 함께 쓰지 않음)
+            limit: 최대 개수 (None 이면 전체)
+            cursor: 직전 페이지의 next_cursor (version, script_id 기준)
+        """
+        params: Dict[str, Any] = {"project_id": project_id}
         query = """
         MATCH (proj:Project {project_id: $project_id})-[r:HAS_SCRIPT]->(s:Script)
+        """
+        keyset = self._keyset_clause("s", "script_id", cursor, params, sort_field="version")
+        if keyset:
+            query += f"WHERE {keyset} "
+        query += """
         RETURN s.script_id as script_id,
                s.content as content,
                s.platform as platform,
@@ -941,15 +1059,26 @@ class Neo4jCRUDManager:
                s.version as version,
                s.created_at as created_at,
                r.selected as selected
-        ORDER BY s.version DESC
+        ORDER BY s.version DESC, s.script_id DESC
         """
-        results = self.client.query(query, {"project_id": project_id})
+        query += self._page_clause(skip, limit, params)
+
+        results = self.client.query(query, params)
         # Neo4j DateTime을 Python datetime으로 변환
         for row in results:
             if row.get('created_at'):
                 row['created_at'] = row['created_at'].to_native()
         return results
 
+    def count_project_scripts(self, project_id: str) -> int:
+        """프로젝트의 스크립트 개수"""
+        query = """
+        MATCH (proj:Project {project_id: $project_id})-[:HAS_SCRIPT]->(s:Script)
+        RETURN count(s) as total
+        """
+        result = self.client.query(query, {"project_id": project_id})
+        return result[0]["total"] if result else 0
+
     def select_script(self, project_id: str, script_id: str) -> bool:
         """스크립트 선택 (다른 스크립트는 선택 해제)"""
         query = """
@@ -1035,10 +1164,30 @@ class Neo4jCRUDManager:
         result = self.client.query(query, params)
         return result[0] if result else {}
 
-    def get_project_videos(self, project_id: str) -> List[Dict]:
-        """프로젝트의 모든 비디오 조회"""
+    def get_project_videos(
+        self,
+        project_id: str,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        프로젝트의 비디오 조회 (최신순)
+
+        Args:
+            project_id: 프로젝트 ID
+            skip: 건너뛸 개수 (cursor 와 함께 쓰지 않음)
+            limit: 최대 개수 (None 이면 전체)
+            cursor: 직전 페이지의 next_cursor
+        """
+        params: Dict[str, Any] = {"project_id": project_id}
         query = """
         MATCH (proj:Project {project_id: $project_id})-[:HAS_VIDEO]->(v:Video)
+        """
+        keyset = self._keyset_clause("v", "video_id", cursor, params)
+        if keyset:
+            query += f"WHERE {keyset} "
+        query += """
         RETURN v.video_id as video_id,
                v.file_path as file_path,
                v.duration as duration,
@@ -1047,9 +1196,25 @@ class Neo4jCRUDManager:
                v.veo_prompt as veo_prompt,
                v.lipsync_enabled as lipsync_enabled,
                v.created_at as created_at
-        ORDER BY v.created_at DESC
+        ORDER BY v.created_at DESC, v.video_id DESC
+        """
+        query += self._page_clause(skip, limit, params)
+
+        results = self.client.query(query, params)
+        # Neo4j DateTime을 Python datetime으로 변환
+        for row in results:
+            if hasattr(row.get('created_at'), 'to_native'):
+                row['created_at'] = row['created_at'].to_native()
+        return results
+
+    def count_project_videos(self, project_id: str) -> int:
+        """프로젝트의 비디오 개수"""
+        query = """
+        MATCH (proj:Project {project_id: $project_id})-[:HAS_VIDEO]->(v:Video)
+        RETURN count(v) as total
         """
-        return self.client.query(query, {"project_id": project_id})
+        result = self.client.query(query, {"project_id": project_id})
+        return result[0]["total"] if result else 0
 
     # ==================== Metrics CRUD ====================
 
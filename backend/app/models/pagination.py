@@ -0,0 +1,62 @@
+"""
+목록 조회 페이지네이션 공통 유틸
+
+keyset(cursor) 페이지네이션:
+    - 정렬 키 = (created_at DESC, id DESC) — 스크립트는 (version DESC, id DESC)
+    - cursor = 직전 페이지 마지막 항목의 (정렬 값, id) 를 base64 로 인코딩한 불투명 문자열
+    - 다음 페이지는 "정렬 키가 cursor 보다 작은 항목"부터 LIMIT 건 → SKIP 없이 인덱스 범위 스캔
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple, Type
+
+
+# 목록 개수(count) 캐시 TTL — 생성/삭제 시 무효화하므로 짧게 유지
+COUNT_CACHE_TTL_SECONDS = 60
+
+
+def encode_cursor(created_at: Any, item_id: str) -> str:
+    """(created_at 또는 정렬 값, id) → cursor 문자열"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps([str(created_at), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: Type = datetime) -> Tuple[Any, str]:
+    """
+    cursor 문자열 → (정렬 값, id)
+
+    Args:
+        cursor: encode_cursor 결과
+        sort_type: datetime 이면 created_at ISO 문자열 그대로, int 면 정수로 변환 (스크립트 version)
+
+    Raises:
+        ValueError: 형식이 잘못된 cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if sort_type is datetime:
+            datetime.fromisoformat(sort_value)
+        else:
+            sort_value = sort_type(sort_value)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    return sort_value, str(item_id)
+
+
+def next_cursor(
+    items: list,
+    limit: Optional[int],
+    id_field: str,
+    sort_field: str = "created_at"
+) -> Optional[str]:
+    """가져온 항목 수가 limit 과 같으면 마지막 항목 기준 다음 cursor, 아니면 None"""
+    if not items or limit is None or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last[sort_field], last[id_field])
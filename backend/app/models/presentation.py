@@ -16,6 +16,7 @@ class TransitionEffect(str, Enum):
 
 class PresentationStatus(str, Enum):
     """프리젠테이션 상태"""
+    INGESTING = "ingesting"  # PDF 슬라이드 변환/OCR 진행 중
     UPLOADED = "uploaded"  # PDF 업로드 완료
     SCRIPT_GENERATED = "script_generated"  # 스크립트 생성 완료
     AUDIO_GENERATED = "audio_generated"  # 오디오 생성 완료
@@ -47,6 +48,7 @@ class GenerateScriptRequest(BaseModel):
         False,
         description="슬라이드 번호 포함 여부"
     )
+    voice_id: Optional[str] = Field(None, description="나레이션 음성 ID (분량 예측 보정, 없으면 언어 기본값)")
 
 
 class GenerateAudioRequest(BaseModel):
@@ -177,6 +179,7 @@ class PresentationListResponse(BaseModel):
     total: int = Field(..., description="전체 개수")
     page: int = Field(..., description="현재 페이지")
     page_size: int = Field(..., description="페이지 크기")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 None)")
 
 
 # ==================== Internal Models (Neo4j) ====================
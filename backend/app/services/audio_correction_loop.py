@@ -1,5 +1,6 @@
 """Zero-Fault Audio Correction Loop - TTS → STT → 검증 → 재생성"""
-from typing import Optional, Dict
+import asyncio
+from typing import Optional, Dict, List
 from difflib import SequenceMatcher
 import re
 import logging
@@ -29,6 +30,38 @@ except Exception:
     LOGFIRE_AVAILABLE = False
 
 
+# 문장 단위 모드 — 문장 종결 부호(., !, ?, 。 등) 또는 줄바꿈 기준 분할
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+MIN_SENTENCE_CHARS = 8  # 이보다 짧은 문장은 앞 문장에 붙임 (TTS 호출 과다 방지)
+
+
+def split_sentences(text: str, min_chars: int = MIN_SENTENCE_CHARS) -> List[str]:
+    """
+    문장 단위 모드용 문장 분할
+
+    Args:
+        text: 원본 텍스트
+        min_chars: 최소 문장 길이 (짧은 조각은 앞 문장에 병합)
+
+    Returns:
+        공백 정리된 문장 리스트 (원문 순서 유지)
+    """
+    sentences: List[str] = []
+    for piece in _SENTENCE_BOUNDARY.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if sentences and len(piece) < min_chars:
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    # 첫 문장이 너무 짧으면 다음 문장과 병합
+    if len(sentences) > 1 and len(sentences[0]) < min_chars:
+        sentences[1] = f"{sentences[0]} {sentences[1]}"
+        sentences.pop(0)
+    return sentences
+
+
 class AudioCorrectionLoop:
     """
     Zero-Fault Audio 시스템
@@ -170,6 +203,7 @@ class AudioCorrectionLoop:
         voice_id: Optional[str] = None,
         language: str = "ko",
         save_file: bool = True,
+        sentence_mode: bool = False,
         **tts_kwargs
     ) -> Dict:
         """
@@ -180,6 +214,7 @@ class AudioCorrectionLoop:
             voice_id: 음성 ID
             language: 언어 코드
             save_file: 파일로 저장 여부
+            sentence_mode: True면 문장 단위 생성/검증 (실패 문장만 재생성)
             **tts_kwargs: TTS에 전달할 추가 파라미터
 
         Returns:
@@ -194,6 +229,18 @@ class AudioCorrectionLoop:
                 "iterations": [각 시도별 상세 정보]
             }
         """
+        if sentence_mode:
+            if PYDUB_AVAILABLE and len(split_sentences(text)) > 1:
+                return await self.generate_verified_audio_by_sentence(
+                    text=text,
+                    voice_id=voice_id,
+                    language=language,
+                    save_file=save_file,
+                    **tts_kwargs
+                )
+            if not PYDUB_AVAILABLE:
+                self.logger.warning("pydub not available, falling back to full-text loop")
+
         span_context = logfire.span("audio_correction_loop.generate") if LOGFIRE_AVAILABLE else nullcontext()
         with span_context as main_span:
             # 1. 텍스트 정규화 (한국어 숫자 변환)
@@ -375,6 +422,272 @@ class AudioCorrectionLoop:
                 "warning": f"Could not achieve target accuracy ({self.accuracy_threshold:.0%})"
             }
 
+    # ─────────────────────────────────────────────────────────────────────
+    # 문장 단위 모드 — 실패 문장만 재생성
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def _verify_sentence_once(
+        self,
+        sentence: str,
+        voice_id: Optional[str],
+        language: str,
+        state: Dict,
+        **tts_kwargs
+    ) -> None:
+        """문장 1개 TTS → STT → 유사도 (state에 최고 결과 누적)"""
+        tts_text = sentence
+        if self.enable_normalization and language == "ko":
+            tts_text, _ = self.normalizer.normalize_script(sentence)
+
+        audio_bytes = await self.tts.generate_audio(text=tts_text, voice_id=voice_id, **tts_kwargs)
+        transcribed = await self.stt.transcribe(audio_bytes=audio_bytes, language=language)
+        similarity = self.calculate_similarity(sentence, transcribed)
+
+        state["attempts"] += 1
+        state["iterations"].append({
+            "attempt": state["attempts"],
+            "similarity": similarity,
+            "transcribed_text": transcribed,
+        })
+        if state["audio_bytes"] is None or similarity > state["similarity"]:
+            state.update(audio_bytes=audio_bytes, similarity=similarity, transcribed_text=transcribed)
+
+        state["passed"] = state["similarity"] >= self.accuracy_threshold
+        # 1차 시도 60% 미만 — 전체 모드와 같은 구조적 mismatch 판단, 재시도 중단
+        state["gave_up"] = state["attempts"] == 1 and similarity < 0.60
+
+    def _stitch_sentences(
+        self,
+        states: List[Dict],
+        crossfade_ms: int
+    ) -> tuple:
+        """
+        검증된 문장 오디오를 crossfade로 결합
+
+        Returns:
+            (결합 MP3 바이트, 문장별 타임스탬프, 추정 단어별 타임스탬프)
+
+        Note:
+            문장 경계는 결합 오프셋에서 계산하므로 정확하다.
+            단어 타임스탬프는 각 문장 구간 안에서 글자 수 비례로 배분한 추정치로,
+            _measure_word_timestamps 측정이 실패했을 때만 사용한다.
+        """
+        combined = None
+        sentence_timestamps = []
+        word_timestamps = []
+
+        for index, state in enumerate(states):
+            segment = AudioSegment.from_file(io.BytesIO(state["audio_bytes"]), format="mp3")
+            if combined is None:
+                start_ms = 0
+                combined = segment
+            else:
+                fade = min(crossfade_ms, len(combined), len(segment))
+                start_ms = len(combined) - fade
+                combined = combined.append(segment, crossfade=fade)
+            end_ms = start_ms + len(segment)
+
+            sentence_timestamps.append({
+                "index": index,
+                "text": state["sentence"],
+                "start": start_ms / 1000.0,
+                "end": end_ms / 1000.0,
+            })
+
+            words = state["sentence"].split()
+            total_chars = sum(len(w) for w in words) or 1
+            cursor = start_ms
+            for word in words:
+                word_ms = len(segment) * len(word) / total_chars
+                word_timestamps.append({
+                    "word": word,
+                    "start": round(cursor / 1000.0, 3),
+                    "end": round((cursor + word_ms) / 1000.0, 3),
+                    "sentence_index": index,
+                })
+                cursor += word_ms
+
+        buffer = io.BytesIO()
+        combined.export(buffer, format="mp3")
+        return buffer.getvalue(), sentence_timestamps, word_timestamps
+
+    async def _measure_word_timestamps(
+        self,
+        audio_bytes: bytes,
+        language: str,
+        sentence_timestamps: List[Dict]
+    ) -> Optional[List[Dict]]:
+        """
+        결합 오디오의 단어 타임스탬프를 Whisper로 측정
+
+        Returns:
+            [{"word", "start", "end", "sentence_index"}] 또는 None (측정 실패)
+            sentence_index는 단어 중앙 시점이 속한 문장 구간으로 정한다.
+        """
+        try:
+            result = await self.stt.transcribe_with_timestamps(
+                audio_bytes=audio_bytes, language=language, word_timestamps=True
+            )
+        except Exception as e:
+            self.logger.warning(f"Word timestamp measurement failed, using estimates: {e}")
+            return None
+
+        word_timestamps = []
+        for word in result.get("words", []):
+            midpoint = (word["start"] + word["end"]) / 2
+            sentence_index = next(
+                (st["index"] for st in sentence_timestamps if midpoint < st["end"]),
+                sentence_timestamps[-1]["index"],
+            )
+            word_timestamps.append({
+                "word": word["word"].strip(),
+                "start": round(word["start"], 3),
+                "end": round(word["end"], 3),
+                "sentence_index": sentence_index,
+            })
+        return word_timestamps
+
+    async def generate_verified_audio_by_sentence(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        language: str = "ko",
+        save_file: bool = True,
+        concurrency: int = 4,
+        crossfade_ms: int = 30,
+        **tts_kwargs
+    ) -> Dict:
+        """
+        문장 단위 Zero-Fault Loop
+
+        1. 문장 분할 → 문장별 TTS/STT 검증 (동시 concurrency개)
+        2. 임계값 미달 문장만 다음 라운드에서 재생성 (최대 max_attempts 라운드)
+        3. 문장별 최고 결과를 crossfade로 결합 + 문장 타임스탬프 생성
+        4. 결합 오디오를 Whisper word 타임스탬프로 한 번 더 전사해 단어 타이밍 측정
+
+        긴 스크립트에서 한 문장만 틀려도 전체를 다시 만드는 대신
+        해당 문장 1개의 TTS/STT 비용만 추가된다.
+
+        Returns:
+            generate_verified_audio와 동일한 키 +
+            {"mode": "sentence", "sentences", "sentence_timestamps", "word_timestamps",
+             "word_timestamps_source", "tts_calls"}
+            word_timestamps_source: "stt" (결합 오디오 Whisper 측정) | "estimated" (측정 실패 시 글자 수 비례 추정)
+        """
+        span_context = logfire.span("audio_correction_loop.generate_by_sentence") if LOGFIRE_AVAILABLE else nullcontext()
+        with span_context as main_span:
+            sentences = split_sentences(text)
+            states = [
+                {
+                    "sentence": sentence,
+                    "attempts": 0,
+                    "audio_bytes": None,
+                    "similarity": 0.0,
+                    "transcribed_text": "",
+                    "passed": False,
+                    "gave_up": False,
+                    "iterations": [],
+                }
+                for sentence in sentences
+            ]
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def run(state: Dict) -> None:
+                async with semaphore:
+                    await self._verify_sentence_once(
+                        state["sentence"], voice_id, language, state, **tts_kwargs
+                    )
+
+            for round_no in range(1, self.max_attempts + 1):
+                pending = [st for st in states if not st["passed"] and not st["gave_up"]]
+                if not pending:
+                    break
+                self.logger.info(
+                    f"🔄 Sentence round {round_no}/{self.max_attempts}: "
+                    f"{len(pending)}/{len(states)} sentences"
+                )
+                await asyncio.gather(*(run(st) for st in pending))
+
+            tts_calls = sum(st["attempts"] for st in states)
+            failed = [i for i, st in enumerate(states) if not st["passed"]]
+
+            audio_bytes, sentence_timestamps, estimated_words = self._stitch_sentences(states, crossfade_ms)
+            word_timestamps = await self._measure_word_timestamps(audio_bytes, language, sentence_timestamps)
+            word_timestamps_source = "stt"
+            if word_timestamps is None:
+                word_timestamps, word_timestamps_source = estimated_words, "estimated"
+
+            transcribed = " ".join(st["transcribed_text"] for st in states)
+            final_similarity = self.calculate_similarity(text, transcribed)
+
+            if LOGFIRE_AVAILABLE:
+                main_span.set_attribute("sentence_count", len(states))
+                main_span.set_attribute("tts_calls", tts_calls)
+                main_span.set_attribute("failed_sentences", len(failed))
+
+            self.logger.info(
+                f"{'✅' if not failed else '⚠️'} Sentence mode: {len(states) - len(failed)}/{len(states)} verified, "
+                f"{tts_calls} TTS calls (full-text equivalent: {len(states)}), "
+                f"similarity {final_similarity:.2%}"
+            )
+
+            if not failed and self.enable_learning and self.learning_system:
+                actual_duration = sentence_timestamps[-1]["end"] if sentence_timestamps else None
+                if actual_duration:
+                    try:
+                        self.learning_system.record_prediction(
+                            text=text,
+                            language=language,
+                            actual_duration=actual_duration,
+                            platform=tts_kwargs.get("platform"),
+                            voice_id=voice_id
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Failed to record learning data: {e}")
+
+            audio_path = None
+            if save_file:
+                audio_path = await self.tts.save_audio(audio_bytes=audio_bytes, text=text)
+
+            if not failed:
+                status = "success"
+            elif final_similarity > 0.8:
+                status = "partial_success"
+            else:
+                status = "failed"
+
+            result = {
+                "status": status,
+                "mode": "sentence",
+                "audio_path": audio_path,
+                "attempts": max(st["attempts"] for st in states),
+                "tts_calls": tts_calls,
+                "final_similarity": final_similarity,
+                "original_text": text,
+                "transcribed_text": transcribed,
+                "sentences": [
+                    {
+                        "index": i,
+                        "text": st["sentence"],
+                        "attempts": st["attempts"],
+                        "similarity": st["similarity"],
+                        "passed": st["passed"],
+                        "iterations": st["iterations"],
+                    }
+                    for i, st in enumerate(states)
+                ],
+                "sentence_timestamps": sentence_timestamps,
+                "word_timestamps": word_timestamps,
+                "word_timestamps_source": word_timestamps_source,
+                "iterations": [it for st in states for it in st["iterations"]],
+            }
+            if failed:
+                result["warning"] = (
+                    f"{len(failed)} sentence(s) below target accuracy "
+                    f"({self.accuracy_threshold:.0%}): {failed}"
+                )
+            return result
+
     async def batch_generate(
         self,
         texts: list[str],
@@ -0,0 +1,301 @@
+"""
+Audio Cut Engine — 단일 디코드 / 단일 인코드 구간 제거
+
+무음 제거(remove_silence_task)와 필러 워드 제거(remove_fillers_task)가 공유하는 엔진.
+
+기존 방식의 문제:
+    - 무음 제거: silencedetect 패스 + silenceremove 패스 + ffprobe 재측정 (디코드 3회)
+    - 필러 제거: aselect='1*not(between(t,a,b))*...' — 샘플마다 N개 항을 평가하므로
+      필러가 수백 개인 긴 팟캐스트에서 O(샘플 × 필러) 로 느려짐
+
+현재 방식:
+    1. ffmpeg 로 한 번만 디코드 → raw PCM 파일 (np.memmap 으로 매핑, 메모리 상주 X)
+    2. 무음 구간 / 필러 구간을 샘플 단위로 계산 (numpy 벡터 연산, 청크 단위)
+    3. 제거 구간을 병합 → 유지 구간만 ffmpeg stdin 으로 흘려 한 번만 인코딩
+    4. 길이는 샘플 수로 계산 (ffprobe 재측정 없음)
+
+컷 경계에는 짧은 페이드(기본 5ms)를 적용해 파형 불연속으로 인한 클릭 노이즈를 막는다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.ffmpeg_profile import (
+    IOS_SAFE_AUDIO_SAMPLE_RATE,
+    ios_safe_audio_encoder_args,
+    ios_safe_pcm_args,
+)
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_RATE = int(IOS_SAFE_AUDIO_SAMPLE_RATE)
+DEFAULT_CHANNELS = 2
+PCM_FULL_SCALE = 32768.0
+OUTPUT_SUFFIX = ".m4a"
+
+# 청크 크기 (샘플) — 분석/인코딩 모두 이 단위로 memmap 을 읽는다
+CHUNK_SAMPLES = SAMPLE_RATE * 10
+
+SampleRange = Tuple[int, int]
+
+
+@dataclass
+class CutResult:
+    """구간 제거 결과"""
+    output_path: str
+    original_duration: float
+    new_duration: float
+    removed_segments: List[Dict[str, float]] = field(default_factory=list)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 구간 계산 (순수 numpy)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def detect_silence(
+    samples: np.ndarray,
+    threshold_db: float,
+    min_silence_duration: float,
+    sample_rate: int = SAMPLE_RATE,
+    chunk_samples: int = CHUNK_SAMPLES,
+) -> List[SampleRange]:
+    """
+    무음 구간 감지 (샘플 단위, peak 기준)
+
+    어느 채널이든 |x| 가 임계값을 넘는 샘플을 "소리"로 보고, 소리 샘플 사이의
+    간격이 min_silence_duration 이상이면 무음 구간으로 반환한다.
+    앞부분 무음은 길이와 관계없이 제거 대상 (기존 silenceremove start_periods=1 과 동일).
+
+    Args:
+        samples: (n, channels) int16 PCM
+        threshold_db: 무음 기준 (dBFS)
+        min_silence_duration: 최소 무음 길이 (초)
+
+    Returns:
+        [(start_sample, end_sample)] — end 는 exclusive
+    """
+    total = len(samples)
+    threshold = PCM_FULL_SCALE * 10 ** (threshold_db / 20.0)
+    min_samples = max(1, int(round(min_silence_duration * sample_rate)))
+
+    ranges: List[SampleRange] = []
+    last_loud = -1
+    for start in range(0, total, chunk_samples):
+        block = np.asarray(samples[start:start + chunk_samples])
+        if block.ndim == 1:
+            block = block[:, None]
+        loud = np.flatnonzero(np.abs(block.astype(np.int32)).max(axis=1) > threshold)
+        if loud.size == 0:
+            continue
+
+        bounds = np.concatenate(([last_loud], loud + start))
+        gaps = np.diff(bounds) - 1
+        is_silence = gaps >= min_samples
+        if last_loud < 0:
+            is_silence[0] = gaps[0] > 0
+        for i in np.flatnonzero(is_silence):
+            ranges.append((int(bounds[i]) + 1, int(bounds[i + 1])))
+        last_loud = int(bounds[-1])
+
+    tail = total - last_loud - 1
+    if tail > 0 and (tail >= min_samples or last_loud < 0):
+        ranges.append((last_loud + 1, total))
+    return ranges
+
+
+def seconds_to_ranges(
+    segments: Iterable[Tuple[float, float]],
+    total_samples: int,
+    sample_rate: int = SAMPLE_RATE,
+) -> List[SampleRange]:
+    """(start, end) 초 구간 → 샘플 구간 (범위 밖은 잘라냄, 빈 구간 제외)"""
+    ranges = []
+    for start, end in segments:
+        s = min(max(int(round(float(start) * sample_rate)), 0), total_samples)
+        e = min(max(int(round(float(end) * sample_rate)), 0), total_samples)
+        if e > s:
+            ranges.append((s, e))
+    return ranges
+
+
+def merge_ranges(ranges: Iterable[SampleRange]) -> List[SampleRange]:
+    """겹치거나 맞닿은 구간 병합 (정렬된 결과)"""
+    merged: List[SampleRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def keep_ranges(total_samples: int, cut_ranges: Sequence[SampleRange]) -> List[SampleRange]:
+    """병합된 제거 구간의 여집합 — 실제로 인코딩할 구간"""
+    keep: List[SampleRange] = []
+    cursor = 0
+    for start, end in cut_ranges:
+        if start > cursor:
+            keep.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < total_samples:
+        keep.append((cursor, total_samples))
+    return keep
+
+
+def iter_kept_blocks(
+    samples: np.ndarray,
+    keep: Sequence[SampleRange],
+    fade_samples: int = 0,
+    chunk_samples: int = CHUNK_SAMPLES,
+):
+    """
+    유지 구간을 청크 단위로 산출 (int16, (n, channels))
+
+    컷이 일어난 경계(파일 시작/끝 제외)에는 fade_samples 길이의 선형 페이드를 적용한다.
+    """
+    total = len(samples)
+    for start, end in keep:
+        fade = min(fade_samples, (end - start) // 2)
+        fade_in_until = start + fade if start > 0 else start
+        fade_out_from = end - fade if end < total else end
+
+        for block_start in range(start, end, chunk_samples):
+            block_end = min(block_start + chunk_samples, end)
+            block = np.asarray(samples[block_start:block_end])
+
+            if block_start < fade_in_until or block_end > fade_out_from:
+                positions = np.arange(block_start, block_end)
+                gain = np.ones(len(positions), dtype=np.float32)
+                if fade_in_until > start:
+                    gain = np.minimum(gain, (positions - start + 1) / (fade + 1))
+                if fade_out_from < end:
+                    gain = np.minimum(gain, (end - positions) / (fade + 1))
+                scaled = block.astype(np.float32) * gain.reshape(-1, *([1] * (block.ndim - 1)))
+                block = np.round(scaled).astype(np.int16)
+
+            yield block
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FFmpeg I/O
+# ─────────────────────────────────────────────────────────────────────────────
+
+def decode_pcm(input_path: str, raw_path: str, channels: int = DEFAULT_CHANNELS) -> np.ndarray:
+    """입력 오디오를 한 번 디코드하여 raw PCM 파일로 저장 후 memmap 으로 반환"""
+    cmd = [
+        "ffmpeg", "-y", "-v", "error", "-nostdin",
+        "-i", input_path,
+        "-vn",
+        *ios_safe_pcm_args(channels=channels),
+        raw_path,
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg decode failed: {proc.stderr.strip()[-500:]}")
+
+    if os.path.getsize(raw_path) == 0:
+        return np.zeros((0, channels), dtype=np.int16)
+    return np.memmap(raw_path, dtype=np.int16, mode="r").reshape(-1, channels)
+
+
+def encode_pcm(
+    blocks: Iterable[np.ndarray],
+    output_path: str,
+    channels: int = DEFAULT_CHANNELS,
+) -> int:
+    """PCM 블록을 ffmpeg stdin 으로 흘려 한 번에 인코딩 (AAC/48kHz). 기록한 샘플 수 반환"""
+    cmd = [
+        "ffmpeg", "-y", "-v", "error", "-nostdin",
+        *ios_safe_pcm_args(channels=channels),
+        "-i", "pipe:0",
+        *ios_safe_audio_encoder_args(include_async_filter=False),
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    written = 0
+    try:
+        for block in blocks:
+            proc.stdin.write(np.ascontiguousarray(block, dtype=np.int16).tobytes())
+            written += len(block)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    finally:
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.wait()
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg encode failed: {stderr.strip()[-500:]}")
+    return written
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 엔트리 포인트
+# ─────────────────────────────────────────────────────────────────────────────
+
+def cut_audio(
+    input_path: str,
+    output_path: Optional[str] = None,
+    *,
+    silence_threshold_db: Optional[float] = None,
+    min_silence_duration: float = 0.5,
+    cut_segments: Iterable[Tuple[float, float]] = (),
+    channels: int = DEFAULT_CHANNELS,
+    fade_ms: float = 5.0,
+) -> CutResult:
+    """
+    무음 + 지정 구간을 제거한 오디오 생성 (디코드 1회, 인코딩 1회)
+
+    Args:
+        input_path: 입력 오디오 파일
+        output_path: 출력 경로 (None 이면 임시 .m4a 생성)
+        silence_threshold_db: 무음 기준 dBFS (None 이면 무음 감지 생략)
+        min_silence_duration: 최소 무음 길이 (초)
+        cut_segments: 추가로 제거할 (start, end) 초 구간 (예: 필러 워드)
+        fade_ms: 컷 경계 페이드 길이 (ms)
+
+    Returns:
+        CutResult (removed_segments 는 병합된 실제 제거 구간, 초 단위)
+    """
+    if output_path is None:
+        temp_output = tempfile.NamedTemporaryFile(delete=False, suffix=OUTPUT_SUFFIX)
+        temp_output.close()
+        output_path = temp_output.name
+
+    with tempfile.TemporaryDirectory(prefix="audio_cut_") as workdir:
+        samples = decode_pcm(input_path, os.path.join(workdir, "decoded.pcm"), channels)
+        total = len(samples)
+
+        cuts = seconds_to_ranges(cut_segments, total)
+        if silence_threshold_db is not None:
+            cuts.extend(detect_silence(samples, silence_threshold_db, min_silence_duration))
+        cuts = merge_ranges(cuts)
+        keep = keep_ranges(total, cuts)
+
+        fade_samples = int(SAMPLE_RATE * fade_ms / 1000)
+        written = encode_pcm(iter_kept_blocks(samples, keep, fade_samples), output_path, channels)
+        del samples  # memmap 해제 후 임시 디렉토리 삭제
+
+    result = CutResult(
+        output_path=output_path,
+        original_duration=total / SAMPLE_RATE,
+        new_duration=written / SAMPLE_RATE,
+        removed_segments=[
+            {"start": round(start / SAMPLE_RATE, 3), "end": round(end / SAMPLE_RATE, 3)}
+            for start, end in cuts
+        ],
+    )
+    logger.info(
+        f"Audio cut: {result.original_duration:.2f}s → {result.new_duration:.2f}s "
+        f"({len(cuts)} ranges removed)"
+    )
+    return result
@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 import logging
+from app.services.audit_writer import get_audit_writer
 from app.services.neo4j_client import Neo4jClient
 from app.core.config import get_settings
 
@@ -191,46 +192,20 @@ async def log_security_event(
 
 async def save_audit_event(event: AuditEvent) -> bool:
     """
-    감사 로그를 Neo4j에 저장
+    감사 로그 저장 접수
+
+    요청 경로에서는 AuditWriter 큐에 적재만 하고 즉시 반환한다.
+    Neo4j 기록은 백그라운드 스레드가 UNWIND 배치로 수행하며,
+    그래프 장애 시에는 로컬 스풀에 보존했다가 회복 후 재기록한다.
 
     Args:
         event: 감사 이벤트
 
     Returns:
-        저장 성공 여부
+        접수 성공 여부 (큐 또는 스풀에 보존됨)
     """
     try:
-        query = """
-        CREATE (e:AuditEvent {
-            event_id: $event_id,
-            event_type: $event_type,
-            user_id: $user_id,
-            email: $email,
-            ip_address: $ip_address,
-            user_agent: $user_agent,
-            resource_type: $resource_type,
-            resource_id: $resource_id,
-            action: $action,
-            status: $status,
-            reason: $reason,
-            details: $details,
-            timestamp: datetime($timestamp)
-        })
-        """
-
-        # 사용자와 연결
-        if event.user_id:
-            query += """
-            WITH e
-            MATCH (u:User {user_id: $user_id})
-            CREATE (u)-[:PERFORMED]->(e)
-            """
-
-        query += "RETURN e.event_id as event_id"
-
-        result = neo4j_client.query(query, event.to_dict())
-        return len(result) > 0
-
+        return get_audit_writer().submit(event.to_dict())
     except Exception as e:
         logger.error(f"Failed to save audit event: {e}")
         return False
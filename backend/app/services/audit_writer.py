@@ -0,0 +1,293 @@
+"""AuditWriter - 감사 로그 비동기 배치 기록기
+
+배경:
+    - save_audit_event 가 감사 대상 요청마다 동기 Neo4j 세션 + CREATE 1회 실행
+      → 모든 변경 API 호출의 응답 경로에 그래프 왕복 1회가 추가됨
+
+구조:
+    - 요청 경로는 이벤트를 프로세스 내 bounded 큐에 넣기만 한다 (네트워크 I/O 없음)
+    - 백그라운드 스레드가 큐를 비우며 batch_size 건 또는 flush_interval 초 중
+      먼저 도달한 조건에서 UNWIND 배치 1회로 기록
+    - 그래프 기록 실패 시 로컬 append-only JSONL 스풀에 보존하고 RETRY_SECONDS 동안은
+      그래프를 건너뛰어 스풀로 직행 (장애 중 배치마다 타임아웃 대기 방지)
+    - 그래프가 회복되면 스풀을 배치 단위로 재생 후 삭제
+    - 큐가 가득 차면 요청 스레드가 스풀에 직접 기록 (차단·유실 없음)
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+FLUSH_BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 2.0
+MAX_QUEUE_SIZE = 10_000
+RETRY_SECONDS = 30.0
+
+
+class AuditWriter:
+    """감사 이벤트 큐 + 백그라운드 UNWIND 배치 기록 + 장애 시 파일 스풀"""
+
+    _SAVE_EVENTS = """
+    UNWIND $events AS ev
+    CREATE (e:AuditEvent)
+    SET e = ev, e.timestamp = datetime(ev.timestamp)
+    WITH e, ev
+    OPTIONAL MATCH (u:User {user_id: ev.user_id})
+    FOREACH (_ IN CASE WHEN u IS NULL THEN [] ELSE [1] END | CREATE (u)-[:PERFORMED]->(e))
+    RETURN count(e) AS written
+    """
+
+    def __init__(
+        self,
+        neo4j: Any = None,
+        spool_path: Optional[str] = None,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+    ):
+        """
+        Args:
+            neo4j: `query(cypher, params)` 를 가진 Neo4j 클라이언트 (None 이면 스풀 전용)
+            spool_path: 그래프 장애 시 이벤트를 보존할 JSONL 파일 경로
+            batch_size: 이 건수가 쌓이면 주기 전이라도 기록
+            flush_interval: 최대 기록 지연 (초)
+            max_queue_size: 큐 상한 (초과분은 스풀로 직행)
+        """
+        self.neo4j = neo4j
+        self.spool_path = Path(spool_path) if spool_path else None
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._spool_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._graph_retry_at = 0.0
+        # submit 은 요청 스레드, 나머지는 기록 스레드에서 갱신 → 카운터 전용 락
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "written": 0, "spooled": 0, "replayed": 0, "batches": 0}
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 요청 경로
+    # ─────────────────────────────────────────────────────────────────────
+
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """이벤트 1건 접수 (큐 적재만, 즉시 반환). 보존되지 못했으면 False"""
+        self._count("submitted")
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            logger.warning("Audit queue full, spooling event directly")
+            return self._spool([event])
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 기록 / 스풀
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def _graph_available(self) -> bool:
+        return self.neo4j is not None and time.monotonic() >= self._graph_retry_at
+
+    def _write_graph(self, events: List[Dict[str, Any]]) -> bool:
+        if not self._graph_available():
+            return False
+        try:
+            self.neo4j.query(self._SAVE_EVENTS, {"events": events})
+        except Exception as e:
+            logger.warning(f"Audit batch write failed ({len(events)} events), spooling: {e}")
+            self._graph_retry_at = time.monotonic() + RETRY_SECONDS
+            return False
+        self._count("batches")
+        return True
+
+    def _spool(self, events: List[Dict[str, Any]]) -> bool:
+        if not self._append_spool(events):
+            return False
+        self._count("spooled", len(events))
+        return True
+
+    def _append_spool(self, events: List[Dict[str, Any]]) -> bool:
+        if self.spool_path is None:
+            logger.error(f"Audit events dropped (graph unavailable, no spool): {len(events)}")
+            return False
+        try:
+            with self._spool_lock:
+                self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spool_path, "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(ev, ensure_ascii=False) + "\n" for ev in events)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Audit spool write failed, {len(events)} events lost: {e}")
+            return False
+        return True
+
+    def _write(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        if self._write_graph(events):
+            self._count("written", len(events))
+        else:
+            self._spool(events)
+
+    def replay_spool(self) -> int:
+        """스풀된 이벤트를 그래프에 재기록. 재기록한 건수 반환 (실패분은 스풀에 남김)"""
+        if self.spool_path is None or not self._graph_available():
+            return 0
+
+        with self._spool_lock:
+            if not self.spool_path.exists():
+                return 0
+            # 재생 중 새로 스풀되는 이벤트와 섞이지 않도록 파일을 떼어낸다
+            replay_path = self.spool_path.with_suffix(f".replay-{os.getpid()}")
+            os.replace(self.spool_path, replay_path)
+
+        events: List[Dict[str, Any]] = []
+        with open(replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping corrupt audit spool line")
+
+        replayed = 0
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start:start + self.batch_size]
+            if not self._write_graph(batch):
+                self._append_spool(events[start:])
+                break
+            replayed += len(batch)
+
+        replay_path.unlink(missing_ok=True)
+        if replayed:
+            self._count("replayed", replayed)
+            logger.info(f"Replayed {replayed} spooled audit events")
+        return replayed
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        while len(events) < self.batch_size:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def flush(self) -> int:
+        """큐에 남은 이벤트를 모두 기록 (종료 시 / 테스트용). 처리한 건수 반환"""
+        total = 0
+        with self._write_lock:
+            while True:
+                events = self._drain()
+                if not events:
+                    break
+                self._write(events)
+                total += len(events)
+        return total
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 백그라운드 기록 스레드
+    # ─────────────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """기록 스레드 종료 + 남은 이벤트 기록"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        self._safe(self.replay_spool)
+        while not self._stop.is_set():
+            # 첫 이벤트가 올 때까지 대기 → 이후 batch_size 또는 flush_interval 까지 모음
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._safe(self.replay_spool)
+                continue
+
+            events = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(events) < self.batch_size and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    events.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            with self._write_lock:
+                self._safe(self._write, events)
+            self._safe(self.replay_spool)
+
+    @staticmethod
+    def _safe(fn, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.warning(f"Audit writer error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        spool_bytes = 0
+        if self.spool_path is not None and self.spool_path.exists():
+            spool_bytes = self.spool_path.stat().st_size
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {**stats, "queued": self._queue.qsize(), "spool_bytes": spool_bytes}
+
+
+# ==================== 싱글톤 인스턴스 ====================
+
+_audit_writer_instance: Optional[AuditWriter] = None
+_audit_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """AuditWriter 싱글톤 (최초 호출 시 기록 스레드 시작)"""
+    global _audit_writer_instance
+    with _audit_writer_lock:
+        if _audit_writer_instance is None:
+            from app.core.config import get_settings
+
+            settings = get_settings()
+            try:
+                from app.services.neo4j_client import get_neo4j_client
+                neo4j = get_neo4j_client()
+            except Exception as e:
+                logger.warning(f"Neo4j unavailable, audit events go to spool only: {e}")
+                neo4j = None
+
+            writer = AuditWriter(
+                neo4j,
+                spool_path=settings.AUDIT_SPOOL_PATH,
+                batch_size=settings.AUDIT_FLUSH_BATCH_SIZE,
+                flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+                max_queue_size=settings.AUDIT_QUEUE_MAX_SIZE,
+            )
+            writer.start()
+            _audit_writer_instance = writer
+    return _audit_writer_instance
@@ -1,10 +1,13 @@
 """
 배경 이미지 자동 선택 서비스
-3단계 우선순위 로직으로 최적의 배경 선택
+AI 생성 / 스톡 이미지 우선순위 로직으로 최적의 배경 선택
 """
 import os
+import json
+import asyncio
 import logging
-from typing import Optional
+from contextlib import nullcontext
+from typing import Optional, Dict, Tuple
 from app.services.image_generation import ImageGenerationService
 from app.services.stock_image import StockImageService
 
@@ -13,14 +16,17 @@ logger = logging.getLogger(__name__)
 
 class BackgroundSelector:
     """
-    배경 이미지 자동 선택 (3단계 우선순위)
+    배경 이미지 자동 선택
 
-    1순위: 캠페인 리소스 라이브러리 검색 (TODO)
-    2순위: DALL-E AI 이미지 생성
-    3순위: Unsplash 스톡 이미지
+    1순위: DALL-E AI 이미지 생성
+    2순위: Unsplash 스톡 이미지
+    (prefer_ai=False면 1·2순위 순서 변경)
     Fallback: 단색 배경
     """
 
+    # 배치 처리 시 provider별 동시 호출 상한 (DALL-E rate limit이 가장 낮음)
+    PROVIDER_CONCURRENCY = {"dall-e": 2, "unsplash": 4}
+
     def __init__(self):
         self.image_gen_service = ImageGenerationService()
         self.stock_service = StockImageService()
@@ -33,19 +39,19 @@ class BackgroundSelector:
         prefer_ai: bool = True
     ) -> dict:
         """
-        배경 자동 선택 (3단계 우선순위)
+        배경 자동 선택
 
         Args:
-            campaign_id: 캠페인 ID (리소스 라이브러리 검색용, 현재 미사용)
+            campaign_id: 캠페인 ID (현재 미사용 — 캠페인 이미지 리소스 저장소 없음)
             keywords: 배경 키워드 리스트 (예: ["AI", "technology", "future"])
             visual_concept: 비주얼 컨셉 (예: {"mood": "energetic", "color_tone": "bright"})
-            prefer_ai: True이면 2순위(AI), False이면 3순위(스톡) 먼저 시도
+            prefer_ai: True이면 AI, False이면 스톡 먼저 시도
 
         Returns:
             {
-                "background_type": "uploaded" | "ai_generated" | "stock" | "solid_color",
+                "background_type": "ai_generated" | "stock" | "solid_color",
                 "background_url": "https://...",
-                "source": "campaign_resources" | "dall-e" | "unsplash" | "fallback",
+                "source": "dall-e" | "unsplash" | "fallback",
                 "metadata": {...}  # 추가 정보 (프롬프트, 작가 등)
             }
         """
@@ -53,69 +59,45 @@ class BackgroundSelector:
         keywords = keywords or ["professional", "background"]
         visual_concept = visual_concept or {"mood": "professional", "color_tone": "neutral"}
 
+        return await self._select(keywords, visual_concept, prefer_ai)
+
+    async def _select(
+        self,
+        keywords: list[str],
+        visual_concept: dict,
+        prefer_ai: bool,
+        limits: Optional[Dict[str, asyncio.Semaphore]] = None
+    ) -> dict:
+        """우선순위 선택 (limits: provider별 동시 호출 제한, 배치 처리 시 공유)"""
         logger.info(f"배경 선택 시작 - Keywords: {keywords}, Concept: {visual_concept}")
+        limits = limits or {}
+
+        async def try_ai() -> Optional[dict]:
+            async with limits.get("dall-e") or nullcontext():
+                return await self._try_ai_generation(keywords, visual_concept)
 
-        # 1순위: 캠페인 리소스 라이브러리 (TODO: SQLite 구현 후)
-        if campaign_id:
-            resource_result = await self._search_campaign_resources(campaign_id, keywords)
-            if resource_result:
-                return resource_result
-
-        # 2순위 vs 3순위 (prefer_ai에 따라 순서 변경)
-        if prefer_ai:
-            # AI 우선
-            ai_result = await self._try_ai_generation(keywords, visual_concept)
-            if ai_result:
-                return ai_result
-
-            # AI 실패 시 스톡 이미지
-            stock_result = await self._try_stock_image(keywords)
-            if stock_result:
-                return stock_result
-        else:
-            # 스톡 우선
-            stock_result = await self._try_stock_image(keywords)
-            if stock_result:
-                return stock_result
-
-            # 스톡 실패 시 AI 생성
-            ai_result = await self._try_ai_generation(keywords, visual_concept)
-            if ai_result:
-                return ai_result
+        async def try_stock() -> Optional[dict]:
+            async with limits.get("unsplash") or nullcontext():
+                return await self._try_stock_image(keywords)
+
+        # AI vs 스톡 (prefer_ai에 따라 순서 변경)
+        attempts = (try_ai, try_stock) if prefer_ai else (try_stock, try_ai)
+        for attempt in attempts:
+            result = await attempt()
+            if result:
+                return result
 
         # Fallback: 단색 배경
         logger.warning("모든 배경 소스 실패, 단색 배경 사용")
         return self._fallback_solid_color(visual_concept)
 
-    async def _search_campaign_resources(
-        self,
-        campaign_id: int,
-        keywords: list[str]
-    ) -> Optional[dict]:
-        """
-        1순위: 캠페인 리소스 라이브러리 검색
-
-        TODO: SQLite 구현 후 활성화
-        """
-        logger.info(f"캠페인 리소스 검색 (campaign_id={campaign_id}) - 현재 미구현")
-        # from app.lib.db import search_campaign_resources
-        # resources = await search_campaign_resources(campaign_id, keywords)
-        # if resources:
-        #     return {
-        #         "background_type": "uploaded",
-        #         "background_url": resources[0]['url'],
-        #         "source": "campaign_resources",
-        #         "metadata": {"resource_id": resources[0]['id']}
-        #     }
-        return None
-
     async def _try_ai_generation(
         self,
         keywords: list[str],
         visual_concept: dict
     ) -> Optional[dict]:
         """
-        2순위: DALL-E AI 이미지 생성
+        DALL-E AI 이미지 생성
         """
         try:
             logger.info(f"DALL-E AI 이미지 생성 시도")
@@ -148,7 +130,7 @@ class BackgroundSelector:
         keywords: list[str]
     ) -> Optional[dict]:
         """
-        3순위: Unsplash 스톡 이미지
+        Unsplash 스톡 이미지
         """
         try:
             logger.info(f"Unsplash 스톡 이미지 검색 시도")
@@ -230,44 +212,70 @@ class BackgroundSelector:
     async def batch_select_backgrounds(
         self,
         blocks: list[dict],
-        campaign_id: Optional[int] = None
+        campaign_id: Optional[int] = None,
+        prefer_ai: bool = True
     ) -> list[dict]:
         """
         여러 블록의 배경을 일괄 선택
 
+        - 키워드/비주얼 컨셉이 같은 블록은 1회만 선택해 결과 공유
+        - 고유 요청은 동시 처리하되 provider별 동시 호출 수 제한 (PROVIDER_CONCURRENCY)
+
         Args:
             blocks: [{"block_id": 1, "keywords": [...], "visual_concept": {...}}, ...]
-            campaign_id: 캠페인 ID
+            campaign_id: 캠페인 ID (현재 미사용)
+            prefer_ai: True이면 AI 우선, False이면 스톡 우선
 
         Returns:
-            [{"block_id": 1, "background": {...}}, ...]
+            [{"block_id": 1, "success": True, "background": {...}}, ...] (블록 순서 유지)
         """
-        results = []
+        limits = {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in self.PROVIDER_CONCURRENCY.items()
+        }
 
+        # 동일 요청 dedupe: key → (keywords, visual_concept)
+        groups: Dict[Tuple[str, str], Tuple[list, dict]] = {}
+        block_keys = []
         for block in blocks:
-            block_id = block.get("block_id")
-            keywords = block.get("keywords")
-            visual_concept = block.get("visual_concept")
+            keywords = block.get("keywords") or ["professional", "background"]
+            visual_concept = block.get("visual_concept") or {"mood": "professional", "color_tone": "neutral"}
+            key = (
+                json.dumps(sorted(k.strip().lower() for k in keywords), ensure_ascii=False),
+                json.dumps(visual_concept, sort_keys=True, ensure_ascii=False),
+            )
+            groups.setdefault(key, (keywords, visual_concept))
+            block_keys.append(key)
+
+        logger.info(f"배경 일괄 선택 - 블록 {len(blocks)}개, 고유 요청 {len(groups)}개")
 
-            try:
-                background = await self.select_background(
-                    campaign_id=campaign_id,
-                    keywords=keywords,
-                    visual_concept=visual_concept
-                )
+        keys = list(groups)
+        outcomes = await asyncio.gather(
+            *(
+                self._select(groups[key][0], groups[key][1], prefer_ai, limits)
+                for key in keys
+            ),
+            return_exceptions=True
+        )
+        resolved = dict(zip(keys, outcomes))
 
+        results = []
+        for block, key in zip(blocks, block_keys):
+            block_id = block.get("block_id")
+            outcome = resolved[key]
+            # CancelledError 등 BaseException 도 gather 결과로 들어올 수 있음
+            if isinstance(outcome, BaseException):
+                logger.error(f"블록 {block_id} 배경 선택 실패: {outcome}")
                 results.append({
                     "block_id": block_id,
-                    "success": True,
-                    "background": background
+                    "success": False,
+                    "error": str(outcome)
                 })
-
-            except Exception as e:
-                logger.error(f"블록 {block_id} 배경 선택 실패: {e}")
+            else:
                 results.append({
                     "block_id": block_id,
-                    "success": False,
-                    "error": str(e)
+                    "success": True,
+                    "background": dict(outcome)
                 })
 
         return results
@@ -4,12 +4,17 @@
 """
 import os
 import subprocess
-import json
 import logging
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from app.core.config import get_settings
+from app.services.ducking_engine import (
+    DEFAULT_ATTACK_SECONDS,
+    DEFAULT_RELEASE_SECONDS,
+    compile_ducking_envelope,
+)
+from app.services.media_probe_service import MediaProbeError, get_media_probe_service
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -38,22 +43,7 @@ class BGMEditorService:
             return False
 
         try:
-            cmd = [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                file_path
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                self.logger.error(f"FFprobe failed: {result.stderr}")
-                return False
-
-            metadata = json.loads(result.stdout)
+            metadata = get_media_probe_service().probe(file_path)
 
             # 오디오 스트림 확인
             audio_streams = [
@@ -76,11 +66,8 @@ class BGMEditorService:
             self.logger.info(f"Audio file validated: {file_path} (format: {format_name})")
             return True
 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"FFprobe timeout: {file_path}")
-            return False
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse FFprobe output: {e}")
+        except MediaProbeError as e:
+            self.logger.error(f"FFprobe failed: {e}")
             return False
         except Exception as e:
             self.logger.error(f"Audio validation failed: {e}", exc_info=True)
@@ -97,25 +84,11 @@ class BGMEditorService:
             오디오 길이 (초)
         """
         try:
-            cmd = [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                file_path
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                self.logger.error(f"Failed to get audio duration: {result.stderr}")
-                return 0.0
-
-            metadata = json.loads(result.stdout)
-            duration = float(metadata.get("format", {}).get("duration", 0.0))
-
-            return duration
+            return get_media_probe_service().get_duration(file_path)
 
+        except MediaProbeError as e:
+            self.logger.error(f"Failed to get audio duration: {e}")
+            return 0.0
         except Exception as e:
             self.logger.error(f"Failed to get audio duration: {e}", exc_info=True)
             return 0.0
@@ -155,15 +128,24 @@ class BGMEditorService:
         self,
         voice_segments: List[Tuple[float, float]],
         normal_volume: float,
-        ducking_volume: float
+        ducking_volume: float,
+        sendcmd_path: str,
+        attack: float = DEFAULT_ATTACK_SECONDS,
+        release: float = DEFAULT_RELEASE_SECONDS,
     ) -> str:
         """
         FFmpeg 볼륨 필터 생성 (음성 구간에서 BGM 볼륨 감소)
 
+        음성 구간을 병합해 attack/release 램프를 가진 단일 게인 엔벨로프로 컴파일하고,
+        asendcmd 명령 파일(sendcmd_path)에 기록한다. 필터 체인 길이는 세그먼트 수와 무관.
+
         Args:
             voice_segments: 음성 구간 리스트 [(start, end), ...]
             normal_volume: 일반 볼륨
-            ducking_volume: 덕킹 시 볼륨
+            ducking_volume: 덕킹 시 볼륨 (normal_volume 대비 배율)
+            sendcmd_path: asendcmd 명령 파일 경로 (호출부가 FFmpeg 실행 후 삭제)
+            attack: 덕킹 진입 램프 (초)
+            release: 덕킹 해제 램프 (초)
 
         Returns:
             FFmpeg 볼륨 필터 문자열
@@ -171,20 +153,19 @@ class BGMEditorService:
         if not voice_segments:
             return f"volume={normal_volume}"
 
-        # FFmpeg volume 필터의 enable 옵션 사용
-        filter_parts = []
-
-        for i, (start, end) in enumerate(voice_segments):
-            # 음성 구간에서 볼륨 감소
-            filter_parts.append(
-                f"volume={ducking_volume}:enable='between(t,{start},{end})'"
-            )
+        envelope = compile_ducking_envelope(
+            voice_segments,
+            duck_gain=ducking_volume,
+            attack=attack,
+            release=release,
+        )
+        Path(sendcmd_path).write_text(envelope.to_sendcmd(), encoding="utf-8")
 
-        # 음성 구간 외에는 일반 볼륨
-        all_filter = ",".join(filter_parts)
-        all_filter += f",volume={normal_volume}"
-
-        return all_filter
+        self.logger.info(
+            f"Compiled ducking envelope: {len(voice_segments)} segments → "
+            f"{len(envelope.intervals)} intervals"
+        )
+        return envelope.to_filter(sendcmd_path, normal_volume=normal_volume)
 
     def apply_bgm_effects(
         self,
@@ -221,6 +202,8 @@ class BGMEditorService:
         Returns:
             성공 여부
         """
+        sendcmd_path = f"{output_path}.duck.cmd"
+
         try:
             # FFmpeg 필터 체인 구성
             filters = []
@@ -245,7 +228,8 @@ class BGMEditorService:
                 ducking_filter = self.build_ducking_filter(
                     voice_segments,
                     normal_volume=volume,
-                    ducking_volume=ducking_level
+                    ducking_volume=ducking_level,
+                    sendcmd_path=sendcmd_path,
                 )
                 filters.append(ducking_filter)
             else:
@@ -295,6 +279,9 @@ class BGMEditorService:
         except Exception as e:
             self.logger.error(f"Failed to apply BGM effects: {e}", exc_info=True)
             return False
+        finally:
+            if os.path.exists(sendcmd_path):
+                os.remove(sendcmd_path)
 
     def mix_audio(
         self,
@@ -255,3 +255,18 @@ def invalidate_writer_cache():
     cache.delete_pattern("writer:*")
     cache.delete_pattern("neo4j:*")
     logger.info("Writer cache invalidated")
+
+
+def project_count_cache_key(user_id: str, status: Optional[str] = None) -> str:
+    """사용자 프로젝트 개수 캐시 키"""
+    return f"count:user_projects:{user_id}:{status or 'all'}"
+
+
+def invalidate_project_count_cache(user_id: str):
+    """사용자 프로젝트 개수 캐시 무효화 (상태별 키를 직접 삭제 — KEYS 스캔 없음)"""
+    from app.models.neo4j_models import ProjectStatus
+
+    cache = get_cache_service()
+    for status in [None, *(s.value for s in ProjectStatus)]:
+        cache.delete(project_count_cache_key(user_id, status))
+    logger.info(f"Project count cache invalidated (user={user_id})")
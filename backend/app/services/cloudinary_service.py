@@ -19,7 +19,6 @@ from typing import Optional, Dict, Any, List
 import logging
 from pathlib import Path
 import uuid
-import httpx
 from contextlib import nullcontext
 
 import cloudinary
@@ -29,6 +28,7 @@ import cloudinary.api
 
 from app.core.config import get_settings
 from app.services.cost_tracker import get_cost_tracker, APIProvider, APIService
+from app.services.streaming_io import download_to_file
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -102,6 +102,9 @@ PLATFORM_TRANSFORMATIONS = {
 class CloudinaryService:
     """Cloudinary 미디어 최적화 서비스"""
 
+    # upload_large 청크 크기 (Cloudinary 최소 5MB) — 파일 전체를 한 번에 읽지 않음
+    UPLOAD_CHUNK_SIZE = 20 * 1024 * 1024
+
     def __init__(self, output_dir: str = "./outputs/cloudinary"):
         """
         Cloudinary 서비스 초기화
@@ -175,8 +178,8 @@ class CloudinaryService:
 
                 self.logger.info(f"Uploading video: {video_path} -> {folder}/{public_id}")
 
-                # Cloudinary 업로드 (동기 함수를 비동기로 래핑)
-                result = await self._async_upload(
+                # Cloudinary 청크 업로드 (파일을 청크 단위로 읽어 전송, 동기 함수를 비동기로 래핑)
+                result = await self._async_upload_large(
                     video_path,
                     public_id=public_id,
                     folder=folder,
@@ -708,6 +711,16 @@ class CloudinaryService:
             lambda: cloudinary.uploader.upload(*args, **kwargs)
         )
 
+    async def _async_upload_large(self, *args, **kwargs):
+        """비동기 청크 업로드 래퍼 (UPLOAD_CHUNK_SIZE 단위 분할 전송)"""
+        import asyncio
+        kwargs.setdefault("chunk_size", self.UPLOAD_CHUNK_SIZE)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: cloudinary.uploader.upload_large(*args, **kwargs)
+        )
+
     async def _async_destroy(self, *args, **kwargs):
         """비동기 삭제 래퍼"""
         import asyncio
@@ -727,22 +740,9 @@ class CloudinaryService:
         )
 
     async def _download_file(self, url: str, output_path: str):
-        """파일 다운로드"""
+        """파일 다운로드 (청크 스트리밍)"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=120.0)
-                response.raise_for_status()
-
-                # 파일 저장
-                output_file = Path(output_path)
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(output_file, "wb") as f:
-                    f.write(response.content)
-
-                self.logger.info(
-                    f"Downloaded {len(response.content) / 1024 / 1024:.2f} MB to {output_path}"
-                )
+            await download_to_file(url, output_path, timeout=120.0)
 
         except Exception as e:
             self.logger.error(f"Failed to download file: {e}")
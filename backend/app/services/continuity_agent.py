@@ -24,6 +24,7 @@ from app.core.config import get_settings
 from app.services.neo4j_client import get_neo4j_client
 from app.services.resource_manager import get_resource_manager, Resource
 from app.services.llm_profile import llm_safe_langchain_chat_kwargs
+from app.services.llm_response_cache import get_llm_response_cache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -36,6 +37,15 @@ except Exception:
     LOGFIRE_AVAILABLE = False
 
 
+def _parse_json_reply(content: str) -> Dict[str, Any]:
+    """LLM 응답에서 ```json 코드 블록을 벗겨 JSON 파싱 (실패 시 예외 — 캐시에 저장되지 않음)"""
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return json.loads(content)
+
+
 class CameraWork:
     """카메라 워크 상수"""
     CLOSE_UP = "클로즈업 (CU)"
@@ -219,17 +229,10 @@ JSON 형식으로만 응답하세요."""
                     HumanMessage(content=user_prompt)
                 ]
 
-                response = await self.llm.ainvoke(messages)
-
-                # JSON 파싱
-                content = response.content
-                # ```json 제거
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                scene_data = json.loads(content)
+                content = await get_llm_response_cache().cached_ainvoke(
+                    self.llm, "continuity", messages, validate=_parse_json_reply
+                )
+                scene_data = _parse_json_reply(content)
 
                 # Scene 객체 생성
                 scenes = []
@@ -309,16 +312,10 @@ JSON 형식으로만 응답하세요."""
                     HumanMessage(content=user_prompt)
                 ]
 
-                response = await self.llm.ainvoke(messages)
-
-                # JSON 파싱
-                content = response.content
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                camera_data = json.loads(content)
+                content = await get_llm_response_cache().cached_ainvoke(
+                    self.llm, "continuity", messages, validate=_parse_json_reply
+                )
+                camera_data = _parse_json_reply(content)
 
                 # 씬에 카메라 워크 할당
                 for idx, scene in enumerate(scenes):
@@ -424,16 +421,10 @@ JSON 형식으로만 응답하세요."""
                     HumanMessage(content=user_prompt)
                 ]
 
-                response = await self.llm.ainvoke(messages)
-
-                # JSON 파싱
-                content = response.content
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                mapping_data = json.loads(content)
+                content = await get_llm_response_cache().cached_ainvoke(
+                    self.llm, "continuity", messages, validate=_parse_json_reply
+                )
+                mapping_data = _parse_json_reply(content)
 
                 # 씬에 리소스 이름 할당
                 for mapping in mapping_data["mappings"]:
@@ -0,0 +1,162 @@
+"""
+Ducking Engine — 음성 구간 기반 BGM 게인 엔벨로프 컴파일
+
+배경:
+    - 기존 build_ducking_filter 는 Whisper 세그먼트마다 volume=…:enable='between(t,…)' 를 생성
+    - 300개 세그먼트 → 300단 필터 체인을 모든 오디오 프레임마다 평가 + 경계에서 게인 급변(클릭)
+
+방식:
+    1. 겹치거나 인접한(간격 < attack + release) 음성 구간을 병합
+    2. 병합 구간마다 attack/release 선형 램프를 갖는 단일 게인 엔벨로프 생성
+    3. asendcmd 파일로 컴파일 — 구간 경계에서만 volume@duck 의 expression 을 교체
+       → 필터 체인은 세그먼트 수와 무관하게 asendcmd + volume 2단 고정,
+         프레임당 평가 비용도 O(1)
+
+사용 예:
+    envelope = compile_ducking_envelope(voice_segments, duck_gain=0.3)
+    Path(cmd_path).write_text(envelope.to_sendcmd())
+    af = envelope.to_filter(cmd_path, normal_volume=0.3)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_ATTACK_SECONDS = 0.15
+DEFAULT_RELEASE_SECONDS = 0.4
+
+# asendcmd 가 expression 을 교체하는 volume 필터 인스턴스 이름
+DUCK_FILTER_TARGET = "volume@duck"
+
+
+def merge_voice_segments(
+    segments: Iterable[Tuple[float, float]],
+    merge_gap: float = 0.0,
+) -> List[Tuple[float, float]]:
+    """
+    음성 구간 정렬 + 병합
+
+    Args:
+        segments: [(start, end), ...] (정렬/중복 여부 무관)
+        merge_gap: 이 간격보다 가까운 구간은 하나로 병합 (초)
+
+    Returns:
+        시작 시간 순으로 정렬된, 서로 merge_gap 이상 떨어진 구간 리스트
+    """
+    ordered = sorted((float(s), float(e)) for s, e in segments if e > s)
+
+    merged: List[Tuple[float, float]] = []
+    for start, end in ordered:
+        if merged and start - merged[-1][1] < merge_gap:
+            prev_start, prev_end = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@dataclass(frozen=True)
+class DuckingEnvelope:
+    """
+    병합된 음성 구간 + 램프 설정으로 정의되는 게인 엔벨로프
+
+    게인은 1.0(비음성) ↔ duck_gain(음성) 사이를 오가며,
+    구간 시작 attack 초 전부터 내려가고 구간 종료 후 release 초 동안 올라간다.
+    """
+    intervals: Tuple[Tuple[float, float], ...]
+    duck_gain: float
+    attack: float = DEFAULT_ATTACK_SECONDS
+    release: float = DEFAULT_RELEASE_SECONDS
+
+    def gain_at(self, t: float) -> float:
+        """시각 t 의 게인 (미리보기/검증용 — FFmpeg 결과와 동일한 식)"""
+        gain = 1.0
+        depth = 1.0 - self.duck_gain
+        for start, end in self.intervals:
+            if t < start - self.attack:
+                break
+            if t <= start:
+                ramp = (t - (start - self.attack)) / self.attack if self.attack > 0 else 1.0
+                gain = min(gain, 1.0 - depth * ramp)
+            elif t <= end:
+                gain = self.duck_gain
+            elif t <= end + self.release:
+                ramp = (t - end) / self.release if self.release > 0 else 1.0
+                gain = min(gain, self.duck_gain + depth * ramp)
+        return gain
+
+    def _attack_expr(self, start: float) -> str:
+        ramp_start = start - self.attack
+        if self.attack <= 0:
+            return f"{self.duck_gain:.4f}"
+        return (
+            f"max({self.duck_gain:.4f},"
+            f"1-{1.0 - self.duck_gain:.4f}*(t-{ramp_start:.3f})/{self.attack:.3f})"
+        )
+
+    def _release_expr(self, end: float) -> str:
+        if self.release <= 0:
+            return "1"
+        return (
+            f"min(1,"
+            f"{self.duck_gain:.4f}+{1.0 - self.duck_gain:.4f}*(t-{end:.3f})/{self.release:.3f})"
+        )
+
+    def to_sendcmd(self, target: str = DUCK_FILTER_TARGET) -> str:
+        """
+        asendcmd 명령 파일 내용
+
+        구간마다 2개 명령 (attack 시작 시점, release 시작 시점).
+        각 expression 은 min/max 로 클램프되어 다음 명령까지 그대로 유효하다.
+        """
+        lines = []
+        for start, end in self.intervals:
+            lines.append(f"{max(0.0, start - self.attack):.3f} {target} volume '{self._attack_expr(start)}';")
+            lines.append(f"{end:.3f} {target} volume '{self._release_expr(end)}';")
+        return "\n".join(lines) + "\n"
+
+    def to_filter(self, sendcmd_path: str, normal_volume: float) -> str:
+        """
+        FFmpeg -af 체인 조각 (세그먼트 수와 무관하게 3단 고정)
+
+        기존 동작과 동일하게 음성 구간 게인 = normal_volume × duck_gain.
+        """
+        if not self.intervals:
+            return f"volume={normal_volume}"
+        return (
+            f"asendcmd=f='{_escape_filter_path(sendcmd_path)}',"
+            f"{DUCK_FILTER_TARGET}=volume=1:eval=frame,"
+            f"volume={normal_volume}"
+        )
+
+
+def compile_ducking_envelope(
+    voice_segments: Sequence[Tuple[float, float]],
+    duck_gain: float,
+    attack: float = DEFAULT_ATTACK_SECONDS,
+    release: float = DEFAULT_RELEASE_SECONDS,
+    merge_gap: Optional[float] = None,
+) -> DuckingEnvelope:
+    """
+    음성 구간 → DuckingEnvelope
+
+    Args:
+        voice_segments: Whisper 음성 구간 [(start, end), ...]
+        duck_gain: 음성 구간 게인 (0.0-1.0)
+        attack: 덕킹 진입 램프 길이 (초)
+        release: 덕킹 해제 램프 길이 (초)
+        merge_gap: 병합 간격 (None이면 attack + release — 램프가 겹치지 않도록)
+    """
+    gap = attack + release if merge_gap is None else max(merge_gap, attack + release)
+    intervals = merge_voice_segments(voice_segments, merge_gap=gap)
+    return DuckingEnvelope(
+        intervals=tuple(intervals),
+        duck_gain=duck_gain,
+        attack=attack,
+        release=release,
+    )
+
+
+def _escape_filter_path(path: str) -> str:
+    """필터 옵션 값 안의 경로 이스케이프 (subtitles= 와 동일 규칙)"""
+    return path.replace("\\", "/").replace(":", "\\:").replace("'", "\\'")
@@ -6,11 +6,11 @@ REALPLAN.md Phase 3.1 구현
 - 텍스트 길이 → 예상 오디오 시간 계산
 - 언어별 읽기 속도 설정
 - 구두점 휴지 고려
-- 학습 데이터 기반 보정
+- 학습 데이터 기반 보정 (DurationModel 연결 시 언어/음성/플랫폼별 계수)
 """
 
 import re
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from enum import Enum
 import logging
 
@@ -56,31 +56,53 @@ class DurationCalculator:
         """
         self.language = language
         self.base_speed = self.READING_SPEEDS[language]
-        self.correction_factor = 1.0  # 학습 데이터 기반 보정 계수
+        self.correction_factor = 1.0  # 학습 데이터 기반 보정 계수 (모델 미연결 시)
+        self.model: Optional[Any] = _duration_model  # DurationModel (set_duration_model)
 
-    def calculate(self, text: str) -> Dict[str, float]:
+    def get_correction_factor(
+        self,
+        voice_id: Optional[str] = None,
+        platform: Optional[str] = None
+    ) -> float:
+        """보정 계수 (DurationModel 연결 시 언어/음성/플랫폼별 학습값)"""
+        if self.model is not None:
+            return self.model.factor(self.language.value, voice_id, platform)
+        return self.correction_factor
+
+    def calculate(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        platform: Optional[str] = None
+    ) -> Dict[str, float]:
         """
         텍스트의 예상 오디오 시간 계산
 
         Args:
             text: 입력 텍스트
+            voice_id: 음성 ID (선택, 음성별 보정 계수)
+            platform: 플랫폼 (선택, 플랫폼별 보정 계수)
 
         Returns:
             {
                 'duration': 예상 시간 (초),
+                'raw_duration': 보정 전 예상 시간 (초),
                 'base_duration': 기본 읽기 시간 (초),
                 'pause_duration': 구두점 휴지 시간 (초),
                 'word_count': 글자/단어 수,
                 'correction_factor': 보정 계수
             }
         """
+        correction_factor = self.get_correction_factor(voice_id, platform)
+
         if not text or not text.strip():
             return {
                 'duration': 0.0,
+                'raw_duration': 0.0,
                 'base_duration': 0.0,
                 'pause_duration': 0.0,
                 'word_count': 0,
-                'correction_factor': self.correction_factor
+                'correction_factor': correction_factor
             }
 
         # 1. 글자/단어 수 계산
@@ -93,14 +115,16 @@ class DurationCalculator:
         pause_duration = self._calculate_pause_duration(text)
 
         # 4. 총 예상 시간 (보정 계수 적용)
-        total_duration = (base_duration + pause_duration) * self.correction_factor
+        raw_duration = base_duration + pause_duration
+        total_duration = raw_duration * correction_factor
 
         result = {
             'duration': round(total_duration, 1),
+            'raw_duration': raw_duration,
             'base_duration': round(base_duration, 1),
             'pause_duration': round(pause_duration, 1),
             'word_count': word_count,
-            'correction_factor': self.correction_factor
+            'correction_factor': correction_factor
         }
 
         logger.debug(f"Duration calculation: {result}")
@@ -150,7 +174,7 @@ class DurationCalculator:
 
     def update_correction_factor(self, predicted: float, actual: float):
         """
-        학습 데이터 기반 보정 계수 업데이트
+        학습 데이터 기반 보정 계수 업데이트 (DurationModel 미연결 시 사용되는 단일 계수)
 
         Args:
             predicted: 예측 시간 (초)
@@ -173,7 +197,9 @@ class DurationCalculator:
     def estimate_for_target_duration(
         self,
         target_duration: float,
-        margin: float = 0.1
+        margin: float = 0.1,
+        voice_id: Optional[str] = None,
+        platform: Optional[str] = None
     ) -> Dict[str, int]:
         """
         목표 시간에 맞는 글자 수 범위 계산
@@ -181,6 +207,8 @@ class DurationCalculator:
         Args:
             target_duration: 목표 시간 (초)
             margin: 오차 범위 (기본: 10%)
+            voice_id: 음성 ID (선택)
+            platform: 플랫폼 (선택)
 
         Returns:
             {
@@ -195,15 +223,16 @@ class DurationCalculator:
 
         # 평균 휴지 비율 (전체 시간의 약 15%)
         avg_pause_ratio = 0.15
+        correction_factor = self.get_correction_factor(voice_id, platform)
 
         # 기본 읽기 시간 = 총 시간 * (1 - 휴지 비율) / 보정 계수
-        base_min = (min_duration * (1 - avg_pause_ratio)) / self.correction_factor
-        base_max = (max_duration * (1 - avg_pause_ratio)) / self.correction_factor
+        base_min = (min_duration * (1 - avg_pause_ratio)) / correction_factor
+        base_max = (max_duration * (1 - avg_pause_ratio)) / correction_factor
 
         # 글자/단어 수 = (기본 읽기 시간 / 60) * 읽기 속도
         min_words = int((base_min / 60) * self.base_speed)
         max_words = int((base_max / 60) * self.base_speed)
-        target_words = int(((target_duration * (1 - avg_pause_ratio)) / self.correction_factor / 60) * self.base_speed)
+        target_words = int(((target_duration * (1 - avg_pause_ratio)) / correction_factor / 60) * self.base_speed)
 
         return {
             'min_words': min_words,
@@ -215,6 +244,20 @@ class DurationCalculator:
 # ==================== 싱글톤 인스턴스 ====================
 
 _calculator_instances: Dict[Language, DurationCalculator] = {}
+_duration_model: Optional[Any] = None
+
+
+def set_duration_model(model: Optional[Any]) -> None:
+    """
+    모든 계산기(기존 + 이후 생성)에 DurationModel 연결
+
+    Args:
+        model: `factor(language, voice_id, platform)` 를 가진 모델 (None 이면 연결 해제)
+    """
+    global _duration_model
+    _duration_model = model
+    for calculator in _calculator_instances.values():
+        calculator.model = model
 
 
 def get_duration_calculator(language: Language = Language.KO) -> DurationCalculator:
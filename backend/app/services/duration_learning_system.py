@@ -4,8 +4,8 @@ REALPLAN.md Phase 3.4 구현
 
 기능:
 - 실제 TTS 시간과 예측 시간 비교
-- 자동 보정 계수 업데이트
-- 학습 데이터 Neo4j 저장
+- 자동 보정 계수 업데이트 (DurationModel: 언어/음성/플랫폼별 온라인 학습)
+- 학습 데이터 Neo4j 저장 (DurationModel 이 주기적으로 배치 기록)
 - 언어별/플랫폼별 정확도 추적
 """
 
@@ -15,6 +15,7 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from app.services.duration_calculator import get_duration_calculator, Language
+from app.services.duration_model import get_duration_model
 from app.services.neo4j_client import get_neo4j_client
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class DurationLearningSystem:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.neo4j = get_neo4j_client()
+        self.model = get_duration_model()
 
     def record_prediction(
         self,
@@ -63,19 +65,26 @@ class DurationLearningSystem:
             학습 레코드
         """
         try:
-            # 1. 현재 예측 계산
+            # 1. 보정 전 예측 계산
             lang = Language(language)
             calculator = get_duration_calculator(lang)
-            prediction = calculator.calculate(text)
-            predicted_duration = prediction['duration']
+            raw_duration = calculator.calculate(text)['raw_duration']
 
-            # 2. 정확도 계산
-            accuracy = self._calculate_accuracy(predicted_duration, actual_duration)
+            # 2. 온라인 학습 (DB 기록은 DurationModel 이 배치로 처리)
+            learned = self.model.observe(
+                language=lang.value,
+                raw_predicted=raw_duration,
+                actual=actual_duration,
+                voice_id=voice_id,
+                platform=platform,
+                text=text
+            )
+            predicted_duration = round(learned['predicted'], 1)
+            old_factor = learned['factor_before']
+            new_factor = learned['factor_after']
 
-            # 3. 보정 계수 업데이트
-            old_factor = calculator.correction_factor
-            calculator.update_correction_factor(predicted_duration, actual_duration)
-            new_factor = calculator.correction_factor
+            # 3. 정확도 계산
+            accuracy = self._calculate_accuracy(predicted_duration, actual_duration)
 
             # 4. 학습 레코드 생성
             record = DurationLearningRecord(
@@ -90,9 +99,6 @@ class DurationLearningSystem:
                 timestamp=datetime.now()
             )
 
-            # 5. Neo4j에 저장
-            self._save_to_neo4j(record)
-
             self.logger.info(
                 f"[Learning] Language={language}, "
                 f"Predicted={predicted_duration:.1f}s, "
@@ -125,43 +131,6 @@ class DurationLearningSystem:
         accuracy = max(0, 100 - (error / actual * 100))
         return accuracy
 
-    def _save_to_neo4j(self, record: DurationLearningRecord):
-        """
-        학습 레코드를 Neo4j에 저장
-
-        Args:
-            record: 학습 레코드
-        """
-        query = """
-        CREATE (lr:LearningRecord {
-            text: $text,
-            language: $language,
-            predicted_duration: $predicted_duration,
-            actual_duration: $actual_duration,
-            accuracy: $accuracy,
-            correction_factor: $correction_factor,
-            platform: $platform,
-            voice_id: $voice_id,
-            timestamp: datetime($timestamp)
-        })
-        RETURN lr
-        """
-
-        params = {
-            "text": record.text[:500],  # 텍스트는 500자로 제한
-            "language": record.language,
-            "predicted_duration": record.predicted_duration,
-            "actual_duration": record.actual_duration,
-            "accuracy": record.accuracy,
-            "correction_factor": record.correction_factor,
-            "platform": record.platform,
-            "voice_id": record.voice_id,
-            "timestamp": record.timestamp.isoformat() if record.timestamp else datetime.now().isoformat()
-        }
-
-        self.neo4j.query(query, params)
-        self.logger.debug(f"Saved learning record to Neo4j: {record}")
-
     def get_learning_stats(
         self,
         language: Optional[str] = None,
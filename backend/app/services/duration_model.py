@@ -0,0 +1,431 @@
+"""DurationModel - (언어, 음성, 플랫폼)별 온라인 시간 예측 보정 모델
+
+배경:
+    - DurationLearningSystem 이 성공한 오디오마다 Neo4j 노드를 1개씩 즉시 기록
+    - 보정 계수는 언어별 계산기 싱글톤의 전역 값 1개 → 음성/플랫폼 차이 무시,
+      프로세스마다 따로 학습되고 재시작하면 1.0 으로 초기화
+
+구조:
+    - 키 (language, voice_id, platform) 마다 RunningStats (count, log 보정계수 EWMA, 오차 EWMA)
+      관측 1건은 (l, v, p) / (l, v, *) / (l, *, *) 세 수준을 모두 갱신
+      조회는 MIN_SAMPLES 이상 쌓인 가장 구체적인 수준의 계수 사용
+    - 보정 계수는 log(actual / raw_predicted) 의 지수이동평균 (최근 MEMORY 건 가중)
+    - 영속화: 학습 레코드와 통계 변화량을 메모리에 모아 백그라운드 스레드가
+      FLUSH_INTERVAL_SECONDS 마다 (또는 FLUSH_BATCH_SIZE 건 도달 시) UNWIND 배치로 기록
+      통계는 변화량 병합이라 여러 워커가 같은 키를 학습해도 덮어쓰지 않음
+    - 시작 시 DurationModelStats 노드에서 warm start
+      (없으면 기존 LearningRecord 이력을 집계해 초기화)
+    - 같은 스레드가 REFRESH_INTERVAL_SECONDS 마다 DurationModelStats 를 다시 읽어
+      다른 프로세스가 학습한 계수를 반영 (관측을 기록하지 않는 API 프로세스도 최신 계수 사용)
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+ANY = "*"
+MIN_SAMPLES = 3
+MEMORY = 20  # EWMA 유효 표본 수 (alpha 하한 = 1/MEMORY)
+FACTOR_BOUNDS = (0.5, 2.0)
+FLUSH_INTERVAL_SECONDS = 30.0
+REFRESH_INTERVAL_SECONDS = 60.0
+FLUSH_BATCH_SIZE = 50
+MAX_PENDING_RECORDS = 5000
+
+StatsKey = Tuple[str, str, str]
+
+
+@dataclass
+class RunningStats:
+    """키 1개의 온라인 통계 + 마지막 flush 이후 변화량"""
+    count: int = 0
+    log_factor: float = 0.0      # log(actual / raw_predicted) EWMA
+    abs_pct_error: float = 0.0   # |predicted - actual| / actual EWMA (보정 적용 예측 기준)
+    pending_count: int = 0
+    pending_log_sum: float = 0.0
+    pending_error_sum: float = 0.0
+
+    def observe(self, log_ratio: float, abs_pct_error: float) -> None:
+        self.count += 1
+        alpha = 1.0 / min(self.count, MEMORY)
+        self.log_factor += alpha * (log_ratio - self.log_factor)
+        self.abs_pct_error += alpha * (abs_pct_error - self.abs_pct_error)
+        self.pending_count += 1
+        self.pending_log_sum += log_ratio
+        self.pending_error_sum += abs_pct_error
+
+    @property
+    def factor(self) -> float:
+        low, high = FACTOR_BOUNDS
+        return min(high, max(low, math.exp(self.log_factor)))
+
+
+def stats_levels(language: str, voice_id: Optional[str], platform: Optional[str]) -> List[StatsKey]:
+    """구체적인 순서의 통계 키 목록: (l, v, p) → (l, v, *) → (l, *, *)"""
+    voice = voice_id or ANY
+    plat = (platform or ANY).lower()
+    levels = [(language, voice, plat), (language, voice, ANY), (language, ANY, ANY)]
+    return list(dict.fromkeys(levels))
+
+
+class DurationModel:
+    """(언어, 음성, 플랫폼)별 보정 계수 온라인 학습 + 배치 영속화"""
+
+    def __init__(
+        self,
+        neo4j: Any = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            neo4j: `query(cypher, params)` 를 가진 Neo4j 클라이언트 (None 이면 메모리 전용)
+            flush_interval: 백그라운드 flush 주기 (초)
+            batch_size: 이 건수가 쌓이면 주기 전이라도 flush
+            refresh_interval: 저장된 통계 재조회 주기 (초)
+        """
+        self.neo4j = neo4j
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.refresh_interval = refresh_interval
+        self._last_refresh = time.monotonic()
+
+        self._stats: Dict[StatsKey, RunningStats] = {}
+        self._pending_records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 예측 / 학습
+    # ─────────────────────────────────────────────────────────────────────
+
+    def factor(self, language: str, voice_id: Optional[str] = None, platform: Optional[str] = None) -> float:
+        """가장 구체적인 (MIN_SAMPLES 이상) 수준의 보정 계수, 없으면 1.0"""
+        with self._lock:
+            return self._factor_locked(language, voice_id, platform)
+
+    def _factor_locked(self, language: str, voice_id: Optional[str], platform: Optional[str]) -> float:
+        for key in stats_levels(language, voice_id, platform):
+            stats = self._stats.get(key)
+            if stats is not None and stats.count >= MIN_SAMPLES:
+                return stats.factor
+        return 1.0
+
+    def observe(
+        self,
+        language: str,
+        raw_predicted: float,
+        actual: float,
+        voice_id: Optional[str] = None,
+        platform: Optional[str] = None,
+        text: str = "",
+    ) -> Dict[str, float]:
+        """
+        실제 TTS 시간 1건 학습 (DB 기록은 다음 flush 로 지연)
+
+        Args:
+            raw_predicted: 보정 계수 적용 전 예측 시간 (초)
+            actual: 실제 오디오 시간 (초)
+
+        Returns:
+            {'predicted': 학습 전 계수로 보정한 예측, 'factor_before', 'factor_after'}
+        """
+        if raw_predicted <= 0 or actual <= 0:
+            factor = self.factor(language, voice_id, platform)
+            return {'predicted': raw_predicted * factor, 'factor_before': factor, 'factor_after': factor}
+
+        log_ratio = math.log(actual / raw_predicted)
+        with self._lock:
+            factor_before = self._factor_locked(language, voice_id, platform)
+            predicted = raw_predicted * factor_before
+            abs_pct_error = abs(predicted - actual) / actual
+
+            for key in stats_levels(language, voice_id, platform):
+                self._stats.setdefault(key, RunningStats()).observe(log_ratio, abs_pct_error)
+            factor_after = self._factor_locked(language, voice_id, platform)
+
+            self._pending_records.append({
+                "text": text[:500],
+                "language": language,
+                "predicted_duration": round(predicted, 2),
+                "actual_duration": actual,
+                "accuracy": max(0.0, 100 - abs_pct_error * 100),
+                "correction_factor": factor_after,
+                "platform": platform,
+                "voice_id": voice_id,
+                "timestamp": datetime.now().isoformat(),
+            })
+            if len(self._pending_records) > MAX_PENDING_RECORDS:
+                del self._pending_records[:-MAX_PENDING_RECORDS]
+            if len(self._pending_records) >= self.batch_size:
+                self._wake.set()
+
+        return {'predicted': predicted, 'factor_before': factor_before, 'factor_after': factor_after}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """현재 통계 (디버깅/모니터링용)"""
+        with self._lock:
+            return [
+                {
+                    "language": key[0], "voice_id": key[1], "platform": key[2],
+                    "count": stats.count, "factor": round(stats.factor, 4),
+                    "abs_pct_error": round(stats.abs_pct_error, 4),
+                }
+                for key, stats in sorted(self._stats.items())
+            ]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 영속화
+    # ─────────────────────────────────────────────────────────────────────
+
+    _LOAD_STATS = """
+    MATCH (m:DurationModelStats)
+    RETURN m.language AS language, m.voice_id AS voice_id, m.platform AS platform,
+           m.count AS count, m.log_factor AS log_factor, m.abs_pct_error AS abs_pct_error
+    """
+
+    # 저장된 predicted 는 (당시 계수 적용) 값 → raw ≈ predicted / correction_factor
+    _LOAD_HISTORY = """
+    MATCH (lr:LearningRecord)
+    WHERE lr.actual_duration > 0 AND lr.predicted_duration > 0
+    WITH lr.language AS language,
+         coalesce(lr.voice_id, '*') AS voice_id,
+         toLower(coalesce(lr.platform, '*')) AS platform,
+         log(lr.actual_duration * coalesce(lr.correction_factor, 1.0) / lr.predicted_duration) AS log_ratio,
+         abs(lr.predicted_duration - lr.actual_duration) / lr.actual_duration AS error
+    RETURN language, voice_id, platform, count(*) AS count,
+           avg(log_ratio) AS log_factor, avg(error) AS abs_pct_error
+    """
+
+    _SAVE_RECORDS = """
+    UNWIND $records AS r
+    CREATE (lr:LearningRecord {
+        text: r.text,
+        language: r.language,
+        predicted_duration: r.predicted_duration,
+        actual_duration: r.actual_duration,
+        accuracy: r.accuracy,
+        correction_factor: r.correction_factor,
+        platform: r.platform,
+        voice_id: r.voice_id,
+        timestamp: datetime(r.timestamp)
+    })
+    """
+
+    # 변화량 병합: 기존 값은 최대 MEMORY 건 가중치로 취급 (EWMA 와 같은 망각)
+    _SAVE_STATS = """
+    UNWIND $stats AS s
+    MERGE (m:DurationModelStats {language: s.language, voice_id: s.voice_id, platform: s.platform})
+    ON CREATE SET m.count = 0, m.log_factor = 0.0, m.abs_pct_error = 0.0
+    WITH m, s, CASE WHEN m.count < $memory THEN m.count ELSE $memory END AS weight
+    SET m.log_factor = (m.log_factor * weight + s.log_sum) / (weight + s.count),
+        m.abs_pct_error = (m.abs_pct_error * weight + s.error_sum) / (weight + s.count),
+        m.count = m.count + s.count,
+        m.updated_at = datetime()
+    RETURN m.language AS language, m.voice_id AS voice_id, m.platform AS platform,
+           m.count AS count, m.log_factor AS log_factor, m.abs_pct_error AS abs_pct_error
+    """
+
+    def warm_start(self) -> int:
+        """저장된 통계(없으면 LearningRecord 이력)로 초기화. 로드한 키 수 반환"""
+        if self.neo4j is None:
+            return 0
+        try:
+            rows = self.neo4j.query(self._LOAD_STATS, {})
+            if not rows:
+                rows = self._rollup(self.neo4j.query(self._LOAD_HISTORY, {}))
+        except Exception as e:
+            logger.warning(f"Duration model warm start failed (starting empty): {e}")
+            return 0
+
+        with self._lock:
+            self._apply_stats_locked(rows)
+        self._last_refresh = time.monotonic()
+
+        logger.info(f"Duration model warm-started: {len(rows)} keys")
+        return len(rows)
+
+    def refresh(self) -> int:
+        """저장된 통계 재조회 — 다른 프로세스가 학습한 계수 반영. 갱신한 키 수 반환"""
+        if self.neo4j is None:
+            return 0
+        # flush 와 직렬화: 병합 쿼리 전의 값을 읽어 방금 flush 한 학습분을 되돌리지 않도록
+        with self._flush_lock:
+            try:
+                rows = self.neo4j.query(self._LOAD_STATS, {})
+            except Exception as e:
+                logger.warning(f"Duration model refresh failed: {e}")
+                return 0
+            with self._lock:
+                updated = self._apply_stats_locked(rows)
+        self._last_refresh = time.monotonic()
+        logger.debug(f"Duration model refreshed: {updated} keys")
+        return updated
+
+    def _apply_stats_locked(self, rows: List[Dict[str, Any]]) -> int:
+        """저장된 통계로 덮어쓰기 (flush 대기 중인 관측이 있는 키는 건너뜀, lock 보유 상태에서 호출)"""
+        updated = 0
+        for row in rows or []:
+            key = (row["language"], row["voice_id"] or ANY, row["platform"] or ANY)
+            stats = self._stats.setdefault(key, RunningStats())
+            if stats.pending_count:
+                continue
+            stats.count = int(row["count"] or 0)
+            stats.log_factor = float(row["log_factor"] or 0.0)
+            stats.abs_pct_error = float(row["abs_pct_error"] or 0.0)
+            updated += 1
+        return updated
+
+    @staticmethod
+    def _rollup(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """가장 구체적인 키의 이력 집계 → 상위 수준 (l, v, *) / (l, *, *) 가중 평균"""
+        totals: Dict[StatsKey, List[float]] = {}
+        for row in rows:
+            count = int(row["count"] or 0)
+            voice = None if row["voice_id"] == ANY else row["voice_id"]
+            platform = None if row["platform"] == ANY else row["platform"]
+            for key in stats_levels(row["language"], voice, platform):
+                total = totals.setdefault(key, [0, 0.0, 0.0])
+                total[0] += count
+                total[1] += count * float(row["log_factor"] or 0.0)
+                total[2] += count * float(row["abs_pct_error"] or 0.0)
+        return [
+            {
+                "language": key[0], "voice_id": key[1], "platform": key[2], "count": count,
+                "log_factor": log_sum / count, "abs_pct_error": error_sum / count,
+            }
+            for key, (count, log_sum, error_sum) in totals.items() if count
+        ]
+
+    def flush(self) -> int:
+        """대기 중인 학습 레코드/통계 변화량을 배치 기록. 기록한 레코드 수 반환"""
+        if self.neo4j is None:
+            with self._lock:
+                self._pending_records.clear()
+                for stats in self._stats.values():
+                    stats.pending_count, stats.pending_log_sum, stats.pending_error_sum = 0, 0.0, 0.0
+            return 0
+
+        with self._flush_lock:
+            with self._lock:
+                records, self._pending_records = self._pending_records, []
+                deltas = []
+                for key, stats in self._stats.items():
+                    if stats.pending_count:
+                        deltas.append({
+                            "language": key[0], "voice_id": key[1], "platform": key[2],
+                            "count": stats.pending_count,
+                            "log_sum": stats.pending_log_sum,
+                            "error_sum": stats.pending_error_sum,
+                        })
+                        stats.pending_count, stats.pending_log_sum, stats.pending_error_sum = 0, 0.0, 0.0
+
+            if not records and not deltas:
+                return 0
+
+            try:
+                if records:
+                    self.neo4j.query(self._SAVE_RECORDS, {"records": records})
+                merged = self.neo4j.query(self._SAVE_STATS, {"stats": deltas, "memory": MEMORY}) if deltas else []
+            except Exception as e:
+                logger.warning(f"Duration model flush failed, will retry: {e}")
+                self._restore(records, deltas)
+                return 0
+
+            # 다른 워커가 기록한 학습분 반영 (flush 이후 새 관측이 없는 키만)
+            with self._lock:
+                self._apply_stats_locked(merged)
+
+        logger.debug(f"Duration model flushed: {len(records)} records, {len(deltas)} stats")
+        return len(records)
+
+    def _restore(self, records: List[Dict[str, Any]], deltas: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._pending_records[:0] = records
+            if len(self._pending_records) > MAX_PENDING_RECORDS:
+                del self._pending_records[:-MAX_PENDING_RECORDS]
+            for delta in deltas:
+                stats = self._stats.setdefault(
+                    (delta["language"], delta["voice_id"], delta["platform"]), RunningStats()
+                )
+                stats.pending_count += delta["count"]
+                stats.pending_log_sum += delta["log_sum"]
+                stats.pending_error_sum += delta["error_sum"]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 백그라운드 flush 스레드
+    # ─────────────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="duration-model-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """flush 스레드 종료 + 남은 데이터 기록"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+                # 관측이 없는 프로세스(API)도 다른 프로세스의 학습분을 주기적으로 반영
+                if time.monotonic() - self._last_refresh >= self.refresh_interval:
+                    self.refresh()
+            except Exception as e:
+                logger.warning(f"Duration model flush error: {e}")
+
+
+# ==================== 싱글톤 인스턴스 ====================
+
+_duration_model_instance: Optional[DurationModel] = None
+_duration_model_lock = threading.Lock()
+
+
+def get_duration_model() -> DurationModel:
+    """
+    DurationModel 싱글톤 (최초 호출 시 warm start + flush 스레드 시작,
+    DurationCalculator 에 연결)
+    """
+    global _duration_model_instance
+    with _duration_model_lock:
+        if _duration_model_instance is None:
+            from app.services.duration_calculator import set_duration_model
+
+            try:
+                from app.services.neo4j_client import get_neo4j_client
+                neo4j = get_neo4j_client()
+            except Exception as e:
+                logger.warning(f"Neo4j unavailable, duration model is in-memory only: {e}")
+                neo4j = None
+
+            model = DurationModel(neo4j)
+            model.warm_start()
+            model.start()
+            set_duration_model(model)
+            _duration_model_instance = model
+    return _duration_model_instance
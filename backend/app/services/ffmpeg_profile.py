@@ -167,6 +167,25 @@ def ios_safe_audio_encoder_args(
     return args
 
 
+def ios_safe_pcm_args(*, channels: int = 2) -> List[str]:
+    """
+    raw PCM(s16le) 교환 포맷 args — 디코드 출력과 stdin 파이프 입력 양쪽에 사용.
+
+    오디오를 numpy로 직접 편집할 때 쓴다. 표준 샘플레이트(48kHz)로 디코드하므로
+    ios_safe_audio_encoder_args 로 다시 인코딩할 때 리샘플이 일어나지 않는다.
+
+    예시:
+        decode = ["ffmpeg", "-i", src, *ios_safe_pcm_args(), raw_path]
+        encode = ["ffmpeg", *ios_safe_pcm_args(), "-i", "pipe:0",
+                  *ios_safe_audio_encoder_args(include_async_filter=False), dst]
+    """
+    return [
+        "-f", "s16le",
+        "-ac", str(channels),
+        "-ar", IOS_SAFE_AUDIO_SAMPLE_RATE,
+    ]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 컴포지트 헬퍼 — 자주 쓰는 패턴
 # ─────────────────────────────────────────────────────────────────────────────
@@ -259,6 +278,20 @@ def ios_safe_subtitle_burn_args(
     return args
 
 
+def ios_safe_gop_args(gop_seconds: float = 2.0) -> List[str]:
+    """
+    고정 GOP args — 세그먼트 병렬 인코딩 후 concat 할 때 사용.
+
+    모든 세그먼트가 같은 GOP 길이/키프레임 간격을 갖도록 강제한다.
+    scene-cut 키프레임을 끄므로 세그먼트 경계(GOP 배수)가 항상 IDR로 시작.
+
+    Args:
+        gop_seconds: GOP 길이 (초). IOS_SAFE_FPS 기준 프레임 수로 변환됨.
+    """
+    frames = str(int(round(float(IOS_SAFE_FPS) * gop_seconds)))
+    return ["-g", frames, "-keyint_min", frames, "-sc_threshold", "0"]
+
+
 def ios_safe_concat_demuxer_args() -> List[str]:
     """
     FFmpeg concat demuxer로 동일 codec/spec 클립을 이어붙일 때 쓰는 args.
@@ -0,0 +1,209 @@
+"""
+Format Transcoder — 마스터 1회 렌더 → 포맷별 crop/scale 병렬 트랜스코딩
+
+배경:
+    - 멀티플랫폼 export 는 포맷(16:9 / 9:16 / 1:1)마다 `npx remotion render` 를 따로 실행
+    - Chromium 렌더가 전체 작업에서 가장 비싼 단계 → 포맷 수만큼 반복 지불
+
+방식:
+    1. 컴포지션을 마스터 해상도로 한 번만 렌더 (Remotion --scale)
+       - 마스터 스케일은 가장 좁은 크롭도 업스케일되지 않도록 계산 (RENDER_MASTER_MAX_SCALE 상한)
+    2. 포맷별로 중앙 crop → lanczos scale 을 FFmpeg 로 병렬 실행
+    3. 인코딩 args 는 모두 ffmpeg_profile 의 ios_safe_* 헬퍼에서 가져온다 (ISS-037)
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.services.ffmpeg_profile import ios_safe_full_encode_args, verify_ios_safe_output
+from app.services.media_probe_service import get_media_probe_service
+
+logger = logging.getLogger(__name__)
+
+
+Size = Tuple[int, int]
+
+# 화면비별 표준 납품 해상도
+ASPECT_SIZES: Dict[str, Size] = {
+    "16:9": (1920, 1080),
+    "9:16": (1080, 1920),
+    "1:1": (1080, 1080),
+}
+
+# render_video_task 포맷 → 납품 해상도
+FORMAT_SIZES: Dict[str, Size] = {
+    "youtube": ASPECT_SIZES["16:9"],
+    "tiktok": ASPECT_SIZES["9:16"],
+    "instagram": ASPECT_SIZES["1:1"],
+}
+
+
+class TranscodeError(RuntimeError):
+    """포맷 트랜스코딩 실패"""
+
+
+@dataclass(frozen=True)
+class CropBox:
+    """마스터 프레임 내 중앙 크롭 영역 (짝수 픽셀)"""
+    width: int
+    height: int
+    x: int
+    y: int
+
+    @property
+    def filter(self) -> str:
+        return f"crop={self.width}:{self.height}:{self.x}:{self.y}"
+
+
+def _even(value: float) -> int:
+    return max(2, int(value) // 2 * 2)
+
+
+def center_crop(source: Size, target: Size) -> CropBox:
+    """source 프레임에서 target 화면비의 최대 중앙 크롭 영역"""
+    src_w, src_h = source
+    dst_w, dst_h = target
+    if dst_w * src_h <= src_w * dst_h:
+        # 목표가 더 좁음 → 높이 전체 사용, 좌우 크롭
+        width, height = _even(src_h * dst_w / dst_h), _even(src_h)
+    else:
+        width, height = _even(src_w), _even(src_w * dst_h / dst_w)
+    return CropBox(width, height, (src_w - width) // 2, (src_h - height) // 2)
+
+
+def required_master_scale(base: Size, targets: Iterable[Size]) -> float:
+    """모든 target 크롭이 업스케일 없이 나오기 위한 최소 마스터 배율"""
+    scale = 1.0
+    for target in targets:
+        crop = center_crop(base, target)
+        scale = max(scale, target[0] / crop.width, target[1] / crop.height)
+    return scale
+
+
+def master_render_scale(base: Size, targets: Iterable[Size], max_scale: float) -> float:
+    """Remotion --scale 값 (0.01 단위 올림, [1, max_scale] 범위)"""
+    scale = math.ceil(required_master_scale(base, targets) * 100) / 100
+    return min(max(1.0, scale), max(1.0, max_scale))
+
+
+def probe_video_size(path: str) -> Size:
+    """첫 번째 비디오 스트림 해상도"""
+    probe = get_media_probe_service().probe(path)
+    for stream in probe.get("streams", []):
+        if stream.get("codec_type") == "video":
+            return int(stream["width"]), int(stream["height"])
+    raise TranscodeError(f"No video stream: {path}")
+
+
+class FormatTranscoder:
+    """마스터 영상 → 포맷별 납품 영상 병렬 트랜스코더"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_hw_acceleration: bool = False,
+        verify_output: bool = False,
+    ):
+        """
+        Args:
+            workers: 동시 FFmpeg 프로세스 수 (None이면 포맷 수 기준 자동)
+            use_hw_acceleration: h264_videotoolbox 사용 여부 (macOS)
+            verify_output: 결과물 iOS 호환 검증 여부
+        """
+        self.workers = workers
+        self.use_hw_acceleration = use_hw_acceleration
+        self.verify_output = verify_output
+
+    def build_cmd(
+        self,
+        master_path: str,
+        master_size: Size,
+        target: Size,
+        output_path: str,
+        threads: int = 0,
+    ) -> List[str]:
+        """포맷 1개 트랜스코딩 명령 (중앙 crop → lanczos scale → iOS safe 인코딩)"""
+        crop = center_crop(master_size, target)
+        video_filter = f"{crop.filter},scale={target[0]}:{target[1]}:flags=lanczos,setsar=1"
+
+        cmd = ["ffmpeg", "-y", "-i", master_path, "-vf", video_filter]
+        cmd.extend(ios_safe_full_encode_args(
+            use_hw_acceleration=self.use_hw_acceleration,
+            threads=str(threads),
+        ))
+        cmd.append(output_path)
+        return cmd
+
+    def _run(self, cmd: List[str]) -> None:
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="ignore")[-2000:] if e.stderr else ""
+            raise TranscodeError(f"FFmpeg failed: {cmd[-1]}\n{stderr}") from e
+
+        if self.verify_output:
+            verify = verify_ios_safe_output(cmd[-1])
+            if not verify.get("ok"):
+                raise TranscodeError(f"Output is not iOS safe: {verify.get('errors')}")
+
+    def transcode(
+        self,
+        master_path: str,
+        targets: Dict[str, Size],
+        output_dir: str,
+    ) -> Dict[str, Optional[str]]:
+        """
+        마스터 영상을 포맷별로 병렬 트랜스코딩
+
+        Args:
+            master_path: 마스터 렌더 결과
+            targets: {포맷 이름: (width, height)}
+            output_dir: 출력 디렉토리 ({포맷 이름}.mp4)
+
+        Returns:
+            {포맷 이름: 출력 경로} — 실패한 포맷은 None
+        """
+        master_size = probe_video_size(master_path)
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        cpu_count = os.cpu_count() or 1
+        workers = max(1, min(self.workers or len(targets), len(targets)))
+        threads = max(1, cpu_count // workers)
+
+        jobs = {
+            name: self.build_cmd(
+                master_path, master_size, size, str(Path(output_dir) / f"{name}.mp4"), threads
+            )
+            for name, size in targets.items()
+        }
+        logger.info(
+            f"🎞️ Transcoding master {master_size[0]}x{master_size[1]} → "
+            f"{', '.join(f'{n} {w}x{h}' for n, (w, h) in targets.items())} ({workers} workers)"
+        )
+
+        results: Dict[str, Optional[str]] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcode") as pool:
+            futures = {name: pool.submit(self._run, cmd) for name, cmd in jobs.items()}
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    results[name] = jobs[name][-1]
+                except TranscodeError as e:
+                    logger.error(f"Transcode failed for {name}: {e}")
+                    results[name] = None
+        return results
+
+
+def get_format_transcoder() -> FormatTranscoder:
+    """설정 기반 FormatTranscoder 생성"""
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    return FormatTranscoder(workers=settings.RENDER_TRANSCODE_WORKERS or None)
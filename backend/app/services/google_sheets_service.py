@@ -9,6 +9,7 @@ from googleapiclient.errors import HttpError
 from contextlib import nullcontext
 
 from app.core.config import get_settings
+from app.services.sheets_ingestion import SheetChanges, SheetsIngestion
 
 settings = get_settings()
 
@@ -28,14 +29,21 @@ class GoogleSheetsService:
     - 전략 시트 읽기 (캠페인, 타겟, 톤앤매너)
     - 콘텐츠 스케줄 관리
     - 성과 데이터 기록
+
+    읽기는 SheetsIngestion 경유 (이벤트 루프 밖 실행, batchGet, 리비전 캐시)
     """
 
     # Google Sheets API 스코프
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets',
+        'https://www.googleapis.com/auth/drive.metadata.readonly',  # 리비전(version) 조회
+    ]
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.service = None
+        self.drive = None
+        self.ingestion: Optional[SheetsIngestion] = None
         self._initialize_client()
 
     def _initialize_client(self):
@@ -58,11 +66,21 @@ class GoogleSheetsService:
 
             # Google Sheets API 클라이언트 생성
             self.service = build('sheets', 'v4', credentials=credentials)
+            try:
+                self.drive = build('drive', 'v3', credentials=credentials)
+            except Exception as e:
+                self.logger.warning(f"Drive client unavailable, sheet changes detected by content hash: {e}")
+            self.ingestion = SheetsIngestion(
+                self.service,
+                drive=self.drive,
+                cache_dir=settings.SHEETS_CACHE_DIR
+            )
             self.logger.info("Google Sheets API client initialized successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to initialize Google Sheets client: {e}")
             self.service = None
+            self.ingestion = None
 
     def is_available(self) -> bool:
         """서비스 사용 가능 여부"""
@@ -90,12 +108,7 @@ class GoogleSheetsService:
 
         with span_context:
             try:
-                result = self.service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name
-                ).execute()
-
-                values = result.get('values', [])
+                values = await self.ingestion.fetch_range(spreadsheet_id, range_name)
                 self.logger.info(f"Read {len(values)} rows from {range_name}")
                 return values
 
@@ -106,6 +119,33 @@ class GoogleSheetsService:
                 self.logger.error(f"Error reading sheet: {e}")
                 raise
 
+    async def read_sheets(
+        self,
+        spreadsheet_id: str,
+        range_names: List[str]
+    ) -> Dict[str, List[List[str]]]:
+        """
+        여러 범위를 batchGet 1회로 읽기
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            range_names: 읽을 범위 리스트 (예: ['전략!A:Z', '스케줄!A:Z'])
+
+        Returns:
+            {범위: 2차원 배열}
+        """
+        if not self.is_available():
+            raise RuntimeError("Google Sheets service is not available")
+
+        span_context = logfire.span("google_sheets.batch_read", spreadsheet_id=spreadsheet_id, ranges=range_names) if LOGFIRE_AVAILABLE else nullcontext()
+
+        with span_context:
+            try:
+                return await self.ingestion.fetch_ranges(spreadsheet_id, range_names)
+            except HttpError as e:
+                self.logger.error(f"HTTP error batch reading sheet: {e}")
+                raise
+
     async def write_sheet(
         self,
         spreadsheet_id: str,
@@ -131,12 +171,15 @@ class GoogleSheetsService:
         with span_context:
             try:
                 body = {'values': values}
-                result = self.service.spreadsheets().values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name,
-                    valueInputOption='USER_ENTERED',
-                    body=body
-                ).execute()
+                result = await self.ingestion.execute(
+                    self.service.spreadsheets().values().update(
+                        spreadsheetId=spreadsheet_id,
+                        range=range_name,
+                        valueInputOption='USER_ENTERED',
+                        body=body
+                    )
+                )
+                self.ingestion.invalidate(spreadsheet_id)
 
                 updated_cells = result.get('updatedCells', 0)
                 self.logger.info(f"Updated {updated_cells} cells in {range_name}")
@@ -174,13 +217,16 @@ class GoogleSheetsService:
         with span_context:
             try:
                 body = {'values': values}
-                result = self.service.spreadsheets().values().append(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name,
-                    valueInputOption='USER_ENTERED',
-                    insertDataOption='INSERT_ROWS',
-                    body=body
-                ).execute()
+                result = await self.ingestion.execute(
+                    self.service.spreadsheets().values().append(
+                        spreadsheetId=spreadsheet_id,
+                        range=range_name,
+                        valueInputOption='USER_ENTERED',
+                        insertDataOption='INSERT_ROWS',
+                        body=body
+                    )
+                )
+                self.ingestion.invalidate(spreadsheet_id)
 
                 updated_rows = result.get('updates', {}).get('updatedRows', 0)
                 self.logger.info(f"Appended {updated_rows} rows to {range_name}")
@@ -302,6 +348,35 @@ class GoogleSheetsService:
 
         return schedule
 
+    async def get_schedule_changes(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str = "스케줄",
+        key_columns: Optional[List[str]] = None
+    ) -> SheetChanges:
+        """
+        마지막 호출 이후 추가/변경된 스케줄 행만 조회 (캠페인 폴링용)
+
+        시트 리비전이 그대로면 Sheets API 호출 없이 빈 변경분을 반환하므로
+        스크립트 생성 등 하위 단계는 changed 행만 처리하면 된다.
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            sheet_name: 시트 이름 (기본값: '스케줄')
+            key_columns: 행 식별 컬럼 (기본값: 캠페인명 + 소제목, 값이 없으면 행 번호)
+
+        Returns:
+            SheetChanges (changed: 레코드 리스트, removed: 사라진 행 키)
+        """
+        if not self.is_available():
+            raise RuntimeError("Google Sheets service is not available")
+
+        return await self.ingestion.changed_rows(
+            spreadsheet_id,
+            f"{sheet_name}!A:Z",
+            key_columns=key_columns or ["캠페인명", "소제목"]
+        )
+
     async def update_content_status(
         self,
         spreadsheet_id: str,
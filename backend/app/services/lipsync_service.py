@@ -19,6 +19,8 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import get_settings
+from app.services.media_probe_service import MediaProbeError, get_media_probe_service
+from app.services.streaming_io import download_to_file
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -438,14 +440,9 @@ class LipsyncService:
         """
         logger.info(f"Downloading video from {video_url} to {output_path}")
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.get(video_url)
-            response.raise_for_status()
-
-            # 파일 저장
-            Path(output_path).write_bytes(response.content)
+        saved = await download_to_file(video_url, output_path, timeout=300.0)
 
-            logger.info(f"Video downloaded: {output_path} ({len(response.content)} bytes)")
+        logger.info(f"Video downloaded: {output_path} ({saved.size} bytes)")
 
     async def _get_video_duration(self, video_path: str) -> float:
         """
@@ -457,30 +454,10 @@ class LipsyncService:
         Returns:
             영상 길이 (초)
         """
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            video_path
-        ]
-
         try:
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await result.communicate()
+            return await get_media_probe_service().aget_duration(video_path)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"ffprobe failed: {stderr.decode()}")
-
-            duration = float(stdout.decode().strip())
-            return duration
-
-        except Exception as e:
+        except MediaProbeError as e:
             logger.warning(f"Failed to get video duration: {e}, using default 10s")
             return 10.0  # 기본값
 
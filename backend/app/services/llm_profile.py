@@ -32,6 +32,12 @@ Variant via Parameter, Not Branch / Verifier Co-located)을 LLM 호출 영역에
     - continuity        : 콘티 일관성 (Claude Haiku, temp=0.3)
     - slide_to_script   : 슬라이드→스크립트 (Claude Haiku, temp=0.7)
     - long_form         : 긴 콘텐츠 (Claude Sonnet, temp=0.7)
+    - subtitle_translate: 자막 세그먼트 배치 번역 (GPT-4o-mini, temp=0.0)
+
+응답 캐시:
+    continuity 는 cache_ttl_seconds 가 설정되어 llm_response_cache 로 동일 프롬프트 응답을 재사용한다
+    (LangChain 호출 사이트는 모두 LLMResponseCache.cached_ainvoke 경유 — 창작 태스크는 TTL 없음 = 항상 호출).
+    subtitle_translate 는 subtitle_localization 이 원본 세그먼트 해시로 언어별 결과를 캐시한다.
 """
 from __future__ import annotations
 
@@ -63,6 +69,9 @@ MODEL_PRICING = {
 # 1 USD ≈ 1400 KRW (대략, 가격 표시용)
 USD_TO_KRW = 1400
 
+# 콘티 응답 캐시 TTL (같은 스크립트 → 같은 씬 분할·카메라 워크·리소스 매핑)
+CONTINUITY_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Task 프리셋 (단일 진실 소스)
@@ -80,6 +89,7 @@ TaskName = Literal[
     "continuity",
     "slide_to_script",
     "long_form",
+    "subtitle_translate",
 ]
 
 
@@ -94,6 +104,7 @@ class TaskPreset:
     timeout_seconds: int = 60
     retry_attempts: int = 3
     response_format: Optional[str] = None  # "json_object" 등
+    cache_ttl_seconds: Optional[int] = None  # 설정 시 llm_response_cache 사용 (None=캐시 안 함)
 
 
 # 모든 task 프리셋의 단일 카탈로그.
@@ -187,6 +198,7 @@ TASK_PRESETS: dict[TaskName, TaskPreset] = {
             "장면 간 연결, 캐릭터 일관성, 톤 유지를 검증합니다."
         ),
         backend="langchain_anthropic",
+        cache_ttl_seconds=CONTINUITY_CACHE_TTL_SECONDS,
     ),
     "slide_to_script": TaskPreset(
         model=CLAUDE_3_HAIKU,
@@ -209,6 +221,21 @@ TASK_PRESETS: dict[TaskName, TaskPreset] = {
         ),
         backend="langchain_anthropic",
     ),
+    "subtitle_translate": TaskPreset(
+        model=GPT_4O_MINI,
+        temperature=0.0,
+        max_tokens=4000,
+        system_prompt=(
+            "당신은 영상 자막 번역가입니다. JSON의 lines 배열을 "
+            "source_language 에서 target_language 로 번역하여 "
+            '{"lines": [...]} 형식으로만 응답합니다. '
+            "줄 수와 순서를 반드시 유지하고, 줄을 합치거나 나누지 않습니다. "
+            "자막답게 짧고 자연스러운 구어체로 번역합니다."
+        ),
+        backend="openai",
+        response_format="json_object",
+        # 캐시는 subtitle_localization 이 원본 세그먼트 해시 기준으로 직접 관리
+    ),
 }
 
 
@@ -456,5 +483,6 @@ def task_info(task: TaskName) -> dict[str, Any]:
         "max_tokens": preset.max_tokens,
         "system_prompt_preview": preset.system_prompt[:100] + ("..." if len(preset.system_prompt) > 100 else ""),
         "response_format": preset.response_format,
+        "cache_ttl_seconds": preset.cache_ttl_seconds,
         "model_pricing_per_1m": MODEL_PRICING.get(preset.model),
     }
@@ -0,0 +1,341 @@
+"""
+LLM Response Cache — llm_profile task 프리셋 단위 응답 캐시
+
+배경:
+    - continuity(콘티 씬 분할·카메라 워크·리소스 매핑)는 같은 스크립트로 재생성할 때마다
+      동일 프롬프트를 다시 전송 (지연 + 비용)
+    - 모델/온도/프롬프트가 같으면 같은 콘티를 재사용하는 편이 일관성 면에서도 낫다
+
+원칙:
+    1. 캐시 여부·TTL 은 llm_profile.TaskPreset.cache_ttl_seconds 로 task 별 결정
+       (None 이면 캐시하지 않음 — 창작 태스크는 매번 새 응답)
+    2. 키 = sha256(task, model, system prompt 해시, messages 해시, 파라미터)
+    3. 로컬 SQLite 저장소, TTL 만료 + 최대 엔트리 수 초과 시 LRU 삭제
+    4. task 별 hit/miss/hit_rate 와 절약 비용(USD) 보고
+
+사용 예 (LangChain ChatAnthropic/ChatOpenAI):
+    content = await get_llm_response_cache().cached_ainvoke(
+        self.llm, "continuity", messages, validate=json.loads
+    )
+
+    writer / slide_to_script 도 같은 래퍼를 거치지만 프리셋에 TTL 이 없어 항상 모델을 호출한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.llm_profile import TASK_PRESETS, TaskName, estimate_cost_usd
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    task TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used_at);
+"""
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def build_cache_key(
+    task: str,
+    model: str,
+    system_prompt: str,
+    messages: List[Dict[str, Any]],
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        task: llm_profile task 이름
+        model: 모델 이름
+        system_prompt: 시스템 프롬프트
+        messages: system 을 제외한 메시지 목록 (OpenAI/Anthropic dict 형식)
+        params: temperature, max_tokens, response_format 등 응답에 영향을 주는 옵션
+    """
+    payload = json.dumps(
+        {
+            "task": task,
+            "model": model,
+            "system": _sha256(system_prompt or ""),
+            "messages": _sha256(json.dumps(messages, sort_keys=True, ensure_ascii=False)),
+            "params": params or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return _sha256(payload)
+
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (":memory:" 가능)
+            max_entries: 최대 엔트리 수 (초과 시 오래 안 쓴 순으로 삭제)
+            enabled: False면 항상 원 호출 실행
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 저장소
+    # ─────────────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Tuple[str, int, int]]:
+        """(response, input_tokens, output_tokens) 또는 None (없음/만료)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, input_tokens, output_tokens, expires_at "
+                "FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[3] <= now:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_used_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        return row[0], row[1], row[2]
+
+    def put(
+        self,
+        key: str,
+        task: str,
+        model: str,
+        response: str,
+        ttl_seconds: int,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, task, model, response, input_tokens, output_tokens, "
+                " created_at, expires_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, task, model, response, input_tokens, output_tokens,
+                 now, now + ttl_seconds, now),
+            )
+            self._evict_locked(now)
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _evict_locked(self, now: float) -> None:
+        """만료 엔트리 삭제 + max_entries 초과분 LRU 삭제 (lock 보유 상태에서 호출)"""
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY last_used_at ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def clear(self, task: Optional[str] = None) -> int:
+        """엔트리 삭제 (task 지정 시 해당 task만). 삭제 건수 반환"""
+        with self._lock:
+            if task:
+                cursor = self._conn.execute("DELETE FROM llm_responses WHERE task = ?", (task,))
+            else:
+                cursor = self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            return cursor.rowcount
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 호출 래퍼
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _record(self, task: str, hit: bool, input_tokens: int = 0, output_tokens: int = 0) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(task, {"hits": 0, "misses": 0, "saved_usd": 0.0})
+            entry["hits" if hit else "misses"] += 1
+            if hit and task in TASK_PRESETS:
+                entry["saved_usd"] = round(
+                    entry["saved_usd"]
+                    + estimate_cost_usd(task, input_tokens=input_tokens, output_tokens=output_tokens),
+                    6,
+                )
+
+    async def get_or_call(
+        self,
+        task: TaskName,
+        request: Dict[str, Any],
+        call: Callable[[], Awaitable[Tuple[str, int, int]]],
+        validate: Optional[Callable[[str], Any]] = None,
+    ) -> str:
+        """
+        캐시 조회 후 miss 면 call() 실행·저장
+
+        Args:
+            task: llm_profile task 이름 (프리셋의 cache_ttl_seconds 로 캐시 여부 결정)
+            request: llm_safe_*_kwargs 결과 (model/system/messages/temperature/...)
+            call: 실제 LLM 호출 — (response_text, input_tokens, output_tokens) 반환
+            validate: 응답 검증 (예: JSON 파싱). 예외를 던지면 저장하지 않고 그대로 전파 —
+                깨진 응답이 TTL 동안 재생되지 않도록. 캐시된 응답이 검증에 실패하면 삭제 후 재호출
+
+        Returns:
+            응답 텍스트
+        """
+        ttl = TASK_PRESETS[task].cache_ttl_seconds
+        if not self.enabled or not ttl:
+            text, _, _ = await call()
+            return text
+
+        messages = list(request.get("messages", []))
+        system_prompt = request.get("system", "")
+        if messages and messages[0].get("role") == "system":
+            system_prompt = messages[0]["content"]
+            messages = messages[1:]
+        params = {
+            k: v for k, v in request.items()
+            if k not in ("model", "messages", "system")
+        }
+        key = build_cache_key(task, request["model"], system_prompt, messages, params)
+
+        cached = self.get(key)
+        if cached is not None:
+            try:
+                if validate is not None:
+                    validate(cached[0])
+            except Exception as e:
+                logger.warning(f"LLM cache entry failed validation, dropping: task={task}, error={e}")
+                self.delete(key)
+            else:
+                self._record(task, True, cached[1], cached[2])
+                logger.debug(f"LLM cache hit: task={task}")
+                return cached[0]
+
+        text, input_tokens, output_tokens = await call()
+        self._record(task, False)
+        if validate is not None:
+            validate(text)
+        self.put(key, task, request["model"], text, ttl, input_tokens, output_tokens)
+        return text
+
+    async def cached_ainvoke(
+        self,
+        llm: Any,
+        task: TaskName,
+        messages: List[Any],
+        validate: Optional[Callable[[str], Any]] = None,
+    ) -> str:
+        """
+        LangChain chat 모델 ainvoke (캐시)
+
+        Args:
+            llm: llm_safe_langchain_chat_kwargs 로 생성한 ChatAnthropic / ChatOpenAI
+            task: llm_profile task 이름
+            messages: SystemMessage / HumanMessage 목록
+            validate: get_or_call 참조 — 실패한 응답은 캐시하지 않음
+
+        Returns:
+            응답 텍스트 (response.content)
+        """
+        request = {
+            "model": getattr(llm, "model", None) or TASK_PRESETS[task].model,
+            "messages": [{"role": m.type, "content": m.content} for m in messages],
+            "temperature": getattr(llm, "temperature", None),
+            "max_tokens": getattr(llm, "max_tokens", None),
+        }
+
+        async def call() -> Tuple[str, int, int]:
+            response = await llm.ainvoke(messages)
+            usage = getattr(response, "usage_metadata", None) or {}
+            return (
+                response.content,
+                usage.get("input_tokens", 0) or 0,
+                usage.get("output_tokens", 0) or 0,
+            )
+
+        return await self.get_or_call(task, request, call, validate=validate)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 통계
+    # ─────────────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로세스 누적 task별 hit/miss/hit_rate 및 저장소 엔트리 수"""
+        with self._lock:
+            tasks = {name: dict(entry) for name, entry in self._stats.items()}
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        for entry in tasks.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / lookups * 100, 2) if lookups else 0.0
+        return {
+            "enabled": self.enabled,
+            "tasks": tasks,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "cached_tasks": sorted(
+                name for name, preset in TASK_PRESETS.items() if preset.cache_ttl_seconds
+            ),
+        }
+
+
+# 싱글톤 인스턴스
+_llm_response_cache_instance: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """LLMResponseCache 싱글톤 인스턴스"""
+    global _llm_response_cache_instance
+    if _llm_response_cache_instance is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _llm_response_cache_instance = LLMResponseCache(
+            db_path=settings.LLM_CACHE_PATH,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            enabled=settings.LLM_CACHE_ENABLED,
+        )
+    return _llm_response_cache_instance
@@ -0,0 +1,493 @@
+"""
+Local Vector Index — Pinecone 호환 로컬 ANN 인덱스 (NumPy memmap + IVF)
+
+배경:
+    - YouTubeThumbnailLearner / ContentPerformanceTracker 의 유사도 검색이
+      매 호출 원격 Pinecone 왕복 → 네트워크 지연, 오프라인 테스트 불가
+
+구조:
+    - 벡터: float32 (capacity, dim) 행렬을 .npy memmap 으로 보관 (cosine 이면 정규화 후 저장)
+      용량 부족 시 2배로 재할당
+    - 메타데이터/행 번호/IVF 리스트 번호: SQLite (upsert 마다 해당 행만 기록)
+    - IVF: 벡터 수가 train_threshold 이상이면 spherical k-means 로 nlist≈√N 개 중심점 학습
+      질의 시 가까운 nprobe 개 리스트만 정밀 스코어링, 학습 전에는 전체 스캔
+      벡터 수가 학습 시점의 RETRAIN_GROWTH 배가 되면 재학습
+    - 필터: Pinecone 문법 ($eq/$ne/$gt/$gte/$lt/$lte/$in/$nin/$and/$or)
+      IVF 후보에서 top_k 를 못 채우면 필터 통과 행 전체를 정밀 스캔 (선택적 필터 대비)
+
+Pinecone Index 와 같은 upsert/query/fetch/delete/describe_index_stats 인터페이스를 제공하므로
+get_vector_index() 결과를 pinecone_index 자리에 그대로 넘기면 된다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import operator
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DIMENSION = 512  # CLIP ViT-B/32
+DEFAULT_NPROBE = 16
+DEFAULT_TRAIN_THRESHOLD = 4096
+RETRAIN_GROWTH = 4
+INITIAL_CAPACITY = 1024
+KMEANS_ITERATIONS = 10
+KMEANS_MAX_SAMPLES = 32_768
+ASSIGN_CHUNK = 8192
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    id TEXT PRIMARY KEY,
+    row INTEGER NOT NULL UNIQUE,
+    list_id INTEGER NOT NULL DEFAULT -1,
+    metadata TEXT NOT NULL
+);
+"""
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# 메타데이터 필터 (Pinecone 문법)
+# ─────────────────────────────────────────────────────────────────────────
+
+_FILTER_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": operator.eq,
+    "$ne": operator.ne,
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+}
+# 필드가 없어도 참인 연산자
+_MISSING_OK = frozenset({"$ne", "$nin"})
+
+
+def matches_filter(metadata: Optional[Dict[str, Any]], flt: Optional[Dict[str, Any]]) -> bool:
+    """
+    Pinecone 메타데이터 필터 평가
+
+    Raises:
+        ValueError: 지원하지 않는 연산자
+    """
+    if not flt:
+        return True
+    metadata = metadata or {}
+
+    for key, condition in flt.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        value = metadata.get(key)
+        for op, operand in condition.items():
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            if value is None:
+                if op in _MISSING_OK:
+                    continue
+                return False
+            try:
+                if not _FILTER_OPS[op](value, operand):
+                    return False
+            except TypeError:
+                return False
+    return True
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# 인덱스
+# ─────────────────────────────────────────────────────────────────────────
+
+class LocalVectorIndex:
+    """Pinecone Index 호환 로컬 벡터 인덱스 (memmap + IVF)"""
+
+    def __init__(
+        self,
+        directory: str,
+        dimension: int = DEFAULT_DIMENSION,
+        metric: str = "cosine",
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD,
+    ):
+        """
+        Args:
+            directory: 인덱스 파일 디렉토리 (vectors.npy, centroids.npy, index.sqlite3)
+            dimension: 벡터 차원
+            metric: "cosine" | "dotproduct"
+            nprobe: 질의 시 탐색할 IVF 리스트 수
+            train_threshold: IVF 학습을 시작할 최소 벡터 수 (미만이면 전체 스캔)
+        """
+        if metric not in ("cosine", "dotproduct"):
+            raise ValueError(f"Unsupported metric: {metric}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dimension = dimension
+        self.metric = metric
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+
+        self._lock = threading.RLock()
+        self._vectors_path = self.directory / "vectors.npy"
+        self._centroids_path = self.directory / "centroids.npy"
+
+        self._conn = sqlite3.connect(
+            str(self.directory / "index.sqlite3"), timeout=30, check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+        self._vectors: Optional[np.memmap] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._count = 0  # 사용된 행 수 (삭제된 행 포함)
+        self._ids: List[Optional[str]] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+        self._row_of: Dict[str, int] = {}
+        self._assign = np.full(0, -1, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+
+        self._load()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 저장소
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        rows = self._conn.execute("SELECT id, row, list_id, metadata FROM vectors").fetchall()
+        if self._vectors_path.exists():
+            self._vectors = np.load(self._vectors_path, mmap_mode="r+")
+            if self._vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Index dimension {self._vectors.shape[1]} != requested {self.dimension}"
+                )
+        capacity = self._vectors.shape[0] if self._vectors is not None else 0
+
+        self._count = max((row for _, row, _, _ in rows), default=-1) + 1
+        self._ids = [None] * self._count
+        self._metadata = [None] * self._count
+        self._assign = np.full(capacity, -1, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        for item_id, row, list_id, metadata in rows:
+            self._ids[row] = item_id
+            self._metadata[row] = json.loads(metadata)
+            self._row_of[item_id] = row
+            self._assign[row] = list_id
+            self._alive[row] = True
+
+        if self._centroids_path.exists():
+            self._centroids = np.load(self._centroids_path)
+            self._trained_size = len(rows)
+
+        if rows:
+            logger.info(f"Local vector index loaded: {self.directory} ({len(rows)} vectors)")
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._vectors.shape[0] if self._vectors is not None else 0
+        if needed <= capacity:
+            return
+
+        new_capacity = max(INITIAL_CAPACITY, capacity * 2)
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        tmp_path = self._vectors_path.with_name("vectors.tmp.npy")
+        grown = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=np.float32, shape=(new_capacity, self.dimension)
+        )
+        if self._vectors is not None:
+            grown[:self._count] = self._vectors[:self._count]
+        grown.flush()
+        del grown
+        self._vectors = None
+        os.replace(tmp_path, self._vectors_path)
+        self._vectors = np.load(self._vectors_path, mmap_mode="r+")
+
+        self._assign = np.concatenate([self._assign, np.full(new_capacity - capacity, -1, dtype=np.int32)])
+        self._alive = np.concatenate([self._alive, np.zeros(new_capacity - capacity, dtype=bool)])
+
+    def _prepare(self, values: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(values, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dimension:
+            raise ValueError(f"Vector dimension {vector.shape[0]} != index dimension {self.dimension}")
+        if self.metric == "cosine":
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vector = vector / norm
+        return vector
+
+    @staticmethod
+    def _normalize_item(item: Any) -> tuple:
+        if isinstance(item, dict):
+            return item["id"], item["values"], item.get("metadata") or {}
+        item_id, values, *rest = item
+        return item_id, values, (rest[0] if rest else None) or {}
+
+    # ─────────────────────────────────────────────────────────────────────
+    # IVF 학습
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _nearest_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _train(self) -> None:
+        """alive 벡터로 spherical k-means 학습 후 전체 재할당"""
+        alive_rows = np.flatnonzero(self._alive[:self._count])
+        n = len(alive_rows)
+        nlist = min(n, int(min(4096, max(16, math.sqrt(n)))))
+        rng = np.random.default_rng(0)
+
+        sample_rows = alive_rows
+        if n > KMEANS_MAX_SAMPLES:
+            sample_rows = np.sort(rng.choice(alive_rows, KMEANS_MAX_SAMPLES, replace=False))
+        sample = np.asarray(self._vectors[sample_rows])
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = sums / np.maximum(norms, 1e-12)
+
+        self._centroids = centroids.astype(np.float32)
+        np.save(self._centroids_path, self._centroids)
+
+        for start in range(0, n, ASSIGN_CHUNK):
+            chunk = alive_rows[start:start + ASSIGN_CHUNK]
+            self._assign[chunk] = self._nearest_centroids(np.asarray(self._vectors[chunk]))
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE vectors SET list_id = ? WHERE row = ?",
+                [(int(self._assign[row]), int(row)) for row in alive_rows],
+            )
+
+        self._trained_size = n
+        logger.info(f"Local vector index trained: {n} vectors, nlist={nlist}")
+
+    def _maybe_train(self) -> None:
+        alive = int(self._alive[:self._count].sum())
+        if self._centroids is None:
+            if alive >= self.train_threshold:
+                self._train()
+        elif alive >= self._trained_size * RETRAIN_GROWTH:
+            self._train()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Pinecone 호환 API
+    # ─────────────────────────────────────────────────────────────────────
+
+    def upsert(self, vectors: Iterable[Any], **kwargs) -> Dict[str, int]:
+        """
+        벡터 추가/갱신 (같은 id 면 같은 행 덮어쓰기)
+
+        Args:
+            vectors: [(id, values, metadata)] 또는 [{"id", "values", "metadata"}]
+        """
+        items = [self._normalize_item(item) for item in vectors]
+        if not items:
+            return {"upserted_count": 0}
+
+        with self._lock:
+            new_ids = {item_id for item_id, _, _ in items if item_id not in self._row_of}
+            self._ensure_capacity(self._count + len(new_ids))
+
+            records = []
+            for item_id, values, metadata in items:
+                vector = self._prepare(values)
+                row = self._row_of.get(item_id)
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._ids.append(item_id)
+                    self._metadata.append(None)
+                    self._row_of[item_id] = row
+
+                self._vectors[row] = vector
+                self._metadata[row] = metadata
+                self._alive[row] = True
+                self._assign[row] = (
+                    int(self._nearest_centroids(vector[None, :])[0])
+                    if self._centroids is not None else -1
+                )
+                records.append((
+                    item_id, row, int(self._assign[row]),
+                    json.dumps(metadata, ensure_ascii=False, default=str),
+                ))
+
+            self._vectors.flush()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO vectors (id, row, list_id, metadata) VALUES (?, ?, ?, ?)",
+                    records,
+                )
+            self._maybe_train()
+
+        return {"upserted_count": len(items)}
+
+    def query(
+        self,
+        vector: Sequence[float],
+        top_k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = False,
+        include_values: bool = False,
+        nprobe: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        유사 벡터 검색
+
+        Args:
+            vector: 질의 벡터
+            top_k: 반환 개수
+            filter: Pinecone 메타데이터 필터
+            include_metadata / include_values: 결과에 포함할 항목
+            nprobe: 이번 질의만 탐색 리스트 수 변경 (학습 전/nlist 이상이면 전체 스캔)
+
+        Returns:
+            {"matches": [{"id", "score", "metadata"?, "values"?}, ...]} (score 내림차순)
+        """
+        query = self._prepare(vector)
+
+        with self._lock:
+            if self._count == 0 or top_k <= 0:
+                return {"matches": []}
+
+            alive = self._alive[:self._count]
+            probe = nprobe or self.nprobe
+            exhaustive = self._centroids is None or probe >= len(self._centroids)
+
+            if exhaustive:
+                rows = np.flatnonzero(alive)
+            else:
+                lists = np.argpartition(-(self._centroids @ query), probe - 1)[:probe]
+                rows = np.flatnonzero(alive & np.isin(self._assign[:self._count], lists))
+
+            if filter:
+                rows = self._filter_rows(rows, filter)
+                if len(rows) < top_k and not exhaustive:
+                    # 선택적 필터 → 필터 통과 행 전체 정밀 스캔
+                    rows = self._filter_rows(np.flatnonzero(alive), filter)
+
+            rows, scores = self._top_k(rows, query, top_k)
+
+            matches = []
+            for row, score in zip(rows, scores):
+                match: Dict[str, Any] = {"id": self._ids[row], "score": float(score)}
+                if include_metadata:
+                    match["metadata"] = dict(self._metadata[row] or {})
+                if include_values:
+                    match["values"] = self._vectors[row].tolist()
+                matches.append(match)
+
+        return {"matches": matches}
+
+    def _filter_rows(self, rows: np.ndarray, flt: Dict[str, Any]) -> np.ndarray:
+        return np.fromiter(
+            (row for row in rows if matches_filter(self._metadata[row], flt)), dtype=np.int64
+        )
+
+    def _top_k(self, rows: np.ndarray, query: np.ndarray, top_k: int) -> tuple:
+        if len(rows) == 0:
+            return rows, np.zeros(0, dtype=np.float32)
+        if rows[-1] - rows[0] + 1 == len(rows):
+            # 연속 구간 (전체 스캔) → 슬라이스로 memmap 복사 없이 계산
+            scores = self._vectors[rows[0]:rows[-1] + 1] @ query
+        else:
+            scores = np.asarray(self._vectors[rows]) @ query
+        if len(rows) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+            rows, scores = rows[best], scores[best]
+        order = np.argsort(-scores, kind="stable")
+        return rows[order], scores[order]
+
+    def fetch(self, ids: Iterable[str], **kwargs) -> Dict[str, Dict[str, Any]]:
+        """id 로 벡터 조회"""
+        with self._lock:
+            vectors = {}
+            for item_id in ids:
+                row = self._row_of.get(item_id)
+                if row is not None:
+                    vectors[item_id] = {
+                        "id": item_id,
+                        "values": self._vectors[row].tolist(),
+                        "metadata": dict(self._metadata[row] or {}),
+                    }
+        return {"vectors": vectors}
+
+    def delete(self, ids: Optional[Iterable[str]] = None, delete_all: bool = False, **kwargs) -> Dict:
+        """id 삭제 (행은 비워 두고 재사용하지 않음)"""
+        with self._lock:
+            targets = list(self._row_of) if delete_all else list(ids or [])
+            for item_id in targets:
+                row = self._row_of.pop(item_id, None)
+                if row is None:
+                    continue
+                self._alive[row] = False
+                self._assign[row] = -1
+                self._ids[row] = None
+                self._metadata[row] = None
+            with self._conn:
+                self._conn.executemany("DELETE FROM vectors WHERE id = ?", [(i,) for i in targets])
+        return {}
+
+    def describe_index_stats(self, **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "dimension": self.dimension,
+                "total_vector_count": len(self._row_of),
+                "ivf_lists": len(self._centroids) if self._centroids is not None else 0,
+            }
+
+
+# 인덱스 이름별 싱글톤
+_local_indexes: Dict[str, LocalVectorIndex] = {}
+_local_indexes_lock = threading.Lock()
+
+
+def get_vector_index(name: Optional[str] = None, dimension: int = DEFAULT_DIMENSION):
+    """
+    설정된 벡터 인덱스 백엔드 반환 (VECTOR_INDEX_BACKEND = "local" | "pinecone")
+
+    Args:
+        name: 인덱스 이름 (기본 PINECONE_INDEX_NAME)
+        dimension: 로컬 인덱스 벡터 차원
+    """
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    name = name or settings.PINECONE_INDEX_NAME
+
+    if settings.VECTOR_INDEX_BACKEND == "pinecone":
+        from pinecone import Pinecone
+        return Pinecone(api_key=settings.PINECONE_API_KEY).Index(name)
+
+    with _local_indexes_lock:
+        if name not in _local_indexes:
+            _local_indexes[name] = LocalVectorIndex(
+                directory=str(Path(settings.VECTOR_INDEX_DIR) / name),
+                dimension=dimension,
+                nprobe=settings.VECTOR_INDEX_NPROBE,
+            )
+        return _local_indexes[name]
@@ -0,0 +1,430 @@
+"""
+Media Probe Service — ffprobe 결과 공유 캐시
+
+배경:
+    - VideoRenderer._merge_with_transitions 가 클립마다 ffmpeg.probe 호출
+    - BGMEditorService.apply_bgm_effects 는 같은 BGM을 두 번 probe
+    - VideoEditorService / LipsyncService / VideoMetadataService 가 각자 다시 probe
+    → 한 번의 렌더에서 같은 파일을 여러 번 ffprobe 하는 낭비 발생
+
+원칙:
+    1. ffprobe 호출은 이 모듈을 통해서만 한다 (직접 subprocess 금지)
+    2. 캐시 키는 (절대경로, size, mtime_ns) — 파일이 바뀌면 자동 무효화
+    3. 2단 캐시: in-process LRU → 디스크 JSON (워커 재시작/프로세스 간 공유)
+    4. 동일 파일 동시 probe 는 in-flight 공유로 1회만 실행
+    5. 실패 결과는 캐시하지 않는다
+
+사용 예:
+    probe_service = get_media_probe_service()
+    duration = probe_service.get_duration("narration.mp3")
+    results = probe_service.probe_many(["a.mp4", "b.mp4", "c.mp4"])
+    durations = await probe_service.aget_durations(audio_files)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_DISK_ENTRIES = 20000
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PROBE_TIMEOUT = 30
+
+# 디스크 캐시 prune 주기 (쓰기 N회마다 1번 디렉토리 스캔)
+_DISK_PRUNE_INTERVAL = 256
+
+
+class MediaProbeError(RuntimeError):
+    """ffprobe 실행/파싱 실패"""
+
+
+CacheKey = Tuple[str, int, int]
+
+
+class MediaProbeService:
+    """ffprobe 결과 2단 캐시 (LRU + 디스크) + 병렬 배치 probe"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        disk_entries: int = DEFAULT_DISK_ENTRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: int = DEFAULT_PROBE_TIMEOUT,
+    ):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리 캐시만 사용)
+            memory_entries: in-process LRU 최대 항목 수
+            disk_entries: 디스크 캐시 최대 항목 수 (초과 시 오래된 것부터 삭제)
+            max_workers: probe_many 동시 실행 ffprobe 프로세스 수
+            timeout: ffprobe 1회 타임아웃 (초)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self._memory: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "inflight_shared": 0,
+            "errors": 0,
+        }
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 캐시 키
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def cache_key(file_path: str) -> CacheKey:
+        """
+        (절대경로, size, mtime_ns) 캐시 키
+
+        Raises:
+            MediaProbeError: 파일이 존재하지 않을 때
+        """
+        abs_path = os.path.abspath(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError as e:
+            raise MediaProbeError(f"Media file not found: {file_path}") from e
+        return (abs_path, st.st_size, st.st_mtime_ns)
+
+    def _disk_path(self, key: CacheKey) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(f"{key[0]}|{key[1]}|{key[2]}".encode()).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 캐시 조회/저장
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _memory_get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+            return value
+
+    def _memory_put(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            value = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Corrupt probe cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        with self._lock:
+            self._stats["disk_hits"] += 1
+        return value
+
+    def _disk_put(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(value, ensure_ascii=False))
+            os.replace(tmp_path, path)  # 원자적 교체 (다른 워커와 경합 안전)
+        except OSError as e:
+            logger.warning(f"Failed to write probe cache {path}: {e}")
+            return
+
+        with self._lock:
+            self._disk_writes += 1
+            should_prune = self._disk_writes % _DISK_PRUNE_INTERVAL == 0
+        if should_prune:
+            self.prune_disk_cache()
+
+    def prune_disk_cache(self) -> int:
+        """
+        디스크 캐시가 disk_entries 를 넘으면 오래된 항목부터 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        if not self.cache_dir:
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.disk_entries
+        if excess <= 0:
+            return 0
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+
+        logger.info(f"Pruned {excess} probe cache entries")
+        return excess
+
+    # ─────────────────────────────────────────────────────────────────────
+    # ffprobe 실행
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _run_ffprobe(self, file_path: str) -> Dict[str, Any]:
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            file_path,
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=True,
+            )
+            return json.loads(result.stdout)
+        except subprocess.CalledProcessError as e:
+            raise MediaProbeError(f"ffprobe failed for {file_path}: {e.stderr.strip()}") from e
+        except subprocess.TimeoutExpired as e:
+            raise MediaProbeError(f"ffprobe timeout for {file_path}") from e
+        except FileNotFoundError as e:
+            raise MediaProbeError("ffprobe is not installed") from e
+        except json.JSONDecodeError as e:
+            raise MediaProbeError(f"Failed to parse ffprobe output for {file_path}: {e}") from e
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 공개 API (sync)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def probe(self, file_path: str) -> Dict[str, Any]:
+        """
+        ffprobe JSON (format + streams) 조회 — 캐시 우선
+
+        Args:
+            file_path: 미디어 파일 경로
+
+        Returns:
+            ffprobe -show_format -show_streams JSON dict
+
+        Raises:
+            MediaProbeError: 파일 없음 / ffprobe 실패
+        """
+        key = self.cache_key(file_path)
+
+        cached = self._memory_get(key)
+        if cached is not None:
+            return cached
+
+        # 동일 파일 동시 probe → 먼저 시작한 쪽 결과 공유
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["inflight_shared"] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = self._disk_get(key)
+            if value is None:
+                with self._lock:
+                    self._stats["misses"] += 1
+                value = self._run_ffprobe(key[0])
+                self._disk_put(key, value)
+            self._memory_put(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def get_duration(self, file_path: str) -> float:
+        """
+        미디어 길이 (초)
+
+        Raises:
+            MediaProbeError: probe 실패 또는 duration 정보 없음
+        """
+        return extract_duration(self.probe(file_path), file_path)
+
+    def probe_many(
+        self,
+        file_paths: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 파일을 병렬 probe (중복 경로는 1회만 실행)
+
+        Args:
+            file_paths: 파일 경로 리스트
+            max_workers: 동시 ffprobe 수 (None이면 서비스 기본값)
+
+        Returns:
+            {file_path: probe dict} — 입력 경로 문자열 그대로 키로 사용
+
+        Raises:
+            MediaProbeError: 하나라도 실패하면 첫 번째 실패를 전파
+        """
+        unique_paths = list(dict.fromkeys(file_paths))
+        if not unique_paths:
+            return {}
+        if len(unique_paths) == 1:
+            return {unique_paths[0]: self.probe(unique_paths[0])}
+
+        workers = min(max_workers or self.max_workers, len(unique_paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media-probe") as pool:
+            results = list(pool.map(self.probe, unique_paths))
+
+        return dict(zip(unique_paths, results))
+
+    def get_durations(
+        self,
+        file_paths: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> List[float]:
+        """입력 순서대로 길이(초) 리스트 반환 (병렬 probe)"""
+        probes = self.probe_many(file_paths, max_workers=max_workers)
+        return [extract_duration(probes[path], path) for path in file_paths]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 공개 API (async) — 이벤트 루프 블로킹 방지
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def aprobe(self, file_path: str) -> Dict[str, Any]:
+        """probe()의 비동기 버전 (worker thread 에서 실행)"""
+        return await asyncio.to_thread(self.probe, file_path)
+
+    async def aget_duration(self, file_path: str) -> float:
+        """get_duration()의 비동기 버전"""
+        return extract_duration(await self.aprobe(file_path), file_path)
+
+    async def aprobe_many(
+        self,
+        file_paths: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """probe_many()의 비동기 버전"""
+        return await asyncio.to_thread(self.probe_many, file_paths, max_workers)
+
+    async def aget_durations(
+        self,
+        file_paths: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> List[float]:
+        """get_durations()의 비동기 버전"""
+        return await asyncio.to_thread(self.get_durations, file_paths, max_workers)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 관리
+    # ─────────────────────────────────────────────────────────────────────
+
+    def invalidate(self, file_path: str) -> None:
+        """특정 파일의 메모리 캐시 제거 (디스크는 mtime 키로 자연 무효화)"""
+        abs_path = os.path.abspath(file_path)
+        with self._lock:
+            for key in [k for k in self._memory if k[0] == abs_path]:
+                del self._memory[key]
+
+    def clear(self) -> None:
+        """메모리 캐시 및 통계 초기화"""
+        with self._lock:
+            self._memory.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit rate %)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["memory_hits"] + stats["disk_hits"]) / lookups * 100, 2)
+            if lookups else 0.0
+        )
+        return stats
+
+
+def extract_duration(probe: Dict[str, Any], file_path: str = "") -> float:
+    """
+    probe dict 에서 길이(초) 추출
+
+    format.duration 우선, 없으면 스트림 duration 최대값.
+
+    Raises:
+        MediaProbeError: duration 정보가 없을 때
+    """
+    duration = probe.get("format", {}).get("duration")
+    if duration is None:
+        stream_durations = [
+            float(s["duration"]) for s in probe.get("streams", []) if s.get("duration")
+        ]
+        if stream_durations:
+            return max(stream_durations)
+        raise MediaProbeError(f"No duration in probe result: {file_path}")
+    return float(duration)
+
+
+# 싱글톤 인스턴스
+_media_probe_service_instance: Optional[MediaProbeService] = None
+
+
+def get_media_probe_service() -> MediaProbeService:
+    """MediaProbeService 싱글톤 인스턴스"""
+    global _media_probe_service_instance
+    if _media_probe_service_instance is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _media_probe_service_instance = MediaProbeService(
+            cache_dir=settings.MEDIA_PROBE_CACHE_DIR,
+            memory_entries=settings.MEDIA_PROBE_MEMORY_ENTRIES,
+        )
+    return _media_probe_service_instance
@@ -0,0 +1,309 @@
+"""
+Parallel Encoder — GOP 정렬 세그먼트 병렬 인코딩 + 무재인코딩 stitching
+
+배경:
+    - VideoRenderer 자막 burn / optimize_for_platform 은 단일 FFmpeg 프로세스로 인코딩
+    - libx264 는 긴 영상에서도 몇 개 코어만 포화 (lookahead/슬라이스 한계)
+    → 10분 이상 영상은 타임라인을 나눠 여러 FFmpeg 프로세스로 병렬 인코딩
+
+방식:
+    1. 타임라인을 GOP 배수 프레임 경계로 분할 (ffmpeg_profile.ios_safe_gop_args 로 GOP 고정)
+    2. 세그먼트마다 -ss 입력 seek + -frames:v 로 프레임 정확히 인코딩 (비디오만)
+    3. 오디오는 세그먼트 경계 클릭/priming 방지를 위해 한 번에 인코딩 (또는 copy)
+    4. concat demuxer 로 -c copy 결합 + 오디오 mux + faststart
+    5. verify_ios_safe_output 로 검증, 실패 시 ParallelEncodeError (호출부가 단일 인코딩 fallback)
+
+iOS 호환 args 는 모두 ffmpeg_profile 의 ios_safe_* 헬퍼에서 가져온다 (ISS-037).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+from app.services.ffmpeg_profile import (
+    IOS_SAFE_AUDIO_BITRATE,
+    IOS_SAFE_FPS,
+    ios_safe_audio_encoder_args,
+    ios_safe_concat_demuxer_args,
+    ios_safe_gop_args,
+    ios_safe_video_encoder_args,
+    ios_safe_video_output_args,
+    verify_ios_safe_output,
+)
+from app.services.media_probe_service import get_media_probe_service
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SEGMENT_SECONDS = 60.0
+DEFAULT_GOP_SECONDS = 2.0
+
+
+class ParallelEncodeError(RuntimeError):
+    """세그먼트 병렬 인코딩 실패 (호출부는 단일 프로세스 인코딩으로 fallback)"""
+
+
+@dataclass(frozen=True)
+class EncodeSegment:
+    """프레임 단위 세그먼트 (start_frame 은 항상 GOP 배수)"""
+    index: int
+    start_frame: int
+    frame_count: int
+    fps: float
+
+    @property
+    def start_seconds(self) -> float:
+        return self.start_frame / self.fps
+
+
+def plan_segments(
+    duration: float,
+    fps: float = float(IOS_SAFE_FPS),
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    gop_seconds: float = DEFAULT_GOP_SECONDS,
+) -> List[EncodeSegment]:
+    """
+    타임라인을 GOP 정렬 세그먼트로 분할
+
+    Args:
+        duration: 전체 길이 (초)
+        fps: 출력 fps
+        segment_seconds: 목표 세그먼트 길이 (GOP 배수로 내림)
+        gop_seconds: GOP 길이 (초)
+
+    Returns:
+        EncodeSegment 리스트 — frame_count 합계 = 전체 프레임 수
+    """
+    total_frames = int(round(duration * fps))
+    gop_frames = max(1, int(round(gop_seconds * fps)))
+    segment_frames = max(gop_frames, int(segment_seconds * fps) // gop_frames * gop_frames)
+
+    segments: List[EncodeSegment] = []
+    start = 0
+    while start < total_frames:
+        count = min(segment_frames, total_frames - start)
+        # 마지막 조각이 GOP 1개 미만이면 앞 세그먼트에 합침 (너무 짧은 세그먼트 방지)
+        if segments and count < gop_frames:
+            last = segments.pop()
+            segments.append(EncodeSegment(last.index, last.start_frame, last.frame_count + count, fps))
+            break
+        segments.append(EncodeSegment(len(segments), start, count, fps))
+        start += count
+    return segments
+
+
+class ParallelEncoder:
+    """세그먼트 병렬 인코딩기"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        gop_seconds: float = DEFAULT_GOP_SECONDS,
+        work_dir: Optional[str] = None,
+        verify_output: bool = True,
+    ):
+        """
+        Args:
+            workers: 동시 FFmpeg 프로세스 수 (None이면 CPU 코어 수 기준 자동,
+                코어가 4개 미만이면 1 → 호출부가 단일 프로세스 인코딩으로 처리)
+            segment_seconds: 목표 세그먼트 길이 (초)
+            gop_seconds: 고정 GOP 길이 (초)
+            work_dir: 세그먼트 임시 디렉토리 상위 경로 (None이면 시스템 temp)
+            verify_output: 결합 결과 iOS 호환 검증 여부
+        """
+        cpu_count = os.cpu_count() or 1
+        # 여유 코어 없이 프로세스만 나누면 분할/결합 오버헤드만 남음 (1 vCPU 11분 입력 0.92x)
+        self.workers = max(1, workers or min(8, cpu_count // 2))
+        self.threads_per_worker = max(1, cpu_count // self.workers)
+        self.segment_seconds = segment_seconds
+        self.gop_seconds = gop_seconds
+        self.work_dir = work_dir
+        self.verify_output = verify_output
+
+    # ─────────────────────────────────────────────────────────────────────
+    # FFmpeg 명령 구성
+    # ─────────────────────────────────────────────────────────────────────
+
+    def build_segment_cmd(
+        self,
+        input_path: str,
+        segment: EncodeSegment,
+        output_path: str,
+        video_filter: Optional[str] = None,
+        preset: str = "medium",
+        crf: str = "23",
+        extra_video_args: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        세그먼트 1개 비디오 인코딩 명령
+
+        -copyts 로 원본 타임스탬프를 유지해 필터(자막 등)가 원본 시간 기준으로 동작하고,
+        setpts 로 세그먼트 출력은 0부터 시작하도록 재설정한다.
+        """
+        filters = [video_filter] if video_filter else []
+        filters.append("setpts=PTS-STARTPTS")
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", f"{segment.start_seconds:.6f}",
+            "-copyts",
+            "-i", input_path,
+            "-vf", ",".join(filters),
+            "-an",
+        ]
+        if extra_video_args:
+            cmd.extend(extra_video_args)
+        cmd.extend(ios_safe_video_encoder_args(preset=preset, crf=crf))
+        cmd.extend(ios_safe_gop_args(self.gop_seconds))
+        cmd.extend(ios_safe_video_output_args(
+            include_faststart=False,
+            threads=str(self.threads_per_worker),
+        ))
+        cmd.extend(["-frames:v", str(segment.frame_count), output_path])
+        return cmd
+
+    def build_audio_cmd(self, input_path: str, output_path: str, bitrate: str) -> List[str]:
+        """오디오 단일 패스 인코딩 명령 (세그먼트 경계 클릭 방지)"""
+        cmd = ["ffmpeg", "-y", "-i", input_path, "-vn"]
+        cmd.extend(ios_safe_audio_encoder_args(bitrate=bitrate, include_async_filter=False))
+        cmd.append(output_path)
+        return cmd
+
+    def build_stitch_cmd(
+        self,
+        concat_list: str,
+        audio_source: Optional[str],
+        output_path: str,
+    ) -> List[str]:
+        """세그먼트 concat(-c copy) + 오디오 mux 명령"""
+        cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", concat_list]
+        if audio_source:
+            cmd.extend(["-i", audio_source, "-map", "0:v:0", "-map", "1:a:0?"])
+        cmd.extend(ios_safe_concat_demuxer_args())
+        cmd.extend(["-movflags", "+faststart"])
+        if audio_source:
+            cmd.append("-shortest")
+        cmd.append(output_path)
+        return cmd
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 실행
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _run(cmd: List[str]) -> None:
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="ignore")[-2000:] if e.stderr else ""
+            raise ParallelEncodeError(f"FFmpeg failed: {' '.join(cmd[:8])}...\n{stderr}") from e
+
+    def encode(
+        self,
+        input_path: str,
+        output_path: str,
+        video_filter: Optional[str] = None,
+        preset: str = "medium",
+        crf: str = "23",
+        extra_video_args: Optional[List[str]] = None,
+        audio_mode: Literal["encode", "copy", "none"] = "encode",
+        audio_bitrate: str = IOS_SAFE_AUDIO_BITRATE,
+    ) -> Dict[str, Any]:
+        """
+        세그먼트 병렬 인코딩 실행
+
+        Args:
+            input_path: 입력 영상
+            output_path: 최종 출력 경로
+            video_filter: 비디오 필터 (scale/pad, subtitles 등)
+            preset: libx264 preset
+            crf: libx264 CRF
+            extra_video_args: 인코더 앞에 붙일 추가 비디오 args (예: ["-b:v", "8M"])
+            audio_mode: "encode"(AAC 단일 패스), "copy"(원본 오디오 copy), "none"
+            audio_bitrate: audio_mode="encode" 일 때 비트레이트
+
+        Returns:
+            {"output_path", "segments", "workers", "elapsed_time", "verify"}
+
+        Raises:
+            ParallelEncodeError: 인코딩/결합/검증 실패
+        """
+        start_time = time.time()
+
+        probe = get_media_probe_service().probe(input_path)
+        duration = float(probe.get("format", {}).get("duration", 0.0))
+        has_audio = any(s.get("codec_type") == "audio" for s in probe.get("streams", []))
+        segments = plan_segments(
+            duration,
+            segment_seconds=self.segment_seconds,
+            gop_seconds=self.gop_seconds,
+        )
+        if not segments:
+            raise ParallelEncodeError(f"Empty timeline: {input_path}")
+
+        work_dir = Path(tempfile.mkdtemp(prefix="parallel_encode_", dir=self.work_dir))
+        logger.info(
+            f"⚡ Parallel encode: {len(segments)} segments × {self.workers} workers "
+            f"({duration:.1f}s, threads/worker={self.threads_per_worker})"
+        )
+
+        try:
+            segment_paths = [str(work_dir / f"seg_{s.index:04d}.mp4") for s in segments]
+            jobs = [
+                self.build_segment_cmd(
+                    input_path, segment, path,
+                    video_filter=video_filter,
+                    preset=preset,
+                    crf=crf,
+                    extra_video_args=extra_video_args,
+                )
+                for segment, path in zip(segments, segment_paths)
+            ]
+
+            audio_source: Optional[str] = None
+            if has_audio and audio_mode == "encode":
+                audio_source = str(work_dir / "audio.m4a")
+                jobs.append(self.build_audio_cmd(input_path, audio_source, audio_bitrate))
+            elif has_audio and audio_mode == "copy":
+                audio_source = input_path
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="encode-seg") as pool:
+                list(pool.map(self._run, jobs))
+
+            concat_list = work_dir / "concat.txt"
+            concat_list.write_text(
+                "".join(f"file '{Path(p).resolve()}'\n" for p in segment_paths)
+            )
+
+            self._run(self.build_stitch_cmd(str(concat_list), audio_source, output_path))
+
+            verify = None
+            if self.verify_output:
+                verify = verify_ios_safe_output(output_path)
+                if not verify.get("ok"):
+                    raise ParallelEncodeError(
+                        f"Stitched output is not iOS safe: {verify.get('errors')}"
+                    )
+
+            elapsed = time.time() - start_time
+            logger.info(f"✅ Parallel encode completed in {elapsed:.1f}s: {output_path}")
+
+            return {
+                "output_path": output_path,
+                "segments": len(segments),
+                "workers": self.workers,
+                "elapsed_time": round(elapsed, 2),
+                "verify": verify,
+            }
+
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,293 @@
+"""
+PDF Ingest Pipeline — 페이지 범위 병렬 래스터화 + 페이지 단위 리사이즈/PNG/OCR
+
+배경:
+    - 업로드 요청 안에서 convert_from_path 로 문서 전체를 한 번에 래스터화
+      → 100페이지 덱이면 모든 페이지 비트맵이 동시에 메모리에 존재
+    - OCR 은 전체 변환이 끝난 뒤 순차 실행 → 응답까지 수 분
+
+구조:
+    1. 페이지 수만 먼저 확인 (pdfinfo) → 업로드 응답은 즉시 반환
+    2. 페이지를 범위(기본 4장) 단위로 나눠 ProcessPoolExecutor 에 분배
+    3. 워커는 pdftoppm 출력을 임시 폴더에 파일로 받고 한 장씩 열어
+       (워터마크 제거) → 리사이즈 → PNG 저장 → Tesseract OCR 후 즉시 해제
+       → 워커당 메모리 = 페이지 비트맵 1장
+    4. 범위가 끝날 때마다 페이지별 on_page 콜백 → 진행률 보고
+
+사용 예:
+    pipeline = get_pdf_ingest_pipeline()
+    pages = await pipeline.run(pdf_path, dpi=200, on_page=lambda page, done, total: ...)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PAGES_PER_TASK = 4
+DEFAULT_MAX_WIDTH = 1920
+
+
+class PDFIngestError(Exception):
+    """PDF 인제스트 실패"""
+    pass
+
+
+@dataclass(frozen=True)
+class PageResult:
+    """페이지 1장 처리 결과"""
+    page_number: int
+    image_path: str
+    ocr_text: Optional[str]
+
+
+def plan_page_ranges(total_pages: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    """1-based (first_page, last_page) 범위 목록"""
+    pages_per_task = max(1, pages_per_task)
+    return [
+        (first, min(first + pages_per_task - 1, total_pages))
+        for first in range(1, total_pages + 1, pages_per_task)
+    ]
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    """래스터화 없이 페이지 수 확인 (pdfinfo, 실패 시 PyPDF2)"""
+    try:
+        from pdf2image import pdfinfo_from_path
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+    except Exception as e:
+        logger.debug(f"pdfinfo failed, falling back to PyPDF2: {e}")
+        from PyPDF2 import PdfReader
+        return len(PdfReader(pdf_path).pages)
+
+
+def iter_rasterized_pages(
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    dpi: int,
+) -> Iterator[Tuple[int, "Image.Image"]]:
+    """
+    페이지 범위를 래스터화해 (page_number, PIL Image) 를 한 장씩 yield
+
+    pdftoppm 이 임시 폴더에 페이지 파일을 쓰고, 여기서는 파일 경로만 받아
+    필요한 시점에 한 장씩 연다 (범위 전체 비트맵을 동시에 들고 있지 않음).
+    """
+    from pdf2image import convert_from_path
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory(prefix="pdf_ingest_") as tmp_dir:
+        page_files = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=first_page,
+            last_page=last_page,
+            output_folder=tmp_dir,
+            paths_only=True,
+        )
+        for offset, page_file in enumerate(sorted(page_files)):
+            with Image.open(page_file) as image:
+                image.load()
+                yield first_page + offset, image
+            os.remove(page_file)
+
+
+def resize_to_max_width(image: "Image.Image", max_width: int) -> "Image.Image":
+    """가로가 max_width 를 넘으면 비율 유지 축소"""
+    from PIL import Image
+
+    if image.width <= max_width:
+        return image
+    height = int(image.height * max_width / image.width)
+    return image.resize((max_width, height), Image.Resampling.LANCZOS)
+
+
+def process_page_range(
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    dpi: int,
+    output_dir: str,
+    file_prefix: str,
+    lang: Optional[str],
+    max_width: int,
+    remove_watermark: bool,
+) -> List[PageResult]:
+    """
+    프로세스 풀 워커: 범위 내 페이지를 래스터화 → (워터마크 제거) → 리사이즈 → PNG → OCR
+
+    Returns:
+        페이지 순서대로 PageResult 목록
+    """
+    try:
+        import pytesseract
+    except ImportError:
+        pytesseract = None
+
+    results = []
+    for page_number, image in iter_rasterized_pages(pdf_path, first_page, last_page, dpi):
+        if remove_watermark:
+            from app.services.notebooklm_adapter import crop_watermark_pil
+            image = crop_watermark_pil(image)
+
+        image = resize_to_max_width(image.convert("RGB"), max_width)
+        image_path = str(Path(output_dir) / f"{file_prefix}_{page_number:03d}.png")
+        image.save(image_path, "PNG", optimize=True)
+
+        ocr_text = None
+        if lang and pytesseract is not None:
+            try:
+                cleaned = " ".join(pytesseract.image_to_string(image, lang=lang).split())
+                ocr_text = cleaned or None
+            except Exception as e:
+                logger.warning(f"OCR failed for page {page_number}: {e}")
+
+        results.append(PageResult(page_number, image_path, ocr_text))
+
+    return results
+
+
+class PDFIngestPipeline:
+    """페이지 범위 병렬 PDF 인제스트"""
+
+    def __init__(
+        self,
+        output_dir: str = "./outputs/slides",
+        workers: Optional[int] = None,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        max_width: int = DEFAULT_MAX_WIDTH,
+    ):
+        """
+        Args:
+            output_dir: 슬라이드 PNG 저장 디렉토리
+            workers: 프로세스 풀 크기 (None/0 이면 min(4, CPU 수))
+            pages_per_task: 워커 1회 호출당 페이지 수
+            max_width: 슬라이드 이미지 최대 가로 (px)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, workers or min(4, os.cpu_count() or 1))
+        self.pages_per_task = pages_per_task
+        self.max_width = max_width
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def count_pages(self, pdf_path: str) -> int:
+        return await asyncio.to_thread(count_pdf_pages, pdf_path)
+
+    async def run(
+        self,
+        pdf_path: str,
+        dpi: int = 200,
+        lang: Optional[str] = "kor+eng",
+        total_pages: Optional[int] = None,
+        on_page: Optional[Callable[[PageResult, int, int], Union[None, Awaitable[None]]]] = None,
+    ) -> List[PageResult]:
+        """
+        PDF 전체 인제스트
+
+        Args:
+            pdf_path: PDF 파일 경로
+            dpi: 래스터화 해상도
+            lang: Tesseract 언어 (None 이면 OCR 생략)
+            total_pages: 미리 확인한 페이지 수 (없으면 조회)
+            on_page: 페이지 완료 콜백 (page, processed_pages, total_pages) — 코루틴 함수면 await
+
+        Returns:
+            페이지 번호 순 PageResult 목록
+
+        Raises:
+            PDFIngestError: 래스터화/저장 실패
+        """
+        if not await asyncio.to_thread(Path(pdf_path).exists):
+            raise PDFIngestError(f"PDF file not found: {pdf_path}")
+
+        if total_pages is None:
+            total_pages = await self.count_pages(pdf_path)
+
+        from app.services.notebooklm_adapter import detect_notebooklm_pdf
+        remove_watermark = await asyncio.to_thread(detect_notebooklm_pdf, pdf_path)
+
+        file_hash = hashlib.md5(pdf_path.encode()).hexdigest()[:8]
+        file_prefix = f"slide_{int(time.time())}_{file_hash}"
+        ranges = plan_page_ranges(total_pages, self.pages_per_task)
+
+        logger.info(
+            f"PDF ingest: {pdf_path} ({total_pages} pages, {len(ranges)} ranges × "
+            f"{self.workers} workers, dpi={dpi}, notebooklm={remove_watermark})"
+        )
+        started = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        futures = [
+            loop.run_in_executor(
+                executor,
+                process_page_range,
+                pdf_path, first, last, dpi, str(self.output_dir), file_prefix,
+                lang, self.max_width, remove_watermark,
+            )
+            for first, last in ranges
+        ]
+
+        pages: List[PageResult] = []
+        try:
+            for next_done in asyncio.as_completed(futures):
+                for page in await next_done:
+                    pages.append(page)
+                    if on_page:
+                        reported = on_page(page, len(pages), total_pages)
+                        if inspect.isawaitable(reported):
+                            await reported
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            raise PDFIngestError(f"PDF ingest failed: {e}") from e
+
+        pages.sort(key=lambda page: page.page_number)
+        logger.info(
+            f"PDF ingest done: {len(pages)} pages in {time.perf_counter() - started:.1f}s"
+        )
+        return pages
+
+
+# 싱글톤 인스턴스
+_pdf_ingest_pipeline_instance: Optional[PDFIngestPipeline] = None
+
+
+def get_pdf_ingest_pipeline() -> PDFIngestPipeline:
+    """PDFIngestPipeline 싱글톤 인스턴스"""
+    global _pdf_ingest_pipeline_instance
+    if _pdf_ingest_pipeline_instance is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _pdf_ingest_pipeline_instance = PDFIngestPipeline(
+            workers=settings.PDF_INGEST_WORKERS,
+            pages_per_task=settings.PDF_INGEST_PAGES_PER_TASK,
+            max_width=settings.PDF_INGEST_MAX_WIDTH,
+        )
+    return _pdf_ingest_pipeline_instance
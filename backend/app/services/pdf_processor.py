@@ -5,12 +5,12 @@ import logging
 from datetime import datetime
 import uuid
 
-from pdf2image import convert_from_path
 from PIL import Image
 import pytesseract
 
 from app.models.neo4j_models import SlideDataModel, PresentationModel
 from app.services.neo4j_client import get_neo4j_client
+from app.services.pdf_ingest_pipeline import count_pdf_pages, iter_rasterized_pages
 
 
 logger = logging.getLogger(__name__)
@@ -142,10 +142,11 @@ class PDFProcessor:
             PDFProcessorError: 변환 실패 시
         """
         try:
-            images = convert_from_path(pdf_path, dpi=dpi)
             image_paths = []
 
-            for idx, image in enumerate(images, start=1):
+            # 페이지를 한 장씩 래스터화 (문서 전체 비트맵을 동시에 들고 있지 않음)
+            total_pages = count_pdf_pages(pdf_path)
+            for idx, image in iter_rasterized_pages(pdf_path, 1, total_pages, dpi):
                 # PNG로 저장
                 img_filename = f"slide_{idx:03d}.png"
                 img_path = Path(output_dir) / img_filename
@@ -23,6 +23,7 @@ except ImportError:
     LOGFIRE_AVAILABLE = False
 
 from app.core.config import get_settings
+from app.services.streaming_io import save_upload_content_addressed
 
 settings = get_settings()
 
@@ -168,39 +169,39 @@ class PDFToSlidesService:
 
     async def save_uploaded_pdf(
         self,
-        file_data: bytes,
+        upload,
         user_id: str,
-        original_filename: str
+        original_filename: str,
+        max_bytes: Optional[int] = None
     ) -> str:
         """
-        업로드된 PDF 파일 저장
+        업로드된 PDF 파일 저장 (청크 스트리밍, 메모리에 전체를 올리지 않음)
 
         Args:
-            file_data: PDF 파일 바이트
+            upload: 업로드 파일 (FastAPI UploadFile)
             user_id: 사용자 ID
             original_filename: 원본 파일명
+            max_bytes: 최대 크기 (초과 시 StreamSizeLimitError)
 
         Returns:
             저장된 파일 경로
         """
-        # 파일명 생성
-        timestamp = int(time.time())
-        file_hash = hashlib.md5(file_data).hexdigest()[:8]
-        filename = f"{user_id}_{timestamp}_{file_hash}.pdf"
-
         # PDF 저장 디렉토리
         pdf_dir = Path("./uploads/pdfs")
         pdf_dir.mkdir(parents=True, exist_ok=True)
 
-        file_path = pdf_dir / filename
-
-        # 파일 저장
-        with open(file_path, "wb") as f:
-            f.write(file_data)
+        # 파일명: 저장하면서 계산한 해시 사용
+        timestamp = int(time.time())
+        saved = await save_upload_content_addressed(
+            upload,
+            pdf_dir,
+            f"{user_id}_{timestamp}_{{hash}}.pdf",
+            max_bytes=max_bytes
+        )
 
-        self.logger.info(f"Saved PDF: {file_path} ({len(file_data) / 1024:.2f} KB)")
+        self.logger.info(f"Saved PDF: {saved.path} ({saved.size / 1024:.2f} KB)")
 
-        return str(file_path)
+        return saved.path
 
     async def extract_text_from_slides(
         self,
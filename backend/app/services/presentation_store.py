@@ -0,0 +1,373 @@
+"""
+Presentation Store — 프리젠테이션 상태 공유 저장소 (SQLite)
+
+배경:
+    - api/v1/presentation.py 가 프로세스 로컬 dict 에 상태를 보관
+      → uvicorn 워커가 여러 개면 업로드를 받지 않은 워커로 간 요청은 404
+      → 버려진 업로드도 프로세스가 살아 있는 동안 계속 쌓임
+
+구조:
+    - 헤더(상태, 경로, 메타데이터)와 본문(slides_data, full_script)을 분리 저장
+      본문은 zlib 압축 JSON, 목록/상태 조회는 헤더만 읽음 (lazy loading)
+    - version 컬럼으로 낙관적 동시성 제어
+      update(expected_version=..., expected_status=...) 불일치 시 PresentationConflictError
+    - ingesting/uploaded/failed 상태는 마지막 갱신 + TTL 이후 만료 → evict_expired() 가
+      행과 PDF/슬라이드 파일을 함께 삭제 (스크립트 생성 이후 단계는 만료 없음)
+    - WAL 모드 SQLite 파일 1개를 모든 워커가 공유
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_UPLOAD_TTL_SECONDS = 24 * 3600
+EVICT_INTERVAL_SECONDS = 600
+
+# 만료 대상 상태 (스크립트 생성 전 단계 = 버려진 업로드 후보)
+EXPIRING_STATUSES = frozenset({"ingesting", "uploaded", "failed"})
+
+# 본문(payload) 필드 — 목록/상태 조회 시 읽지 않음
+PAYLOAD_FIELDS = ("slides_data", "full_script")
+# 컬럼 필드
+COLUMN_FIELDS = (
+    "presentation_id", "project_id", "status", "version",
+    "total_slides", "thumbnail_url", "created_at", "updated_at",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS presentations (
+    presentation_id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    total_slides INTEGER NOT NULL DEFAULT 0,
+    thumbnail_url TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    expires_at REAL,
+    header TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_presentations_project
+    ON presentations (project_id, created_at DESC, presentation_id DESC);
+CREATE INDEX IF NOT EXISTS idx_presentations_expires
+    ON presentations (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+
+class PresentationConflictError(Exception):
+    """version/status 불일치 (다른 요청이 먼저 상태를 바꿈)"""
+    pass
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _pack(payload: Dict[str, Any]) -> bytes:
+    return zlib.compress(_dumps(payload).encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class PresentationStore:
+    """SQLite 기반 프리젠테이션 상태 저장소"""
+
+    def __init__(self, db_path: str, upload_ttl_seconds: int = DEFAULT_UPLOAD_TTL_SECONDS):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (":memory:" 가능)
+            upload_ttl_seconds: ingesting/uploaded/failed 상태 만료 시간
+        """
+        self.db_path = db_path
+        self.upload_ttl_seconds = upload_ttl_seconds
+        self._lock = threading.Lock()
+        self._last_evict = 0.0
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 직렬화
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _expires_at(self, status: str, now: float) -> Optional[float]:
+        return now + self.upload_ttl_seconds if status in EXPIRING_STATUSES else None
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row, include_payload: bool) -> Dict[str, Any]:
+        record = {field: row[field] for field in COLUMN_FIELDS}
+        record.update(json.loads(row["header"]))
+        if include_payload:
+            record.update(_unpack(row["payload"]))
+        return record
+
+    @staticmethod
+    def _split(record: Dict[str, Any]) -> tuple:
+        header = {
+            k: v for k, v in record.items()
+            if k not in COLUMN_FIELDS and k not in PAYLOAD_FIELDS
+        }
+        payload = {k: record.get(k) for k in PAYLOAD_FIELDS}
+        return header, payload
+
+    @staticmethod
+    def _thumbnail(slides_data: Optional[List[dict]]) -> Optional[str]:
+        return slides_data[0].get("image_path") if slides_data else None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # CRUD
+    # ─────────────────────────────────────────────────────────────────────
+
+    def create(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """새 프리젠테이션 저장 (version=1)"""
+        now = time.time()
+        record = {**record, "version": 1}
+        record.setdefault("created_at", datetime.now().isoformat())
+        record.setdefault("updated_at", record["created_at"])
+        record.setdefault("slides_data", [])
+        record.setdefault("full_script", None)
+        header, payload = self._split(record)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO presentations (presentation_id, project_id, status, version, "
+                "total_slides, thumbnail_url, created_at, updated_at, expires_at, header, payload) "
+                "VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record["presentation_id"], record["project_id"], record["status"],
+                    record.get("total_slides", 0), self._thumbnail(record["slides_data"]),
+                    record["created_at"], record["updated_at"],
+                    self._expires_at(record["status"], now), _dumps(header), _pack(payload),
+                ),
+            )
+
+        self.maybe_evict(now)
+        return record
+
+    def get(self, presentation_id: str, include_slides: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        프리젠테이션 조회
+
+        Args:
+            include_slides: False면 slides_data/full_script 를 읽지 않음 (압축 해제 생략)
+        """
+        columns = "*" if include_slides else "presentation_id, project_id, status, version, " \
+            "total_slides, thumbnail_url, created_at, updated_at, header"
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {columns} FROM presentations WHERE presentation_id = ?",
+                (presentation_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_record(row, include_slides)
+
+    def get_slides(self, presentation_id: str) -> List[dict]:
+        """slides_data 만 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM presentations WHERE presentation_id = ?",
+                (presentation_id,),
+            ).fetchone()
+        return _unpack(row["payload"]).get("slides_data") or [] if row else []
+
+    def update(
+        self,
+        presentation_id: str,
+        changes: Dict[str, Any],
+        expected_version: Optional[int] = None,
+        expected_status: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        필드 갱신 (version + 1)
+
+        Args:
+            changes: 바꿀 필드 (metadata 는 dict 병합)
+            expected_version: 지정 시 현재 version 이 같아야 갱신
+            expected_status: 지정 시 현재 status 가 이 중 하나여야 갱신
+
+        Returns:
+            갱신된 레코드 헤더 (slides_data 는 changes 에 있을 때만 포함)
+
+        Raises:
+            KeyError: 존재하지 않는 presentation_id
+            PresentationConflictError: version/status 불일치
+        """
+        touches_payload = any(field in changes for field in PAYLOAD_FIELDS)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM presentations WHERE presentation_id = ?",
+                    (presentation_id,),
+                ).fetchone()
+                if row is None:
+                    raise KeyError(presentation_id)
+
+                if expected_version is not None and row["version"] != expected_version:
+                    raise PresentationConflictError(
+                        f"{presentation_id}: version {row['version']} != expected {expected_version}"
+                    )
+                if expected_status is not None and row["status"] not in set(expected_status):
+                    raise PresentationConflictError(
+                        f"{presentation_id}: status '{row['status']}' not in {sorted(expected_status)}"
+                    )
+
+                record = self._row_to_record(row, include_payload=touches_payload)
+                metadata = {**(record.get("metadata") or {}), **(changes.get("metadata") or {})}
+                record.update(changes)
+                record["metadata"] = metadata
+                record["version"] = row["version"] + 1
+                record["updated_at"] = changes.get("updated_at") or datetime.now().isoformat()
+
+                header, payload = self._split(record)
+                params = [
+                    record["status"], record["version"], record.get("total_slides", 0),
+                    record["updated_at"], self._expires_at(record["status"], now), _dumps(header),
+                ]
+                sql = (
+                    "UPDATE presentations SET status = ?, version = ?, total_slides = ?, "
+                    "updated_at = ?, expires_at = ?, header = ?"
+                )
+                if touches_payload:
+                    sql += ", payload = ?, thumbnail_url = ?"
+                    params += [_pack(payload), self._thumbnail(payload.get("slides_data"))]
+                sql += " WHERE presentation_id = ? AND version = ?"
+                params += [presentation_id, row["version"]]
+
+                self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return record
+
+    def delete(self, presentation_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM presentations WHERE presentation_id = ?", (presentation_id,)
+            )
+        return cursor.rowcount > 0
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 목록
+    # ─────────────────────────────────────────────────────────────────────
+
+    def list_by_project(
+        self,
+        project_id: str,
+        limit: int,
+        skip: int = 0,
+        cursor: Optional[tuple] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        프로젝트의 프리젠테이션 목록 (최신순, 헤더만)
+
+        Args:
+            cursor: (created_at, presentation_id) — 지정 시 keyset, skip 무시
+        """
+        sql = (
+            "SELECT presentation_id, project_id, status, version, total_slides, thumbnail_url, "
+            "created_at, updated_at, header FROM presentations WHERE project_id = ?"
+        )
+        params: List[Any] = [project_id]
+        if cursor:
+            sql += " AND (created_at, presentation_id) < (?, ?)"
+            params += list(cursor)
+        sql += " ORDER BY created_at DESC, presentation_id DESC LIMIT ?"
+        params.append(limit)
+        if not cursor and skip:
+            sql += " OFFSET ?"
+            params.append(skip)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_record(row, include_payload=False) for row in rows]
+
+    def count_by_project(self, project_id: str) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM presentations WHERE project_id = ?", (project_id,)
+            ).fetchone()
+        return count
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 만료
+    # ─────────────────────────────────────────────────────────────────────
+
+    def evict_expired(self, now: Optional[float] = None, delete_files: bool = True) -> int:
+        """만료된 업로드 삭제 (PDF/슬라이드 이미지 포함). 삭제 건수 반환"""
+        now = now or time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT presentation_id, header, payload FROM presentations "
+                "WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    "DELETE FROM presentations WHERE presentation_id = ? AND expires_at <= ?",
+                    [(row["presentation_id"], now) for row in rows],
+                )
+            self._last_evict = now
+
+        if delete_files:
+            for row in rows:
+                paths = [json.loads(row["header"]).get("pdf_path")]
+                paths += [s.get("image_path") for s in _unpack(row["payload"]).get("slides_data") or []]
+                for path in filter(None, paths):
+                    Path(path).unlink(missing_ok=True)
+
+        if rows:
+            logger.info(f"Evicted {len(rows)} abandoned presentation upload(s)")
+        return len(rows)
+
+    def maybe_evict(self, now: Optional[float] = None) -> int:
+        """마지막 정리 후 EVICT_INTERVAL_SECONDS 가 지났으면 evict_expired 실행"""
+        now = now or time.time()
+        if now - self._last_evict < EVICT_INTERVAL_SECONDS:
+            return 0
+        try:
+            return self.evict_expired(now)
+        except Exception as e:
+            logger.warning(f"Presentation eviction failed: {e}")
+            return 0
+
+
+# 싱글톤 인스턴스
+_presentation_store_instance: Optional[PresentationStore] = None
+
+
+def get_presentation_store() -> PresentationStore:
+    """PresentationStore 싱글톤 인스턴스"""
+    global _presentation_store_instance
+    if _presentation_store_instance is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _presentation_store_instance = PresentationStore(
+            db_path=settings.PRESENTATION_STORE_PATH,
+            upload_ttl_seconds=settings.PRESENTATION_UPLOAD_TTL_HOURS * 3600,
+        )
+    return _presentation_store_instance
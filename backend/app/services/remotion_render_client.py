@@ -0,0 +1,213 @@
+"""
+Remotion Render Client — 상주 렌더 서버(frontend/remotion/scripts/render-server.mjs) 클라이언트
+
+배경:
+    - `npx remotion render` 는 호출마다 npx 기동 + 웹팩 번들 + Chromium 기동 (수십 초 콜드 스타트)
+    - CLI 진행률은 로그 문자열뿐이라 고정값(50%/80%)으로 보고하고 있었음
+
+방식:
+    - 렌더 서버는 한 번 번들링하고 브라우저 풀을 유지한 채 유닉스 소켓으로 작업을 받는다
+    - 요청/응답은 NDJSON (연결 1개 = 작업 1개)
+    - 서버가 스트리밍하는 실제 프레임 수를 RenderProgress 로 콜백에 전달
+    - 서버가 떠 있지 않으면 RemotionRenderUnavailable → 호출부가 CLI 로 fallback
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 렌더 서버 응답 한 줄 최대 크기 (에러 스택 포함)
+STREAM_LIMIT = 1024 * 1024
+
+
+class RemotionRenderError(RuntimeError):
+    """렌더 서버가 작업 실패를 보고"""
+
+
+class RemotionRenderUnavailable(RemotionRenderError):
+    """렌더 서버에 연결할 수 없음 (CLI fallback 대상)"""
+
+
+@dataclass(frozen=True)
+class RenderProgress:
+    """렌더 진행 상황 (실제 프레임 수 기준)"""
+    rendered_frames: int
+    encoded_frames: int
+    total_frames: int
+    elapsed_seconds: float
+    stage: Optional[str] = None
+
+    @property
+    def fraction(self) -> float:
+        """0.0 ~ 1.0 — 렌더 90%, 인코딩 10% 가중"""
+        if self.total_frames <= 0:
+            return 0.0
+        rendered = min(self.rendered_frames, self.total_frames) / self.total_frames
+        encoded = min(self.encoded_frames, self.total_frames) / self.total_frames
+        return round(0.9 * rendered + 0.1 * encoded, 4)
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.rendered_frames / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """남은 렌더 시간 추정 (큐 소진 시간 계산용)"""
+        fps = self.frames_per_second
+        if fps <= 0:
+            return None
+        return round((self.total_frames - self.rendered_frames) / fps, 1)
+
+    def as_metadata(self) -> Dict[str, Any]:
+        return {
+            "rendered_frames": self.rendered_frames,
+            "encoded_frames": self.encoded_frames,
+            "total_frames": self.total_frames,
+            "frames_per_second": round(self.frames_per_second, 2),
+            "eta_seconds": self.eta_seconds,
+        }
+
+
+ProgressCallback = Callable[[RenderProgress], Any]
+
+
+class RemotionRenderClient:
+    """상주 Remotion 렌더 서버 클라이언트"""
+
+    def __init__(self, socket_path: str, connect_timeout: float = 2.0):
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+
+    async def _connect(self):
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path, limit=STREAM_LIMIT),
+                timeout=self.connect_timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise RemotionRenderUnavailable(f"Render server not reachable at {self.socket_path}: {e}") from e
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+        writer.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        await writer.drain()
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def ping(self) -> Optional[Dict[str, Any]]:
+        """서버 상태 (브라우저 풀/대기열). 연결 불가 시 None"""
+        try:
+            reader, writer = await self._connect()
+        except RemotionRenderUnavailable:
+            return None
+        try:
+            await self._send(writer, {"type": "ping"})
+            line = await asyncio.wait_for(reader.readline(), timeout=self.connect_timeout)
+            return json.loads(line) if line else None
+        except (OSError, asyncio.TimeoutError, ValueError):
+            return None
+        finally:
+            await self._close(writer)
+
+    async def is_available(self) -> bool:
+        return await self.ping() is not None
+
+    async def render(
+        self,
+        composition_id: str,
+        output_path: str,
+        input_props: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """
+        렌더 작업 제출 후 완료까지 진행률 스트리밍
+
+        Args:
+            composition_id: Remotion composition ID
+            output_path: 출력 파일 경로 (서버와 같은 호스트)
+            input_props: composition props
+            on_progress: RenderProgress 콜백 (sync 또는 async)
+            **options: width, height, fps, scale, crf, codec, concurrency
+
+        Returns:
+            {"output_path", "total_frames", "elapsed_ms"}
+
+        Raises:
+            RemotionRenderUnavailable: 서버 연결 불가
+            RemotionRenderError: 렌더 실패 또는 연결 중단
+        """
+        reader, writer = await self._connect()
+        started = time.monotonic()
+        job = {
+            "type": "render",
+            "compositionId": composition_id,
+            "outputPath": output_path,
+            "inputProps": input_props,
+            **{k: v for k, v in options.items() if v is not None},
+        }
+        try:
+            await self._send(writer, job)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    raise RemotionRenderError("Render server closed the connection before completion")
+
+                message = json.loads(line)
+                kind = message.get("type")
+                if kind == "progress" and on_progress is not None:
+                    progress = RenderProgress(
+                        rendered_frames=int(message.get("renderedFrames", 0)),
+                        encoded_frames=int(message.get("encodedFrames", 0)),
+                        total_frames=int(message.get("totalFrames", 0)),
+                        elapsed_seconds=time.monotonic() - started,
+                        stage=message.get("stage"),
+                    )
+                    result = on_progress(progress)
+                    if inspect.isawaitable(result):
+                        await result
+                elif kind == "done":
+                    return {
+                        "output_path": message.get("outputPath", output_path),
+                        "total_frames": message.get("totalFrames"),
+                        "elapsed_ms": message.get("elapsedMs"),
+                    }
+                elif kind == "error":
+                    raise RemotionRenderError(message.get("message", "Unknown render error"))
+        finally:
+            await self._close(writer)
+
+    def render_sync(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """동기 컨텍스트(Celery 워커)용 render 래퍼"""
+        return asyncio.run(self.render(*args, **kwargs))
+
+
+# Singleton instance
+_client: Optional[RemotionRenderClient] = None
+
+
+def get_remotion_render_client() -> Optional[RemotionRenderClient]:
+    """렌더 서버 클라이언트 싱글톤 (REMOTION_RENDER_SERVER_ENABLED=False 면 None)"""
+    global _client
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    if not settings.REMOTION_RENDER_SERVER_ENABLED:
+        return None
+    if _client is None:
+        _client = RemotionRenderClient(settings.REMOTION_RENDER_SOCKET)
+    return _client
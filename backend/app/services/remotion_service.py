@@ -15,16 +15,24 @@ Features:
 """
 
 import os
+import re
 import json
+import time
 import subprocess
 import tempfile
 import asyncio
-from typing import Dict, Any, List, Optional, Literal
+from typing import Callable, Dict, Any, List, Optional, Literal
 from pathlib import Path
 import logging
 
 from app.core.config import get_settings
 from app.services.cloudinary_service import CloudinaryService
+from app.services.format_transcoder import get_format_transcoder, master_render_scale
+from app.services.remotion_render_client import (
+    RemotionRenderUnavailable,
+    RenderProgress,
+    get_remotion_render_client,
+)
 from app.services.websocket_manager import get_websocket_manager
 
 settings = get_settings()
@@ -74,6 +82,9 @@ PLATFORM_COMPOSITIONS = {
     }
 }
 
+# Remotion CLI 진행 로그의 "123/900" 프레임 카운터
+CLI_FRAME_PATTERN = re.compile(r"(\d+)\s*/\s*(\d+)")
+
 
 class RemotionService:
     """Remotion 기반 영상 렌더링 서비스"""
@@ -156,17 +167,25 @@ class RemotionService:
         self,
         content_id: int,
         props: Dict[str, Any],
-        composition_id: str = "OmniVibeComposition"
+        composition_id: str = "OmniVibeComposition",
+        platforms: Optional[List[str]] = None,
+        on_progress: Optional[Callable[[int, str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """Remotion으로 영상 렌더링 (비동기)
 
+        platforms 가 주어지면 컴포지션을 마스터 해상도로 한 번만 렌더한 뒤
+        플랫폼별 해상도는 FFmpeg crop/scale 병렬 트랜스코딩으로 파생한다.
+
         Args:
             content_id: 콘텐츠 ID (WebSocket 진행 상태 업데이트용)
             props: Remotion composition props
             composition_id: Remotion composition ID (frontend에서 정의)
+            platforms: 멀티포맷 출력 플랫폼 목록 (PLATFORM_COMPOSITIONS 키)
+            on_progress: 진행률 콜백 (percent, message, frame metadata) — 워커 스레드에서 호출
 
         Returns:
-            렌더링 결과 (로컬 파일 경로, Cloudinary URL)
+            렌더링 결과 (로컬 파일 경로, Cloudinary URL).
+            멀티포맷이면 첫 플랫폼 기준 결과 + outputs {플랫폼: 결과}
         """
         try:
             # WebSocket: 렌더링 시작 알림
@@ -183,75 +202,74 @@ class RemotionService:
             output_filename = f"video_{content_id}_{int(asyncio.get_event_loop().time())}.mp4"
             output_path = self.output_dir / output_filename
 
-            # Remotion CLI 명령어 구성
+            # 렌더 해상도 / 멀티포맷 타깃
             platform = props.get("platform", "YouTube")
             composition = PLATFORM_COMPOSITIONS.get(platform, PLATFORM_COMPOSITIONS["YouTube"])
 
-            remotion_command = [
-                "npx",
-                "remotion",
-                "render",
-                composition_id,
-                str(output_path),
-                f"--props={props_file}",
-                f"--width={composition['width']}",
-                f"--height={composition['height']}",
-                f"--fps={composition['fps']}",
-                f"--codec={composition['codec']}",
-                "--concurrency=4"  # 병렬 렌더링
-            ]
-
-            # WebSocket: 렌더링 진행
-            await self._send_progress(content_id, "rendering", 30, "Remotion CLI 실행 중...")
-
-            # Remotion 렌더링 실행
-            logger.info(f"🎬 Starting Remotion render: {' '.join(remotion_command)}")
-
-            process = await asyncio.create_subprocess_exec(
-                *remotion_command,
-                cwd=str(self.frontend_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            # 실시간 로그 출력 및 진행률 업데이트
-            async def read_stream(stream, is_stderr=False):
-                while True:
-                    line = await stream.readline()
-                    if not line:
-                        break
-                    text = line.decode('utf-8').strip()
-                    if text:
-                        logger.info(f"Remotion: {text}")
-
-                        # 진행률 파싱 (Remotion은 프레임 진행률을 출력)
-                        if "Rendering frames" in text:
-                            await self._send_progress(content_id, "rendering", 50, text)
-                        elif "Encoding" in text:
-                            await self._send_progress(content_id, "rendering", 80, text)
-
-            # stdout/stderr 동시 읽기
-            await asyncio.gather(
-                read_stream(process.stdout),
-                read_stream(process.stderr, is_stderr=True)
-            )
-
-            await process.wait()
-
-            if process.returncode != 0:
-                raise RuntimeError(f"Remotion render failed with exit code {process.returncode}")
+            targets = {
+                name: (PLATFORM_COMPOSITIONS[name]["width"], PLATFORM_COMPOSITIONS[name]["height"])
+                for name in (platforms or []) if name in PLATFORM_COMPOSITIONS
+            }
+            scale = None
+            if targets:
+                output_path = self.output_dir / f"master_{content_id}_{int(asyncio.get_event_loop().time())}.mp4"
+                scale = master_render_scale(
+                    (composition["width"], composition["height"]),
+                    targets.values(),
+                    settings.RENDER_MASTER_MAX_SCALE
+                )
+
+            # 실제 프레임 진행률 → WebSocket + 호출부 콜백 (트랜스코딩이 뒤따르면 70%까지)
+            render_span = 65 if targets else 75
+            last_pct = -1
+
+            async def report(progress: RenderProgress) -> None:
+                nonlocal last_pct
+                pct = int(5 + progress.fraction * render_span)
+                if pct == last_pct:
+                    return
+                last_pct = pct
+                message = f"렌더링 {progress.rendered_frames}/{progress.total_frames} 프레임"
+                await self._send_progress(content_id, "rendering", pct, message, progress.as_metadata())
+                if on_progress is not None:
+                    await asyncio.to_thread(on_progress, pct, message, progress.as_metadata())
+
+            render_client = get_remotion_render_client()
+            try:
+                if render_client is None:
+                    raise RemotionRenderUnavailable("Render server disabled")
+                await render_client.render(
+                    composition_id,
+                    str(output_path),
+                    props,
+                    on_progress=report,
+                    width=composition["width"],
+                    height=composition["height"],
+                    fps=composition["fps"],
+                    scale=scale,
+                    concurrency=4
+                )
+            except RemotionRenderUnavailable as e:
+                logger.info(f"Render server unavailable, falling back to CLI: {e}")
+                await self._render_with_cli(
+                    composition_id, output_path, props_file, composition, scale, report
+                )
 
             logger.info(f"✅ Remotion render completed: {output_path}")
 
+            if targets:
+                return await self._transcode_and_upload(
+                    content_id, str(output_path), targets, props["metadata"]["totalDuration"]
+                )
+
             # WebSocket: Cloudinary 업로드 시작
             await self._send_progress(content_id, "uploading", 85, "Cloudinary 업로드 중...")
 
             # Cloudinary 업로드
-            cloudinary_result = self.cloudinary.upload_video(
+            cloudinary_result = await self.cloudinary.upload_video(
                 str(output_path),
-                folder=f"omnivibe/content_{content_id}",
                 public_id=f"video_{content_id}",
-                resource_type="video"
+                folder=f"omnivibe/content_{content_id}",
             )
 
             video_url = cloudinary_result.get("secure_url")
@@ -274,24 +292,148 @@ class RemotionService:
             await self._send_progress(content_id, "failed", 0, f"렌더링 실패: {str(e)}")
             raise
 
+    async def _render_with_cli(
+        self,
+        composition_id: str,
+        output_path: Path,
+        props_file: Path,
+        composition: Dict[str, Any],
+        scale: Optional[float],
+        report: Callable[[RenderProgress], Any]
+    ) -> None:
+        """npx remotion render fallback (렌더 서버 미기동 시) — CLI 출력의 프레임 수를 파싱"""
+        remotion_command = [
+            "npx",
+            "remotion",
+            "render",
+            composition_id,
+            str(output_path),
+            f"--props={props_file}",
+            f"--width={composition['width']}",
+            f"--height={composition['height']}",
+            f"--fps={composition['fps']}",
+            f"--codec={composition['codec']}",
+            "--concurrency=4"  # 병렬 렌더링
+        ]
+        if scale:
+            remotion_command.append(f"--scale={scale}")
+
+        logger.info(f"🎬 Starting Remotion render: {' '.join(remotion_command)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *remotion_command,
+            cwd=str(self.frontend_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        started = time.monotonic()
+        frames = {"rendered": 0, "encoded": 0, "total": 0}
+
+        # 실시간 로그 출력 및 진행률 업데이트 (예: "Rendered 120/900", "Encoded 110/900")
+        async def read_stream(stream):
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                text = line.decode('utf-8', errors='replace').split('\r')[-1].strip()
+                if not text:
+                    continue
+                logger.info(f"Remotion: {text}")
+
+                match = CLI_FRAME_PATTERN.search(text)
+                if not match:
+                    continue
+                done, total = int(match.group(1)), int(match.group(2))
+                key = "encoded" if "ncod" in text else "rendered"
+                frames[key] = done
+                frames["total"] = total
+                await report(RenderProgress(
+                    rendered_frames=max(frames["rendered"], frames["encoded"]),
+                    encoded_frames=frames["encoded"],
+                    total_frames=total,
+                    elapsed_seconds=time.monotonic() - started
+                ))
+
+        # stdout/stderr 동시 읽기
+        await asyncio.gather(read_stream(process.stdout), read_stream(process.stderr))
+        await process.wait()
+
+        if process.returncode != 0:
+            raise RuntimeError(f"Remotion render failed with exit code {process.returncode}")
+
+    async def _transcode_and_upload(
+        self,
+        content_id: int,
+        master_path: str,
+        targets: Dict[str, tuple],
+        duration: float
+    ) -> Dict[str, Any]:
+        """마스터 영상 → 플랫폼별 병렬 트랜스코딩 + Cloudinary 업로드"""
+        await self._send_progress(content_id, "transcoding", 70, f"{len(targets)}개 포맷 변환 중...")
+
+        output_dir = self.output_dir / f"video_{content_id}_formats"
+        paths = await asyncio.to_thread(
+            get_format_transcoder().transcode, master_path, targets, str(output_dir)
+        )
+        os.unlink(master_path)
+
+        await self._send_progress(content_id, "uploading", 85, "Cloudinary 업로드 중...")
+
+        outputs: Dict[str, Any] = {}
+        for name, path in paths.items():
+            if not path:
+                outputs[name] = {"status": "failed"}
+                continue
+            cloudinary_result = await self.cloudinary.upload_video(
+                path,
+                public_id=f"video_{content_id}_{name.lower()}",
+                folder=f"omnivibe/content_{content_id}",
+            )
+            width, height = targets[name]
+            outputs[name] = {
+                "status": "success",
+                "local_path": path,
+                "cloudinary_url": cloudinary_result.get("secure_url"),
+                "resolution": f"{width}x{height}"
+            }
+
+        succeeded = [name for name, output in outputs.items() if output["status"] == "success"]
+        if not succeeded:
+            raise RuntimeError("All format transcodes failed")
+
+        await self._send_progress(content_id, "completed", 100, "렌더링 완료!")
+
+        primary = outputs[succeeded[0]]
+        return {
+            "status": "success",
+            "local_path": primary["local_path"],
+            "cloudinary_url": primary["cloudinary_url"],
+            "duration": duration,
+            "platform": succeeded[0],
+            "resolution": primary["resolution"],
+            "outputs": outputs
+        }
+
     async def _send_progress(
         self,
         content_id: int,
         stage: str,
         progress: int,
-        message: str
+        message: str,
+        frames: Optional[Dict[str, Any]] = None
     ):
         """WebSocket으로 진행 상태 전송"""
+        payload = {
+            "content_id": content_id,
+            "stage": stage,
+            "progress": progress,
+            "message": message
+        }
+        if frames:
+            payload["frames"] = frames
         try:
-            await self.ws_manager.broadcast(
-                f"content_{content_id}",
-                {
-                    "content_id": content_id,
-                    "stage": stage,
-                    "progress": progress,
-                    "message": message
-                }
-            )
+            await self.ws_manager.broadcast(f"content_{content_id}", payload)
         except Exception as e:
             logger.warning(f"Failed to send progress via WebSocket: {e}")
 
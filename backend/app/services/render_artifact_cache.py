@@ -0,0 +1,412 @@
+"""
+Render Artifact Cache — 렌더 그래프 중간 산출물 content-addressed 캐시
+
+배경:
+    - regenerate_video_with_edits_task / 에디터 API는 섹션 1개의 클립, 자막 스타일,
+      BGM 볼륨만 바뀌어도 전체 파이프라인(클립 생성 → xfade → 오디오 믹스 → 자막 burn)을 재실행
+    - 입력이 동일한 단계는 결과도 동일하므로 재사용 가능
+
+원칙:
+    1. 단계 키 = sha256(stage, 입력 파일 fingerprint, 파라미터 JSON)
+    2. 입력 파일 fingerprint 는 내용 해시 (경로/파일명이 달라도 같은 내용이면 hit)
+       - 이 캐시가 만든 산출물은 키 자체를 fingerprint 로 등록 → 대용량 재해시 생략
+    3. 저장소는 크기 제한 (초과 시 LRU 삭제)
+    4. 산출물은 복사로 주고받는다 (hardlink 금지 — 이후 ffmpeg -y 가 같은 경로를
+       덮어쓰면 저장소 원본까지 손상됨)
+    5. 단계별 hit/miss, 절약 시간을 RenderCacheReport 로 보고
+
+사용 예:
+    cache = get_render_artifact_cache()
+    report = RenderCacheReport()
+    cache.run_stage(
+        "audio_mix",
+        output_path=with_audio_path,
+        producer=lambda: self._mix(...),
+        input_files=[video_path, audio_path, bgm_path],
+        params={"bgm_volume": 0.2},
+        report=report,
+    )
+    report.to_dict()  # {"stages": {"audio_mix": {"hits": 1, ...}}, ...}
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_BYTES = 20 * 1024 ** 3  # 20 GB
+_HASH_CHUNK = 4 * 1024 * 1024
+_META_SUFFIX = ".meta.json"
+
+
+class RenderCacheReport:
+    """렌더 1회 동안의 단계별 캐시 hit/miss 기록"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, summary: Optional[Dict[str, Any]]) -> "RenderCacheReport":
+        """to_dict() 요약에서 복원 (LangGraph state 에는 요약 dict 만 두고 노드마다 이어서 기록)"""
+        report = cls()
+        for name, entry in ((summary or {}).get("stages") or {}).items():
+            report.stages[name] = dict(entry)
+        return report
+
+    def record(self, stage: str, hit: bool, elapsed: float, saved: float = 0.0) -> None:
+        with self._lock:
+            entry = self.stages.setdefault(
+                stage, {"hits": 0, "misses": 0, "elapsed_seconds": 0.0, "saved_seconds": 0.0}
+            )
+            entry["hits" if hit else "misses"] += 1
+            entry["elapsed_seconds"] = round(entry["elapsed_seconds"] + elapsed, 3)
+            entry["saved_seconds"] = round(entry["saved_seconds"] + saved, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: dict(entry) for name, entry in self.stages.items()}
+        hits = sum(e["hits"] for e in stages.values())
+        misses = sum(e["misses"] for e in stages.values())
+        return {
+            "stages": stages,
+            "hits": hits,
+            "misses": misses,
+            "saved_seconds": round(sum(e["saved_seconds"] for e in stages.values()), 3),
+        }
+
+
+class RenderArtifactCache:
+    """크기 제한 content-addressed 산출물 저장소"""
+
+    def __init__(self, root_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        """
+        Args:
+            root_dir: 저장소 디렉토리
+            max_bytes: 저장소 최대 크기 (바이트)
+            enabled: False면 항상 producer 실행 (키 계산/저장 생략)
+        """
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[Tuple[str, int, int], str] = {}
+        self._total_bytes: Optional[int] = None
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        if self.enabled:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 키 계산
+    # ─────────────────────────────────────────────────────────────────────
+
+    def fingerprint(self, file_path: str) -> str:
+        """
+        파일 내용 fingerprint (sha256)
+
+        (절대경로, size, mtime_ns) 가 같으면 재해시하지 않는다.
+        """
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+        stat_key = (abs_path, st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            cached = self._fingerprints.get(stat_key)
+        if cached:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(abs_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+
+        with self._lock:
+            self._fingerprints[stat_key] = value
+        return value
+
+    def _register_fingerprint(self, file_path: str, value: str) -> None:
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+        with self._lock:
+            self._fingerprints[(abs_path, st.st_size, st.st_mtime_ns)] = value
+
+    def compute_key(
+        self,
+        stage: str,
+        input_files: Sequence[Optional[str]] = (),
+        params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """단계 키 = sha256(stage + 입력 fingerprint 목록 + 파라미터)"""
+        payload = {
+            "stage": stage,
+            "inputs": [self.fingerprint(p) if p else None for p in input_files],
+            "params": params or {},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 저장소
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _artifact_path(self, stage: str, key: str, suffix: str) -> Path:
+        return self.root_dir / stage / key[:2] / f"{key}{suffix}"
+
+    def _find_artifact(self, stage: str, key: str) -> Optional[Path]:
+        directory = self.root_dir / stage / key[:2]
+        if not directory.exists():
+            return None
+        for candidate in directory.glob(f"{key}*"):
+            if not candidate.name.endswith(_META_SUFFIX) and not candidate.name.endswith(".tmp"):
+                return candidate
+        return None
+
+    def _read_meta(self, artifact: Path) -> Dict[str, Any]:
+        meta_path = artifact.with_name(artifact.name + _META_SUFFIX)
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def fetch(self, stage: str, key: str, output_path: str) -> Optional[Dict[str, Any]]:
+        """
+        저장소에서 산출물을 output_path 로 복사
+
+        Returns:
+            hit 시 메타데이터 dict (producer_seconds 등), miss 시 None
+        """
+        artifact = self._find_artifact(stage, key)
+        if artifact is None:
+            return None
+
+        try:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(artifact, output_path)
+            os.utime(artifact)  # LRU 갱신
+        except OSError as e:
+            logger.warning(f"Render cache fetch failed ({stage}/{key[:12]}): {e}")
+            return None
+
+        self._register_fingerprint(output_path, f"artifact:{key}")
+        return self._read_meta(artifact)
+
+    def store(self, stage: str, key: str, output_path: str, producer_seconds: float) -> None:
+        """producer 산출물을 저장소에 복사 (원자적 교체)"""
+        source = Path(output_path)
+        if not source.exists():
+            logger.warning(f"Render cache store skipped, output missing: {output_path}")
+            return
+
+        artifact = self._artifact_path(stage, key, source.suffix)
+        tmp_path = artifact.with_name(f"{artifact.name}.{os.getpid()}.tmp")
+        try:
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, artifact)
+            artifact.with_name(artifact.name + _META_SUFFIX).write_text(json.dumps({
+                "stage": stage,
+                "producer_seconds": round(producer_seconds, 3),
+                "created_at": time.time(),
+            }))
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Render cache store failed ({stage}/{key[:12]}): {e}")
+            return
+
+        self._register_fingerprint(output_path, f"artifact:{key}")
+        self._add_bytes(artifact.stat().st_size)
+
+    def _scan_total_bytes(self) -> int:
+        return sum(
+            p.stat().st_size
+            for p in self.root_dir.glob("*/*/*")
+            if p.is_file() and not p.name.endswith(_META_SUFFIX)
+        )
+
+    def _add_bytes(self, size: int) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += size
+            over_budget = self._total_bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        저장소가 max_bytes 를 넘으면 가장 오래 사용되지 않은 산출물부터 삭제
+
+        Returns:
+            삭제된 산출물 수
+        """
+        artifacts: List[Tuple[float, int, Path]] = []
+        for p in self.root_dir.glob("*/*/*"):
+            if not p.is_file() or p.name.endswith(_META_SUFFIX) or p.name.endswith(".tmp"):
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            artifacts.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in artifacts)
+        removed = 0
+        for _, size, path in sorted(artifacts):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            path.with_name(path.name + _META_SUFFIX).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+        if removed:
+            logger.info(f"Render cache evicted {removed} artifacts ({total / 1024 ** 2:.1f} MB left)")
+        return removed
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 단계 실행
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _record(self, stage: str, hit: bool) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(stage, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+
+    def lookup(
+        self,
+        stage: str,
+        output_path: str,
+        input_files: Sequence[Optional[str]] = (),
+        params: Optional[Dict[str, Any]] = None,
+        report: Optional[RenderCacheReport] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        producer 실행 전 캐시 확인 (run_stage 를 쓸 수 없는 호출부용)
+
+        Returns:
+            (key, hit) — 캐시 비활성 시 (None, False)
+        """
+        if not self.enabled:
+            return None, False
+
+        start = time.time()
+        key = self.compute_key(stage, input_files, params)
+        meta = self.fetch(stage, key, output_path)
+        if meta is None:
+            return key, False
+
+        self._record(stage, True)
+        if report is not None:
+            report.record(stage, True, time.time() - start, meta.get("producer_seconds", 0.0))
+        logger.info(f"♻️  Render cache HIT: {stage} ({key[:12]})")
+        return key, True
+
+    def commit(
+        self,
+        stage: str,
+        key: Optional[str],
+        output_path: str,
+        producer_seconds: float,
+        report: Optional[RenderCacheReport] = None,
+    ) -> None:
+        """producer 실행 후 산출물 저장 (lookup 의 miss 쌍)"""
+        if report is not None:
+            report.record(stage, False, producer_seconds)
+        if key is None:
+            return
+        self._record(stage, False)
+        self.store(stage, key, output_path, producer_seconds)
+
+    def run_stage(
+        self,
+        stage: str,
+        output_path: str,
+        producer: Callable[[], Any],
+        input_files: Sequence[Optional[str]] = (),
+        params: Optional[Dict[str, Any]] = None,
+        report: Optional[RenderCacheReport] = None,
+    ) -> bool:
+        """
+        캐시 hit 이면 산출물을 output_path 에 복사, miss 면 producer 실행 후 저장
+
+        producer 는 output_path 에 결과 파일을 써야 한다.
+
+        Returns:
+            캐시 hit 여부
+        """
+        key, hit = self.lookup(stage, output_path, input_files, params, report)
+        if hit:
+            return True
+
+        start = time.time()
+        producer()
+        self.commit(stage, key, output_path, time.time() - start, report)
+        return False
+
+    async def arun_stage(
+        self,
+        stage: str,
+        output_path: str,
+        producer: Callable[[], Awaitable[Any]],
+        input_files: Sequence[Optional[str]] = (),
+        params: Optional[Dict[str, Any]] = None,
+        report: Optional[RenderCacheReport] = None,
+    ) -> bool:
+        """run_stage()의 비동기 producer 버전"""
+        key, hit = self.lookup(stage, output_path, input_files, params, report)
+        if hit:
+            return True
+
+        start = time.time()
+        await producer()
+        self.commit(stage, key, output_path, time.time() - start, report)
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로세스 누적 단계별 hit/miss 및 저장소 크기"""
+        with self._lock:
+            stages = {name: dict(entry) for name, entry in self._stats.items()}
+            total_bytes = self._total_bytes
+        for entry in stages.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / lookups * 100, 2) if lookups else 0.0
+        return {
+            "enabled": self.enabled,
+            "stages": stages,
+            "store_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 싱글톤 인스턴스
+_render_artifact_cache_instance: Optional[RenderArtifactCache] = None
+
+
+def get_render_artifact_cache() -> RenderArtifactCache:
+    """RenderArtifactCache 싱글톤 인스턴스"""
+    global _render_artifact_cache_instance
+    if _render_artifact_cache_instance is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _render_artifact_cache_instance = RenderArtifactCache(
+            root_dir=settings.RENDER_CACHE_DIR,
+            max_bytes=settings.RENDER_CACHE_MAX_BYTES,
+            enabled=settings.RENDER_CACHE_ENABLED,
+        )
+    return _render_artifact_cache_instance
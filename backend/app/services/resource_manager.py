@@ -308,9 +308,9 @@ class ResourceManager:
             메타데이터 (duration, width, height, fps 등)
         """
         try:
-            import ffmpeg
+            from app.services.media_probe_service import get_media_probe_service
 
-            probe = ffmpeg.probe(video_path)
+            probe = await get_media_probe_service().aprobe(video_path)
             video_stream = next(
                 (stream for stream in probe['streams'] if stream['codec_type'] == 'video'),
                 None
@@ -329,9 +329,6 @@ class ResourceManager:
 
             return metadata
 
-        except ImportError:
-            self.logger.warning("ffmpeg-python not installed. Video metadata unavailable.")
-            return {}
         except Exception as e:
             self.logger.error(f"Failed to extract video metadata: {e}")
             return {}
@@ -0,0 +1,291 @@
+"""
+Sheets Ingestion — 리비전/내용 해시 캐시 + 변경 행만 방출하는 Google Sheets 수집 계층
+
+배경:
+    - read_sheet 가 동기 클라이언트의 `.execute()` 를 async 함수 안에서 직접 호출 (이벤트 루프 차단)
+    - 호출마다 전체 범위를 다시 내려받고, 캠페인 폴링은 바뀐 게 없어도 매번 전체 행을 재처리
+
+방식:
+    - 모든 API 호출은 asyncio.to_thread 로 실행 (httplib2 는 스레드 안전하지 않아 호출은 직렬화)
+    - 여러 범위는 values.batchGet 1회로 수집
+    - Drive 파일 version(리비전)이 마지막 수집과 같으면 Sheets 호출 없이 캐시 반환
+      (Drive 조회 불가 시 내려받은 값의 내용 해시로 변경 여부 판단)
+    - changed_rows: 키 컬럼(없으면 행 번호) 기준 행 해시를 마지막 방출분과 비교해
+      추가/변경된 행과 삭제된 키만 반환 → 스크립트 생성 등 하위 단계는 변경분만 처리
+
+사용 예시:
+    ingestion = get_sheets_ingestion()
+    values = await ingestion.fetch_ranges(spreadsheet_id, ["전략!A:Z", "스케줄!A:Z"])
+    changes = await ingestion.changed_rows(spreadsheet_id, "스케줄!A:Z", key_columns=["캠페인명", "소제목"])
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def values_hash(values: List[List[Any]]) -> str:
+    """범위 값 전체의 내용 해시"""
+    payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _row_hash(row: List[Any]) -> str:
+    # 뒤쪽 빈 셀은 API 응답에서 생략되므로 정규화
+    cells = [str(cell).strip() for cell in row]
+    while cells and not cells[-1]:
+        cells.pop()
+    return hashlib.sha1(json.dumps(cells, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def rows_to_records(values: List[List[Any]]) -> List[Dict[str, Any]]:
+    """첫 행을 헤더로 딕셔너리 리스트 변환 (빈 행 제외, `_row` = 시트 행 번호)"""
+    if not values:
+        return []
+    headers = [str(h).strip() for h in values[0]]
+    records = []
+    for offset, row in enumerate(values[1:], start=2):
+        if not any(str(cell).strip() for cell in row):
+            continue
+        record: Dict[str, Any] = {"_row": offset}
+        for i, header in enumerate(headers):
+            value = row[i] if i < len(row) else ""
+            record[header] = value.strip() if isinstance(value, str) else value
+        records.append(record)
+    return records
+
+
+@dataclass
+class SheetChanges:
+    """마지막 방출 이후 변경분"""
+    range_name: str
+    revision: Optional[str]
+    changed: List[Dict[str, Any]] = field(default_factory=list)   # 추가 + 변경 행 (레코드)
+    removed: List[str] = field(default_factory=list)              # 사라진 행 키
+    total_rows: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class SheetsIngestion:
+    """Google Sheets 수집 (비차단 호출, batchGet, 리비전 캐시, 변경 행 추적)"""
+
+    def __init__(self, service: Any, drive: Any = None, cache_dir: Optional[str] = None):
+        """
+        Args:
+            service: googleapiclient Sheets v4 리소스
+            drive: googleapiclient Drive v3 리소스 (리비전 조회용, None이면 내용 해시만 사용)
+            cache_dir: 스냅샷/방출 상태 디스크 캐시 (None이면 메모리만)
+        """
+        self.service = service
+        self.drive = drive
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._api_lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._state_lock = threading.Lock()  # 임계 구역에 await 없음 (스레드/루프 무관)
+        self._stats = {"revision_hits": 0, "batch_gets": 0, "ranges_fetched": 0, "unchanged_content": 0}
+
+    # ─────────────────────────────────────────────────────────────────────
+    # API 호출 (이벤트 루프 밖)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _execute_locked(self, request: Any) -> Dict[str, Any]:
+        with self._api_lock:
+            return request.execute()
+
+    async def execute(self, request: Any) -> Dict[str, Any]:
+        """googleapiclient 요청을 워커 스레드에서 실행"""
+        return await asyncio.to_thread(self._execute_locked, request)
+
+    async def get_revision(self, spreadsheet_id: str) -> Optional[str]:
+        """Drive 파일 version (시트가 편집될 때마다 증가). 조회 불가 시 None"""
+        if self.drive is None:
+            return None
+        try:
+            meta = await self.execute(
+                self.drive.files().get(fileId=spreadsheet_id, fields="version", supportsAllDrives=True)
+            )
+            return str(meta["version"]) if meta.get("version") is not None else None
+        except Exception as e:
+            logger.debug(f"Drive revision unavailable for {spreadsheet_id}: {e}")
+            return None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 상태 (스냅샷 + 방출된 행 해시)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _state_path(self, spreadsheet_id: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(spreadsheet_id.encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _load(self, spreadsheet_id: str) -> Dict[str, Any]:
+        state = self._state.get(spreadsheet_id)
+        if state is not None:
+            return state
+        state = {"ranges": {}, "emitted": {}}
+        path = self._state_path(spreadsheet_id)
+        if path is not None and path.exists():
+            try:
+                state = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Sheets cache unreadable ({path.name}): {e}")
+        self._state[spreadsheet_id] = state
+        return state
+
+    def _save(self, spreadsheet_id: str) -> None:
+        path = self._state_path(spreadsheet_id)
+        if path is None:
+            return
+        try:
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(self._state[spreadsheet_id], ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)  # 원자적 교체 (다른 워커와 경합 안전)
+        except OSError as e:
+            logger.warning(f"Sheets cache write failed: {e}")
+
+    def invalidate(self, spreadsheet_id: str) -> None:
+        """쓰기 직후 등 — 다음 조회에서 리비전 캐시를 건너뛰도록 표시 (방출 상태는 유지)"""
+        with self._state_lock:
+            state = self._load(spreadsheet_id)
+            for entry in state["ranges"].values():
+                entry["revision"] = None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # 수집
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def fetch_ranges(self, spreadsheet_id: str, ranges: Sequence[str]) -> Dict[str, List[List[Any]]]:
+        """
+        여러 범위 값 수집 (리비전 동일 시 캐시, 아니면 batchGet 1회)
+
+        Returns:
+            {range_name: 2차원 값 배열} (요청한 범위 이름 그대로)
+        """
+        return await self._fetch(spreadsheet_id, ranges, await self.get_revision(spreadsheet_id))
+
+    async def fetch_range(self, spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        return (await self.fetch_ranges(spreadsheet_id, [range_name]))[range_name]
+
+    async def _fetch(
+        self,
+        spreadsheet_id: str,
+        ranges: Sequence[str],
+        revision: Optional[str],
+    ) -> Dict[str, List[List[Any]]]:
+        ranges = list(dict.fromkeys(ranges))
+        with self._state_lock:
+            state = self._load(spreadsheet_id)
+            cached = state["ranges"]
+            if revision is not None and all(cached.get(r, {}).get("revision") == revision for r in ranges):
+                self._stats["revision_hits"] += 1
+                return {r: cached[r]["values"] for r in ranges}
+
+        response = await self.execute(
+            self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id, ranges=ranges, majorDimension="ROWS"
+            )
+        )
+        # valueRanges 는 요청 순서대로 반환 (range 는 정규화된 A1 표기라 이름 대신 순서로 매핑)
+        fetched = [vr.get("values", []) for vr in response.get("valueRanges", [])]
+        self._stats["batch_gets"] += 1
+        self._stats["ranges_fetched"] += len(ranges)
+
+        with self._state_lock:
+            state = self._load(spreadsheet_id)
+            result: Dict[str, List[List[Any]]] = {}
+            for range_name, values in zip(ranges, fetched):
+                digest = values_hash(values)
+                previous = state["ranges"].get(range_name)
+                if previous is not None and previous["hash"] == digest:
+                    self._stats["unchanged_content"] += 1
+                state["ranges"][range_name] = {"revision": revision, "hash": digest, "values": values}
+                result[range_name] = values
+            self._save(spreadsheet_id)
+        return result
+
+    async def changed_rows(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        key_columns: Optional[Sequence[str]] = None,
+    ) -> SheetChanges:
+        """
+        마지막 호출 이후 추가/변경된 행만 반환 (첫 호출은 전체 행)
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            range_name: 헤더 행을 포함한 범위 (예: '스케줄!A:Z')
+            key_columns: 행 식별 컬럼 (None이면 시트 행 번호 — 중간 삽입 시 이후 행이 변경으로 잡힘)
+        """
+        revision = await self.get_revision(spreadsheet_id)
+        with self._state_lock:
+            state = self._load(spreadsheet_id)
+            emitted_state = state["emitted"].get(range_name)
+            if (
+                revision is not None
+                and emitted_state is not None
+                and emitted_state.get("revision") == revision
+            ):
+                self._stats["revision_hits"] += 1
+                return SheetChanges(range_name, revision, total_rows=len(emitted_state["rows"]))
+
+        values = (await self._fetch(spreadsheet_id, [range_name], revision))[range_name]
+        records = rows_to_records(values)
+        columns = list(key_columns or [])
+
+        current: Dict[str, str] = {}
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            if columns and all(record.get(c) for c in columns):
+                key = "|".join(str(record[c]) for c in columns)
+            else:
+                key = f"#{record['_row']}"
+            row = [v for k, v in record.items() if k != "_row"]
+            current[key] = _row_hash(row)
+            by_key[key] = record
+
+        with self._state_lock:
+            state = self._load(spreadsheet_id)
+            previous = (state["emitted"].get(range_name) or {}).get("rows", {})
+            changes = SheetChanges(
+                range_name,
+                revision,
+                changed=[by_key[k] for k, h in current.items() if previous.get(k) != h],
+                removed=[k for k in previous if k not in current],
+                total_rows=len(current),
+            )
+            state["emitted"][range_name] = {"revision": revision, "rows": current}
+            self._save(spreadsheet_id)
+
+        if changes.has_changes:
+            logger.info(
+                f"Sheet {range_name}: {len(changes.changed)} changed, "
+                f"{len(changes.removed)} removed of {changes.total_rows} rows"
+            )
+        return changes
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats)
+
+
+def get_sheets_ingestion() -> Optional[SheetsIngestion]:
+    """GoogleSheetsService 가 보유한 SheetsIngestion (서비스 미설정 시 None)"""
+    from app.services.google_sheets_service import get_sheets_service
+
+    return get_sheets_service().ingestion
@@ -19,6 +19,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.services.duration_calculator import get_duration_calculator, Language
 from app.services.llm_profile import llm_safe_langchain_chat_kwargs
+from app.services.llm_response_cache import get_llm_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -104,12 +105,16 @@ class SlideToScriptConverter:
     def __init__(
         self,
         model_name: Optional[str] = None,
-        language: str = "ko"
+        language: str = "ko",
+        voice_id: Optional[str] = None,
+        platform: Optional[str] = None
     ):
         """
         Args:
             model_name: 사용할 LLM 모델 (None이면 llm_profile task='slide_to_script' 기본값)
             language: 언어 코드 (ko, en, ja, zh)
+            voice_id: 나레이션 음성 ID (선택, 분량 예측 보정 계수)
+            platform: 플랫폼 (선택, 분량 예측 보정 계수)
         """
         # llm_profile 단일 SoT — task='slide_to_script': Claude Haiku temp=0.7 (ISS-044)
         # model_name override는 호환성 유지를 위해 보존
@@ -119,6 +124,8 @@ class SlideToScriptConverter:
         )
         self.language = Language(language)
         self.duration_calculator = get_duration_calculator(self.language)
+        self.voice_id = voice_id
+        self.platform = platform
         logger.info(f"SlideToScriptConverter initialized with model={model_name}, language={language}")
 
     async def convert_slides_to_script(
@@ -160,15 +167,18 @@ class SlideToScriptConverter:
             HumanMessage(content=user_prompt)
         ]
 
-        response = await self.llm.ainvoke(messages)
-        script_text = response.content
+        script_text = await get_llm_response_cache().cached_ainvoke(
+            self.llm, "slide_to_script", messages
+        )
 
         # 4. 슬라이드별 스크립트 분리
         slide_scripts = self._parse_slide_scripts(script_text, len(slides))
 
         # 5. 슬라이드별 시간 계산
         for slide_script in slide_scripts:
-            duration_info = self.duration_calculator.calculate(slide_script["script"])
+            duration_info = self.duration_calculator.calculate(
+                slide_script["script"], voice_id=self.voice_id, platform=self.platform
+            )
             slide_script["estimated_duration"] = duration_info["duration"]
             slide_script["word_count"] = duration_info["word_count"]
 
@@ -312,7 +322,9 @@ class SlideToScriptConverter:
         Returns:
             예상 시간 (초)
         """
-        duration_info = self.duration_calculator.calculate(script)
+        duration_info = self.duration_calculator.calculate(
+            script, voice_id=self.voice_id, platform=self.platform
+        )
         return duration_info["duration"]
 
     def adjust_script_length(
@@ -371,7 +383,9 @@ async def convert_slides_to_script(
     slides: List[Dict[str, Any]],
     tone: str = "professional",
     target_duration_per_slide: float = 15.0,
-    language: str = "ko"
+    language: str = "ko",
+    voice_id: Optional[str] = None,
+    platform: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     간편 함수: 슬라이드 → 나레이션 스크립트 변환
@@ -381,6 +395,8 @@ async def convert_slides_to_script(
         tone: 톤 (professional, friendly, educational)
         target_duration_per_slide: 슬라이드당 목표 시간 (초)
         language: 언어 코드
+        voice_id: 나레이션 음성 ID (선택)
+        platform: 플랫폼 (선택)
 
     Returns:
         변환 결과 (딕셔너리)
@@ -388,7 +404,7 @@ async def convert_slides_to_script(
     # 딕셔너리 → Pydantic 모델 변환
     slide_models = [SlideData(**slide) for slide in slides]
 
-    converter = SlideToScriptConverter(language=language)
+    converter = SlideToScriptConverter(language=language, voice_id=voice_id, platform=platform)
     result = await converter.convert_slides_to_script(
         slides=slide_models,
         tone=ToneType(tone),
@@ -401,7 +417,9 @@ async def convert_slides_to_script(
 def estimate_presentation_duration(
     slides: List[Dict[str, str]],
     target_duration_per_slide: float = 15.0,
-    language: str = "ko"
+    language: str = "ko",
+    voice_id: Optional[str] = None,
+    platform: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     간편 함수: 프리젠테이션 예상 시간 계산
@@ -410,6 +428,8 @@ def estimate_presentation_duration(
         slides: 슬라이드 데이터 (딕셔너리 리스트)
         target_duration_per_slide: 슬라이드당 목표 시간 (초)
         language: 언어 코드
+        voice_id: 나레이션 음성 ID (선택)
+        platform: 플랫폼 (선택)
 
     Returns:
         예상 시간 정보
@@ -421,7 +441,7 @@ def estimate_presentation_duration(
 
     for slide in slides:
         content = f"{slide.get('title', '')} {slide.get('content', '')}"
-        duration_info = calculator.calculate(content)
+        duration_info = calculator.calculate(content, voice_id=voice_id, platform=platform)
         slide_durations.append(duration_info["duration"])
         total_duration += duration_info["duration"]
 
@@ -0,0 +1,243 @@
+"""
+Streaming I/O — 업로드/다운로드를 청크 단위로 디스크에 기록
+
+배경:
+    - 업로드 엔드포인트가 `await file.read()` 로 파일 전체를 메모리에 올린 뒤 저장
+    - 다운로드 경로도 `response.content` 로 전체 바이트를 RAM 에 보관
+    - 100MB 업로드가 동시에 몰리면 워커 메모리가 바닥남
+
+원칙:
+    1. 고정 크기 청크(기본 1MB)로 읽고 바로 기록 → 메모리 사용량 = 청크 크기
+    2. 기록하면서 해시(md5/sha256)와 크기를 누적 → 재읽기 없이 파일명/무결성 처리
+    3. 크기 제한은 스트리밍 도중 검사 → 초과 즉시 중단, 부분 파일 삭제
+    4. `<dest>.part` 에 쓰고 완료 시 rename → 중간 실패 시 깨진 파일이 남지 않음
+
+사용 예:
+    saved = await save_upload(file, "/tmp/in.mp4", max_bytes=MAX_FILE_SIZE["video"])
+    saved = await download_to_file(url, "/tmp/out.mp4", timeout=300.0)
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+PathLike = Union[str, Path]
+
+
+class StreamSizeLimitError(ValueError):
+    """스트리밍 중 최대 크기 초과"""
+
+    def __init__(self, max_bytes: int, received: int):
+        self.max_bytes = max_bytes
+        self.received = received
+        super().__init__(
+            f"File too large: received more than {max_bytes / (1024 * 1024):.2f}MB"
+        )
+
+
+@dataclass(frozen=True)
+class StreamedFile:
+    """스트리밍 저장 결과"""
+    path: str
+    size: int
+    digest: str  # hexdigest (hash_name 알고리즘)
+
+    @property
+    def size_mb(self) -> float:
+        return self.size / (1024 * 1024)
+
+
+class _StreamWriter:
+    """`.part` 파일에 청크 기록 + 해시/크기 누적 + 크기 제한"""
+
+    def __init__(self, dest_path: PathLike, max_bytes: Optional[int], hash_name: str):
+        self.dest = Path(dest_path)
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+        self.part = self.dest.with_name(self.dest.name + ".part")
+        self.max_bytes = max_bytes
+        self.hasher = hashlib.new(hash_name)
+        self.size = 0
+        self._file = open(self.part, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise StreamSizeLimitError(self.max_bytes, self.size)
+        self.hasher.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> StreamedFile:
+        self._file.close()
+        os.replace(self.part, self.dest)
+        return StreamedFile(path=str(self.dest), size=self.size, digest=self.hasher.hexdigest())
+
+    def abort(self) -> None:
+        self._file.close()
+        self.part.unlink(missing_ok=True)
+
+
+async def write_chunks(
+    chunks: AsyncIterator[bytes],
+    dest_path: PathLike,
+    max_bytes: Optional[int] = None,
+    hash_name: str = "md5",
+) -> StreamedFile:
+    """비동기 청크 이터레이터를 파일로 기록"""
+    writer = _StreamWriter(dest_path, max_bytes, hash_name)
+    try:
+        async for chunk in chunks:
+            writer.write(chunk)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.commit()
+
+
+def write_chunks_sync(
+    chunks: Iterable[bytes],
+    dest_path: PathLike,
+    max_bytes: Optional[int] = None,
+    hash_name: str = "md5",
+) -> StreamedFile:
+    """동기 청크 이터레이터를 파일로 기록 (Celery 태스크 등)"""
+    writer = _StreamWriter(dest_path, max_bytes, hash_name)
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.commit()
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# 업로드 (Starlette UploadFile)
+# ─────────────────────────────────────────────────────────────────────────
+
+async def iter_upload(upload: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """UploadFile 을 청크 단위로 읽기"""
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def save_upload(
+    upload: Any,
+    dest_path: PathLike,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    hash_name: str = "md5",
+) -> StreamedFile:
+    """
+    업로드 파일을 청크 단위로 디스크에 저장
+
+    Args:
+        upload: `read(size)` 코루틴을 가진 업로드 객체 (FastAPI UploadFile)
+        dest_path: 저장 경로
+        max_bytes: 최대 크기 (초과 시 StreamSizeLimitError, 부분 파일 삭제)
+        chunk_size: 청크 크기
+        hash_name: hashlib 알고리즘 이름
+
+    Returns:
+        StreamedFile(path, size, digest)
+    """
+    saved = await write_chunks(iter_upload(upload, chunk_size), dest_path, max_bytes, hash_name)
+    logger.info(f"Upload saved: {saved.path} ({saved.size_mb:.2f} MB)")
+    return saved
+
+
+async def save_upload_content_addressed(
+    upload: Any,
+    directory: PathLike,
+    name_template: str,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamedFile:
+    """
+    업로드를 임시 이름으로 스트리밍 저장한 뒤 해시가 들어간 최종 이름으로 rename
+
+    Args:
+        name_template: 최종 파일명 템플릿 (`{hash}` 자리에 md5 앞 8자리)
+    """
+    directory = Path(directory)
+    temp = await save_upload(
+        upload,
+        directory / f".upload_{uuid.uuid4().hex}",
+        max_bytes=max_bytes,
+        chunk_size=chunk_size,
+    )
+    final = directory / name_template.format(hash=temp.digest[:8])
+    os.replace(temp.path, final)
+    return StreamedFile(path=str(final), size=temp.size, digest=temp.digest)
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# 다운로드 (httpx)
+# ─────────────────────────────────────────────────────────────────────────
+
+async def download_to_file(
+    url: str,
+    dest_path: PathLike,
+    timeout: float = 120.0,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    client: Any = None,
+) -> StreamedFile:
+    """
+    URL 을 스트리밍으로 다운로드 (응답 본문을 메모리에 모으지 않음)
+
+    Args:
+        url: 다운로드 URL
+        dest_path: 저장 경로
+        timeout: 요청 타임아웃 (초)
+        max_bytes: 최대 크기
+        chunk_size: 청크 크기
+        client: 재사용할 httpx.AsyncClient (없으면 1회용 생성)
+    """
+    import httpx
+
+    async def _stream(http: Any) -> StreamedFile:
+        async with http.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            return await write_chunks(
+                response.aiter_bytes(chunk_size), dest_path, max_bytes
+            )
+
+    if client is not None:
+        saved = await _stream(client)
+    else:
+        async with httpx.AsyncClient(follow_redirects=True) as http:
+            saved = await _stream(http)
+
+    logger.info(f"Downloaded {saved.size_mb:.2f} MB to {saved.path}")
+    return saved
+
+
+def download_to_file_sync(
+    url: str,
+    dest_path: PathLike,
+    timeout: float = 120.0,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamedFile:
+    """download_to_file 의 동기 버전 (Celery 태스크용)"""
+    import httpx
+
+    with httpx.stream("GET", url, timeout=timeout, follow_redirects=True) as response:
+        response.raise_for_status()
+        saved = write_chunks_sync(response.iter_bytes(chunk_size), dest_path, max_bytes)
+
+    logger.info(f"Downloaded {saved.size_mb:.2f} MB to {saved.path}")
+    return saved
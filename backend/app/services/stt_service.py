@@ -112,8 +112,10 @@ class STTService:
 
     async def transcribe_with_timestamps(
         self,
-        audio_file_path: str,
-        language: str = "ko"
+        audio_file_path: Optional[str] = None,
+        language: str = "ko",
+        word_timestamps: bool = False,
+        audio_bytes: Optional[bytes] = None
     ) -> dict:
         """
         타임스탬프 포함 변환
@@ -121,22 +123,34 @@ class STTService:
         Args:
             audio_file_path: 오디오 파일 경로
             language: 언어 코드
+            word_timestamps: True면 단어 단위 타임스탬프("words")도 요청
+            audio_bytes: 오디오 바이트 (파일 경로 대신 사용 가능)
 
         Returns:
-            {"text": "전체 텍스트", "segments": [...]}
+            {"text": "전체 텍스트", "segments": [...], "words": [...] (word_timestamps=True일 때)}
         """
         span_context = logfire.span("whisper.transcribe_with_timestamps") if LOGFIRE_AVAILABLE else nullcontext()
         with span_context:
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language,
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"]
-                )
+            if audio_file_path is None and audio_bytes is None:
+                raise ValueError("Either audio_file_path or audio_bytes must be provided")
+
+            granularities = ["segment", "word"] if word_timestamps else ["segment"]
+            with tempfile.NamedTemporaryFile(suffix=".mp3") if audio_bytes else nullcontext() as temp_file:
+                if temp_file is not None:
+                    temp_file.write(audio_bytes)
+                    temp_file.flush()
+                    audio_file_path = temp_file.name
 
-            return {
+                with open(audio_file_path, "rb") as audio_file:
+                    transcript = self.client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=audio_file,
+                        language=language,
+                        response_format="verbose_json",
+                        timestamp_granularities=granularities
+                    )
+
+            result = {
                 "text": transcript.text,
                 "language": transcript.language,
                 "duration": transcript.duration,
@@ -149,6 +163,16 @@ class STTService:
                     for seg in transcript.segments
                 ]
             }
+            if word_timestamps:
+                result["words"] = [
+                    {
+                        "word": word.word,
+                        "start": word.start,
+                        "end": word.end
+                    }
+                    for word in (transcript.words or [])
+                ]
+            return result
 
     async def translate_to_english(
         self,
@@ -0,0 +1,347 @@
+"""
+Subtitle Localization — 1회 전사 세그먼트를 여러 언어로 병렬 번역 + SRT/VTT 생성
+
+배경:
+    - generate_subtitles_for_multiple_languages 는 언어마다 Whisper 전사를 처음부터 다시 수행
+      (오디오 업로드·전사 비용이 언어 수만큼 반복, 언어 간 타임코드도 미묘하게 어긋남)
+
+방식:
+    - 원본 언어로 1회 전사한 세그먼트를 기준으로 언어별 번역 → SRT/VTT 생성
+    - 언어별 작업은 asyncio.Semaphore 로 동시 실행 수를 제한해 병렬 수행
+    - 번역은 세그먼트 배치 단위 JSON 배열 요청 (줄 수 검증으로 타임코드 정렬 유지)
+    - 결과는 원본 세그먼트 내용 해시 + 언어 + 모델 키로 디스크 캐시
+      → 같은 세그먼트로 언어를 다시 요청하면 LLM 호출 없이 파일만 다시 쓴다
+
+사용 예시:
+    localizer = get_subtitle_localizer()
+    results = await localizer.localize(
+        segments, ["en", "ja"], source_language="ko",
+        output_dir="./outputs/subtitles", stem="video_123",
+    )
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.llm_profile import (
+    TASK_PRESETS,
+    estimate_cost_usd,
+    llm_safe_chat_kwargs,
+)
+from app.services.subtitle_service import SubtitleService
+
+logger = logging.getLogger(__name__)
+
+
+TRANSLATE_TASK = "subtitle_translate"
+
+# 번역 요청 1회당 세그먼트 수 (max_tokens 안에 응답이 들어오도록)
+DEFAULT_BATCH_SIZE = 80
+
+# (번역된 텍스트 리스트, 입력 토큰, 출력 토큰)
+TranslateBatch = Callable[[List[str], str, str], Awaitable[Tuple[List[str], int, int]]]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 세그먼트 해시 / 자막 포맷
+# ─────────────────────────────────────────────────────────────────────────────
+
+def segments_digest(segments: List[Dict[str, Any]]) -> str:
+    """세그먼트 내용 해시 (start/end 밀리초 + 텍스트만 사용)"""
+    canonical = [
+        [round(float(seg["start"]) * 1000), round(float(seg["end"]) * 1000), seg["text"]]
+        for seg in segments
+    ]
+    payload = json.dumps(canonical, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_srt(segments: List[Dict[str, Any]]) -> str:
+    """세그먼트 → SRT 문자열 (SubtitleService 와 같은 포맷터)"""
+    return SubtitleService._generate_srt_content(segments)
+
+
+def build_vtt(segments: List[Dict[str, Any]]) -> str:
+    """세그먼트 → WebVTT 문자열"""
+    lines: List[str] = ["WEBVTT", ""]
+    for seg in segments:
+        start = SubtitleService._format_timestamp(seg["start"], ".")
+        end = SubtitleService._format_timestamp(seg["end"], ".")
+        lines.append(f"{start} --> {end}")
+        lines.append(seg["text"])
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 언어별 번역 결과 캐시 (디스크)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SubtitleTranslationCache:
+    """원본 세그먼트 해시 + 언어 + 모델 → 번역된 세그먼트"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 캐시 안 함)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def cache_key(digest: str, language: str, model: str) -> str:
+        return hashlib.sha256(f"{digest}|{language}|{model}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))["segments"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Subtitle cache entry unreadable ({path.name}): {e}")
+            return None
+
+    def put(self, key: str, segments: List[Dict[str, Any]]) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({"segments": segments}, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)  # 원자적 교체 (다른 워커와 경합 안전)
+        except OSError as e:
+            logger.warning(f"Subtitle cache write failed: {e}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LLM 번역 (세그먼트 배치 → JSON 배열)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def openai_batch_translator(get_client: Callable[[], Any]) -> TranslateBatch:
+    """
+    AsyncOpenAI 클라이언트로 세그먼트 배치를 번역하는 함수 생성
+
+    요청/응답 모두 {"lines": [...]} — 줄 수가 다르면 타임코드 정렬이 깨지므로 실패 처리
+
+    Args:
+        get_client: 호출 시점의 AsyncOpenAI 클라이언트를 반환하는 함수 (이벤트 루프별 클라이언트)
+    """
+
+    async def translate(texts: List[str], source_language: str, target_language: str):
+        user_message = json.dumps(
+            {"source_language": source_language, "target_language": target_language, "lines": texts},
+            ensure_ascii=False,
+        )
+        kwargs = llm_safe_chat_kwargs(TRANSLATE_TASK, user_message=user_message)
+        response = await get_client().chat.completions.create(**kwargs)
+
+        content = response.choices[0].message.content or ""
+        lines = json.loads(content).get("lines")
+        if not isinstance(lines, list) or len(lines) != len(texts):
+            raise ValueError(
+                f"Translation returned {len(lines) if isinstance(lines, list) else 'no'} lines "
+                f"for {len(texts)} segments ({target_language})"
+            )
+        usage = getattr(response, "usage", None)
+        return (
+            [str(line).strip() for line in lines],
+            getattr(usage, "prompt_tokens", 0) or 0,
+            getattr(usage, "completion_tokens", 0) or 0,
+        )
+
+    return translate
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 병렬 다국어 생성
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SubtitleLocalizer:
+    """전사 세그먼트 1벌 → 언어별 SRT/VTT (병렬, 캐시)"""
+
+    def __init__(
+        self,
+        translate: TranslateBatch,
+        cache: Optional[SubtitleTranslationCache] = None,
+        concurrency: int = 4,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        model: Optional[str] = None,
+    ):
+        """
+        Args:
+            translate: 배치 번역 함수 (openai_batch_translator 결과 등)
+            cache: 번역 결과 캐시 (None이면 캐시 안 함)
+            concurrency: 동시에 진행하는 번역 요청 수 (모든 언어 합산)
+            batch_size: 번역 요청 1회당 세그먼트 수
+            model: 캐시 키에 포함할 번역 모델명 (기본: subtitle_translate 프리셋 모델)
+        """
+        self.translate = translate
+        self.cache = cache or SubtitleTranslationCache(None)
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.model = model or TASK_PRESETS[TRANSLATE_TASK].model
+
+    async def _translate_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        source_language: str,
+        target_language: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        async def run_batch(batch: List[Dict[str, Any]]):
+            async with semaphore:
+                return await self.translate([seg["text"] for seg in batch], source_language, target_language)
+
+        batches = [segments[i:i + self.batch_size] for i in range(0, len(segments), self.batch_size)]
+        outputs = await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+        translated: List[Dict[str, Any]] = []
+        cost_usd = 0.0
+        for batch, (texts, input_tokens, output_tokens) in zip(batches, outputs):
+            translated.extend(
+                {"start": seg["start"], "end": seg["end"], "text": text}
+                for seg, text in zip(batch, texts)
+            )
+            cost_usd += estimate_cost_usd(TRANSLATE_TASK, input_tokens=input_tokens, output_tokens=output_tokens)
+        return translated, cost_usd
+
+    @staticmethod
+    def _write(segments: List[Dict[str, Any]], output_dir: Path, stem: str, language: str) -> Dict[str, str]:
+        srt_path = output_dir / f"{stem}_{language}.srt"
+        vtt_path = output_dir / f"{stem}_{language}.vtt"
+        srt_path.write_text(build_srt(segments), encoding="utf-8")
+        vtt_path.write_text(build_vtt(segments), encoding="utf-8")
+        return {"srt_path": str(srt_path), "vtt_path": str(vtt_path)}
+
+    async def _localize_one(
+        self,
+        segments: List[Dict[str, Any]],
+        digest: str,
+        source_language: str,
+        language: str,
+        output_dir: Path,
+        stem: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        cost_usd = 0.0
+        cached = True
+        if language == source_language:
+            localized = segments
+        else:
+            key = self.cache.cache_key(digest, language, self.model)
+            localized = self.cache.get(key)
+            if localized is None:
+                cached = False
+                localized, cost_usd = await self._translate_segments(
+                    segments, source_language, language, semaphore
+                )
+                self.cache.put(key, localized)
+
+        paths = await asyncio.to_thread(self._write, localized, output_dir, stem, language)
+        return {
+            **paths,
+            "segments": localized,
+            "language": language,
+            "source_language": source_language,
+            "cached": cached,
+            "cost_usd": round(cost_usd, 6),
+        }
+
+    async def localize(
+        self,
+        segments: List[Dict[str, Any]],
+        languages: List[str],
+        source_language: str,
+        output_dir: str,
+        stem: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        언어별 번역 + SRT/VTT 생성 (병렬)
+
+        Args:
+            segments: 원본 언어 전사 세그먼트 [{"start", "end", "text"}, ...]
+            languages: 대상 언어 코드 리스트 (원본 언어 포함 가능 → 번역 없이 파일만 생성)
+            source_language: 원본 언어 코드
+            output_dir: 출력 디렉토리
+            stem: 파일명 접두어 ("{stem}_{lang}.srt / .vtt")
+
+        Returns:
+            {lang: {"srt_path", "vtt_path", "segments", "cached", "cost_usd", ...}}
+            실패한 언어는 {"error": str}
+        """
+        out_dir = Path(output_dir)
+        await asyncio.to_thread(out_dir.mkdir, parents=True, exist_ok=True)
+        digest = segments_digest(segments)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        unique_languages = list(dict.fromkeys(languages))
+
+        outcomes = await asyncio.gather(
+            *(
+                self._localize_one(segments, digest, source_language, lang, out_dir, stem, semaphore)
+                for lang in unique_languages
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for lang, outcome in zip(unique_languages, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to localize {lang} subtitles: {outcome}")
+                results[lang] = {"error": str(outcome)}
+            else:
+                results[lang] = outcome
+        return results
+
+
+# AsyncOpenAI 클라이언트는 생성된 이벤트 루프에 묶인 연결 풀을 가지므로 루프마다 따로 둔다
+# (Celery 태스크마다 asyncio.run 으로 새 루프가 생김 — 루프가 사라지면 항목도 정리)
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _openai_client() -> Any:
+    """현재 이벤트 루프 전용 AsyncOpenAI 클라이언트"""
+    loop = asyncio.get_running_loop()
+    client = _openai_clients.get(loop)
+    if client is None:
+        from openai import AsyncOpenAI
+
+        from app.core.config import get_settings
+
+        client = AsyncOpenAI(api_key=get_settings().OPENAI_API_KEY)
+        _openai_clients[loop] = client
+    return client
+
+
+# Singleton instance
+_localizer: Optional[SubtitleLocalizer] = None
+
+
+def get_subtitle_localizer() -> SubtitleLocalizer:
+    """OpenAI 번역 + 디스크 캐시 기반 SubtitleLocalizer 싱글톤 (번역 클라이언트는 루프별)"""
+    global _localizer
+    if _localizer is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _localizer = SubtitleLocalizer(
+            openai_batch_translator(_openai_client),
+            cache=SubtitleTranslationCache(settings.SUBTITLE_CACHE_DIR),
+            concurrency=settings.SUBTITLE_TRANSLATION_CONCURRENCY,
+        )
+    return _localizer
@@ -261,8 +261,9 @@ class SubtitleService:
 
         return segments
 
+    @classmethod
     def _generate_srt_content(
-        self,
+        cls,
         segments: List[Dict[str, Any]]
     ) -> str:
         """
@@ -290,8 +291,8 @@ class SubtitleService:
             srt_lines.append(str(i))
 
             # 타임스탬프 (00:00:00,000 --> 00:00:00,000)
-            start_ts = self._format_timestamp(segment["start"])
-            end_ts = self._format_timestamp(segment["end"])
+            start_ts = cls._format_timestamp(segment["start"])
+            end_ts = cls._format_timestamp(segment["end"])
             srt_lines.append(f"{start_ts} --> {end_ts}")
 
             # 텍스트
@@ -302,22 +303,26 @@ class SubtitleService:
 
         return "\n".join(srt_lines)
 
-    def _format_timestamp(self, seconds: float) -> str:
+    @staticmethod
+    def _format_timestamp(seconds: float, decimal_marker: str = ",") -> str:
         """
         초 단위 시간을 SRT 타임스탬프 형식으로 변환
 
+        밀리초 단위로 반올림 (부동소수점 절사로 62.123 → 122ms 가 되지 않도록)
+
         Args:
             seconds: 초 단위 시간 (예: 125.5)
+            decimal_marker: 밀리초 구분자 ("," = SRT, "." = WebVTT)
 
         Returns:
             SRT 타임스탬프 (예: "00:02:05,500")
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        total_ms = max(0, int(round(seconds * 1000)))
+        hours, rest = divmod(total_ms, 3_600_000)
+        minutes, rest = divmod(rest, 60_000)
+        secs, millis = divmod(rest, 1000)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_marker}{millis:03d}"
 
     async def apply_subtitles_to_video(
         self,
@@ -506,26 +511,34 @@ class SubtitleService:
         languages: List[str],
         output_dir: Optional[str] = None,
         user_id: Optional[str] = None,
-        project_id: Optional[str] = None
+        project_id: Optional[str] = None,
+        source_language: str = "ko",
+        source_segments: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         여러 언어로 자막 생성 (다국어 지원)
 
+        원본 언어로 1회만 전사한 뒤, 대상 언어별 번역 + SRT/VTT 생성을
+        subtitle_localization 으로 병렬 수행한다 (SUBTITLE_TRANSLATION_CONCURRENCY 제한).
+        번역 결과는 원본 세그먼트 내용 해시로 캐시되어 같은 언어 재요청은 LLM 호출이 없다.
+
         Args:
             audio_path: 오디오 파일 경로
             languages: 언어 코드 리스트 (예: ["ko", "en", "ja"])
             output_dir: 출력 디렉토리 (None이면 원본과 동일)
             user_id: 사용자 ID
             project_id: 프로젝트 ID
+            source_language: 오디오 원본 언어 (Whisper 전사 언어)
+            source_segments: 이미 전사된 원본 세그먼트 (주어지면 Whisper 호출 생략)
 
         Returns:
             {
-                "ko": {"srt_path": "...", "segments": [...], ...},
-                "en": {"srt_path": "...", "segments": [...], ...},
+                "ko": {"srt_path": "...", "vtt_path": "...", "segments": [...], "cached": bool, ...},
+                "en": {"srt_path": "...", "vtt_path": "...", "segments": [...], "cached": bool, ...},
                 ...
             }
         """
-        results = {}
+        from app.services.subtitle_localization import get_subtitle_localizer
 
         audio_file = Path(audio_path)
         if output_dir:
@@ -534,27 +547,40 @@ class SubtitleService:
         else:
             output_path = audio_file.parent
 
-        for lang in languages:
+        # 1) 원본 언어 1회 전사
+        transcription: Dict[str, Any] = {}
+        if source_segments is None:
             try:
-                # 언어별 SRT 파일 경로
-                srt_filename = f"{audio_file.stem}_{lang}.srt"
-                srt_path = str(output_path / srt_filename)
-
-                self.logger.info(f"Generating {lang} subtitles...")
-
-                result = await self.generate_subtitles(
+                self.logger.info(f"Transcribing {source_language} source once for {languages}")
+                transcription = await self.generate_subtitles(
                     audio_path=audio_path,
-                    language=lang,
-                    output_srt_path=srt_path,
+                    language=source_language,
+                    output_srt_path=str(output_path / f"{audio_file.stem}_{source_language}.srt"),
                     user_id=user_id,
                     project_id=project_id
                 )
-
-                results[lang] = result
-
             except Exception as e:
-                self.logger.error(f"Failed to generate {lang} subtitles: {e}")
-                results[lang] = {"error": str(e)}
+                self.logger.error(f"Failed to transcribe {source_language} source: {e}")
+                return {lang: {"error": str(e)} for lang in languages}
+            source_segments = transcription["segments"]
+
+        # 2) 언어별 번역 + SRT/VTT 병렬 생성
+        results = await get_subtitle_localizer().localize(
+            source_segments,
+            languages,
+            source_language=source_language,
+            output_dir=str(output_path),
+            stem=audio_file.stem
+        )
+
+        for lang, result in results.items():
+            if "error" in result:
+                continue
+            if "duration" in transcription:
+                result["duration"] = transcription["duration"]
+            if lang == source_language and transcription:
+                result["cost_usd"] = transcription["cost_usd"]
+                result["word_count"] = transcription["word_count"]
 
         return results
 
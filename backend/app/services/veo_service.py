@@ -17,6 +17,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from contextlib import nullcontext
 
 from app.core.config import get_settings
+from app.services.streaming_io import download_to_file
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -258,16 +259,11 @@ class VeoService:
         self.logger.info(f"Downloading video from {video_url} to {output_path}")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(video_url)
-                response.raise_for_status()
-
-                # 파일 저장
-                output_path.write_bytes(response.content)
+            saved = await download_to_file(video_url, output_path)
 
-                self.logger.info(f"Video downloaded: {output_path} ({len(response.content)} bytes)")
+            self.logger.info(f"Video downloaded: {output_path} ({saved.size} bytes)")
 
-                return output_path
+            return output_path
 
         except Exception as e:
             self.logger.error(f"Video download failed: {e}")
@@ -17,6 +17,8 @@ except ImportError:
 
 from app.core.config import get_settings
 from app.services.stt_service import get_stt_service
+from app.services.media_probe_service import MediaProbeError, get_media_probe_service
+from app.services.render_artifact_cache import get_render_artifact_cache
 from app.services.ffmpeg_profile import (
     ios_safe_audio_encoder_args,
     ios_safe_concat_demuxer_args,
@@ -111,31 +113,19 @@ import logging
         Returns:
             길이(초) 리스트
         """
-        durations = []
+        probe_service = get_media_probe_service()
 
-        for audio_file in audio_files:
-            # FFprobe로 길이 확인
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                audio_file
-            ]
+        try:
+            # 공유 probe 캐시로 병렬 조회
+            return await probe_service.aget_durations(audio_files)
+        except MediaProbeError as e:
+            self.logger.warning(f"Batch probe failed, falling back per file: {e}")
 
+        durations = []
+        for audio_file in audio_files:
             try:
-                result = await asyncio.to_thread(
-                    subprocess.run,
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-
-                duration = float(result.stdout.strip())
-                durations.append(duration)
-
-            except Exception as e:
+                durations.append(await probe_service.aget_duration(audio_file))
+            except MediaProbeError as e:
                 self.logger.error(f"Failed to get duration for {audio_file}: {e}")
                 # Fallback: 5초로 가정
                 durations.append(5.0)
@@ -170,26 +160,26 @@ import logging
 
         # 단일 클립 생성 (이미지 루프 + 오디오)
         # iOS 호환 표준 풀세트는 ffmpeg_profile.ios_safe_full_encode_args에서 관리
+        video_filter = "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1"
+        encode_args = ios_safe_full_encode_args(
+            use_hw_acceleration=False,
+            preset="medium",
+            crf="23",
+            include_audio=True,
+            audio_async_filter=True,
+        )
         cmd = [
             "ffmpeg",
             "-loop", "1",
             "-i", image_path,
             "-i", audio_path,
             "-t", str(duration),
-            "-vf", "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1",
+            "-vf", video_filter,
         ]
-        cmd.extend(
-            ios_safe_full_encode_args(
-                use_hw_acceleration=False,
-                preset="medium",
-                crf="23",
-                include_audio=True,
-                audio_async_filter=True,
-            )
-        )
+        cmd.extend(encode_args)
         cmd.extend(["-shortest", "-y", str(clip_path)])
 
-        try:
+        async def _encode_clip():
             await asyncio.to_thread(
                 subprocess.run,
                 cmd,
@@ -197,7 +187,23 @@ import logging
                 check=True
             )
 
-            self.logger.info(f"Created clip {index + 1}: {clip_path}")
+        try:
+            # 이미지 + 오디오 + 길이 + 인코딩 옵션이 같으면 이전 클립 재사용
+            hit = await get_render_artifact_cache().arun_stage(
+                "slide_clip",
+                output_path=str(clip_path),
+                producer=_encode_clip,
+                input_files=[image_path, audio_path],
+                params={
+                    "duration": duration,
+                    "video_filter": video_filter,
+                    "encode_args": encode_args,
+                },
+            )
+
+            self.logger.info(
+                f"{'Reused' if hit else 'Created'} clip {index + 1}: {clip_path}"
+            )
 
             return str(clip_path)
 
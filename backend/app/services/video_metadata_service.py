@@ -3,12 +3,13 @@
 FFmpeg의 ffprobe를 사용하여 영상 파일의 메타데이터를 추출합니다.
 """
 import subprocess
-import json
 import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import logging
 
+from app.services.media_probe_service import MediaProbeError, get_media_probe_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,26 +55,8 @@ class VideoMetadataService:
             return None
 
         try:
-            # ffprobe 명령어 실행
-            cmd = [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                video_path
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-
-            # JSON 파싱
-            metadata = json.loads(result.stdout)
+            # 공유 probe 캐시 (동일 파일 반복 조회 시 ffprobe 생략)
+            metadata = get_media_probe_service().probe(video_path)
 
             # 메타데이터 정리
             parsed = self._parse_ffprobe_output(metadata, video_path)
@@ -81,15 +64,9 @@ class VideoMetadataService:
             logger.info(f"Successfully extracted metadata from {video_path}")
             return parsed
 
-        except subprocess.CalledProcessError as e:
+        except MediaProbeError as e:
             logger.error(f"ffprobe command failed: {e}")
             return None
-        except subprocess.TimeoutExpired:
-            logger.error(f"ffprobe timeout for {video_path}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output: {e}")
-            return None
         except Exception as e:
             logger.error(f"Unexpected error extracting metadata: {e}")
             return None
@@ -28,6 +28,7 @@ from app.services.stt_service import get_stt_service
 from app.services.neo4j_client import get_neo4j_client
 from app.services.cost_tracker import get_cost_tracker, APIService
 from app.services.ffmpeg_profile import ios_safe_subtitle_burn_args
+from app.services.render_artifact_cache import RenderCacheReport, get_render_artifact_cache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class VideoClip(TypedDict):
     video_job_id: Optional[str]
     video_url: Optional[str]
     local_path: Optional[str]
+    artifact_key: Optional[str]  # render artifact cache 키 (다운로드 후 저장용)
 
 
 class DirectorState(TypedDict):
@@ -95,6 +97,10 @@ class DirectorState(TypedDict):
     created_at: Optional[str]
     completed_at: Optional[str]
 
+    # 증분 재렌더링 (render artifact cache)
+    reuse_clips: bool  # True면 동일 섹션의 기존 Veo 클립 재사용 (수정본 재생성용)
+    artifact_cache: Optional[Dict[str, Any]]  # RenderCacheReport.to_dict() 누적 요약 (직렬화 가능)
+
     # 에러
     error: Optional[str]
     success: bool
@@ -113,6 +119,7 @@ class VideoDirectorAgent:
         self.stt_service = get_stt_service()
         self.neo4j_client = get_neo4j_client()
         self.cost_tracker = get_cost_tracker()
+        self.artifact_cache = get_render_artifact_cache()
 
         # 출력 디렉토리
         self.video_dir = Path("./outputs/videos")
@@ -275,13 +282,49 @@ class VideoDirectorAgent:
         span_context = logfire.span("director.generate_video_clips") if LOGFIRE_AVAILABLE else nullcontext()
 
         with span_context:
+            cache_report = RenderCacheReport.from_dict(state.get("artifact_cache"))
             try:
                 self.logger.info("Generating video clips with Veo")
 
                 sections = state["script_sections"]
                 clips: List[VideoClip] = []
 
-                for section in sections:
+                for i, section in enumerate(sections):
+                    clip_params = {
+                        "section_text": section["text"],
+                        "section_type": section["type"],
+                        "duration": int(section["duration"]),
+                        "character_reference": state["character_reference_url"],
+                    }
+                    clip_path = str(
+                        self.veo_service.output_dir
+                        / f"{state['project_id']}_clip_{i}_{section['type']}.mp4"
+                    )
+
+                    # 수정본 재생성: 내용이 바뀌지 않은 섹션은 기존 클립 재사용
+                    if state.get("reuse_clips"):
+                        artifact_key, hit = self.artifact_cache.lookup(
+                            "veo_clip", clip_path,
+                            params=clip_params,
+                            report=cache_report,
+                        )
+                        if hit:
+                            clips.append({
+                                "section_type": section["type"],
+                                "section_text": section["text"],
+                                "duration": section["duration"],
+                                "video_job_id": None,
+                                "video_url": None,
+                                "local_path": clip_path,
+                                "artifact_key": artifact_key,
+                            })
+                            continue
+                    else:
+                        artifact_key = (
+                            self.artifact_cache.compute_key("veo_clip", params=clip_params)
+                            if self.artifact_cache.enabled else None
+                        )
+
                     self.logger.info(
                         f"Generating {section['type']} clip "
                         f"({section['duration']:.1f}s): {section['text'][:50]}..."
@@ -301,7 +344,8 @@ class VideoDirectorAgent:
                         "duration": section["duration"],
                         "video_job_id": veo_result.get("job_id"),
                         "video_url": None,
-                        "local_path": None
+                        "local_path": None,
+                        "artifact_key": artifact_key
                     }
 
                     clips.append(clip)
@@ -328,20 +372,29 @@ class VideoDirectorAgent:
                 state["error"] = f"영상 클립 생성 실패: {str(e)}"
                 state["success"] = False
                 return state
+            finally:
+                state["artifact_cache"] = cache_report.to_dict()
 
     async def _wait_for_videos(self, state: DirectorState) -> DirectorState:
         """4단계: 영상 생성 완료 대기"""
         span_context = logfire.span("director.wait_for_videos") if LOGFIRE_AVAILABLE else nullcontext()
 
         with span_context:
+            cache_report = RenderCacheReport.from_dict(state.get("artifact_cache"))
             try:
                 self.logger.info("Waiting for video generation to complete")
 
                 clips = state["video_clips"]
 
                 for i, clip in enumerate(clips):
+                    if clip.get("local_path"):
+                        # artifact cache 에서 재사용된 클립
+                        self.logger.info(f"Clip {i+1} reused from render cache: {clip['local_path']}")
+                        continue
+
                     job_id = clip["video_job_id"]
                     self.logger.info(f"Checking status for clip {i+1}/{len(clips)}: {job_id}")
+                    wait_started = datetime.now()
 
                     # 상태 확인 (최대 10분 대기)
                     max_wait = 600
@@ -362,6 +415,15 @@ class VideoDirectorAgent:
                             )
                             clip["local_path"] = str(local_path)
 
+                            # 이후 수정본 재생성에서 재사용할 수 있도록 저장
+                            self.artifact_cache.commit(
+                                "veo_clip",
+                                clip.get("artifact_key"),
+                                clip["local_path"],
+                                (datetime.now() - wait_started).total_seconds(),
+                                report=cache_report,
+                            )
+
                             self.logger.info(f"Clip {i+1} completed: {local_path}")
                             break
 
@@ -392,12 +454,15 @@ class VideoDirectorAgent:
                 state["error"] = f"영상 생성 대기 실패: {str(e)}"
                 state["success"] = False
                 return state
+            finally:
+                state["artifact_cache"] = cache_report.to_dict()
 
     async def _merge_clips(self, state: DirectorState) -> DirectorState:
         """5단계: 클립 병합 (FFmpeg)"""
         span_context = logfire.span("director.merge_clips") if LOGFIRE_AVAILABLE else nullcontext()
 
         with span_context:
+            cache_report = RenderCacheReport.from_dict(state.get("artifact_cache"))
             try:
                 self.logger.info("Merging video clips with FFmpeg")
 
@@ -422,20 +487,29 @@ class VideoDirectorAgent:
                     str(merged_path)
                 ]
 
-                self.logger.info(f"Running FFmpeg: {' '.join(cmd)}")
+                async def _concat():
+                    self.logger.info(f"Running FFmpeg: {' '.join(cmd)}")
 
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
 
-                stdout, stderr = await process.communicate()
+                    stdout, stderr = await process.communicate()
 
-                if process.returncode != 0:
-                    raise RuntimeError(
-                        f"FFmpeg merge failed: {stderr.decode()}"
-                    )
+                    if process.returncode != 0:
+                        raise RuntimeError(
+                            f"FFmpeg merge failed: {stderr.decode()}"
+                        )
+
+                await self.artifact_cache.arun_stage(
+                    "concat",
+                    output_path=str(merged_path),
+                    producer=_concat,
+                    input_files=[clip["local_path"] for clip in clips],
+                    report=cache_report,
+                )
 
                 state["raw_video_path"] = str(merged_path)
 
@@ -448,12 +522,15 @@ class VideoDirectorAgent:
                 state["error"] = f"클립 병합 실패: {str(e)}"
                 state["success"] = False
                 return state
+            finally:
+                state["artifact_cache"] = cache_report.to_dict()
 
     async def _apply_lipsync(self, state: DirectorState) -> DirectorState:
         """6단계: 립싱크 적용 (HeyGen/Wav2Lip)"""
         span_context = logfire.span("director.apply_lipsync") if LOGFIRE_AVAILABLE else nullcontext()
 
         with span_context:
+            cache_report = RenderCacheReport.from_dict(state.get("artifact_cache"))
             try:
                 self.logger.info("Applying lipsync to video")
 
@@ -463,13 +540,34 @@ class VideoDirectorAgent:
                     self.video_dir / f"{state['project_id']}_lipsynced.mp4"
                 )
 
+                # 영상/오디오가 그대로면 이전 립싱크 결과 재사용 (HeyGen 비용 절감)
+                artifact_key, hit = self.artifact_cache.lookup(
+                    "lipsync", output_path,
+                    input_files=[video_path, audio_path],
+                    params={"method": "auto"},
+                    report=cache_report,
+                )
+                if hit:
+                    state["lipsynced_video_path"] = output_path
+                    state["lipsync_cost_usd"] = 0.0
+                    self.logger.info(f"Lipsync reused from render cache: {output_path}")
+                    return state
+
                 # 립싱크 생성
+                lipsync_started = datetime.now()
                 lipsync_result = await self.lipsync_service.generate_lipsync(
                     video_path=video_path,
                     audio_path=audio_path,
                     output_path=output_path,
                     method="auto"
                 )
+                self.artifact_cache.commit(
+                    "lipsync",
+                    artifact_key,
+                    lipsync_result["output_path"],
+                    (datetime.now() - lipsync_started).total_seconds(),
+                    report=cache_report,
+                )
 
                 state["lipsynced_video_path"] = lipsync_result["output_path"]
                 state["lipsync_cost_usd"] = lipsync_result.get("cost_usd", 0.0)
@@ -494,6 +592,8 @@ class VideoDirectorAgent:
                 state["error"] = f"립싱크 적용 실패: {str(e)}"
                 state["success"] = False
                 return state
+            finally:
+                state["artifact_cache"] = cache_report.to_dict()
 
     async def _generate_subtitles(self, state: DirectorState) -> DirectorState:
         """7단계: 자막 생성 (Whisper Timestamps)"""
@@ -575,6 +675,7 @@ class VideoDirectorAgent:
         span_context = logfire.span("director.render_final_video") if LOGFIRE_AVAILABLE else nullcontext()
 
         with span_context:
+            cache_report = RenderCacheReport.from_dict(state.get("artifact_cache"))
             try:
                 self.logger.info("Rendering final video with subtitles")
 
@@ -593,20 +694,30 @@ class VideoDirectorAgent:
                 cmd.extend(ios_safe_subtitle_burn_args())
                 cmd.append(output_path)
 
-                self.logger.info(f"Running FFmpeg: {' '.join(cmd)}")
+                async def _burn_subtitles():
+                    self.logger.info(f"Running FFmpeg: {' '.join(cmd)}")
 
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
 
-                stdout, stderr = await process.communicate()
+                    stdout, stderr = await process.communicate()
 
-                if process.returncode != 0:
-                    raise RuntimeError(
-                        f"FFmpeg render failed: {stderr.decode()}"
-                    )
+                    if process.returncode != 0:
+                        raise RuntimeError(
+                            f"FFmpeg render failed: {stderr.decode()}"
+                        )
+
+                await self.artifact_cache.arun_stage(
+                    "subtitle_burn",
+                    output_path=output_path,
+                    producer=_burn_subtitles,
+                    input_files=[video_path, srt_path],
+                    params={"burn_args": ios_safe_subtitle_burn_args()},
+                    report=cache_report,
+                )
 
                 state["final_video_path"] = output_path
                 state["completed_at"] = datetime.now().isoformat()
@@ -621,6 +732,8 @@ class VideoDirectorAgent:
                 state["error"] = f"최종 렌더링 실패: {str(e)}"
                 state["success"] = False
                 return state
+            finally:
+                state["artifact_cache"] = cache_report.to_dict()
 
     async def _save_metadata(self, state: DirectorState) -> DirectorState:
         """9단계: 메타데이터 저장 (Neo4j)"""
@@ -694,7 +807,8 @@ class VideoDirectorAgent:
         persona_id: Optional[str] = None,
         gender: str = "female",
         age_range: str = "30-40",
-        character_style: str = "professional"
+        character_style: str = "professional",
+        reuse_clips: bool = False
     ) -> Dict[str, Any]:
         """
         영상 생성 메인 함수
@@ -707,9 +821,10 @@ class VideoDirectorAgent:
             gender: 성별
             age_range: 연령대
             character_style: 캐릭터 스타일
+            reuse_clips: 동일 섹션의 기존 Veo 클립 재사용 여부 (수정본 재생성 시 True)
 
         Returns:
-            생성된 영상 정보
+            생성된 영상 정보 (artifact_cache: 단계별 캐시 hit/miss 포함)
         """
         span_context = logfire.span(
             "director.generate_video_main",
@@ -742,6 +857,8 @@ class VideoDirectorAgent:
                 "cost_breakdown": None,
                 "created_at": datetime.now().isoformat(),
                 "completed_at": None,
+                "reuse_clips": reuse_clips,
+                "artifact_cache": None,
                 "error": None,
                 "success": False
             }
@@ -774,7 +891,8 @@ class VideoDirectorAgent:
                     "total_cost_usd": final_state.get("total_cost_usd"),
                     "cost_breakdown": final_state.get("cost_breakdown"),
                     "created_at": final_state.get("created_at"),
-                    "completed_at": final_state.get("completed_at")
+                    "completed_at": final_state.get("completed_at"),
+                    "artifact_cache": final_state.get("artifact_cache") or RenderCacheReport().to_dict()
                 }
 
             except Exception as e:
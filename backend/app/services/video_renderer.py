@@ -16,15 +16,23 @@ import subprocess
 import tempfile
 import time
 from contextlib import nullcontext
-import ffmpeg
 import os
 
 from app.core.config import get_settings
+from app.services.media_probe_service import MediaProbeError, get_media_probe_service
+from app.services.parallel_encoder import ParallelEncodeError, ParallelEncoder
+from app.services.render_artifact_cache import (
+    RenderArtifactCache,
+    RenderCacheReport,
+    get_render_artifact_cache,
+)
 from app.services.ffmpeg_profile import (
     IOS_SAFE_AUDIO_SAMPLE_RATE,
+    IOS_SAFE_FPS,
     ios_safe_audio_encoder_args,
     ios_safe_audio_mux_args,
     ios_safe_concat_demuxer_args,
+    ios_safe_full_encode_args,
     ios_safe_subtitle_burn_args,
     ios_safe_video_encoder_args,
     ios_safe_video_output_args,
@@ -292,14 +300,28 @@ class VideoRenderer:
         )
     """
 
-    def __init__(self, output_dir: str = "./outputs/videos"):
+    def __init__(
+        self,
+        output_dir: str = "./outputs/videos",
+        artifact_cache: Optional[RenderArtifactCache] = None
+    ):
         """
         Args:
             output_dir: 렌더링된 영상 저장 경로
+            artifact_cache: 단계별 중간 산출물 캐시 (None이면 공유 싱글톤)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        self.artifact_cache = artifact_cache or get_render_artifact_cache()
+
+        # 긴 영상 최종 인코딩은 세그먼트 병렬 모드 사용
+        self.parallel_encode_enabled = settings.PARALLEL_ENCODE_ENABLED
+        self.parallel_encode_min_seconds = settings.PARALLEL_ENCODE_MIN_SECONDS
+        self.parallel_encoder = ParallelEncoder(
+            workers=settings.PARALLEL_ENCODE_WORKERS or None,
+            segment_seconds=settings.PARALLEL_ENCODE_SEGMENT_SECONDS,
+        )
 
         # FFmpeg 설치 확인
         self._check_ffmpeg()
@@ -393,6 +415,7 @@ class VideoRenderer:
 
             steps_info = {}
             current_video = None
+            cache_report = RenderCacheReport()
 
             try:
                 # 1️⃣ 클립 병합
@@ -405,23 +428,41 @@ class VideoRenderer:
                     }
                 else:
                     merged_path = str(self.output_dir / f"merged_{int(time.time())}.mp4")
-                    merge_result = self.merge_clips(
-                        clips=video_clips,
+                    merge_result = self._run_cached_step(
+                        "merge_clips",
                         output_path=merged_path,
-                        transitions=transitions,
-                        transition_duration=transition_duration
+                        producer=lambda: self.merge_clips(
+                            clips=video_clips,
+                            output_path=merged_path,
+                            transitions=transitions,
+                            transition_duration=transition_duration
+                        ),
+                        input_files=video_clips,
+                        params={
+                            "transitions": transitions,
+                            "transition_duration": transition_duration,
+                        },
+                        report=cache_report,
                     )
                     current_video = merged_path
                     steps_info["merge_clips"] = merge_result
 
                 # 2️⃣ 오디오 믹싱
                 with_audio_path = str(self.output_dir / f"with_audio_{int(time.time())}.mp4")
-                audio_result = self.add_audio_mix(
-                    video_path=current_video,
-                    audio_path=audio_path,
-                    bgm_path=bgm_path,
+                merged_video = current_video
+                audio_result = self._run_cached_step(
+                    "audio_mix",
                     output_path=with_audio_path,
-                    bgm_volume=bgm_volume
+                    producer=lambda: self.add_audio_mix(
+                        video_path=merged_video,
+                        audio_path=audio_path,
+                        bgm_path=bgm_path,
+                        output_path=with_audio_path,
+                        bgm_volume=bgm_volume
+                    ),
+                    input_files=[merged_video, audio_path, bgm_path],
+                    params={"bgm_volume": bgm_volume if bgm_path else None},
+                    report=cache_report,
                 )
                 current_video = with_audio_path
                 steps_info["audio_mix"] = audio_result
@@ -429,11 +470,21 @@ class VideoRenderer:
                 # 3️⃣ 자막 오버레이 (선택적)
                 if subtitle_path:
                     with_subtitle_path = str(self.output_dir / f"with_subtitle_{int(time.time())}.mp4")
-                    subtitle_result = self.add_subtitles_overlay(
-                        video_path=current_video,
-                        subtitle_path=subtitle_path,
+                    subtitle_style = platform or "default"
+                    subtitle_result = self._run_cached_step(
+                        "subtitle_burn",
                         output_path=with_subtitle_path,
-                        style=platform or "default"
+                        producer=lambda: self.add_subtitles_overlay(
+                            video_path=with_audio_path,
+                            subtitle_path=subtitle_path,
+                            output_path=with_subtitle_path,
+                            style=subtitle_style
+                        ),
+                        input_files=[with_audio_path, subtitle_path],
+                        params={
+                            "style": SUBTITLE_STYLES.get(subtitle_style, SUBTITLE_STYLES["default"]),
+                        },
+                        report=cache_report,
                     )
                     current_video = with_subtitle_path
                     steps_info["subtitles"] = subtitle_result
@@ -446,10 +497,18 @@ class VideoRenderer:
 
                 # 4️⃣ 플랫폼별 최적화 (선택적)
                 if platform and platform in PLATFORM_SPECS:
-                    optimize_result = self.optimize_for_platform(
-                        video_path=current_video,
-                        platform=platform,
-                        output_path=output_path
+                    pre_optimize_video = current_video
+                    optimize_result = self._run_cached_step(
+                        "platform_optimize",
+                        output_path=output_path,
+                        producer=lambda: self.optimize_for_platform(
+                            video_path=pre_optimize_video,
+                            platform=platform,
+                            output_path=output_path
+                        ),
+                        input_files=[pre_optimize_video],
+                        params={"spec": PLATFORM_SPECS[platform]},
+                        report=cache_report,
                     )
                     steps_info["platform_optimize"] = optimize_result
                 else:
@@ -484,13 +543,47 @@ class VideoRenderer:
                     "output_path": output_path,
                     "file_size_mb": round(file_size, 2),
                     "render_time": round(render_time, 2),
-                    "steps": steps_info
+                    "steps": steps_info,
+                    "artifact_cache": cache_report.to_dict()
                 }
 
             except Exception as e:
                 self.logger.error(f"❌ Rendering failed: {e}", exc_info=True)
                 raise
 
+    def _run_cached_step(
+        self,
+        stage: str,
+        output_path: str,
+        producer,
+        input_files: List[Optional[str]],
+        params: Dict[str, Any],
+        report: Optional[RenderCacheReport] = None
+    ) -> Dict[str, Any]:
+        """
+        렌더 단계를 artifact cache 경유로 실행
+
+        입력 파일 내용 + 파라미터 + iOS 인코딩 프로파일이 같으면 이전 산출물을
+        output_path 로 복사하고 FFmpeg 실행을 생략한다.
+
+        Returns:
+            단계 결과 dict (+ "cache": "hit" | "miss")
+        """
+        cache_params = dict(params, encode_profile=ios_safe_full_encode_args())
+        key, hit = self.artifact_cache.lookup(
+            stage, output_path, input_files, cache_params, report
+        )
+        if hit:
+            return {"output_path": output_path, "cache": "hit"}
+
+        start_time = time.time()
+        result = producer()
+        self.artifact_cache.commit(
+            stage, key, output_path, time.time() - start_time, report
+        )
+        result["cache"] = "miss"
+        return result
+
     def merge_clips(
         self,
         clips: List[str],
@@ -622,12 +715,8 @@ class VideoRenderer:
                 )
                 validated_transitions.append("fade")
 
-        # 각 클립의 길이 추출 (xfade offset 계산용)
-        clip_durations = []
-        for clip in clips:
-            probe = ffmpeg.probe(clip)
-            duration = float(probe['format']['duration'])
-            clip_durations.append(duration)
+        # 각 클립의 길이 추출 (xfade offset 계산용) — 공유 probe 캐시로 병렬 조회
+        clip_durations = get_media_probe_service().get_durations(clips)
 
         self.logger.debug(f"Clip durations: {clip_durations}")
 
@@ -872,30 +961,47 @@ class VideoRenderer:
                 f"MarginV={style_config['margin_v']}"
             )
 
-            # 자막 burn-in: 비디오 재인코딩 필수, 오디오 copy
-            # iOS 호환 표준은 ffmpeg_profile.ios_safe_subtitle_burn_args에서 관리
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-vf", f"subtitles={subtitle_path_escaped}:force_style='{force_style}'",
-            ]
-            cmd.extend(ios_safe_subtitle_burn_args())
-            cmd.extend(["-y", output_path])
+            subtitle_filter = f"subtitles={subtitle_path_escaped}:force_style='{force_style}'"
 
-            self.logger.debug(f"Running: {' '.join(cmd)}")
+            encode_mode = "single"
+            if self._should_encode_in_parallel(video_path):
+                try:
+                    self.parallel_encoder.encode(
+                        input_path=video_path,
+                        output_path=output_path,
+                        video_filter=subtitle_filter,
+                        audio_mode="copy",
+                    )
+                    encode_mode = "parallel"
+                except ParallelEncodeError as e:
+                    self.logger.warning(f"⚠️ Parallel encode failed, falling back to single process: {e}")
+
+            if encode_mode == "single":
+                # 자막 burn-in: 비디오 재인코딩 필수, 오디오 copy
+                # iOS 호환 표준은 ffmpeg_profile.ios_safe_subtitle_burn_args에서 관리
+                cmd = [
+                    "ffmpeg",
+                    "-i", video_path,
+                    "-vf", subtitle_filter,
+                ]
+                cmd.extend(ios_safe_subtitle_burn_args())
+                cmd.extend(["-y", output_path])
 
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                self.logger.debug(f"Running: {' '.join(cmd)}")
+
+                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
             elapsed = time.time() - start_time
 
             self.logger.info(
-                f"✅ Subtitles added in {elapsed:.1f}s (style: {style})"
+                f"✅ Subtitles added in {elapsed:.1f}s (style: {style}, encode: {encode_mode})"
             )
 
             return {
                 "output_path": output_path,
                 "style": style,
                 "subtitle_file": subtitle_path,
+                "encode_mode": encode_mode,
                 "elapsed_time": round(elapsed, 2)
             }
 
@@ -948,34 +1054,51 @@ class VideoRenderer:
                 f"pad={spec['width']}:{spec['height']}:(ow-iw)/2:(oh-ih)/2"
             )
 
-            # 플랫폼별 fps/bitrate는 spec이 우선 (iOS 호환 profile/level/pix_fmt는 표준 유지)
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-vf", scale_filter,
-                "-b:v", spec["bitrate"],
-            ]
-            cmd.extend(ios_safe_video_encoder_args(preset="medium", crf="23"))
-            # platform spec fps로 override (ios_safe 기본 30 대신)
-            cmd.extend(ios_safe_video_output_args(include_fps=False, threads=None))
-            cmd.extend(["-r", str(spec["fps"])])
-            # 오디오 인코더 (platform spec bitrate)
-            cmd.extend(
-                ios_safe_audio_encoder_args(
-                    bitrate=spec["audio_bitrate"],
-                    include_async_filter=False,  # 단일 영상 변환이라 불필요
+            encode_mode = "single"
+            # 병렬 세그먼트는 ios_safe 30fps 고정 — spec fps가 다르면 단일 인코딩
+            if str(spec["fps"]) == IOS_SAFE_FPS and self._should_encode_in_parallel(video_path):
+                try:
+                    self.parallel_encoder.encode(
+                        input_path=video_path,
+                        output_path=output_path,
+                        video_filter=scale_filter,
+                        extra_video_args=["-b:v", spec["bitrate"]],
+                        audio_mode="encode",
+                        audio_bitrate=spec["audio_bitrate"],
+                    )
+                    encode_mode = "parallel"
+                except ParallelEncodeError as e:
+                    self.logger.warning(f"⚠️ Parallel encode failed, falling back to single process: {e}")
+
+            if encode_mode == "single":
+                # 플랫폼별 fps/bitrate는 spec이 우선 (iOS 호환 profile/level/pix_fmt는 표준 유지)
+                cmd = [
+                    "ffmpeg",
+                    "-i", video_path,
+                    "-vf", scale_filter,
+                    "-b:v", spec["bitrate"],
+                ]
+                cmd.extend(ios_safe_video_encoder_args(preset="medium", crf="23"))
+                # platform spec fps로 override (ios_safe 기본 30 대신)
+                cmd.extend(ios_safe_video_output_args(include_fps=False, threads=None))
+                cmd.extend(["-r", str(spec["fps"])])
+                # 오디오 인코더 (platform spec bitrate)
+                cmd.extend(
+                    ios_safe_audio_encoder_args(
+                        bitrate=spec["audio_bitrate"],
+                        include_async_filter=False,  # 단일 영상 변환이라 불필요
+                    )
                 )
-            )
-            cmd.extend(["-y", output_path])
+                cmd.extend(["-y", output_path])
 
-            self.logger.debug(f"Running: {' '.join(cmd)}")
+                self.logger.debug(f"Running: {' '.join(cmd)}")
 
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
             elapsed = time.time() - start_time
 
             self.logger.info(
-                f"✅ Platform optimization completed in {elapsed:.1f}s"
+                f"✅ Platform optimization completed in {elapsed:.1f}s (encode: {encode_mode})"
             )
 
             return {
@@ -984,9 +1107,20 @@ class VideoRenderer:
                 "resolution": spec["resolution"],
                 "bitrate": spec["bitrate"],
                 "fps": spec["fps"],
+                "encode_mode": encode_mode,
                 "elapsed_time": round(elapsed, 2)
             }
 
+    def _should_encode_in_parallel(self, video_path: str) -> bool:
+        """긴 영상(PARALLEL_ENCODE_MIN_SECONDS 이상)만 세그먼트 병렬 인코딩"""
+        if not self.parallel_encode_enabled or self.parallel_encoder.workers < 2:
+            return False
+        try:
+            duration = get_media_probe_service().get_duration(video_path)
+        except MediaProbeError:
+            return False
+        return duration >= self.parallel_encode_min_seconds
+
     def _color_to_ass(self, color: str) -> str:
         """
         CSS 색상을 ASS 자막 형식으로 변환
@@ -3,7 +3,6 @@ from typing import Optional, List, Dict, BinaryIO
 import asyncio
 import logging
 from pathlib import Path
-import hashlib
 import time
 from elevenlabs import ElevenLabs, Voice
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -16,6 +15,7 @@ except ImportError:
     LOGFIRE_AVAILABLE = False
 
 from app.core.config import get_settings
+from app.services.streaming_io import save_upload_content_addressed
 from app.services.elevenlabs_credit_check import check_elevenlabs_credits, get_estimated_chars
 
 settings = get_settings()
@@ -222,36 +222,37 @@ class VoiceCloningService:
 
     async def save_uploaded_file(
         self,
-        file_data: bytes,
+        upload,
         user_id: str,
-        original_filename: str
+        original_filename: str,
+        max_bytes: Optional[int] = None
     ) -> str:
         """
-        업로드된 오디오 파일 저장
+        업로드된 오디오 파일 저장 (청크 스트리밍)
 
         Args:
-            file_data: 파일 바이트
+            upload: 업로드 파일 (FastAPI UploadFile)
             user_id: 사용자 ID
             original_filename: 원본 파일명
+            max_bytes: 최대 크기 (초과 시 StreamSizeLimitError)
 
         Returns:
             저장된 파일 경로
         """
-        # 파일명 생성 (충돌 방지)
+        # 파일명 생성 (충돌 방지, 해시는 저장하면서 계산)
         timestamp = int(time.time())
-        file_hash = hashlib.md5(file_data).hexdigest()[:8]
         file_ext = Path(original_filename).suffix or ".mp3"
 
-        filename = f"{user_id}_{timestamp}_{file_hash}{file_ext}"
-        file_path = self.upload_dir / filename
+        saved = await save_upload_content_addressed(
+            upload,
+            self.upload_dir,
+            f"{user_id}_{timestamp}_{{hash}}{file_ext}",
+            max_bytes=max_bytes
+        )
 
-        # 파일 저장
-        with open(file_path, "wb") as f:
-            f.write(file_data)
+        self.logger.info(f"Saved uploaded file: {saved.path} ({saved.size / 1024:.2f} KB)")
 
-        self.logger.info(f"Saved uploaded file: {file_path} ({len(file_data) / 1024:.2f} KB)")
-
-        return str(file_path)
+        return saved.path
 
     async def validate_audio_file(self, file_path: str) -> Dict[str, any]:
         """
@@ -0,0 +1,155 @@
+"""
+WebSocket Fan-out — 클라이언트별 bounded 송신 큐 + 전용 송신 태스크
+
+배경:
+    - send_to_project 가 소켓마다 send_json 을 순서대로 await
+      → 느린 모바일 클라이언트 1개가 같은 프로젝트의 다른 모든 시청자 진행률 전달을 지연
+    - 소켓마다 같은 메시지를 다시 JSON 직렬화
+
+방식:
+    - 메시지는 브로드캐스트 1회당 한 번만 직렬화 (encode_message)
+    - 클라이언트마다 ClientChannel (bounded deque + 송신 태스크) → 브로드캐스트는 큐 적재만 하고
+      실제 전송은 클라이언트별로 동시에 진행
+    - 진행률 이벤트는 coalesce 키 (task 단위) — 아직 전송 안 된 같은 키 메시지는 최신 값으로 교체
+    - 큐가 가득 차면 가장 오래된 coalesce 가능 메시지를 버림 (drop-oldest)
+      버릴 수 있는 메시지가 없으면 (완료/에러만 쌓임) 클라이언트를 축출
+    - send_timeout 안에 전송되지 않으면 죽은 연결로 보고 축출
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_SEND_TIMEOUT = 5.0
+
+# 큐 항목: (coalesce 키 | None, 직렬화된 메시지)
+QueueItem = Tuple[Optional[str], str]
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Starlette send_json 과 동일한 직렬화 (브로드캐스트당 1회)"""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[str]:
+    """최신 값만 의미 있는 메시지의 coalesce 키 (진행률 = task 단위)"""
+    if message.get("type") == "progress":
+        return f"progress:{message.get('task_name', '')}"
+    return None
+
+
+class ClientChannel:
+    """클라이언트 1개의 bounded 송신 큐 + 송신 태스크"""
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        on_evict: Optional[Callable[["ClientChannel", str], Any]] = None,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+        name: str = "",
+    ):
+        """
+        Args:
+            send: 직렬화된 메시지 전송 코루틴 (websocket.send_text)
+            on_evict: 축출 시 콜백 (channel, reason) — 연결 정리용
+            max_queue: 미전송 메시지 상한
+            send_timeout: 메시지 1개 전송 제한 시간 (초)
+            name: 로그용 식별자
+        """
+        self._send = send
+        self._on_evict = on_evict
+        self.max_queue = max(1, max_queue)
+        self.send_timeout = send_timeout
+        self.name = name
+
+        self._queue: Deque[QueueItem] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.stats = {"sent": 0, "coalesced": 0, "dropped": 0}
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"ws-send:{self.name}")
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def offer(self, text: str, key: Optional[str] = None) -> bool:
+        """메시지 적재 (즉시 반환). 축출되었거나 닫혔으면 False"""
+        if self.closed:
+            return False
+
+        if key is not None:
+            for i, (queued_key, _) in enumerate(self._queue):
+                if queued_key == key:
+                    self._queue[i] = (key, text)
+                    self.stats["coalesced"] += 1
+                    return True
+
+        if len(self._queue) >= self.max_queue and not self._drop_oldest():
+            self.evict("outgoing queue full of undroppable messages")
+            return False
+
+        self._queue.append((key, text))
+        self._wakeup.set()
+        return True
+
+    def _drop_oldest(self) -> bool:
+        for i, (queued_key, _) in enumerate(self._queue):
+            if queued_key is not None:
+                del self._queue[i]
+                self.stats["dropped"] += 1
+                return True
+        return False
+
+    async def _run(self) -> None:
+        while not self.closed:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            _, text = self._queue.popleft()
+            try:
+                await asyncio.wait_for(self._send(text), timeout=self.send_timeout)
+                self.stats["sent"] += 1
+            except asyncio.TimeoutError:
+                self.evict(f"send timed out after {self.send_timeout}s")
+            except Exception as e:
+                self.evict(f"send failed: {e}")
+
+    def evict(self, reason: str) -> None:
+        """송신 중단 + 연결 정리 콜백"""
+        if self.closed:
+            return
+        logger.warning(f"Evicting WebSocket client {self.name}: {reason}")
+        self.close()
+        if self._on_evict is not None:
+            self._on_evict(self, reason)
+
+    def close(self) -> None:
+        """송신 태스크 종료 (미전송 메시지 폐기)"""
+        self.closed = True
+        self._queue.clear()
+        self._wakeup.set()
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+
+def fan_out(channels: List[ClientChannel], message: Dict[str, Any]) -> int:
+    """메시지를 1회 직렬화해 모든 채널에 적재. 적재된 채널 수 반환"""
+    if not channels:
+        return 0
+    text = encode_message(message)
+    key = coalesce_key(message)
+    return sum(1 for channel in channels if channel.offer(text, key))
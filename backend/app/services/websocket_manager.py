@@ -2,6 +2,9 @@
 
 프로젝트별로 여러 클라이언트의 WebSocket 연결을 관리하고,
 Celery 작업 진행 상태를 실시간으로 브로드캐스트합니다.
+
+전송은 클라이언트별 ClientChannel(bounded 큐 + 송신 태스크)을 거치므로
+느린 클라이언트가 다른 시청자의 진행률 수신을 지연시키지 않습니다.
 """
 
 from typing import Dict, List, Set, Optional
@@ -11,6 +14,15 @@ import json
 import asyncio
 from datetime import datetime
 
+from app.services.websocket_fanout import (
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_SEND_TIMEOUT,
+    ClientChannel,
+    coalesce_key,
+    encode_message,
+    fan_out,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,9 +43,21 @@ class ConnectionManager:
     PROGRESS_KEY_PREFIX = "ws:progress:"
     PROGRESS_TTL = 3600  # 1시간
 
-    def __init__(self):
+    def __init__(
+        self,
+        client_queue_size: int = DEFAULT_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT
+    ):
+        """
+        Args:
+            client_queue_size: 클라이언트별 미전송 메시지 상한 (초과 시 오래된 진행률부터 폐기)
+            send_timeout: 메시지 1개 전송 제한 시간 (초과 시 연결 축출)
+        """
         # project_id: Set[WebSocket]
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.channels: Dict[WebSocket, ClientChannel] = {}
+        self.client_queue_size = client_queue_size
+        self.send_timeout = send_timeout
         self.logger = logging.getLogger(__name__)
 
     async def connect(self, websocket: WebSocket, project_id: str):
@@ -44,6 +68,17 @@ class ConnectionManager:
             self.active_connections[project_id] = set()
 
         self.active_connections[project_id].add(websocket)
+
+        channel = ClientChannel(
+            websocket.send_text,
+            on_evict=lambda _channel, _reason: self._evict(websocket, project_id),
+            max_queue=self.client_queue_size,
+            send_timeout=self.send_timeout,
+            name=project_id
+        )
+        self.channels[websocket] = channel
+        channel.start()
+
         self.logger.info(
             f"WebSocket connected: project={project_id}, "
             f"total={len(self.active_connections[project_id])}"
@@ -52,17 +87,18 @@ class ConnectionManager:
         # 재연결 시 Redis 캐시된 진행률 자동 전송
         cached = self.get_cached_progress(project_id)
         if cached:
-            try:
-                await websocket.send_json(cached)
-                self.logger.info(
-                    f"Restored cached progress for {project_id}: "
-                    f"{cached.get('progress', 0)*100:.0f}%"
-                )
-            except Exception as e:
-                self.logger.warning(f"Failed to send cached progress: {e}")
+            self.send_to_client(websocket, cached)
+            self.logger.info(
+                f"Restored cached progress for {project_id}: "
+                f"{cached.get('progress', 0)*100:.0f}%"
+            )
 
     def disconnect(self, websocket: WebSocket, project_id: str):
         """클라이언트 연결 해제"""
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
+
         if project_id in self.active_connections:
             self.active_connections[project_id].discard(websocket)
 
@@ -72,26 +108,43 @@ class ConnectionManager:
 
         self.logger.info(f"WebSocket disconnected: project={project_id}")
 
+    def _evict(self, websocket: WebSocket, project_id: str):
+        """송신 타임아웃/큐 포화 클라이언트 정리 (수신 루프도 끊기도록 소켓 닫기)"""
+        self.disconnect(websocket, project_id)
+
+        async def close():
+            try:
+                await asyncio.wait_for(websocket.close(code=1011), timeout=self.send_timeout)
+            except Exception:
+                pass
+
+        asyncio.ensure_future(close())
+
+    def send_to_client(self, websocket: WebSocket, message: dict) -> bool:
+        """단일 클라이언트에게 메시지 전송 (클라이언트 송신 큐 경유)"""
+        channel = self.channels.get(websocket)
+        if channel is None:
+            return False
+        return channel.offer(encode_message(message), coalesce_key(message))
+
     async def send_to_project(self, project_id: str, message: dict):
-        """특정 프로젝트의 모든 클라이언트에게 메시지 전송"""
+        """특정 프로젝트의 모든 클라이언트에게 메시지 전송
+
+        메시지는 1회만 직렬화되어 클라이언트별 송신 큐에 적재되고,
+        실제 전송은 클라이언트마다 동시에 진행된다 (느린 클라이언트가 다른 클라이언트를 막지 않음).
+        """
         if project_id not in self.active_connections:
             self.logger.warning(
                 f"No active connections for project: {project_id}"
             )
             return
 
-        disconnected = []
-
-        for websocket in self.active_connections[project_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                self.logger.error(f"Failed to send message: {e}")
-                disconnected.append(websocket)
-
-        # 연결 끊긴 클라이언트 정리
-        for ws in disconnected:
-            self.disconnect(ws, project_id)
+        channels = [
+            self.channels[ws]
+            for ws in self.active_connections[project_id]
+            if ws in self.channels
+        ]
+        fan_out(channels, message)
 
     async def broadcast_progress(
         self,
@@ -320,5 +373,11 @@ def get_websocket_manager() -> ConnectionManager:
     """
     global _manager
     if _manager is None:
-        _manager = ConnectionManager()
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        _manager = ConnectionManager(
+            client_queue_size=settings.WS_CLIENT_QUEUE_SIZE,
+            send_timeout=settings.WS_SEND_TIMEOUT_SECONDS
+        )
     return _manager
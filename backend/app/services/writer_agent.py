@@ -24,6 +24,7 @@ from app.services.google_sheets_service import get_sheets_service
 from app.services.neo4j_client import get_neo4j_client
 from app.services.duration_calculator import get_duration_calculator, Language
 from app.services.llm_profile import llm_safe_langchain_chat_kwargs
+from app.services.llm_response_cache import get_llm_response_cache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ class WriterState(TypedDict):
     campaign_name: str
     topic: str  # 소제목
     platform: str  # YouTube, Instagram, TikTok
+    voice_id: Optional[str]  # 나레이션 음성 (분량 예측 보정 계수용)
     target_duration: Optional[int]  # 목표 영상 길이 (초)
 
     # 전략 데이터
@@ -219,7 +221,11 @@ class WriterAgent:
                 # 목표 분량 계산
                 target_duration = state.get("target_duration") or 180
                 duration_calc = get_duration_calculator(Language.KO)
-                word_count_info = duration_calc.estimate_for_target_duration(target_duration)
+                word_count_info = duration_calc.estimate_for_target_duration(
+                    target_duration,
+                    voice_id=state.get("voice_id"),
+                    platform=state["platform"],
+                )
 
                 target_words = word_count_info['target_words']
                 min_words = word_count_info['min_words']
@@ -257,8 +263,9 @@ class WriterAgent:
                     HumanMessage(content=user_prompt)
                 ]
 
-                response = await self.llm.ainvoke(messages)
-                script_content = response.content
+                script_content = await get_llm_response_cache().cached_ainvoke(
+                    self.llm, "writer", messages
+                )
 
                 # 스크립트 파싱
                 state["script"] = script_content
@@ -405,7 +412,8 @@ class WriterAgent:
         campaign_name: str,
         topic: str,
         platform: str = "YouTube",
-        target_duration: int = 180
+        target_duration: int = 180,
+        voice_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         스크립트 생성 메인 함수
@@ -416,6 +424,7 @@ class WriterAgent:
             topic: 소제목
             platform: 플랫폼 (YouTube, Instagram, TikTok)
             target_duration: 목표 영상 길이 (초)
+            voice_id: 나레이션 음성 ID (선택, 음성별 분량 보정)
 
         Returns:
             생성된 스크립트 및 메타데이터
@@ -435,6 +444,7 @@ class WriterAgent:
                 "campaign_name": campaign_name,
                 "topic": topic,
                 "platform": platform,
+                "voice_id": voice_id,
                 "target_duration": target_duration,
                 "strategy": None,
                 "target_audience": None,
@@ -1,9 +1,17 @@
-"""유튜브 썸네일 + 카피 AI 학습 모듈 (영상 성과 기반)"""
+"""유튜브 썸네일 + 카피 AI 학습 모듈 (영상 성과 기반)
+
+썸네일 학습 파이프라인 (store_in_pinecone):
+    1. 공유 httpx.AsyncClient 로 썸네일을 동시 다운로드 (FETCH_CONCURRENCY 제한)
+    2. EMBED_BATCH_SIZE 장씩 워커 스레드에서 CLIP get_image_features 1회 forward
+    3. 같은 배치의 색상/밝기 패턴을 numpy 로 한 번에 계산
+    → 다운로드가 계속 진행되는 동안 추론이 배치 단위로 소비 (네트워크 병목)
+"""
 import asyncio
 import logging
-from typing import List, Dict, Optional
-import requests
+from typing import List, Dict, Optional, Tuple
 from io import BytesIO
+import httpx
+import numpy as np
 from PIL import Image
 import torch
 from transformers import CLIPProcessor, CLIPModel
@@ -22,9 +30,65 @@ from app.core.config import get_settings
 settings = get_settings()
 
 
+# ITU-R 601-2 luma (PIL convert('L') 과 동일 가중치)
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def analyze_patterns_batch(images: List[Image.Image]) -> List[Dict]:
+    """
+    썸네일 배치의 색상/밝기 패턴 (numpy 벡터화)
+
+    - 밝기: 같은 해상도끼리 (N, H, W, 3) 로 쌓아 luma 평균을 한 번에 계산
+    - 대표 색상: (이미지 인덱스 << 24 | RGB) 키로 배치 전체를 np.unique 1회 → 이미지별 상위 3색
+    """
+    if not images:
+        return []
+
+    arrays = [np.asarray(image.convert('RGB'), dtype=np.uint8) for image in images]
+
+    brightness = np.zeros(len(arrays), dtype=np.float64)
+    by_shape: Dict[Tuple[int, ...], List[int]] = {}
+    for i, array in enumerate(arrays):
+        by_shape.setdefault(array.shape, []).append(i)
+    for indices in by_shape.values():
+        stacked = np.stack([arrays[i] for i in indices]).astype(np.float32)
+        brightness[indices] = (stacked @ _LUMA_WEIGHTS).mean(axis=(1, 2))
+
+    keys = np.concatenate([
+        (np.uint64(i) << np.uint64(24)) | (
+            array.reshape(-1, 3).astype(np.uint64) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint64)
+        )
+        for i, array in enumerate(arrays)
+    ])
+    unique_keys, counts = np.unique(keys, return_counts=True)
+    owners = (unique_keys >> np.uint64(24)).astype(np.int64)
+    # 이미지 순 → 빈도 내림차순 정렬
+    order = np.lexsort((-counts, owners))
+
+    dominant: List[List[Tuple[int, int, int]]] = [[] for _ in arrays]
+    for key, owner in zip(unique_keys[order], owners[order]):
+        if len(dominant[owner]) < 3:
+            rgb = int(key) & 0xFFFFFF
+            dominant[owner].append((rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF))
+
+    return [
+        {
+            'dominant_colors': dominant[i],
+            'brightness': float(brightness[i]),
+            'resolution': f"{image.width}x{image.height}",
+            'aspect_ratio': image.width / image.height
+        }
+        for i, image in enumerate(images)
+    ]
+
+
 class YouTubeThumbnailLearner:
     """조회수, CTR, 인게이지먼트 기반 고성과 썸네일 + 타이틀 패턴 학습"""
 
+    # 썸네일 동시 다운로드 수 / CLIP forward 1회당 이미지 수
+    FETCH_CONCURRENCY = 16
+    EMBED_BATCH_SIZE = 32
+
     def __init__(self, pinecone_index):
         self.youtube = build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY)
         self.pinecone = pinecone_index
@@ -95,42 +159,100 @@ class YouTubeThumbnailLearner:
                 self.logger.error(f"YouTube API error: {e}")
                 return []
 
+    async def _fetch_thumbnail(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        thumbnail_url: str
+    ) -> Optional[Image.Image]:
+        """썸네일 다운로드 + 디코드 (실패 시 None)"""
+        try:
+            async with semaphore:
+                response = await client.get(thumbnail_url)
+                response.raise_for_status()
+            image = Image.open(BytesIO(response.content))
+            image.load()
+            return image
+        except Exception as e:
+            self.logger.warning(f"Thumbnail fetch failed ({thumbnail_url}): {e}")
+            return None
+
+    async def _fetch_one(self, thumbnail_url: str) -> Image.Image:
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            image = await self._fetch_thumbnail(client, asyncio.Semaphore(1), thumbnail_url)
+        if image is None:
+            raise ValueError(f"Failed to fetch thumbnail: {thumbnail_url}")
+        return image
+
+    def _embed_images_sync(self, images: List[Image.Image]) -> List[List[float]]:
+        """CLIP 이미지 임베딩 (배치 1회 forward, 워커 스레드에서 실행)"""
+        inputs = self.clip_processor(images=[image.convert('RGB') for image in images], return_tensors="pt")
+        with torch.no_grad():
+            embeddings = self.clip_model.get_image_features(**inputs)
+        return embeddings.cpu().numpy().tolist()
+
+    def _process_batch_sync(self, images: List[Image.Image]) -> Tuple[List[List[float]], List[Dict]]:
+        return self._embed_images_sync(images), analyze_patterns_batch(images)
+
     async def analyze_thumbnail_patterns(self, thumbnail_url: str) -> Dict:
         """썸네일 이미지 분석 (색상, 레이아웃, 텍스트 비율 등)"""
         with self.logger.span("thumbnail.analyze_patterns"):
-            # 이미지 다운로드
-            response = requests.get(thumbnail_url)
-            image = Image.open(BytesIO(response.content))
-
-            # 색상 분석
-            colors = image.getcolors(maxcolors=1000000)
-            dominant_colors = sorted(colors, key=lambda x: x[0], reverse=True)[:5]
-
-            # 밝기 분석
-            grayscale = image.convert('L')
-            brightness = sum(grayscale.getdata()) / (grayscale.width * grayscale.height)
+            image = await self._fetch_one(thumbnail_url)
 
             # TODO: OCR로 텍스트 비율 분석 (EasyOCR 또는 Tesseract)
             # TODO: 얼굴 감지 (OpenCV 또는 Face Recognition)
 
-            return {
-                'dominant_colors': [rgb for count, rgb in dominant_colors[:3]],
-                'brightness': brightness,
-                'resolution': f"{image.width}x{image.height}",
-                'aspect_ratio': image.width / image.height
-            }
+            patterns = await asyncio.to_thread(analyze_patterns_batch, [image])
+            return patterns[0]
 
     async def embed_thumbnail(self, thumbnail_url: str) -> List[float]:
         """CLIP으로 썸네일 이미지 임베딩"""
         with self.logger.span("clip.embed_image"):
-            response = requests.get(thumbnail_url)
-            image = Image.open(BytesIO(response.content))
+            image = await self._fetch_one(thumbnail_url)
+            embeddings = await asyncio.to_thread(self._embed_images_sync, [image])
+            return embeddings[0]
 
-            inputs = self.clip_processor(images=image, return_tensors="pt")
-            with torch.no_grad():
-                embedding = self.clip_model.get_image_features(**inputs)
+    async def embed_thumbnails(self, thumbnail_urls: List[str]) -> List[Optional[List[float]]]:
+        """여러 썸네일 임베딩 (동시 다운로드 + 배치 추론, 실패한 항목은 None)"""
+        with self.logger.span("clip.embed_images"):
+            results = await self._embed_and_analyze(thumbnail_urls)
+            return [result[0] if result else None for result in results]
 
-            return embedding.cpu().numpy().tolist()[0]
+    async def _embed_and_analyze(
+        self,
+        thumbnail_urls: List[str]
+    ) -> List[Optional[Tuple[List[float], Dict]]]:
+        """
+        썸네일 전체를 동시에 받으면서 EMBED_BATCH_SIZE 단위로 임베딩 + 패턴 분석
+
+        다운로드 태스크를 먼저 모두 띄우고 배치 순서대로 소비하므로,
+        앞 배치가 스레드에서 추론하는 동안 뒤 배치 다운로드가 계속 진행된다.
+        """
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        results: List[Optional[Tuple[List[float], Dict]]] = [None] * len(thumbnail_urls)
+
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            fetches = [
+                asyncio.create_task(self._fetch_thumbnail(client, semaphore, url))
+                for url in thumbnail_urls
+            ]
+            try:
+                for start in range(0, len(fetches), self.EMBED_BATCH_SIZE):
+                    images = await asyncio.gather(*fetches[start:start + self.EMBED_BATCH_SIZE])
+                    loaded = [(start + i, image) for i, image in enumerate(images) if image is not None]
+                    if not loaded:
+                        continue
+
+                    embeddings, patterns = await asyncio.to_thread(
+                        self._process_batch_sync, [image for _, image in loaded]
+                    )
+                    for (index, _), embedding, pattern in zip(loaded, embeddings, patterns):
+                        results[index] = (embedding, pattern)
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+
+        return results
 
     async def embed_text(self, text: str) -> List[float]:
         """CLIP으로 타이틀/카피 텍스트 임베딩"""
@@ -146,12 +268,13 @@ class YouTubeThumbnailLearner:
         with self.logger.span("pinecone.upsert"):
             vectors = []
 
-            for video in videos_data:
-                # 썸네일 임베딩
-                thumbnail_embedding = await self.embed_thumbnail(video['thumbnail_url'])
+            # 썸네일 임베딩 + 패턴 분석 (동시 다운로드, 배치 추론)
+            processed = await self._embed_and_analyze([video['thumbnail_url'] for video in videos_data])
 
-                # 패턴 분석
-                patterns = await self.analyze_thumbnail_patterns(video['thumbnail_url'])
+            for video, result in zip(videos_data, processed):
+                if result is None:
+                    continue
+                thumbnail_embedding, patterns = result
 
                 # 메타데이터 구성
                 metadata = {
@@ -2,7 +2,6 @@
 import logging
 from typing import Optional, Dict
 import asyncio
-import subprocess
 import tempfile
 import os
 import json
@@ -10,6 +9,8 @@ from pathlib import Path
 
 from app.tasks.celery_app import celery_app
 from app.services.audio_correction_loop import get_audio_correction_loop
+from app.services.audio_cut_engine import cut_audio
+from app.services.streaming_io import download_to_file_sync
 from app.tasks.progress_tracker import ProgressTracker, BatchProgressTracker
 from app.utils.progress_mapper import ProgressMapper
 from app.core.config import get_settings
@@ -37,6 +38,7 @@ def generate_verified_audio_task(
     voice_id: Optional[str] = None,
     language: str = "ko",
     user_id: Optional[str] = None,
+    sentence_mode: bool = False,
     **kwargs
 ) -> Dict:
     """
@@ -47,6 +49,7 @@ def generate_verified_audio_task(
         voice_id: 음성 ID
         language: 언어 코드
         user_id: 사용자 ID
+        sentence_mode: True면 문장 단위 생성/검증 (실패 문장만 재생성)
         **kwargs: AudioCorrectionLoop에 전달할 추가 파라미터
 
     Returns:
@@ -97,6 +100,7 @@ def generate_verified_audio_task(
                 voice_id=voice_id,
                 language=language,
                 save_file=True,
+                sentence_mode=sentence_mode,
                 **kwargs
             )
         )
@@ -321,7 +325,7 @@ def remove_silence_task(
     Returns:
         {
             "success": bool,
-            "processed_audio_url": str,
+            "processed_audio_url": str,  # AAC 48kHz (.m4a)
             "original_duration": float,
             "new_duration": float,
             "removed_segments": [{"start": float, "end": float}]
@@ -341,88 +345,36 @@ def remove_silence_task(
 
         # 2. 오디오 다운로드 (로컬 파일이면 스킵)
         if audio_url.startswith("http"):
-            import requests
-            response = requests.get(audio_url)
-            response.raise_for_status()
-
             temp_input = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_input.write(response.content)
             temp_input.close()
-            input_path = temp_input.name
+            input_path = download_to_file_sync(audio_url, temp_input.name).path
         else:
             input_path = audio_url
 
         tracker.update(20, "processing", "오디오 파일 다운로드 완료")
 
-        # 3. 원본 길이 측정
-        duration_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            input_path
-        ]
-        original_duration = float(subprocess.check_output(duration_cmd).decode().strip())
-        logger.info(f"Original duration: {original_duration:.2f}s")
-
-        tracker.update(30, "processing", f"원본 길이: {original_duration:.2f}초")
-
-        # 4. 무음 구간 감지
-        detect_cmd = [
-            "ffmpeg", "-i", input_path,
-            "-af", f"silencedetect=noise={threshold_db}dB:d={min_silence_duration}",
-            "-f", "null", "-"
-        ]
-
-        result = subprocess.run(detect_cmd, capture_output=True, text=True)
-        silence_log = result.stderr
-
-        # 무음 구간 파싱
-        removed_segments = []
-        lines = silence_log.split('\n')
-        silence_start = None
-
-        for line in lines:
-            if 'silence_start' in line:
-                silence_start = float(line.split('silence_start: ')[1].strip())
-            elif 'silence_end' in line and silence_start is not None:
-                silence_end = float(line.split('silence_end: ')[1].split('|')[0].strip())
-                removed_segments.append({"start": silence_start, "end": silence_end})
-                silence_start = None
+        # 3. 단일 디코드 → 무음 구간 계산 → 단일 인코딩 (길이는 샘플 수로 계산)
+        tracker.update(30, "processing", "무음 구간 감지 및 제거 중...")
+        cut = cut_audio(
+            input_path,
+            silence_threshold_db=threshold_db,
+            min_silence_duration=min_silence_duration,
+        )
+        original_duration = cut.original_duration
+        new_duration = cut.new_duration
+        removed_segments = cut.removed_segments
 
         logger.info(f"Detected {len(removed_segments)} silence segments")
-        tracker.update(50, "processing", f"무음 구간 감지 완료: {len(removed_segments)}개")
-
-        # 5. 무음 제거
-        temp_output = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        temp_output.close()
-
-        remove_cmd = [
-            "ffmpeg", "-i", input_path,
-            "-af", f"silenceremove=start_periods=1:start_duration=0:start_threshold={threshold_db}dB:detection=peak,silenceremove=stop_periods=-1:stop_duration={min_silence_duration}:stop_threshold={threshold_db}dB:detection=peak",
-            "-c:a", "libmp3lame", "-b:a", "192k",
-            temp_output.name, "-y"
-        ]
-
-        subprocess.run(remove_cmd, check=True, capture_output=True)
-        tracker.update(80, "processing", "무음 제거 완료")
-
-        # 6. 새로운 길이 측정
-        new_duration = float(subprocess.check_output([
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            temp_output.name
-        ]).decode().strip())
-
+        tracker.update(80, "processing", f"무음 제거 완료: {len(removed_segments)}개 구간")
         logger.info(f"New duration: {new_duration:.2f}s (removed {original_duration - new_duration:.2f}s)")
 
-        # 7. Cloudinary 업로드 (선택)
+        # 4. Cloudinary 업로드 (선택)
         # TODO: Cloudinary 업로드 구현
-        processed_audio_url = temp_output.name  # 임시로 로컬 경로 반환
+        processed_audio_url = cut.output_path  # 임시로 로컬 경로 반환
 
         tracker.update(90, "processing", "처리된 파일 저장 완료")
 
-        # 8. 임시 파일 정리
+        # 5. 임시 파일 정리
         if audio_url.startswith("http"):
             os.unlink(input_path)
 
@@ -479,7 +431,7 @@ def remove_fillers_task(
     Returns:
         {
             "success": bool,
-            "processed_audio_url": str,
+            "processed_audio_url": str,  # AAC 48kHz (.m4a)
             "transcript": str,
             "removed_words": [{"word": str, "start": float, "end": float}],
             "original_duration": float,
@@ -503,14 +455,9 @@ def remove_fillers_task(
 
         # 2. 오디오 다운로드
         if audio_url.startswith("http"):
-            import requests
-            response = requests.get(audio_url)
-            response.raise_for_status()
-
             temp_input = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_input.write(response.content)
             temp_input.close()
-            input_path = temp_input.name
+            input_path = download_to_file_sync(audio_url, temp_input.name).path
         else:
             input_path = audio_url
 
@@ -535,7 +482,7 @@ def remove_fillers_task(
 
         # 4. 필러 워드 감지
         removed_words = []
-        filler_segments = []  # FFmpeg에서 제거할 구간 (시작, 끝)
+        filler_segments = []  # 제거할 구간 (시작, 끝) 초
 
         if hasattr(transcript_result, 'words') and transcript_result.words:
             for word_data in transcript_result.words:
@@ -553,60 +500,21 @@ def remove_fillers_task(
         logger.info(f"Detected {len(removed_words)} filler words")
         tracker.update(60, "processing", f"필러 워드 감지 완료: {len(removed_words)}개")
 
-        # 5. 원본 길이 측정
-        duration_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            input_path
-        ]
-        original_duration = float(subprocess.check_output(duration_cmd).decode().strip())
-
-        # 6. FFmpeg로 필러 워드 구간 제거
-        if filler_segments:
-            # FFmpeg select 필터를 사용해 특정 구간 제거
-            # between(t,start,end) 함수로 제거할 구간 지정
-            select_expr = "1"
-            for start, end in filler_segments:
-                select_expr += f"*not(between(t,{start},{end}))"
-
-            temp_output = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_output.close()
-
-            # aselect로 구간 선택, asetpts로 타임스탬프 재조정
-            remove_cmd = [
-                "ffmpeg", "-i", input_path,
-                "-af", f"aselect='{select_expr}',asetpts=N/SR/TB",
-                "-c:a", "libmp3lame", "-b:a", "192k",
-                temp_output.name, "-y"
-            ]
-
-            subprocess.run(remove_cmd, check=True, capture_output=True)
-            tracker.update(80, "processing", "필러 워드 제거 완료")
-
-            # 7. 새로운 길이 측정
-            new_duration = float(subprocess.check_output([
-                "ffprobe", "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                temp_output.name
-            ]).decode().strip())
-
-            processed_audio_url = temp_output.name
-        else:
-            # 필러 워드가 없으면 원본 그대로
-            logger.info("No filler words detected, returning original audio")
-            processed_audio_url = input_path
-            new_duration = original_duration
+        # 5. 단일 디코드 → 필러 구간 제거 → 단일 인코딩 (길이는 샘플 수로 계산)
+        cut = cut_audio(input_path, cut_segments=filler_segments)
+        original_duration = cut.original_duration
+        new_duration = cut.new_duration
+        processed_audio_url = cut.output_path
+        tracker.update(80, "processing", "필러 워드 제거 완료")
 
         logger.info(f"New duration: {new_duration:.2f}s (removed {original_duration - new_duration:.2f}s)")
 
-        # 8. Cloudinary 업로드 (선택)
+        # 6. Cloudinary 업로드 (선택)
         # TODO: Cloudinary 업로드 구현
 
         tracker.update(90, "processing", "처리된 파일 저장 완료")
 
-        # 9. 임시 파일 정리
+        # 7. 임시 파일 정리
         if audio_url.startswith("http"):
             os.unlink(input_path)
 
@@ -115,7 +115,7 @@ def select_background_auto_task(
     prefer_ai: bool = True
 ) -> dict:
     """
-    배경 자동 선택 (3단계 우선순위 로직)
+    배경 자동 선택 (AI / 스톡 우선순위 로직)
 
     Args:
         block_id: 스토리보드 블록 ID
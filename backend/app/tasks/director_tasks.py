@@ -4,22 +4,29 @@ Video Director Agent를 Celery로 비동기 실행하는 작업들
 
 작업 유형:
 1. generate_video_from_script_task: 스크립트 → 완성된 영상
-2. batch_generate_videos_task: 여러 영상 배치 생성
+2. batch_generate_videos_task: 여러 영상 배치 생성 (영상별 하위 작업 chord 분산)
 3. regenerate_video_with_edits_task: 기존 영상 재생성 (수정본)
 """
 import logging
 import asyncio
+import time
 from typing import Optional, Dict, List
 from datetime import datetime
 
+from celery import chord, group
+
 from app.tasks.celery_app import celery_app
 from app.services.video_orchestrator_agent import get_video_director_agent
 from app.services.cost_tracker import get_cost_tracker
-from app.tasks.progress_tracker import ProgressTracker, BatchProgressTracker
+from app.tasks.progress_tracker import BatchProgressTracker, ProgressTracker, RedisBatchItemProgress
+from app.tasks.tenant_slots import get_tenant_slot_limiter
 from app.utils.progress_mapper import ProgressMapper
 
 logger = logging.getLogger(__name__)
 
+# 배치 하위 작업 실패 재시도 횟수 (슬롯 대기 재시도는 별도)
+BATCH_ITEM_MAX_RETRIES = 2
+
 
 @celery_app.task(
     name="generate_video_from_script",
@@ -218,17 +225,20 @@ def generate_video_from_script_task(
 
 @celery_app.task(
     name="batch_generate_videos",
-    bind=True,
-    time_limit=7200,  # 2시간
-    soft_time_limit=7000
+    bind=True
 )
 def batch_generate_videos_task(
     self,
     video_requests: List[Dict],
-    user_id: Optional[str] = None
-) -> Dict:
+    user_id: Optional[str] = None,
+    tenant_id: Optional[str] = None
+):
     """
-    여러 영상 배치 생성 Celery 작업
+    여러 영상 배치 생성 Celery 작업 (fan-out / fan-in)
+
+    영상마다 generate_batch_video_item_task 로 분산(chord header)하고,
+    aggregate_batch_videos_task 가 결과와 부분 실패를 집계한다(chord callback).
+    이 작업은 chord 로 대체(replace)되므로 task_id 의 최종 결과는 집계 결과다.
 
     Args:
         video_requests: [
@@ -244,11 +254,13 @@ def batch_generate_videos_task(
             ...
         ]
         user_id: 사용자 ID
+        tenant_id: 동시 실행 제한 단위 (기본: user_id)
 
     Returns:
         {
-            "status": "completed" | "error",
-            "results": [...],
+            "status": "completed",
+            "results": [...],  # 요청 순서
+            "failed_items": [{"index": int, "project_id": str, "error": str}],
             "summary": {
                 "total": int,
                 "success": int,
@@ -259,121 +271,193 @@ def batch_generate_videos_task(
             }
         }
     """
+    batch_id = self.request.id
+    tenant = tenant_id or user_id or "anonymous"
+    total = len(video_requests)
+
     logger.info(
         f"Starting batch video generation task - "
-        f"total: {len(video_requests)}, user: {user_id or 'anonymous'}"
+        f"total: {total}, user: {user_id or 'anonymous'}, tenant: {tenant}"
     )
 
-    # 배치 진행률 추적기 초기화
-    batch_tracker = BatchProgressTracker(
+    if not video_requests:
+        return {
+            "status": "completed",
+            "results": [],
+            "failed_items": [],
+            "summary": {"total": 0, "success": 0, "failed": 0, "total_duration": 0,
+                        "total_cost_usd": 0, "execution_time_seconds": 0.0},
+            "user_id": user_id,
+            "task_id": batch_id
+        }
+
+    ProgressTracker(
         task=self,
-        project_id=f"batch_{self.request.id}",
-        task_name="batch_video_generation",
-        total_items=len(video_requests)
+        project_id=f"batch_{batch_id}",
+        task_name="batch_video_generation"
+    ).update(0.0, "processing", f"{total}개 영상 분산 처리 시작")
+
+    header = group(
+        generate_batch_video_item_task.s(request, i, total, batch_id, tenant)
+        for i, request in enumerate(video_requests)
+    )
+    callback = aggregate_batch_videos_task.s(
+        batch_id=batch_id,
+        user_id=user_id,
+        started_at=time.time()
     )
+    return self.replace(chord(header, callback))
 
-    start_time = datetime.now()
 
-    try:
-        director = get_video_director_agent()
-        results = []
+@celery_app.task(
+    name="generate_batch_video_item",
+    bind=True,
+    max_retries=None,  # 슬롯 대기는 무제한, 실패 재시도는 attempt 로 별도 제한
+    time_limit=3600,  # 1시간 타임아웃
+    soft_time_limit=3300
+)
+def generate_batch_video_item_task(
+    self,
+    request: Dict,
+    index: int,
+    total: int,
+    batch_id: str,
+    tenant_id: str,
+    attempt: int = 0
+) -> Dict:
+    """
+    배치 영상 1개 생성 (chord header 하위 작업)
 
-        # 각 영상 순차 처리
-        for i, request in enumerate(video_requests):
-            logger.info(
-                f"Processing video {i+1}/{len(video_requests)}: "
-                f"project={request['project_id']}"
-            )
+    - 테넌트 슬롯을 얻지 못하면 잠시 뒤 재시도 (실패 횟수에 포함되지 않음)
+    - 생성 실패는 BATCH_ITEM_MAX_RETRIES 회까지 지수 백오프 재시도
+    - 최종 실패도 예외 대신 에러 결과를 반환 → chord 콜백이 부분 실패로 집계
+    """
+    project_id = request["project_id"]
+    limiter = get_tenant_slot_limiter()
 
-            # 개별 아이템 시작 (0%)
-            batch_tracker.update_item(
-                i, 0.0, "processing",
-                f"영상 {i+1}/{len(video_requests)} 생성 시작"
-            )
+    if not limiter.acquire(tenant_id, self.request.id):
+        raise self.retry(countdown=limiter.retry_delay())
 
-            try:
-                result = asyncio.run(
-                    director.generate_video(
-                        project_id=request["project_id"],
-                        script=request["script"],
-                        audio_path=request["audio_path"],
-                        persona_id=request.get("persona_id"),
-                        gender=request.get("gender", "female"),
-                        age_range=request.get("age_range", "30-40"),
-                        character_style=request.get("character_style", "professional")
-                    )
-                )
-                results.append(result)
-
-                # 개별 아이템 완료 (100%)
-                batch_tracker.update_item(
-                    i, 1.0, "processing",
-                    f"영상 {i+1}/{len(video_requests)} 생성 완료"
-                )
-
-            except Exception as e:
-                logger.error(f"Batch item {i+1} failed: {e}")
-                results.append({
-                    "status": "error",
-                    "error": str(e),
-                    "project_id": request["project_id"]
-                })
-
-                # 개별 아이템 실패 처리 (진행률은 1.0으로 카운트)
-                batch_tracker.update_item(
-                    i, 1.0, "processing",
-                    f"영상 {i+1}/{len(video_requests)} 실패"
-                )
-
-        # 통계 계산
-        summary = {
-            "total": len(results),
-            "success": sum(1 for r in results if r.get("success")),
-            "failed": sum(1 for r in results if not r.get("success")),
-            "total_duration": sum(r.get("total_duration", 0) for r in results),
-            "total_cost_usd": sum(r.get("total_cost_usd", 0) for r in results),
-            "execution_time_seconds": (datetime.now() - start_time).total_seconds()
-        }
+    # 아이템별 진행률을 Redis 로 공유 → 어느 워커에서 보고해도 배치 전체 진행률로 집계
+    tracker = BatchProgressTracker(
+        task=self,
+        project_id=f"batch_{batch_id}",
+        task_name="batch_video_generation",
+        total_items=total,
+        item_store=RedisBatchItemProgress.for_batch(batch_id)
+    )
+    metadata = {"project_id": project_id}
 
-        logger.info(
-            f"Batch video generation completed - "
-            f"success: {summary['success']}/{summary['total']}, "
-            f"cost: ${summary['total_cost_usd']:.2f}, "
-            f"time: {summary['execution_time_seconds']:.1f}s"
+    try:
+        tracker.update_item(
+            index, 0.0, "processing",
+            f"영상 {index+1}/{total} 생성 시작", metadata
         )
 
-        # 배치 작업 완료 브로드캐스트
-        batch_tracker.complete({
-            "total": summary['total'],
-            "success": summary['success'],
-            "failed": summary['failed'],
-            "total_cost_usd": summary['total_cost_usd'],
-            "execution_time_seconds": summary['execution_time_seconds']
-        })
+        director = get_video_director_agent()
+        result = asyncio.run(
+            director.generate_video(
+                project_id=project_id,
+                script=request["script"],
+                audio_path=request["audio_path"],
+                persona_id=request.get("persona_id"),
+                gender=request.get("gender", "female"),
+                age_range=request.get("age_range", "30-40"),
+                character_style=request.get("character_style", "professional")
+            )
+        )
 
-        return {
-            "status": "completed",
-            "results": results,
-            "summary": summary,
-            "user_id": user_id,
-            "task_id": self.request.id
-        }
+        tracker.update_item(
+            index, 1.0, "processing",
+            f"영상 {index+1}/{total} 생성 완료", metadata
+        )
+        return result
 
     except Exception as e:
-        logger.error(f"Batch video generation task failed: {e}")
+        logger.error(f"Batch item {index+1}/{total} failed (attempt {attempt + 1}): {e}")
+
+        if attempt < BATCH_ITEM_MAX_RETRIES:
+            limiter.release(tenant_id, self.request.id)
+            raise self.retry(
+                exc=e,
+                countdown=60 * (2 ** attempt),
+                kwargs={**self.request.kwargs, "attempt": attempt + 1}
+            )
 
-        # 배치 작업 에러 브로드캐스트
-        batch_tracker.error(
-            str(e),
-            {"user_id": user_id, "total_requests": len(video_requests)}
+        tracker.update_item(
+            index, 1.0, "processing",
+            f"영상 {index+1}/{total} 실패", {**metadata, "error": str(e)}
         )
-
         return {
             "status": "error",
+            "success": False,
             "error": str(e),
-            "user_id": user_id,
-            "task_id": self.request.id
+            "project_id": project_id
+        }
+
+    finally:
+        limiter.release(tenant_id, self.request.id)
+
+
+@celery_app.task(
+    name="aggregate_batch_videos",
+    bind=True
+)
+def aggregate_batch_videos_task(
+    self,
+    results: List[Dict],
+    batch_id: str,
+    user_id: Optional[str] = None,
+    started_at: Optional[float] = None
+) -> Dict:
+    """배치 영상 결과 집계 (chord callback) — 부분 실패 포함"""
+    failed_items = [
+        {
+            "index": i,
+            "project_id": r.get("project_id"),
+            "error": r.get("error", "Unknown error")
         }
+        for i, r in enumerate(results) if not r.get("success")
+    ]
+
+    # 통계 계산
+    summary = {
+        "total": len(results),
+        "success": len(results) - len(failed_items),
+        "failed": len(failed_items),
+        "total_duration": sum(r.get("total_duration", 0) for r in results),
+        "total_cost_usd": sum(r.get("total_cost_usd", 0) for r in results),
+        "execution_time_seconds": time.time() - started_at if started_at else 0.0
+    }
+
+    logger.info(
+        f"Batch video generation completed - "
+        f"success: {summary['success']}/{summary['total']}, "
+        f"cost: ${summary['total_cost_usd']:.2f}, "
+        f"time: {summary['execution_time_seconds']:.1f}s"
+    )
+
+    # 배치 작업 완료 브로드캐스트
+    ProgressTracker(
+        task=self,
+        project_id=f"batch_{batch_id}",
+        task_name="batch_video_generation"
+    ).complete({
+        "total": summary['total'],
+        "success": summary['success'],
+        "failed": summary['failed'],
+        "total_cost_usd": summary['total_cost_usd'],
+        "execution_time_seconds": summary['execution_time_seconds']
+    })
+
+    return {
+        "status": "completed",
+        "results": results,
+        "failed_items": failed_items,
+        "summary": summary,
+        "user_id": user_id,
+        "task_id": batch_id
+    }
 
 
 @celery_app.task(
@@ -430,7 +514,7 @@ def regenerate_video_with_edits_task(
         # 오디오 경로 결정
         audio_path = edited_audio_path or f"./generated_audio/{new_project_id}.mp3"
 
-        # 영상 재생성
+        # 영상 재생성 — 수정되지 않은 섹션/단계는 render artifact cache 에서 재사용
         director = get_video_director_agent()
         result = asyncio.run(
             director.generate_video(
@@ -440,7 +524,8 @@ def regenerate_video_with_edits_task(
                 persona_id=persona_id,
                 gender=gender,
                 age_range=age_range,
-                character_style=character_style
+                character_style=character_style,
+                reuse_clips=True
             )
         )
 
@@ -449,10 +534,14 @@ def regenerate_video_with_edits_task(
         result["original_project_id"] = original_project_id
         result["is_regeneration"] = True
 
+        cache_report = result.get("artifact_cache") or {}
         logger.info(
             f"Video regeneration task completed - "
             f"new project: {new_project_id}, "
-            f"cost: ${result.get('total_cost_usd', 0):.2f}"
+            f"cost: ${result.get('total_cost_usd', 0):.2f}, "
+            f"cache hits: {cache_report.get('hits', 0)}/"
+            f"{cache_report.get('hits', 0) + cache_report.get('misses', 0)}, "
+            f"saved: {cache_report.get('saved_seconds', 0):.1f}s"
         )
 
         return result
@@ -326,6 +326,9 @@ class BatchProgressTracker:
         >>> for i in range(10):
         ...     # 각 아이템 처리
         ...     batch_tracker.update_item(i, 1.0, "completed", f"Item {i} done")
+
+    아이템이 여러 워커의 하위 작업(chord header)으로 나뉘어 처리되면 item_store
+    (예: RedisBatchItemProgress)로 아이템 진행률을 공유해 전체 진행률을 집계한다.
     """
 
     def __init__(
@@ -333,7 +336,8 @@ class BatchProgressTracker:
         task: Task,
         project_id: str,
         task_name: str,
-        total_items: int
+        total_items: int,
+        item_store: Optional["RedisBatchItemProgress"] = None
     ):
         """BatchProgressTracker 초기화
 
@@ -342,11 +346,13 @@ class BatchProgressTracker:
             project_id: 프로젝트 ID
             task_name: 작업 이름
             total_items: 전체 아이템 수
+            item_store: 워커 간 공유 아이템 진행률 저장소 (None이면 프로세스 내 집계)
         """
         self.base_tracker = ProgressTracker(task, project_id, task_name)
         self.total_items = total_items
         self.completed_items = 0
         self.item_progress = {}  # {item_idx: progress_value}
+        self.item_store = item_store
 
     def update_item(
         self,
@@ -365,14 +371,17 @@ class BatchProgressTracker:
             message: 메시지
             metadata: 추가 정보
         """
-        # 아이템 진행률 저장
+        # 아이템 진행률 저장 (공유 저장소가 있으면 다른 워커의 아이템 진행률까지 병합)
         self.item_progress[item_idx] = item_progress
+        if self.item_store is not None:
+            shared = self.item_store.record(item_idx, item_progress)
+            if shared is not None:
+                self.item_progress = shared
 
         # 아이템 완료 카운트
-        if item_progress >= 1.0:
-            self.completed_items = sum(
-                1 for p in self.item_progress.values() if p >= 1.0
-            )
+        self.completed_items = sum(
+            1 for p in self.item_progress.values() if p >= 1.0
+        )
 
         # 전체 진행률 계산 (각 아이템의 평균)
         overall_progress = sum(self.item_progress.values()) / self.total_items
@@ -403,3 +412,57 @@ class BatchProgressTracker:
     def error(self, error: str, details: Optional[Dict[str, Any]] = None):
         """배치 작업 에러"""
         self.base_tracker.error(error, details)
+
+
+class RedisBatchItemProgress:
+    """배치 아이템 진행률 공유 저장소 (Redis hash: item_idx → progress)
+
+    chord 하위 작업은 서로 다른 워커에서 실행되므로 BatchProgressTracker 의
+    프로세스 내 item_progress 만으로는 전체 진행률을 계산할 수 없다.
+    Redis 장애 시 None 을 반환 → 호출부는 자기 아이템 진행률로만 집계 (fail-open).
+    """
+
+    def __init__(self, redis_client, batch_id: str, ttl_seconds: int = 86400):
+        """
+        Args:
+            redis_client: redis.Redis 호환 클라이언트 (decode_responses=True)
+            batch_id: 배치 ID
+            ttl_seconds: 진행률 키 만료 시간
+        """
+        self.redis = redis_client
+        self.key = f"batch_progress:{batch_id}"
+        self.ttl_seconds = ttl_seconds
+
+    def record(self, item_idx: int, progress: float) -> Optional[Dict[int, float]]:
+        """아이템 진행률 기록 후 배치 전체 아이템 진행률 반환"""
+        if self.redis is None:
+            return None
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(self.key, str(item_idx), progress)
+            pipe.expire(self.key, self.ttl_seconds)
+            pipe.hgetall(self.key)
+            items = pipe.execute()[-1]
+            return {int(idx): float(value) for idx, value in items.items()}
+        except Exception as e:
+            logger.warning(f"Batch progress store unavailable: {e}")
+            return None
+
+    @classmethod
+    def for_batch(cls, batch_id: str) -> "RedisBatchItemProgress":
+        """설정의 REDIS_URL 을 사용하는 저장소 (클라이언트는 프로세스 내 공유)"""
+        global _batch_progress_redis
+        if _batch_progress_redis is None:
+            from app.core.config import get_settings
+
+            try:
+                import redis
+                _batch_progress_redis = redis.from_url(
+                    get_settings().REDIS_URL, decode_responses=True, socket_timeout=1
+                )
+            except Exception as e:
+                logger.warning(f"Redis unavailable for batch progress: {e}")
+        return cls(_batch_progress_redis, batch_id)
+
+
+_batch_progress_redis = None
@@ -1,7 +1,8 @@
 """Remotion 멀티포맷 렌더링 Celery 태스크
 
-Remotion CLI를 subprocess로 실행하여 영상을 렌더링하고,
-멀티포맷(YouTube/Instagram/TikTok) 출력을 지원합니다.
+Remotion CLI를 subprocess로 실행하여 마스터 영상을 한 번만 렌더링하고,
+멀티포맷(YouTube 16:9 / TikTok 9:16 / Instagram 1:1) 출력은
+FFmpeg crop/scale 병렬 트랜스코딩으로 파생합니다.
 """
 import subprocess
 import json
@@ -10,6 +11,19 @@ import asyncio
 import tempfile
 import logging
 from pathlib import Path
+from typing import Callable, Optional
+
+from app.services.format_transcoder import (
+    FORMAT_SIZES,
+    get_format_transcoder,
+    master_render_scale,
+)
+from app.services.remotion_render_client import (
+    RemotionRenderError,
+    RemotionRenderUnavailable,
+    RenderProgress,
+    get_remotion_render_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,16 +143,55 @@ except ImportError:
     celery_app = None
 
 
+# frontend/remotion/Root.tsx 컴포지션 기본 해상도 (마스터 스케일 계산용)
+COMPOSITION_SIZES = {
+    "auto": (1920, 1080),
+    "youtube": (1920, 1080),
+    "instagram": (1080, 1350),
+    "tiktok": (1080, 1920),
+}
+
+# 마스터는 트랜스코딩 원본이므로 납품본보다 높은 품질로 렌더
+MASTER_CRF = {"low": 23, "medium": 18, "high": 14}
+
+
 def render_video_subprocess(
     composition_id: str,
     props: dict,
     output_path: str,
-    quality: str = "medium"
+    quality: str = "medium",
+    scale: Optional[float] = None,
+    on_progress: Optional[Callable[[RenderProgress], None]] = None
 ) -> tuple:
     """
-    Remotion CLI를 subprocess로 실행하여 영상 렌더링
-    실제 환경에서는 npx remotion render 사용
+    Remotion 영상 렌더링
+
+    상주 렌더 서버(npm run render-server)가 떠 있으면 번들/브라우저를 재사용하고
+    실제 프레임 진행률을 on_progress 로 전달한다. 없으면 npx remotion render 로 fallback.
+
+    Args:
+        scale: 컴포지션 해상도 배율 (Remotion --scale, 마스터 렌더용)
+        on_progress: 렌더 서버 사용 시 프레임 진행률 콜백
     """
+    crf = MASTER_CRF.get(quality, MASTER_CRF['medium'])
+
+    render_client = get_remotion_render_client()
+    if render_client is not None:
+        try:
+            render_client.render_sync(
+                composition_id,
+                output_path,
+                props,
+                on_progress=on_progress,
+                crf=crf,
+                scale=scale
+            )
+            return True, "", ""
+        except RemotionRenderUnavailable as e:
+            logger.info(f"Render server unavailable, falling back to CLI: {e}")
+        except RemotionRenderError as e:
+            return False, "", str(e)
+
     frontend_dir = "/Volumes/E_SSD/02_GitHub.nosync/0030_OmniVibePro/frontend"
 
     # props를 임시 JSON 파일로 저장
@@ -153,7 +206,10 @@ def render_video_subprocess(
             composition_id,
             output_path,
             f"--props={props_file}",
+            f"--crf={crf}",
         ]
+        if scale and scale != 1.0:
+            cmd.append(f"--scale={scale}")
 
         result = subprocess.run(
             cmd,
@@ -180,44 +236,59 @@ if celery_app:
         output_dir = Path("/tmp/remotion_renders") / task_id
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        for i, fmt in enumerate(formats):
-            progress = int((i / len(formats)) * 80)
-            progress_message = f'{fmt} 렌더링 중...'
+        composition_id = render_request.get('composition_id') or formats[0]
+        targets = {fmt: FORMAT_SIZES.get(fmt, FORMAT_SIZES['youtube']) for fmt in formats}
+
+        from app.core.config import get_settings
+        scale = master_render_scale(
+            COMPOSITION_SIZES.get(composition_id, COMPOSITION_SIZES['youtube']),
+            targets.values(),
+            get_settings().RENDER_MASTER_MAX_SCALE
+        )
 
+        def report(progress: int, fmt: str, message: str) -> None:
             # Celery 상태 업데이트 (폴링 방식 클라이언트용)
             self.update_state(
                 state='PROGRESS',
-                meta={
-                    'progress': progress,
-                    'current_format': fmt,
-                    'message': progress_message
-                }
+                meta={'progress': progress, 'current_format': fmt, 'message': message}
             )
-
             # WebSocket 직접 push (실시간 클라이언트용)
-            _sync_broadcast(task_id, progress, fmt, progress_message)
+            _sync_broadcast(task_id, progress, fmt, message)
 
-            output_path = str(output_dir / f"{fmt}.mp4")
+        # 1. 마스터 1회 렌더 (Chromium 렌더는 포맷 수와 무관하게 한 번만)
+        report(0, 'master', f'마스터 렌더링 중... ({composition_id}, x{scale})')
 
-            props = {
-                'blocks': render_request.get('blocks', []),
-                'audioUrl': render_request.get('audio_url', ''),
-                'branding': render_request.get('branding', {})
-            }
+        props = {
+            'blocks': render_request.get('blocks', []),
+            'audioUrl': render_request.get('audio_url', ''),
+            'branding': render_request.get('branding', {})
+        }
+        master_path = str(output_dir / "master.mp4")
 
-            success, stdout, stderr = render_video_subprocess(
-                fmt,
-                props,
-                output_path,
-                render_request.get('quality', 'medium')
-            )
+        success, stdout, stderr = render_video_subprocess(
+            composition_id,
+            props,
+            master_path,
+            render_request.get('quality', 'medium'),
+            scale=scale,
+            on_progress=lambda p: report(int(p.fraction * 70), 'master', f'마스터 렌더링 {p.rendered_frames}/{p.total_frames} 프레임')
+        )
 
-            if success and Path(output_path).exists():
-                # Cloudinary 업로드: 환경변수 설정 시 CDN URL, 미설정 시 로컬 경로
-                results[fmt] = upload_to_cloudinary(output_path, fmt, task_id)
-            else:
-                logger.error(f"Render failed for {fmt}: {stderr}")
-                results[fmt] = None
+        if success and Path(master_path).exists():
+            # 2. 포맷별 crop/scale 병렬 트랜스코딩
+            report(70, 'all', f'{len(formats)}개 포맷 변환 중...')
+            outputs = get_format_transcoder().transcode(master_path, targets, str(output_dir))
+            os.unlink(master_path)
+
+            for fmt in formats:
+                if outputs.get(fmt):
+                    # Cloudinary 업로드: 환경변수 설정 시 CDN URL, 미설정 시 로컬 경로
+                    results[fmt] = upload_to_cloudinary(outputs[fmt], fmt, task_id)
+                else:
+                    results[fmt] = None
+        else:
+            logger.error(f"Master render failed for {composition_id}: {stderr}")
+            results = {fmt: None for fmt in formats}
 
         # 완료 상태 업데이트
         self.update_state(
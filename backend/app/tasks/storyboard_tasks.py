@@ -1,4 +1,5 @@
 """Celery 콘티 블록 자동 생성 작업"""
+import asyncio
 import logging
 from typing import Dict, Any, List
 from pathlib import Path
@@ -84,12 +85,14 @@ def generate_storyboard_task(
             "storyboard_blocks": [],
             "background_suggestions": [],
             "transition_effects": [],
+            "node_latencies": {},
             "error": None
         }
 
         # Director Agent 실행
         logger.info(f"Executing Director Agent for content_id: {content_id}")
-        result = director_graph.invoke(initial_state)
+        # 블록 단위 노드가 async 이므로 ainvoke 로 실행
+        result = asyncio.run(director_graph.ainvoke(initial_state))
 
         if result.get("error"):
             raise Exception(result["error"])
@@ -139,6 +142,7 @@ def generate_storyboard_task(
             "storyboard_blocks": storyboard_blocks,
             "total_blocks": total_blocks,
             "estimated_duration": estimated_duration,
+            "node_latencies": result.get("node_latencies", {}),
             "task_id": self.request.id
         }
 
@@ -0,0 +1,121 @@
+"""테넌트별 동시 실행 슬롯 (Redis)
+
+배치 작업을 Celery group/chord 로 펼치면 한 테넌트의 대량 배치가 클러스터 전체 워커를
+점유할 수 있다. 하위 작업은 시작 전에 테넌트 슬롯을 얻고, 얻지 못하면 잠시 뒤 재시도한다.
+
+구현:
+    - 테넌트별 sorted set (member=task_id, score=만료 시각)
+    - acquire: 만료 항목 정리 → 자신을 추가 → 순위가 limit 미만이면 획득, 아니면 제거
+      (동시 경합 시 과소 승인 쪽으로만 틀리므로 limit 초과 실행은 없음)
+    - 워커가 죽어 release 되지 않은 슬롯은 TTL 후 자동 회수
+    - Redis 장애 시 fail-open (quota 미들웨어와 동일 정책)
+
+사용 예시:
+    limiter = get_tenant_slot_limiter()
+    if not limiter.acquire(tenant_id, self.request.id):
+        raise self.retry(countdown=limiter.retry_delay())
+    try:
+        ...
+    finally:
+        limiter.release(tenant_id, self.request.id)
+"""
+import logging
+import random
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TenantSlotLimiter:
+    """테넌트별 동시 실행 개수 제한"""
+
+    def __init__(
+        self,
+        redis_client,
+        limit: int,
+        ttl_seconds: int = 3900,
+        key_prefix: str = "tenant_slots"
+    ):
+        """
+        Args:
+            redis_client: redis.Redis 호환 클라이언트 (None 이면 제한 없음)
+            limit: 테넌트당 동시 실행 수 (0 이하면 제한 없음)
+            ttl_seconds: 슬롯 만료 시간 (하위 작업 time_limit 보다 길게)
+            key_prefix: Redis 키 접두어
+        """
+        self.redis = redis_client
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _key(self, tenant_id: str) -> str:
+        return f"{self.key_prefix}:{tenant_id}"
+
+    def acquire(self, tenant_id: str, holder_id: str) -> bool:
+        """슬롯 획득 시도 (이미 보유 중이면 만료 시각만 연장)"""
+        if self.redis is None or self.limit <= 0:
+            return True
+
+        key = self._key(tenant_id)
+        now = time.time()
+        try:
+            self.redis.zremrangebyscore(key, 0, now)
+            self.redis.zadd(key, {holder_id: now + self.ttl_seconds})
+            self.redis.expire(key, self.ttl_seconds)
+            rank = self.redis.zrank(key, holder_id)
+            if rank is not None and rank < self.limit:
+                return True
+            self.redis.zrem(key, holder_id)
+            return False
+        except Exception as e:
+            logger.warning(f"Tenant slot limiter unavailable (fail-open): {e}")
+            return True
+
+    def release(self, tenant_id: str, holder_id: str) -> None:
+        """슬롯 반납"""
+        if self.redis is None or self.limit <= 0:
+            return
+        try:
+            self.redis.zrem(self._key(tenant_id), holder_id)
+        except Exception as e:
+            logger.warning(f"Tenant slot release failed (TTL will reclaim): {e}")
+
+    def active(self, tenant_id: str) -> int:
+        """현재 실행 중인 슬롯 수"""
+        if self.redis is None:
+            return 0
+        try:
+            self.redis.zremrangebyscore(self._key(tenant_id), 0, time.time())
+            return int(self.redis.zcard(self._key(tenant_id)))
+        except Exception:
+            return 0
+
+    @staticmethod
+    def retry_delay(base: float = 15.0) -> float:
+        """슬롯 대기 재시도 간격 (동시 깨어남 방지 지터)"""
+        return base + random.uniform(0, base)
+
+
+_limiter: Optional[TenantSlotLimiter] = None
+
+
+def get_tenant_slot_limiter() -> TenantSlotLimiter:
+    """배치 영상 생성용 테넌트 슬롯 리미터 싱글톤"""
+    global _limiter
+    if _limiter is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        try:
+            import redis
+            client = redis.from_url(settings.REDIS_URL, decode_responses=True, socket_timeout=1)
+        except Exception as e:
+            logger.warning(f"Redis unavailable for tenant slots: {e}")
+            client = None
+        _limiter = TenantSlotLimiter(
+            client,
+            limit=settings.BATCH_VIDEO_TENANT_CONCURRENCY,
+            key_prefix="batch_video_slots"
+        )
+    return _limiter
@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, List
 from app.tasks.celery_app import celery_app
 from app.services.lipsync_service import get_lipsync_service
 from app.services.remotion_service import get_remotion_service
+from app.tasks.progress_tracker import ProgressTracker
 
 logger = logging.getLogger(__name__)
 
@@ -267,7 +268,8 @@ def render_video_with_remotion_task(
     storyboard_blocks: List[Dict[str, Any]],
     campaign_concept: Dict[str, str],
     audio_url: Optional[str] = None,
-    composition_id: str = "OmniVibeComposition"
+    composition_id: str = "OmniVibeComposition",
+    platforms: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Remotion 기반 영상 렌더링 Celery 작업
@@ -278,6 +280,7 @@ def render_video_with_remotion_task(
         campaign_concept: 캠페인 컨셉 (gender, tone, style, platform)
         audio_url: Zero-Fault Audio Director 출력 URL
         composition_id: Remotion composition ID
+        platforms: 멀티포맷 출력 플랫폼 (마스터 1회 렌더 후 트랜스코딩)
 
     Returns:
         {
@@ -297,6 +300,12 @@ def render_video_with_remotion_task(
         f"blocks: {len(storyboard_blocks)}, task_id: {self.request.id}"
     )
 
+    tracker = ProgressTracker(
+        task=self,
+        project_id=f"content_{content_id}",
+        task_name="remotion_render"
+    )
+
     try:
         remotion_service = get_remotion_service()
 
@@ -314,7 +323,10 @@ def render_video_with_remotion_task(
             remotion_service.render_video_with_remotion(
                 content_id=content_id,
                 props=props,
-                composition_id=composition_id
+                composition_id=composition_id,
+                platforms=platforms,
+                # 렌더 서버/CLI 가 보고하는 실제 프레임 수 (metadata: frames, eta_seconds)
+                on_progress=lambda pct, message, frames: tracker.update(pct, "processing", message, frames)
             )
         )
 
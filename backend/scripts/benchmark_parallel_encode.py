@@ -0,0 +1,106 @@
+"""세그먼트 병렬 인코딩 벤치마크 — 단일 프로세스 vs ParallelEncoder.
+
+lavfi testsrc2 + sine 으로 긴 테스트 영상을 만들고,
+같은 필터/프로파일로 단일 FFmpeg 인코딩과 세그먼트 병렬 인코딩 시간을 비교한다.
+두 결과 모두 verify_ios_safe_output 으로 iOS 호환 여부를 확인한다.
+
+사용:
+    python -m scripts.benchmark_parallel_encode
+    python -m scripts.benchmark_parallel_encode --duration 900 --workers 6
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.ffmpeg_profile import (
+    ios_safe_audio_encoder_args,
+    ios_safe_video_encoder_args,
+    ios_safe_video_output_args,
+    verify_ios_safe_output,
+)
+from app.services.parallel_encoder import ParallelEncoder
+
+# optimize_for_platform(youtube) 와 같은 형태의 필터
+BENCH_FILTER = (
+    "scale=1920:1080:force_original_aspect_ratio=decrease,"
+    "pad=1920:1080:(ow-iw)/2:(oh-ih)/2"
+)
+
+
+def _make_source(path: Path, duration: float) -> None:
+    """testsrc2 + sine 테스트 영상 생성 (빠른 preset, 벤치 대상 아님)."""
+    cmd = [
+        "ffmpeg", "-y",
+        "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate=30:duration={duration}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=48000:duration={duration}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+        "-c:a", "aac", "-shortest",
+        str(path),
+    ]
+    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _encode_single(src: Path, out: Path, preset: str) -> float:
+    cmd = ["ffmpeg", "-y", "-i", str(src), "-vf", BENCH_FILTER]
+    cmd.extend(ios_safe_video_encoder_args(preset=preset, crf="23"))
+    cmd.extend(ios_safe_video_output_args())
+    cmd.extend(ios_safe_audio_encoder_args(include_async_filter=False))
+    cmd.append(str(out))
+
+    start = time.time()
+    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return time.time() - start
+
+
+def _report(label: str, elapsed: float, out: Path) -> bool:
+    verify = verify_ios_safe_output(str(out))
+    status = "OK" if verify["ok"] else f"FAIL {verify['errors']}"
+    print(f"  {label:<10} {elapsed:8.1f}s  ios_safe={status}")
+    return bool(verify["ok"])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=660.0, help="테스트 영상 길이(초), 기본 11분")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 FFmpeg 프로세스 수 (기본 자동)")
+    parser.add_argument("--segment-seconds", type=float, default=60.0)
+    parser.add_argument("--preset", default="medium")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_parallel_") as tmp:
+        tmp_dir = Path(tmp)
+        src = tmp_dir / "source.mp4"
+        print(f"▶ generating {args.duration:.0f}s test source ...")
+        _make_source(src, args.duration)
+
+        print("▶ encoding")
+        single_out = tmp_dir / "single.mp4"
+        single_elapsed = _encode_single(src, single_out, args.preset)
+        single_ok = _report("single", single_elapsed, single_out)
+
+        encoder = ParallelEncoder(workers=args.workers, segment_seconds=args.segment_seconds)
+        parallel_out = tmp_dir / "parallel.mp4"
+        result = encoder.encode(
+            str(src), str(parallel_out),
+            video_filter=BENCH_FILTER,
+            preset=args.preset,
+            audio_mode="encode",
+        )
+        parallel_ok = _report("parallel", result["elapsed_time"], parallel_out)
+
+        speedup = single_elapsed / max(result["elapsed_time"], 1e-6)
+        print(
+            f"\nspeedup: {speedup:.2f}x "
+            f"({result['segments']} segments, {result['workers']} workers)"
+        )
+
+    return 0 if single_ok and parallel_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""로컬 벡터 인덱스 벤치마크 — IVF 질의 vs 전체 스캔 (recall@k, 지연).
+
+클러스터 구조를 가진 합성 CLIP 크기(512차원) 벡터를 LocalVectorIndex 에 넣고,
+NumPy 전체 스캔 결과를 정답으로 nprobe 별 recall@k 와 p50/p95 지연을 비교한다.
+`views >= N` 메타데이터 필터 질의도 같은 방식으로 측정한다.
+
+사용:
+    python -m scripts.benchmark_vector_index
+    python -m scripts.benchmark_vector_index --vectors 100000 --queries 200 --nprobe 8 16 32
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from app.services.local_vector_index import LocalVectorIndex
+
+
+def _make_vectors(count: int, dimension: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """클러스터 중심 + 잡음 (실제 임베딩처럼 국소적으로 뭉친 분포)."""
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    labels = rng.integers(0, clusters, count)
+    vectors = centers[labels] + 0.35 * rng.standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _exact_top_k(
+    vectors: np.ndarray, query: np.ndarray, top_k: int, mask: Optional[np.ndarray] = None
+) -> set:
+    scores = vectors @ query
+    if mask is not None:
+        scores = np.where(mask, scores, -np.inf)
+    return set(np.argpartition(-scores, top_k - 1)[:top_k].tolist())
+
+
+def _percentiles(samples: List[float]) -> str:
+    ms = np.array(samples) * 1000
+    return f"p50={np.percentile(ms, 50):6.2f}ms  p95={np.percentile(ms, 95):6.2f}ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--min-views", type=int, default=900_000, help="필터 질의 views 하한")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = _make_vectors(args.vectors, args.dimension, clusters=max(64, args.vectors // 500), rng=rng)
+    views = rng.integers(0, 1_000_000, args.vectors)
+    queries = _make_vectors(args.queries, args.dimension, clusters=args.queries, rng=rng)
+
+    with tempfile.TemporaryDirectory(prefix="vector_bench_") as tmp_dir:
+        index = LocalVectorIndex(tmp_dir, dimension=args.dimension)
+
+        start = time.perf_counter()
+        batch = 1000
+        for offset in range(0, args.vectors, batch):
+            index.upsert(vectors=[
+                (f"v{i}", vectors[i], {"views": int(views[i])})
+                for i in range(offset, min(offset + batch, args.vectors))
+            ])
+        print(
+            f"upsert {args.vectors} vectors: {time.perf_counter() - start:.1f}s "
+            f"({index.describe_index_stats()['ivf_lists']} IVF lists)"
+        )
+
+        view_mask = views >= args.min_views
+        truth = [_exact_top_k(vectors, q, args.top_k) for q in queries]
+        filtered_truth = [_exact_top_k(vectors, q, args.top_k, view_mask) for q in queries]
+
+        def run(nprobe: int, flt: Optional[dict], expected: List[set]) -> str:
+            latencies, hits = [], 0
+            for query, answer in zip(queries, expected):
+                start = time.perf_counter()
+                result = index.query(vector=query, top_k=args.top_k, filter=flt, nprobe=nprobe)
+                latencies.append(time.perf_counter() - start)
+                hits += len(answer & {int(m["id"][1:]) for m in result["matches"]})
+            recall = hits / (len(expected) * args.top_k)
+            return f"recall@{args.top_k}={recall:.3f}  {_percentiles(latencies)}"
+
+        exhaustive = args.vectors  # nprobe >= nlist → 전체 스캔
+        flt = {"views": {"$gte": args.min_views}}
+        print(f"{'exact':>10}  {run(exhaustive, None, truth)}")
+        for nprobe in args.nprobe:
+            print(f"{'nprobe=' + str(nprobe):>10}  {run(nprobe, None, truth)}")
+        print(f"\nfilter views >= {args.min_views:,} ({view_mask.mean():.1%} of vectors)")
+        print(f"{'exact':>10}  {run(exhaustive, flt, filtered_truth)}")
+        for nprobe in args.nprobe:
+            print(f"{'nprobe=' + str(nprobe):>10}  {run(nprobe, flt, filtered_truth)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+"""기동 import 시간 프로파일러 — `python -X importtime` 결과를 모듈/패키지별로 집계.
+
+새 인터프리터에서 대상 모듈(기본 app.main)을 import 하며 CPython 의 importtime 로그를 수집하고,
+누적(cumulative) 시간 상위 모듈과 최상위 패키지별 자체(self) 시간 합계를 출력한다.
+지연 로딩 대상이어야 할 무거운 의존성(pydub, langgraph, openai, neo4j 등)이 기동 시 로딩되면 표시한다.
+
+사용:
+    python -m scripts.profile_startup_imports
+    python -m scripts.profile_startup_imports --top 40 --module app.api.v1.audio
+    python -m scripts.profile_startup_imports --json > import_profile.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 기동 시 로딩되면 안 되는 무거운 의존성 (라우터 지연 로딩 대상)
+HEAVY_MODULES = (
+    "pydub", "langgraph", "langchain", "langchain_core", "openai", "anthropic", "neo4j",
+    "pinecone", "celery", "torch", "cv2", "elevenlabs", "googleapiclient",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def run_importtime(module: str) -> Tuple[List[Tuple[str, int, int, int]], float]:
+    """
+    새 프로세스에서 `import <module>` 실행
+
+    Returns:
+        ([(모듈, self_us, cumulative_us, 깊이)], 프로세스 전체 소요 초)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")])))
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        tail = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"import {module} failed:\n{tail[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows, wall
+
+
+def summarize(rows: List[Tuple[str, int, int, int]], top: int) -> Dict[str, object]:
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    loaded = {name for name, _, _, _ in rows}
+    return {
+        "total_ms": round(sum(self_us for _, self_us, _, _ in rows) / 1000, 1),
+        "modules": len(rows),
+        "top_cumulative": [
+            {"module": name, "cumulative_ms": round(cum / 1000, 1), "self_ms": round(self_us / 1000, 1)}
+            for name, self_us, cum, _ in sorted(rows, key=lambda r: r[2], reverse=True)[:top]
+        ],
+        "by_package": {
+            package: round(us / 1000, 1)
+            for package, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "heavy_loaded": sorted(m for m in HEAVY_MODULES if m in loaded),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main", help="import 대상 모듈")
+    parser.add_argument("--top", type=int, default=25, help="출력할 상위 항목 수")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    args = parser.parse_args()
+
+    rows, wall = run_importtime(args.module)
+    report = summarize(rows, args.top)
+    report["wall_seconds"] = round(wall, 3)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"import {args.module}: {report['total_ms']} ms in {report['modules']} modules "
+          f"(process wall {report['wall_seconds']} s)\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for entry in report["top_cumulative"]:
+        print(f"{entry['cumulative_ms']:>14} {entry['self_ms']:>9}  {entry['module']}")
+    print(f"\n{'self ms':>14}  package")
+    for package, ms in report["by_package"].items():
+        print(f"{ms:>14}  {package}")
+    if report["heavy_loaded"]:
+        print(f"\n⚠️  heavy modules loaded at startup: {', '.join(report['heavy_loaded'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
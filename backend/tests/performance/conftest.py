@@ -0,0 +1,137 @@
+"""
+CPU 핫패스 마이크로 벤치마크 공통 설정 + 합성 픽스처
+
+실행 (app.main 을 import 하는 상위 conftest 는 --confcutdir 로 제외):
+    make bench           # 저장된 기준선 대비 비교, BENCH_THRESHOLD 초과 회귀 시 실패
+    make bench-baseline  # 현재 결과를 기준선으로 저장 (tests/performance/.benchmarks)
+
+기준선은 머신별 디렉토리(예: Linux-CPython-3.11-64bit)에 저장되므로
+CI 러너에서 만든 기준선을 커밋해 같은 러너에서 비교한다.
+비교할 기준선이 없으면 (pytest-benchmark 는 경고만 남기므로) 세션을 실패로 종료한다.
+"""
+import logging
+import random
+
+import pytest
+
+# 모든 픽스처는 고정 시드 — 실행마다 같은 입력
+SEED = 20260101
+
+
+def pytest_sessionstart(session):
+    """--benchmark-compare 대상 기준선이 없으면 실패 (비교 없이 통과하는 것 방지)"""
+    benchmark_session = getattr(session.config, "_benchmarksession", None)
+    if benchmark_session is None or not benchmark_session.compare:
+        return
+    compare = None if benchmark_session.compare is True else benchmark_session.compare
+    if not list(benchmark_session.storage.load(compare)):
+        pytest.exit(
+            f"benchmark baseline {benchmark_session.compare!r} not found in "
+            f"{benchmark_session.storage} — run `make bench-baseline` on this machine and commit it",
+            returncode=1,
+        )
+
+_WORDS = [
+    "여러분", "오늘은", "영상", "제작", "자동화", "방법을", "소개합니다", "마케팅",
+    "콘텐츠", "효과적으로", "만드는", "핵심은", "타겟", "고객을", "이해하는", "것입니다",
+    "병원", "학원", "매장", "홍보", "전략", "성과", "분석", "결과",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(5, 10))]
+    # 정규화 대상 숫자 표현 섞기 (날짜/금액/퍼센트/전화번호/개수)
+    extras = [
+        f"{rng.randint(2000, 2030)}년 {rng.randint(1, 12)}월 {rng.randint(1, 28)}일",
+        f"{rng.randint(1, 99) * 1000:,}원",
+        f"{rng.randint(1, 99)}.{rng.randint(0, 9)}%",
+        f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        f"{rng.randint(1, 9)}개",
+    ]
+    words.insert(rng.randint(0, len(words)), rng.choice(extras))
+    return " ".join(words) + "."
+
+
+@pytest.fixture
+def bare():
+    """외부 클라이언트(OpenAI/Neo4j/TTS)를 만드는 __init__ 을 건너뛴 인스턴스 팩토리
+
+    벤치마크 대상 메서드는 순수 계산이라 logger 외 인스턴스 상태가 필요 없다.
+    """
+    def build(cls):
+        instance = cls.__new__(cls)
+        instance.logger = logging.getLogger(f"benchmark.{cls.__name__}")
+        return instance
+    return build
+
+
+@pytest.fixture(scope="session")
+def korean_script():
+    """약 60초 분량 한국어 스크립트 (마크다운 헤더 + 숫자 표현 포함)"""
+    rng = random.Random(SEED)
+    sections = []
+    for header in ("### 훅 (첫 3초)", "### 본문", "### CTA"):
+        sections.append(header)
+        sections.extend(_sentence(rng) for _ in range(6))
+    return "\n".join(sections)
+
+
+@pytest.fixture(scope="session")
+def transcript_pair():
+    """(원본, STT 전사) — 일부 단어가 바뀐 약 500자 텍스트"""
+    rng = random.Random(SEED + 1)
+    original = " ".join(_sentence(rng) for _ in range(12))
+    words = original.split()
+    for i in rng.sample(range(len(words)), k=len(words) // 15):
+        words[i] = rng.choice(_WORDS)
+    return original, " ".join(words)
+
+
+@pytest.fixture(scope="session")
+def subtitle_segments():
+    """10분 분량 자막 세그먼트 300개 (start/end/text dict)"""
+    rng = random.Random(SEED + 2)
+    segments, t = [], 0.0
+    for _ in range(300):
+        duration = rng.uniform(1.0, 3.0)
+        segments.append({"start": round(t, 3), "end": round(t + duration, 3), "text": _sentence(rng)})
+        t += duration
+    return segments
+
+
+@pytest.fixture(scope="session")
+def whisper_segment_dicts():
+    """Whisper 세그먼트 20개 + 그 중 연속 3개를 이어 붙인 슬라이드 스크립트"""
+    rng = random.Random(SEED + 3)
+    segments, t = [], 0.0
+    for i in range(20):
+        duration = rng.uniform(2.0, 5.0)
+        segments.append({"id": i, "start": round(t, 3), "end": round(t + duration, 3), "text": _sentence(rng)})
+        t += duration
+    script = " ".join(seg["text"] for seg in segments[8:11])
+    return script, segments
+
+
+@pytest.fixture(scope="session")
+def word_timestamps():
+    """(word, start, end) 3000개 — 약 15분 분량 단어 타임스탬프"""
+    rng = random.Random(SEED + 4)
+    words, t = [], 0.0
+    for _ in range(3000):
+        duration = rng.uniform(0.15, 0.45)
+        words.append((rng.choice(_WORDS), round(t, 3), round(t + duration, 3)))
+        t += duration + rng.uniform(0.0, 0.1)
+    return words
+
+
+@pytest.fixture(scope="session")
+def voice_segments():
+    """BGM 덕킹용 음성 구간 500개 (일부 겹침/인접 구간 포함)"""
+    rng = random.Random(SEED + 5)
+    segments, t = [], 0.0
+    for _ in range(500):
+        start = t + rng.uniform(-0.1, 0.8)
+        end = start + rng.uniform(0.5, 4.0)
+        segments.append((max(0.0, round(start, 3)), round(end, 3)))
+        t = end
+    return segments
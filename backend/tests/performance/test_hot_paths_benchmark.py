@@ -0,0 +1,84 @@
+"""
+CPU 핫패스 마이크로 벤치마크 (pytest-benchmark)
+
+locustfile.py 와 달리 실행 중인 스택 없이 합성 픽스처로 순수 계산 경로만 측정.
+저장된 기준선 대비 BENCH_THRESHOLD(%) 이상 느려지면 `make bench` 가 실패한다.
+"""
+import pytest
+
+pytestmark = pytest.mark.performance
+
+
+def test_bench_normalize_script(benchmark, korean_script):
+    """KoreanTextNormalizer.normalize_script — 숫자/퍼센트/전화번호 한글 변환"""
+    from app.services.text_normalizer import KoreanTextNormalizer
+
+    normalizer = KoreanTextNormalizer()
+    normalized, mappings = benchmark(normalizer.normalize_script, korean_script)
+
+    assert mappings and "%" not in normalized
+
+
+def test_bench_calculate_similarity(benchmark, bare, transcript_pair):
+    """AudioCorrectionLoop.calculate_similarity — 원본 vs STT 전사 유사도"""
+    from app.services.audio_correction_loop import AudioCorrectionLoop
+
+    loop = bare(AudioCorrectionLoop)
+    similarity = benchmark(loop.calculate_similarity, *transcript_pair)
+
+    assert 0.5 < similarity < 1.0
+
+
+def test_bench_match_script_to_segments(benchmark, bare, whisper_segment_dicts):
+    """SlideTimingAnalyzer.match_script_to_segments — 연속 세그먼트 그룹 탐색"""
+    from app.models.neo4j_models import WhisperSegmentModel
+    from app.services.slide_timing_analyzer import SlideTimingAnalyzer
+
+    script, segment_dicts = whisper_segment_dicts
+    segments = [WhisperSegmentModel(**seg) for seg in segment_dicts]
+    analyzer = bare(SlideTimingAnalyzer)
+    indices = benchmark(analyzer.match_script_to_segments, script, segments)
+
+    assert indices == [8, 9, 10]
+
+
+def test_bench_generate_srt_content(benchmark, bare, subtitle_segments):
+    """SubtitleService._generate_srt_content — 300개 세그먼트 SRT 직렬화"""
+    from app.services.subtitle_service import SubtitleService
+
+    service = bare(SubtitleService)
+    srt = benchmark(service._generate_srt_content, subtitle_segments)
+
+    assert srt.startswith("1\n00:00:00,000 --> ")
+
+
+@pytest.mark.parametrize("fmt", ["srt", "vtt"])
+def test_bench_localized_subtitle_builders(benchmark, subtitle_segments, fmt):
+    """subtitle_localization.build_srt / build_vtt — 번역 자막 파일 직렬화"""
+    from app.services.subtitle_localization import build_srt, build_vtt
+
+    builder = build_srt if fmt == "srt" else build_vtt
+    content = benchmark(builder, subtitle_segments)
+
+    assert content.count("-->") == len(subtitle_segments)
+
+
+def test_bench_build_ducking_filter(benchmark, bare, voice_segments, tmp_path):
+    """BGMEditorService.build_ducking_filter — 500개 음성 구간 엔벨로프 컴파일 + sendcmd 기록"""
+    from app.services.bgm_editor_service import BGMEditorService
+
+    editor = bare(BGMEditorService)
+    sendcmd_path = str(tmp_path / "duck.cmd")
+    af = benchmark(editor.build_ducking_filter, voice_segments, 0.3, 0.3, sendcmd_path)
+
+    assert "asendcmd" in af
+
+
+def test_bench_map_timestamps_to_blocks(benchmark, word_timestamps):
+    """whisper_timestamp_service.map_timestamps_to_blocks — 3000 단어 → 블록 타이밍"""
+    from app.services.whisper_timestamp_service import WordTimestamp, map_timestamps_to_blocks
+
+    timestamps = [WordTimestamp(word=w, start=s, end=e) for w, s, e in word_timestamps]
+    blocks = benchmark(map_timestamps_to_blocks, timestamps)
+
+    assert len(blocks) == 5
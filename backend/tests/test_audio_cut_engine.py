@@ -0,0 +1,57 @@
+"""
+Audio Cut Engine 테스트 (샘플 단위 무음 감지, 구간 병합, 컷 경계 페이드)
+"""
+import numpy as np
+
+from app.services.audio_cut_engine import (
+    detect_silence,
+    iter_kept_blocks,
+    keep_ranges,
+    merge_ranges,
+    seconds_to_ranges,
+)
+
+RATE = 1000
+
+
+def _signal(*parts):
+    """(길이 샘플, 진폭) 조각들을 이어 붙인 스테레오 int16 신호"""
+    chunks = [np.full((length, 2), amplitude, dtype=np.int16) for length, amplitude in parts]
+    return np.concatenate(chunks)
+
+
+def test_detect_silence_is_sample_accurate_across_chunks():
+    # 앞 무음 30 (짧아도 제거) / 소리 500 / 무음 200 / 소리 100 / 무음 40 (짧음) / 소리 100 / 꼬리 무음 300
+    samples = _signal((30, 0), (500, 8000), (200, 10), (100, -8000), (40, 0), (100, 8000), (300, 0))
+
+    ranges = detect_silence(
+        samples, threshold_db=-40, min_silence_duration=0.1, sample_rate=RATE, chunk_samples=64
+    )
+
+    assert ranges == [(0, 30), (530, 730), (970, 1270)]
+
+
+def test_all_silent_input_is_one_range():
+    samples = np.zeros((500, 2), dtype=np.int16)
+    assert detect_silence(samples, -40, 1.0, sample_rate=RATE) == [(0, 500)]
+
+
+def test_merge_and_keep_ranges_with_fillers():
+    fillers = seconds_to_ranges([(0.1, 0.2), (0.15, 0.3), (0.9, 2.0), (0.5, 0.5)], 1000, sample_rate=RATE)
+    cuts = merge_ranges(fillers + [(300, 350), (600, 700)])
+
+    assert cuts == [(100, 350), (600, 700), (900, 1000)]
+    assert keep_ranges(1000, cuts) == [(0, 100), (350, 600), (700, 900)]
+
+
+def test_kept_blocks_fade_only_at_cut_boundaries():
+    samples = np.full((1000, 2), 1000, dtype=np.int16)
+    keep = [(0, 100), (350, 600), (700, 1000)]
+
+    blocks = list(iter_kept_blocks(samples, keep, fade_samples=9, chunk_samples=64))
+    out = np.concatenate(blocks)
+
+    assert len(out) == 100 + 250 + 300
+    assert out[0, 0] == 1000 and out[-1, 0] == 1000  # 파일 시작/끝은 그대로
+    assert out[99, 0] == 100 and out[100, 0] == 100  # 컷 경계는 0 근처로 페이드
+    assert out[150, 0] == 1000
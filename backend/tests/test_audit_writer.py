@@ -0,0 +1,100 @@
+"""
+AuditWriter 테스트 (큐 적재, 크기/시간 트리거 배치 기록, 그래프 장애 시 스풀 + 재생)
+"""
+import json
+import time
+
+from app.services.audit_writer import AuditWriter
+
+
+class FakeNeo4j:
+    """UNWIND 배치 호출 기록 (down=True 면 연결 실패)"""
+
+    def __init__(self):
+        self.batches = []
+        self.down = False
+
+    def query(self, cypher, params):
+        if self.down:
+            raise ConnectionError("graph unavailable")
+        assert "UNWIND $events" in cypher
+        self.batches.append(list(params["events"]))
+        return [{"written": len(params["events"])}]
+
+
+def _event(i):
+    return {"event_id": f"evt_{i}", "event_type": "login_success", "user_id": "u1",
+            "timestamp": "2026-01-01T00:00:00"}
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_submit_is_queue_only_and_flush_batches(tmp_path):
+    neo4j = FakeNeo4j()
+    writer = AuditWriter(neo4j, spool_path=str(tmp_path / "spool.jsonl"), batch_size=4)
+
+    assert all(writer.submit(_event(i)) for i in range(10))
+    assert neo4j.batches == []  # 요청 경로에서는 그래프 호출 없음
+
+    assert writer.flush() == 10
+    assert [len(b) for b in neo4j.batches] == [4, 4, 2]
+    assert writer.get_stats()["written"] == 10
+
+
+def test_background_thread_flushes_on_size_and_time(tmp_path):
+    neo4j = FakeNeo4j()
+    writer = AuditWriter(neo4j, batch_size=3, flush_interval=0.2)
+    writer.start()
+    try:
+        for i in range(3):
+            writer.submit(_event(i))
+        # 크기 트리거: 주기 전에 3건 배치 기록
+        assert _wait_for(lambda: len(neo4j.batches) == 1, timeout=0.15)
+
+        writer.submit(_event(3))
+        # 시간 트리거: 1건만 있어도 flush_interval 후 기록
+        assert _wait_for(lambda: len(neo4j.batches) == 2)
+        assert [e["event_id"] for e in neo4j.batches[1]] == ["evt_3"]
+    finally:
+        writer.stop()
+
+
+def test_graph_outage_spools_then_replays(tmp_path):
+    neo4j = FakeNeo4j()
+    spool = tmp_path / "spool.jsonl"
+    writer = AuditWriter(neo4j, spool_path=str(spool), batch_size=2)
+
+    neo4j.down = True
+    for i in range(3):
+        writer.submit(_event(i))
+    writer.flush()
+    lines = spool.read_text().splitlines()
+    assert [json.loads(line)["event_id"] for line in lines] == ["evt_0", "evt_1", "evt_2"]
+
+    # 재시도 대기 중에는 그래프를 건너뛰고 스풀로 직행
+    neo4j.down = False
+    writer.submit(_event(3))
+    writer.flush()
+    assert neo4j.batches == [] and len(spool.read_text().splitlines()) == 4
+    assert writer.replay_spool() == 0
+
+    writer._graph_retry_at = 0.0
+    assert writer.replay_spool() == 4
+    assert [len(b) for b in neo4j.batches] == [2, 2]
+    assert not spool.exists()
+
+
+def test_full_queue_spills_to_spool(tmp_path):
+    spool = tmp_path / "spool.jsonl"
+    writer = AuditWriter(FakeNeo4j(), spool_path=str(spool), max_queue_size=2)
+
+    assert all(writer.submit(_event(i)) for i in range(3))
+    assert [json.loads(line)["event_id"] for line in spool.read_text().splitlines()] == ["evt_2"]
+    assert writer.get_stats()["queued"] == 2
@@ -155,6 +155,60 @@ class TestBackgroundSelector:
         assert result['source'] == "dall-e"
         assert result['background_url'] == 'https://cloudinary.com/ai.png'
 
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_and_limits_provider_concurrency(self):
+        """배치 선택 - 동일 요청 dedupe + DALL-E 동시 호출 상한"""
+        active = {"now": 0, "peak": 0}
+
+        async def fake_generate(keywords, visual_concept, style):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return {
+                'image_url': f"https://cloudinary.com/{'-'.join(keywords)}.png",
+                'prompt': 'p',
+                'dall_e_url': 'https://dalle.com/x.png',
+                'width': 1024,
+                'height': 1024
+            }
+
+        selector = BackgroundSelector()
+        selector.image_gen_service = MagicMock()
+        selector.image_gen_service.generate_from_keywords = AsyncMock(side_effect=fake_generate)
+
+        concept = {"mood": "calm"}
+        blocks = [
+            {"block_id": i, "keywords": [f"k{i % 4}"], "visual_concept": concept}
+            for i in range(12)
+        ]
+        results = await selector.batch_select_backgrounds(blocks)
+
+        assert [r["block_id"] for r in results] == list(range(12))
+        assert all(r["success"] for r in results)
+        assert selector.image_gen_service.generate_from_keywords.await_count == 4
+        assert active["peak"] <= BackgroundSelector.PROVIDER_CONCURRENCY["dall-e"]
+        assert results[5]["background"]["background_url"] == "https://cloudinary.com/k1.png"
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_cancelled_selection_as_failure(self):
+        """배치 선택 - gather 결과의 CancelledError 도 블록 실패로 기록"""
+        selector = BackgroundSelector()
+
+        async def select(keywords, visual_concept, prefer_ai, limits=None):
+            if keywords == ["cancel"]:
+                raise asyncio.CancelledError()
+            return {"background_type": "solid_color", "background_url": None, "source": "fallback"}
+
+        selector._select = select
+        results = await selector.batch_select_backgrounds([
+            {"block_id": 1, "keywords": ["cancel"]},
+            {"block_id": 2, "keywords": ["ok"]},
+        ])
+
+        assert results[0]["success"] is False
+        assert results[1]["success"] is True and results[1]["background"]["source"] == "fallback"
+
 
 def test_import_all_modules():
     """모든 모듈 import 테스트"""
@@ -0,0 +1,83 @@
+"""
+배치 진행률 집계 테스트 (chord 하위 작업마다 새 BatchProgressTracker → Redis 공유 아이템 진행률로 전체 집계)
+"""
+from unittest.mock import MagicMock
+
+from app.tasks.progress_tracker import BatchProgressTracker, RedisBatchItemProgress
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """hash 명령만 흉내 내는 인메모리 Redis (decode_responses=True)"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def expire(self, key, seconds):
+        pass
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class BrokenRedis:
+    def pipeline(self):
+        raise ConnectionError("redis down")
+
+
+def _item_tracker(redis, index_total=4):
+    """워커마다 새로 만들어지는 하위 작업 트래커 — 보고된 전체 진행률 기록"""
+    tracker = BatchProgressTracker(
+        task=MagicMock(), project_id="batch_b1", task_name="batch_video_generation",
+        total_items=index_total, item_store=RedisBatchItemProgress(redis, "b1"),
+    )
+    reported = []
+    tracker.base_tracker.update = lambda progress, status, message, metadata=None: reported.append(
+        (progress, metadata)
+    )
+    return tracker, reported
+
+
+def test_item_progress_is_aggregated_across_trackers():
+    redis = FakeRedis()
+
+    for index in range(3):
+        tracker, reported = _item_tracker(redis)
+        tracker.update_item(index, 1.0, "processing", f"영상 {index + 1}/4 생성 완료")
+
+    progress, metadata = reported[-1]
+    assert progress == 0.75  # 단일 트래커 기준이면 0.25 로 되돌아감
+    assert metadata["completed_items"] == 3 and metadata["current_item"] == 2
+
+    tracker, reported = _item_tracker(redis)
+    tracker.update_item(3, 0.0, "processing", "영상 4/4 생성 시작")
+    assert reported[-1][0] == 0.75  # 새 아이템 시작이 완료된 아이템 진행률을 덮어쓰지 않음
+
+
+def test_store_failure_falls_back_to_local_progress():
+    tracker, reported = _item_tracker(BrokenRedis())
+
+    tracker.update_item(1, 1.0, "processing", "영상 2/4 생성 완료")
+
+    assert reported[-1][0] == 0.25
+    assert reported[-1][1]["completed_items"] == 1
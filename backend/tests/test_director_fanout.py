@@ -0,0 +1,114 @@
+"""
+Director Agent 블록 fan-out 테스트
+
+검증 항목:
+    - 블록별 LLM 호출이 동시 실행되되 동시 실행 제한(호출 시점 조회)을 넘지 않음
+    - ChatOpenAI 클라이언트는 이벤트 루프 단위로 캐시
+    - 결과가 블록 순서대로 반영됨
+    - fused 모드는 블록당 1회 호출로 키워드/비주얼/배경을 모두 채움
+    - node_latencies 기록
+
+외부 API 호출: 모두 fake LLM (OPENAI_API_KEY 의존 없음)
+"""
+import asyncio
+import json
+
+import pytest
+
+
+class FakeLLM:
+    """ainvoke 동시 실행 수를 기록하는 가짜 ChatOpenAI."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        content = self.reply(messages[-1].content)
+
+        class Response:
+            pass
+
+        response = Response()
+        response.content = json.dumps(content, ensure_ascii=False)
+        return response
+
+
+def _state(n_blocks):
+    return {
+        "script": "",
+        "campaign_concept": {},
+        "target_duration": 60,
+        "storyboard_blocks": [
+            {"order": i, "script": f"블록 {i} 스크립트", "emotion": "calm", "keywords": []}
+            for i in range(n_blocks)
+        ],
+        "node_latencies": {},
+        "error": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_keywords_fan_out_with_concurrency_limit(monkeypatch):
+    director = pytest.importorskip("app.agents.director_agent")
+
+    llm = FakeLLM(lambda prompt: [prompt.split("블록 ")[1].split(" ")[0]])
+    monkeypatch.setattr(director, "_get_llm", lambda temperature: llm)
+    monkeypatch.setattr(director, "BLOCK_LLM_CONCURRENCY", 3)
+
+    state = await director.extract_keywords(_state(12))
+
+    assert state["error"] is None
+    assert llm.calls == 12
+    assert 1 < llm.peak <= 3
+    assert [b["keywords"] for b in state["storyboard_blocks"]] == [[str(i)] for i in range(12)]
+    assert "extract_keywords" in state["node_latencies"]
+
+
+@pytest.mark.asyncio
+async def test_fused_mode_single_call_per_block(monkeypatch):
+    director = pytest.importorskip("app.agents.director_agent")
+
+    llm = FakeLLM(lambda prompt: {
+        "keywords": ["a", "b"],
+        "visual_concept": {"background_prompt": "sunrise", "transition_from_previous": "zoom"},
+        "background_suggestions": {"suggestions": [{"type": "stock", "search_keywords": ["sun", "sky"]}]},
+    })
+    monkeypatch.setattr(director, "_get_llm", lambda temperature: llm)
+
+    state = await director.direct_blocks(_state(4))
+
+    assert llm.calls == 4
+    block = state["storyboard_blocks"][0]
+    assert block["keywords"] == ["a", "b"]
+    assert block["transition_effect"] == "zoom"
+    assert block["background_type"] == "stock"
+    assert block["background_prompt"] == "sun, sky"
+    assert len(state["background_suggestions"]) == 4
+
+
+def test_llm_clients_are_cached_per_event_loop(monkeypatch):
+    director = pytest.importorskip("app.agents.director_agent")
+
+    class FakeChatOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(director, "ChatOpenAI", FakeChatOpenAI)
+    monkeypatch.setattr(director, "_llm_clients", director.weakref.WeakKeyDictionary())
+
+    async def pair():
+        return director._get_llm(0.7), director._get_llm(0.7)
+
+    first_a, first_b = asyncio.run(pair())
+    second_a, _ = asyncio.run(pair())  # storyboard_tasks: 작업마다 새 루프
+
+    assert first_a is first_b
+    assert second_a is not first_a
@@ -0,0 +1,60 @@
+"""Ducking Engine 단위 테스트 — 구간 병합, 게인 엔벨로프, asendcmd 컴파일 (ffmpeg 실행 없음)."""
+from __future__ import annotations
+
+import pytest
+
+from app.services.ducking_engine import (
+    compile_ducking_envelope,
+    merge_voice_segments,
+)
+
+
+def test_merge_overlapping_and_close_segments():
+    segments = [(5.0, 6.0), (0.0, 1.0), (0.8, 2.0), (2.3, 3.0)]
+
+    assert merge_voice_segments(segments, merge_gap=0.5) == [(0.0, 3.0), (5.0, 6.0)]
+    assert merge_voice_segments(segments, merge_gap=0.0) == [(0.0, 2.0), (2.3, 3.0), (5.0, 6.0)]
+
+
+def test_envelope_ramps_between_full_and_duck_gain():
+    env = compile_ducking_envelope([(2.0, 4.0)], duck_gain=0.2, attack=0.5, release=1.0)
+
+    assert env.gain_at(0.0) == 1.0
+    assert env.gain_at(1.75) == pytest.approx(0.6)  # attack 중간
+    assert env.gain_at(3.0) == 0.2
+    assert env.gain_at(4.5) == pytest.approx(0.6)   # release 중간
+    assert env.gain_at(6.0) == 1.0
+
+
+def test_gaps_shorter_than_ramps_stay_ducked():
+    env = compile_ducking_envelope([(1.0, 2.0), (2.3, 3.0)], duck_gain=0.3, attack=0.2, release=0.3)
+
+    assert env.intervals == ((1.0, 3.0),)
+    assert env.gain_at(2.15) == 0.3
+
+
+def test_filter_chain_is_constant_size():
+    few = compile_ducking_envelope([(1.0, 2.0)], duck_gain=0.3)
+    many = compile_ducking_envelope(
+        [(i * 3.0, i * 3.0 + 1.5) for i in range(300)], duck_gain=0.3
+    )
+
+    assert few.to_filter("duck.cmd", 0.3) == many.to_filter("duck.cmd", 0.3)
+    assert many.to_filter("duck.cmd", 0.3).count(",") == 2
+    assert len(many.to_sendcmd().strip().splitlines()) == 2 * len(many.intervals)
+
+
+def test_sendcmd_commands_are_sorted_and_quoted():
+    env = compile_ducking_envelope([(3.0, 4.0), (0.1, 1.0)], duck_gain=0.25, attack=0.2, release=0.5)
+    lines = env.to_sendcmd().strip().splitlines()
+
+    times = [float(line.split()[0]) for line in lines]
+    assert times == sorted(times)
+    assert times[0] == 0.0  # 첫 attack 이 0 이전이면 0으로 클램프
+    assert all("volume@duck volume '" in line and line.endswith("';") for line in lines)
+
+
+def test_no_segments_falls_back_to_plain_volume():
+    env = compile_ducking_envelope([], duck_gain=0.3)
+
+    assert env.to_filter("duck.cmd", 0.4) == "volume=0.4"
@@ -0,0 +1,160 @@
+"""
+DurationModel 테스트 (음성별 보정, 배치 flush, 주기적 재조회, warm start, 계산기 연결)
+"""
+import threading
+
+import pytest
+
+from app.services.duration_calculator import DurationCalculator, Language, set_duration_model
+from app.services.duration_model import ANY, MIN_SAMPLES, DurationModel
+
+
+class FakeNeo4j:
+    """query(cypher, params) 호출 기록 + 준비된 응답"""
+
+    def __init__(self, stats_rows=None, history_rows=None):
+        self.calls = []
+        self.stats_rows = stats_rows or []
+        self.history_rows = history_rows or []
+
+    def query(self, cypher, params):
+        self.calls.append((cypher, params))
+        if "MATCH (m:DurationModelStats)" in cypher:
+            return self.stats_rows
+        if "MATCH (lr:LearningRecord)" in cypher:
+            return self.history_rows
+        if "UNWIND $stats" in cypher:
+            return [
+                {**{k: s[k] for k in ("language", "voice_id", "platform", "count")},
+                 "log_factor": s["log_sum"] / s["count"], "abs_pct_error": s["error_sum"] / s["count"]}
+                for s in params["stats"]
+            ]
+        return []
+
+
+def test_per_voice_factor_after_min_samples_without_db_writes():
+    neo4j = FakeNeo4j()
+    model = DurationModel(neo4j, batch_size=100)
+
+    for _ in range(MIN_SAMPLES):
+        model.observe("ko", raw_predicted=10.0, actual=12.0, voice_id="slow", platform="YouTube")
+    model.observe("ko", raw_predicted=10.0, actual=8.0, voice_id="fast")
+
+    assert model.factor("ko", "slow", "youtube") == pytest.approx(1.2)
+    # 표본 부족 → 언어 수준 (4건 평균)
+    assert 0.9 < model.factor("ko", "fast") < 1.2
+    assert model.factor("en") == 1.0
+    assert neo4j.calls == []
+
+
+def test_flush_batches_records_and_stat_deltas():
+    neo4j = FakeNeo4j()
+    model = DurationModel(neo4j)
+    for actual in (11.0, 12.0):
+        model.observe("ko", raw_predicted=10.0, actual=actual, voice_id="v1", text="안녕하세요")
+
+    assert model.flush() == 2
+    (records_query, records_params), (stats_query, stats_params) = neo4j.calls
+    assert "UNWIND $records" in records_query and len(records_params["records"]) == 2
+    keys = {(s["language"], s["voice_id"], s["platform"]) for s in stats_params["stats"]}
+    assert keys == {("ko", "v1", ANY), ("ko", ANY, ANY)}
+    assert all(s["count"] == 2 for s in stats_params["stats"])
+
+    assert model.flush() == 0
+    assert len(neo4j.calls) == 2
+
+
+def test_failed_flush_keeps_pending_data():
+    class FailingNeo4j(FakeNeo4j):
+        def query(self, cypher, params):
+            raise ConnectionError("down")
+
+    model = DurationModel(FailingNeo4j())
+    model.observe("ko", raw_predicted=10.0, actual=11.0)
+    assert model.flush() == 0
+
+    neo4j = FakeNeo4j()
+    model.neo4j = neo4j
+    assert model.flush() == 1
+    assert neo4j.calls[1][1]["stats"][0]["count"] == 1
+
+
+def test_refresh_picks_up_stats_learned_by_other_processes():
+    row = {"language": "ko", "voice_id": ANY, "platform": ANY, "count": 10,
+           "log_factor": 0.2, "abs_pct_error": 0.1}
+    neo4j = FakeNeo4j()
+    model = DurationModel(neo4j)  # API 프로세스 — 관측 없음, warm start 시점엔 통계 없음
+    model.warm_start()
+    assert model.factor("ko") == 1.0
+
+    neo4j.stats_rows = [row]
+    assert model.refresh() == 1
+    assert model.factor("ko") == pytest.approx(1.2214, abs=1e-4)
+
+    # flush 대기 중인 관측이 있는 키는 덮어쓰지 않음
+    model.observe("ko", raw_predicted=10.0, actual=10.0)
+    neo4j.stats_rows = [{**row, "count": 50, "log_factor": 0.0}]
+    assert model.refresh() == 0
+    assert model.factor("ko") > 1.0
+
+
+def test_background_thread_refreshes_without_pending_observations():
+    refreshed = threading.Event()
+
+    class RecordingNeo4j(FakeNeo4j):
+        def query(self, cypher, params):
+            if "MATCH (m:DurationModelStats)" in cypher:
+                refreshed.set()
+            return super().query(cypher, params)
+
+    model = DurationModel(RecordingNeo4j(), flush_interval=0.01, refresh_interval=0.0)
+    model.start()
+    try:
+        assert refreshed.wait(2.0)
+    finally:
+        model.stop()
+
+
+def test_warm_start_from_history_rolls_up_levels_and_drives_calculator():
+    history = [
+        {"language": "ko", "voice_id": "v1", "platform": "youtube", "count": 6,
+         "log_factor": 0.2, "abs_pct_error": 0.1},
+        {"language": "ko", "voice_id": "v2", "platform": ANY, "count": 2,
+         "log_factor": -0.2, "abs_pct_error": 0.1},
+    ]
+    model = DurationModel(FakeNeo4j(history_rows=history))
+    assert model.warm_start() == 4
+
+    set_duration_model(model)
+    try:
+        calculator = DurationCalculator(Language.KO)
+        text = "가" * 200  # 기본 60초
+        assert calculator.calculate(text, voice_id="v1", platform="youtube")["duration"] == pytest.approx(73.3, abs=0.1)
+        # v2 는 표본 부족 → 언어 수준 (가중 평균 log 0.1)
+        assert calculator.calculate(text, voice_id="v2")["correction_factor"] == pytest.approx(1.105, abs=1e-3)
+    finally:
+        set_duration_model(None)
+
+
+def test_prediction_callers_pass_voice_and_platform():
+    from app.services.slide_to_script_converter import estimate_presentation_duration
+
+    class RecordingModel:
+        def __init__(self):
+            self.keys = []
+
+        def factor(self, language, voice_id=None, platform=None):
+            self.keys.append((language, voice_id, platform))
+            return 1.5 if voice_id == "slow" else 1.0
+
+    model = RecordingModel()
+    set_duration_model(model)
+    try:
+        slides = [{"title": "제목", "content": "가" * 198}]
+        base = estimate_presentation_duration(slides)["total_duration"]
+        slow = estimate_presentation_duration(slides, voice_id="slow", platform="TikTok")["total_duration"]
+    finally:
+        set_duration_model(None)
+
+    assert slow == pytest.approx(base * 1.5, abs=0.1)
+    assert ("ko", "slow", "TikTok") in model.keys
@@ -0,0 +1,42 @@
+"""
+Format Transcoder 테스트 (중앙 크롭, 마스터 스케일, 트랜스코딩 명령)
+"""
+import pytest
+
+from app.services.format_transcoder import (
+    FORMAT_SIZES,
+    FormatTranscoder,
+    center_crop,
+    master_render_scale,
+    required_master_scale,
+)
+
+
+def test_center_crop_keeps_target_aspect_and_centers():
+    vertical = center_crop((3840, 2160), (1080, 1920))
+    assert (vertical.width, vertical.height) == (1214, 2160)
+    assert vertical.x == (3840 - 1214) // 2 and vertical.y == 0
+
+    square = center_crop((1080, 1920), (1080, 1080))
+    assert (square.width, square.height, square.x, square.y) == (1080, 1080, 0, 420)
+
+    same = center_crop((1920, 1080), (1920, 1080))
+    assert same.filter == "crop=1920:1080:0:0"
+
+
+def test_master_scale_avoids_upscaling_vertical_crop():
+    targets = FORMAT_SIZES.values()
+    assert required_master_scale((1920, 1080), targets) == pytest.approx(1920 / 1080, rel=1e-2)
+    assert master_render_scale((1920, 1080), targets, max_scale=2.0) == 1.79
+    assert master_render_scale((1920, 1080), targets, max_scale=1.5) == 1.5
+    assert master_render_scale((1920, 1080), [(1280, 720)], max_scale=2.0) == 1.0
+
+
+def test_build_cmd_uses_ios_safe_profile():
+    cmd = FormatTranscoder().build_cmd("master.mp4", (3418, 1922), (1080, 1920), "tiktok.mp4", threads=4)
+
+    vf = cmd[cmd.index("-vf") + 1]
+    assert vf.startswith("crop=1080:1922:1169:0,scale=1080:1920")
+    for flag, value in (("-pix_fmt", "yuv420p"), ("-r", "30"), ("-c:a", "aac"), ("-threads", "4")):
+        assert cmd[cmd.index(flag) + 1] == value
+    assert cmd[-1] == "tiktok.mp4"
@@ -0,0 +1,130 @@
+"""
+라우터 지연 로딩 테스트 (첫 요청 시 해당 라우터만 import, 선언 순서 보존, 선언-라우트 일치, 기동 import 예산)
+"""
+import json
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.lazy_router import LazyRouterLoader, LazyRouterMiddleware, RouterSpec
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 기동 시 import 되면 안 되는 무거운 의존성
+HEAVY_MODULES = ["pydub", "langgraph", "openai", "neo4j"]
+
+# 콜드 스타트 (`import app.main`) 예산 — CI 러너에 맞게 환경변수로 조정
+STARTUP_IMPORT_BUDGET_SECONDS = float(os.environ.get("STARTUP_IMPORT_BUDGET_SECONDS", "3.0"))
+
+
+def _fake_router_module(monkeypatch, name, build):
+    """sys.modules 에 가짜 라우터 모듈 등록 (RouterSpec.module 로 import 됨)"""
+    router = APIRouter()
+    build(router)
+    module = types.ModuleType(name)
+    module.router = router
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+def _app(monkeypatch):
+    def items(router):
+        @router.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"router": "items", "id": item_id}
+
+    def catch_all(router):
+        @router.get("/{anything}")
+        async def get_any(anything: str):
+            return {"router": "catch_all"}
+
+        @router.get("/items/special")
+        async def special():
+            return {"router": "catch_all"}
+
+    _fake_router_module(monkeypatch, "fake_items", items)
+    _fake_router_module(monkeypatch, "fake_catch_all", catch_all)
+
+    app = FastAPI()
+    specs = [
+        RouterSpec(module="fake_items", paths=("/items",)),
+        RouterSpec(module="fake_catch_all", paths=("/items", "/misc")),
+    ]
+    loader = LazyRouterLoader(app, specs, mount_prefix="/api")
+    app.add_middleware(LazyRouterMiddleware, loader=loader)
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    return app, loader
+
+
+def test_router_loads_on_first_matching_request(monkeypatch):
+    app, loader = _app(monkeypatch)
+    client = TestClient(app)
+
+    assert client.get("/health").json() == {"ok": True}
+    assert loader.get_stats()["loaded"] == 0  # API 외 경로는 로딩 없음
+
+    assert client.get("/api/misc").json() == {"router": "catch_all"}
+    assert loader.get_stats()["loaded"] == 1 and not loader.fully_loaded
+
+
+def test_registration_order_follows_declaration(monkeypatch):
+    app, loader = _app(monkeypatch)
+    client = TestClient(app)
+
+    # catch_all 이 먼저 로딩돼도 선언 순서상 앞선 items 가 우선 매칭
+    client.get("/api/misc")
+    assert client.get("/api/items/special").json() == {"router": "items", "id": "special"}
+    assert loader.fully_loaded
+
+
+def test_openapi_and_undeclared_paths_load_everything(monkeypatch):
+    app, loader = _app(monkeypatch)
+    paths = TestClient(app).get("/openapi.json").json()["paths"]
+    assert "/api/items/{item_id}" in paths and "/api/{anything}" in paths
+
+    app, loader = _app(monkeypatch)
+    assert TestClient(app).get("/api/unknown/nested").status_code == 404
+    assert loader.fully_loaded
+
+
+def test_router_specs_cover_every_route():
+    """선언된 paths 밖의 라우트가 있으면 해당 경로 첫 요청이 404 (선언 누락)"""
+    from app.api.v1 import ROUTER_SPECS
+
+    app = FastAPI()
+    loader = LazyRouterLoader(app, ROUTER_SPECS, mount_prefix="/api/v1")
+    for spec in ROUTER_SPECS:
+        paths = [getattr(r, "path", None) for r in loader._build(spec)]  # Mount 등 path 없는 라우트 제외
+        uncovered = [p for p in paths if p is not None and not spec.owns(p[len("/api/v1"):] or "/")]
+        assert not uncovered, f"{spec.name}: paths 선언 누락 {uncovered}"
+
+
+def test_app_cold_import_is_lazy_and_within_budget():
+    """새 인터프리터에서 `import app.main` — 무거운 의존성 미로딩 + 시간 예산"""
+    code = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        "import app.main\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    assert result["heavy"] == [], f"기동 시 로딩된 무거운 의존성: {result['heavy']} (scripts/profile_startup_imports.py 로 확인)"
+    assert result["elapsed"] < STARTUP_IMPORT_BUDGET_SECONDS, (
+        f"import app.main {result['elapsed']:.2f}s > 예산 {STARTUP_IMPORT_BUDGET_SECONDS}s"
+    )
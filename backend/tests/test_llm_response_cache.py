@@ -0,0 +1,135 @@
+"""LLMResponseCache 단위 테스트 — 가짜 LangChain chat 모델로 task 프리셋별 캐시 검증."""
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.llm_response_cache import LLMResponseCache, build_cache_key
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 헬퍼
+# ─────────────────────────────────────────────────────────────────────────────
+
+class FakeChatModel:
+    """ChatAnthropic 과 같은 속성(model/temperature/max_tokens)과 ainvoke 를 갖는 가짜 모델"""
+
+    def __init__(self, model="claude-3-haiku-20240307", temperature=0.3, max_tokens=4096):
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.calls = []
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        return SimpleNamespace(
+            content=f"answer #{len(self.calls)}",
+            usage_metadata={"input_tokens": 1000, "output_tokens": 200},
+        )
+
+
+def _messages(user: str, system: str = "콘티 시스템 프롬프트"):
+    return [SimpleNamespace(type="system", content=system), SimpleNamespace(type="human", content=user)]
+
+
+@pytest.fixture
+def llm():
+    return FakeChatModel()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(db_path=str(tmp_path / "llm.sqlite3"), max_entries=100)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+async def test_continuity_is_cached(cache, llm):
+    first = await cache.cached_ainvoke(llm, "continuity", _messages("스크립트 A"))
+    second = await cache.cached_ainvoke(llm, "continuity", _messages("스크립트 A"))
+
+    assert first == second == "answer #1"
+    assert len(llm.calls) == 1
+
+    stats = cache.get_stats()["tasks"]["continuity"]
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 50.0
+    assert stats["saved_usd"] > 0
+
+
+async def test_creative_tasks_are_never_cached(cache):
+    for task in ("writer", "slide_to_script"):
+        llm = FakeChatModel(temperature=0.7)
+        await cache.cached_ainvoke(llm, task, _messages("스크립트"))
+        await cache.cached_ainvoke(llm, task, _messages("스크립트"))
+        assert len(llm.calls) == 2
+
+
+async def test_prompt_or_param_change_is_miss(cache, llm):
+    await cache.cached_ainvoke(llm, "continuity", _messages("씬 A"))
+    await cache.cached_ainvoke(llm, "continuity", _messages("씬 B"))
+    await cache.cached_ainvoke(llm, "continuity", _messages("씬 A", system="다른 시스템 프롬프트"))
+    assert len(llm.calls) == 3
+
+    other = FakeChatModel(max_tokens=50)
+    await cache.cached_ainvoke(other, "continuity", _messages("씬 A"))
+    assert len(other.calls) == 1
+
+
+async def test_expired_entry_is_refetched(tmp_path, llm, monkeypatch):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm.sqlite3"))
+    await cache.cached_ainvoke(llm, "continuity", _messages("검증"))
+
+    import app.services.llm_response_cache as module
+    real_time = module.time.time
+    monkeypatch.setattr(module.time, "time", lambda: real_time() + 8 * 24 * 3600)
+
+    await cache.cached_ainvoke(llm, "continuity", _messages("검증"))
+    assert len(llm.calls) == 2
+
+
+async def test_invalid_reply_is_not_cached(cache, llm):
+    with pytest.raises(json.JSONDecodeError):
+        await cache.cached_ainvoke(llm, "continuity", _messages("깨진 응답"), validate=json.loads)
+    assert cache.get_stats()["entries"] == 0
+
+    async def valid_ainvoke(messages):
+        llm.calls.append(messages)
+        return SimpleNamespace(content='{"scenes": []}', usage_metadata={})
+
+    llm.ainvoke = valid_ainvoke
+    content = await cache.cached_ainvoke(llm, "continuity", _messages("깨진 응답"), validate=json.loads)
+
+    assert content == '{"scenes": []}'
+    assert len(llm.calls) == 2  # 실패한 응답은 재생되지 않고 재호출
+
+
+async def test_cached_entry_failing_validation_is_dropped(cache, llm):
+    await cache.cached_ainvoke(llm, "continuity", _messages("스크립트"))  # 검증 없이 저장된 "answer #1"
+
+    with pytest.raises(json.JSONDecodeError):
+        await cache.cached_ainvoke(llm, "continuity", _messages("스크립트"), validate=json.loads)
+
+    assert len(llm.calls) == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_lru_eviction_caps_entries(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm.sqlite3"), max_entries=3)
+    for i in range(5):
+        cache.put(f"k{i}", "continuity", "claude-3-haiku-20240307", f"v{i}", ttl_seconds=3600)
+
+    assert cache.get_stats()["entries"] == 3
+    assert cache.get("k0") is None
+    assert cache.get("k4")[0] == "v4"
+
+
+def test_key_depends_on_system_prompt():
+    messages = [{"role": "user", "content": "x"}]
+    a = build_cache_key("critic", "gpt-4o-mini", "system A", messages, {"temperature": 0.0})
+    b = build_cache_key("critic", "gpt-4o-mini", "system B", messages, {"temperature": 0.0})
+    assert a != b
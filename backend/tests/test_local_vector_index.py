@@ -0,0 +1,74 @@
+"""
+Local Vector Index 테스트 (Pinecone 호환 upsert/query, 필터, IVF, 영속성)
+"""
+import numpy as np
+import pytest
+
+from app.services.local_vector_index import LocalVectorIndex, matches_filter
+
+
+def _unit(rng, count, dimension=8):
+    vectors = rng.standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_matches_filter_pinecone_operators():
+    metadata = {"views": 150_000, "user_id": "u1", "is_own_content": True}
+
+    assert matches_filter(metadata, {"views": {"$gte": 100_000}})
+    assert matches_filter(metadata, {"user_id": "u1", "is_own_content": {"$eq": True}})
+    assert matches_filter(metadata, {"$or": [{"user_id": "u2"}, {"views": {"$lt": 200_000}}]})
+    assert not matches_filter(metadata, {"user_id": {"$in": ["u2", "u3"]}})
+    # 필드가 없으면 $ne 만 참 (타인 컨텐츠 조회: is_own_content != True)
+    assert matches_filter({"views": 1}, {"is_own_content": {"$ne": True}})
+    assert not matches_filter({"views": 1}, {"user_id": {"$eq": "u1"}})
+    with pytest.raises(ValueError):
+        matches_filter(metadata, {"views": {"$regex": "1"}})
+
+
+def test_upsert_query_filter_and_overwrite(tmp_path):
+    index = LocalVectorIndex(str(tmp_path), dimension=8)
+    rng = np.random.default_rng(0)
+    vectors = _unit(rng, 20)
+
+    index.upsert(vectors=[(f"v{i}", vectors[i].tolist(), {"views": i * 1000}) for i in range(20)])
+
+    result = index.query(vector=vectors[3], top_k=3, include_metadata=True)
+    assert result["matches"][0]["id"] == "v3"
+    assert result["matches"][0]["score"] == pytest.approx(1.0, abs=1e-5)
+    assert result["matches"][0]["metadata"] == {"views": 3000}
+
+    filtered = index.query(vector=vectors[3], top_k=5, filter={"views": {"$gte": 15_000}})
+    assert {m["id"] for m in filtered["matches"]} == {f"v{i}" for i in range(15, 20)}
+
+    index.upsert(vectors=[{"id": "v3", "values": vectors[7].tolist(), "metadata": {"views": 1}}])
+    assert index.describe_index_stats()["total_vector_count"] == 20
+    assert index.fetch(["v3"])["vectors"]["v3"]["metadata"] == {"views": 1}
+
+    index.delete(ids=["v7"])
+    top = index.query(vector=vectors[7], top_k=1)["matches"][0]
+    assert top["id"] == "v3"
+
+
+def test_ivf_recall_and_reload(tmp_path):
+    rng = np.random.default_rng(1)
+    centers = _unit(rng, 16, dimension=16)
+    labels = rng.integers(0, 16, 3000)
+    vectors = centers[labels] + 0.05 * rng.standard_normal((3000, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index = LocalVectorIndex(str(tmp_path), dimension=16, nprobe=8, train_threshold=1000)
+    for start in range(0, 3000, 500):
+        index.upsert(vectors=[(f"v{i}", vectors[i], {"label": int(labels[i])}) for i in range(start, start + 500)])
+    assert index.describe_index_stats()["ivf_lists"] > 0
+
+    hits = 0
+    for q in range(0, 3000, 100):
+        exact = set(np.argsort(-(vectors @ vectors[q]))[:10].tolist())
+        found = {int(m["id"][1:]) for m in index.query(vector=vectors[q], top_k=10)["matches"]}
+        hits += len(exact & found)
+    assert hits / (30 * 10) >= 0.9
+
+    reopened = LocalVectorIndex(str(tmp_path), dimension=16, nprobe=8, train_threshold=1000)
+    assert reopened.describe_index_stats()["total_vector_count"] == 3000
+    assert reopened.query(vector=vectors[42], top_k=1)["matches"][0]["id"] == "v42"
@@ -0,0 +1,170 @@
+"""MediaProbeService 단위 테스트 — ffprobe 호출 없이 캐시 동작 검증.
+
+_run_ffprobe 를 카운팅 fake 로 교체하여 동일 파일이 두 번 probe 되지 않는지 확인.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services.media_probe_service import (
+    MediaProbeError,
+    MediaProbeService,
+    extract_duration,
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 헬퍼
+# ─────────────────────────────────────────────────────────────────────────────
+
+class CountingProbe:
+    """호출 횟수를 기록하는 가짜 ffprobe."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[str] = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, file_path: str) -> dict:
+        with self._lock:
+            self.calls.append(file_path)
+        if self.delay:
+            time.sleep(self.delay)
+        return {
+            "format": {"duration": str(os.path.getsize(file_path) / 10), "format_name": "mp3"},
+            "streams": [{"codec_type": "audio", "sample_rate": "48000"}],
+        }
+
+
+def _make_file(tmp_path: Path, name: str, size: int = 100) -> str:
+    path = tmp_path / name
+    path.write_bytes(b"\0" * size)
+    return str(path)
+
+
+@pytest.fixture
+def fake_probe() -> CountingProbe:
+    return CountingProbe()
+
+
+@pytest.fixture
+def service(tmp_path: Path, fake_probe: CountingProbe) -> MediaProbeService:
+    svc = MediaProbeService(cache_dir=str(tmp_path / "cache"), memory_entries=8)
+    svc._run_ffprobe = fake_probe
+    return svc
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 캐시 동작
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_memory_cache_hit(service, fake_probe, tmp_path):
+    path = _make_file(tmp_path, "a.mp3")
+
+    assert service.get_duration(path) == 10.0
+    assert service.get_duration(path) == 10.0
+
+    assert len(fake_probe.calls) == 1
+    stats = service.get_stats()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_disk_cache_shared_across_instances(service, fake_probe, tmp_path):
+    path = _make_file(tmp_path, "a.mp3")
+    service.probe(path)
+
+    other_probe = CountingProbe()
+    other = MediaProbeService(cache_dir=str(tmp_path / "cache"))
+    other._run_ffprobe = other_probe
+
+    assert other.get_duration(path) == 10.0
+    assert other_probe.calls == []
+    assert other.get_stats()["disk_hits"] == 1
+
+
+def test_modified_file_is_reprobed(service, fake_probe, tmp_path):
+    path = _make_file(tmp_path, "a.mp3", size=100)
+    assert service.get_duration(path) == 10.0
+
+    Path(path).write_bytes(b"\0" * 200)
+    assert service.get_duration(path) == 20.0
+    assert len(fake_probe.calls) == 2
+
+
+def test_lru_eviction(service, fake_probe, tmp_path):
+    paths = [_make_file(tmp_path, f"{i}.mp3") for i in range(10)]
+    for p in paths:
+        service.probe(p)
+
+    assert service.get_stats()["memory_entries"] == 8
+
+
+def test_missing_file_raises(service, tmp_path):
+    with pytest.raises(MediaProbeError):
+        service.probe(str(tmp_path / "missing.mp3"))
+
+
+def test_failures_are_not_cached(service, tmp_path):
+    path = _make_file(tmp_path, "a.mp3")
+    calls = []
+
+    def failing(file_path):
+        calls.append(file_path)
+        raise MediaProbeError("boom")
+
+    service._run_ffprobe = failing
+    for _ in range(2):
+        with pytest.raises(MediaProbeError):
+            service.probe(path)
+    assert len(calls) == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 배치 / 동시성
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_probe_many_dedupes_and_preserves_order(service, fake_probe, tmp_path):
+    a = _make_file(tmp_path, "a.mp3", size=100)
+    b = _make_file(tmp_path, "b.mp3", size=300)
+
+    durations = service.get_durations([a, b, a, b, a])
+
+    assert durations == [10.0, 30.0, 10.0, 30.0, 10.0]
+    assert sorted(fake_probe.calls) == sorted([a, b])
+
+
+def test_concurrent_probe_same_file_runs_once(tmp_path):
+    slow_probe = CountingProbe(delay=0.05)
+    svc = MediaProbeService(cache_dir=None)
+    svc._run_ffprobe = slow_probe
+    path = _make_file(tmp_path, "a.mp3")
+
+    threads = [threading.Thread(target=svc.probe, args=(path,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(slow_probe.calls) == 1
+
+
+async def test_async_durations(service, fake_probe, tmp_path):
+    paths = [_make_file(tmp_path, f"{i}.mp3", size=(i + 1) * 10) for i in range(4)]
+
+    durations = await service.aget_durations(paths)
+
+    assert durations == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_extract_duration_falls_back_to_streams():
+    probe = {"format": {}, "streams": [{"duration": "3.5"}, {"duration": "4.0"}]}
+    assert extract_duration(probe) == 4.0
+
+    with pytest.raises(MediaProbeError):
+        extract_duration({"format": {}, "streams": []})
@@ -0,0 +1,142 @@
+"""
+목록 페이지네이션 테스트 (cursor 인코딩, Neo4j 쿼리 push-down, 개수 캐시 무효화)
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.neo4j_models import Neo4jCRUDManager, ProjectStatus
+from app.models.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+class FakeNeo4jClient:
+    """실행된 쿼리/파라미터를 기록하고 고정 결과를 반환"""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.calls = []
+
+    def query(self, cypher, parameters=None, **kwargs):
+        self.calls.append((cypher, dict(parameters or {})))
+        return [dict(row) for row in self.rows]
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, "proj_123")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at.isoformat(), "proj_123")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("yesterday", "x")])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_when_page_is_full():
+    items = [
+        {"project_id": "b", "created_at": "2025-03-02T00:00:00"},
+        {"project_id": "a", "created_at": "2025-03-01T00:00:00"},
+    ]
+
+    assert next_cursor(items, 3, "project_id") is None
+    assert decode_cursor(next_cursor(items, 2, "project_id")) == ("2025-03-01T00:00:00", "a")
+
+
+def test_user_projects_page_is_sliced_in_query():
+    client = FakeNeo4jClient()
+    crud = Neo4jCRUDManager(client)
+
+    crud.get_user_projects("user_1", status=ProjectStatus.DRAFT, skip=40, limit=20)
+
+    cypher, params = client.calls[0]
+    assert "SKIP $skip" in cypher and "LIMIT $limit" in cypher
+    assert cypher.index("LIMIT $limit") < cypher.index("OPTIONAL MATCH")
+    assert params == {"user_id": "user_1", "status": "draft", "skip": 40, "limit": 20}
+
+
+def test_user_projects_keyset_cursor():
+    client = FakeNeo4jClient()
+    crud = Neo4jCRUDManager(client)
+    cursor = encode_cursor("2025-03-01T00:00:00+00:00", "proj_9")
+
+    crud.get_user_projects("user_1", limit=10, cursor=cursor)
+
+    cypher, params = client.calls[0]
+    assert "proj.created_at < datetime($cursor_created_at)" in cypher
+    assert "SKIP" not in cypher
+    assert params["cursor_created_at"] == "2025-03-01T00:00:00+00:00"
+    assert params["cursor_id"] == "proj_9"
+
+
+def test_project_scripts_keyset_cursor_on_version():
+    client = FakeNeo4jClient()
+    crud = Neo4jCRUDManager(client)
+    rows = [{"script_id": "s_b", "version": 3}, {"script_id": "s_a", "version": 2}]
+    cursor = next_cursor(rows, 2, "script_id", sort_field="version")
+
+    crud.get_project_scripts("proj_1", limit=2, cursor=cursor)
+
+    cypher, params = client.calls[0]
+    assert "s.version < $cursor_sort" in cypher
+    assert cypher.index("WHERE") < cypher.index("RETURN")
+    assert "SKIP" not in cypher
+    assert params["cursor_sort"] == 2 and params["cursor_id"] == "s_a"
+
+    with pytest.raises(ValueError):
+        crud.get_project_scripts("proj_1", limit=2, cursor=encode_cursor("2025-03-01T00:00:00", "s_a"))
+
+
+def test_unpaged_calls_keep_full_listing():
+    client = FakeNeo4jClient()
+    crud = Neo4jCRUDManager(client)
+
+    crud.get_project_scripts("proj_1")
+    crud.get_project_videos("proj_1")
+
+    for cypher, params in client.calls:
+        assert "LIMIT" not in cypher and "SKIP" not in cypher
+        assert params == {"project_id": "proj_1"}
+
+
+def test_count_query_returns_total():
+    client = FakeNeo4jClient(rows=[{"total": 57}])
+    crud = Neo4jCRUDManager(client)
+
+    assert crud.count_user_projects("user_1") == 57
+    assert "count(proj)" in client.calls[0][0]
+
+
+def test_project_owner_lookup():
+    client = FakeNeo4jClient(rows=[{"user_id": "user_1"}])
+    crud = Neo4jCRUDManager(client)
+
+    assert crud.get_project_owner_id("proj_1") == "user_1"
+    assert "[:OWNS]->(proj:Project {project_id: $project_id})" in client.calls[0][0]
+    assert Neo4jCRUDManager(FakeNeo4jClient()).get_project_owner_id("missing") is None
+
+
+def test_count_cache_invalidation_deletes_only_owner_keys(monkeypatch):
+    from app.services import cache_service
+
+    class RecordingCache:
+        def __init__(self):
+            self.deleted = []
+
+        def delete(self, key):
+            self.deleted.append(key)
+            return True
+
+        def delete_pattern(self, pattern):
+            raise AssertionError("KEYS 스캔 금지")
+
+    cache = RecordingCache()
+    monkeypatch.setattr(cache_service, "get_cache_service", lambda: cache)
+
+    cache_service.invalidate_project_count_cache("user_1")
+
+    assert cache_service.project_count_cache_key("user_1") in cache.deleted
+    assert cache_service.project_count_cache_key("user_1", ProjectStatus.DRAFT.value) in cache.deleted
+    assert all(key.startswith("count:user_projects:user_1:") for key in cache.deleted)
@@ -0,0 +1,68 @@
+"""ParallelEncoder 단위 테스트 — 세그먼트 분할과 FFmpeg 명령 구성 (ffmpeg 실행 없음)."""
+from __future__ import annotations
+
+from app.services import parallel_encoder
+from app.services.parallel_encoder import EncodeSegment, ParallelEncoder, plan_segments
+
+
+def test_segments_cover_timeline_and_align_to_gop():
+    segments = plan_segments(duration=605.0, fps=30, segment_seconds=60, gop_seconds=2)
+
+    assert sum(s.frame_count for s in segments) == 605 * 30
+    assert all(s.start_frame % 60 == 0 for s in segments)
+    # 연속성: 다음 세그먼트는 이전 세그먼트 끝에서 시작
+    for prev, cur in zip(segments, segments[1:]):
+        assert cur.start_frame == prev.start_frame + prev.frame_count
+
+
+def test_short_tail_is_merged_into_previous_segment():
+    # 121초 = 60 + 60 + 1 → 1초(GOP 미만) 꼬리는 마지막 세그먼트에 합침
+    segments = plan_segments(duration=121.0, fps=30, segment_seconds=60, gop_seconds=2)
+
+    assert len(segments) == 2
+    assert segments[-1].frame_count == 61 * 30
+
+
+def test_segment_length_rounds_down_to_gop_multiple():
+    segments = plan_segments(duration=30.0, fps=30, segment_seconds=7, gop_seconds=2)
+
+    assert segments[0].frame_count == 6 * 30
+
+
+def test_segment_cmd_is_video_only_with_fixed_gop():
+    encoder = ParallelEncoder(workers=4, gop_seconds=2)
+    seg = EncodeSegment(index=1, start_frame=1800, frame_count=1800, fps=30)
+
+    cmd = encoder.build_segment_cmd("in.mp4", seg, "seg.mp4", video_filter="subtitles=a.srt")
+
+    assert cmd[cmd.index("-ss") + 1] == "60.000000"
+    assert "-copyts" in cmd and "-an" in cmd
+    assert cmd[cmd.index("-vf") + 1] == "subtitles=a.srt,setpts=PTS-STARTPTS"
+    assert cmd[cmd.index("-g") + 1] == "60"
+    assert cmd[cmd.index("-sc_threshold") + 1] == "0"
+    assert cmd[cmd.index("-frames:v") + 1] == "1800"
+    assert "+faststart" not in cmd
+    assert cmd[-1] == "seg.mp4"
+
+
+def test_stitch_cmd_copies_streams_and_muxes_audio():
+    encoder = ParallelEncoder(workers=2)
+
+    cmd = encoder.build_stitch_cmd("list.txt", "audio.m4a", "out.mp4")
+
+    assert cmd[cmd.index("-f") + 1] == "concat"
+    assert cmd[cmd.index("-c") + 1] == "copy"
+    assert "1:a:0?" in cmd and "-shortest" in cmd
+    assert "+faststart" in cmd
+
+    video_only = encoder.build_stitch_cmd("list.txt", None, "out.mp4")
+    assert "-map" not in video_only and "-shortest" not in video_only
+
+
+def test_auto_workers_stay_single_without_spare_cores(monkeypatch):
+    monkeypatch.setattr(parallel_encoder.os, "cpu_count", lambda: 1)
+    assert ParallelEncoder().workers == 1  # VideoRenderer 는 workers < 2 면 단일 프로세스
+
+    monkeypatch.setattr(parallel_encoder.os, "cpu_count", lambda: 16)
+    encoder = ParallelEncoder()
+    assert encoder.workers == 8 and encoder.threads_per_worker == 2
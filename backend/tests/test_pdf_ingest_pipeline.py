@@ -0,0 +1,91 @@
+"""
+PDF Ingest Pipeline 테스트 (페이지 범위 분할, 진행률 콜백, 실패 처리)
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services import pdf_ingest_pipeline
+from app.services.pdf_ingest_pipeline import (
+    PageResult,
+    PDFIngestError,
+    PDFIngestPipeline,
+    plan_page_ranges,
+)
+
+
+def test_plan_page_ranges():
+    assert plan_page_ranges(10, 4) == [(1, 4), (5, 8), (9, 10)]
+    assert plan_page_ranges(3, 4) == [(1, 3)]
+    assert plan_page_ranges(0, 4) == []
+    assert plan_page_ranges(2, 0) == [(1, 1), (2, 2)]
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """프로세스 풀 대신 스레드 풀 + 가짜 워커 (pdf2image/tesseract 불필요)"""
+    pdf_path = tmp_path / "deck.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    def fake_process_page_range(pdf, first, last, dpi, output_dir, prefix, lang, max_width, remove_watermark):
+        return [
+            PageResult(page, f"{output_dir}/{prefix}_{page:03d}.png", f"page {page}")
+            for page in range(first, last + 1)
+        ]
+
+    monkeypatch.setattr(pdf_ingest_pipeline, "process_page_range", fake_process_page_range)
+    monkeypatch.setattr(
+        "app.services.notebooklm_adapter.detect_notebooklm_pdf", lambda path: False
+    )
+
+    instance = PDFIngestPipeline(output_dir=str(tmp_path / "slides"), workers=2, pages_per_task=3)
+    instance._executor = ThreadPoolExecutor(max_workers=2)
+    yield instance, str(pdf_path)
+    instance.shutdown()
+
+
+async def test_run_reports_every_page_and_returns_in_order(pipeline):
+    instance, pdf_path = pipeline
+    progress = []
+
+    pages = await instance.run(
+        pdf_path,
+        total_pages=7,
+        on_page=lambda page, done, total: progress.append((done, total)),
+    )
+
+    assert [page.page_number for page in pages] == list(range(1, 8))
+    assert pages[0].ocr_text == "page 1"
+    assert progress == [(done, 7) for done in range(1, 8)]
+
+
+async def test_run_awaits_async_progress_callback(pipeline):
+    """코루틴 콜백 (저장소 갱신을 스레드로 넘기는 presentation 인제스트) 도 페이지마다 await"""
+    instance, pdf_path = pipeline
+    progress = []
+
+    async def on_page(page, done, total):
+        progress.append(done)
+
+    await instance.run(pdf_path, total_pages=5, on_page=on_page)
+
+    assert progress == [1, 2, 3, 4, 5]
+
+
+async def test_run_wraps_worker_failure(pipeline, monkeypatch):
+    instance, pdf_path = pipeline
+
+    def broken(*args):
+        raise RuntimeError("pdftoppm crashed")
+
+    monkeypatch.setattr(pdf_ingest_pipeline, "process_page_range", broken)
+
+    with pytest.raises(PDFIngestError, match="pdftoppm crashed"):
+        await instance.run(pdf_path, total_pages=4)
+
+
+async def test_missing_pdf(tmp_path):
+    instance = PDFIngestPipeline(output_dir=str(tmp_path))
+
+    with pytest.raises(PDFIngestError):
+        await instance.run(str(tmp_path / "missing.pdf"), total_pages=1)
@@ -0,0 +1,93 @@
+"""
+Presentation Store 테스트 (lazy slides, 낙관적 동시성, 목록, 만료)
+"""
+import time
+
+import pytest
+
+from app.services.presentation_store import PresentationConflictError, PresentationStore
+
+
+def _record(presentation_id: str, created_at: str, **overrides) -> dict:
+    record = {
+        "presentation_id": presentation_id,
+        "project_id": "proj_1",
+        "pdf_path": None,
+        "total_slides": 2,
+        "slides_data": [],
+        "status": "ingesting",
+        "created_at": created_at,
+        "metadata": {"ingest": {"total_pages": 2, "processed_pages": 0, "error": None}},
+    }
+    record.update(overrides)
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PresentationStore(str(tmp_path / "presentations.sqlite3"), upload_ttl_seconds=60)
+
+
+def test_header_read_skips_slides_and_metadata_merges(store):
+    store.create(_record("pres_a", "2026-01-01T00:00:00"))
+    slides = [{"slide_number": 1, "image_path": "/tmp/a_001.png", "ocr_text": "안녕"}]
+
+    store.update("pres_a", {"metadata": {"ingest": {"total_pages": 2, "processed_pages": 1}}})
+    updated = store.update("pres_a", {"slides_data": slides, "status": "uploaded"})
+
+    assert updated["version"] == 3
+    header = store.get("pres_a", include_slides=False)
+    assert "slides_data" not in header
+    assert header["thumbnail_url"] == "/tmp/a_001.png"
+    assert header["metadata"]["ingest"]["processed_pages"] == 1
+    assert store.get("pres_a")["slides_data"] == slides
+    assert store.get_slides("pres_a") == slides
+
+
+def test_stale_version_and_unexpected_status_conflict(store):
+    store.create(_record("pres_a", "2026-01-01T00:00:00", status="uploaded"))
+    read = store.get("pres_a")
+
+    store.update("pres_a", {"status": "script_generated"}, expected_version=read["version"])
+
+    with pytest.raises(PresentationConflictError):
+        store.update("pres_a", {"status": "script_generated"}, expected_version=read["version"])
+    with pytest.raises(PresentationConflictError):
+        store.update("pres_a", {"status": "uploaded"}, expected_status=["ingesting"])
+    with pytest.raises(KeyError):
+        store.update("missing", {"status": "uploaded"})
+    assert store.get("pres_a")["version"] == 2
+
+
+def test_list_by_project_pages_by_offset_and_keyset(store):
+    for i in range(5):
+        store.create(_record(f"pres_{i}", f"2026-01-0{i + 1}T00:00:00"))
+    store.create(_record("pres_other", "2026-01-09T00:00:00", project_id="proj_2"))
+
+    first = store.list_by_project("proj_1", limit=2)
+    assert [p["presentation_id"] for p in first] == ["pres_4", "pres_3"]
+
+    last = first[-1]
+    after = store.list_by_project("proj_1", limit=2, cursor=(last["created_at"], last["presentation_id"]))
+    assert [p["presentation_id"] for p in after] == ["pres_2", "pres_1"]
+    assert [p["presentation_id"] for p in store.list_by_project("proj_1", limit=2, skip=4)] == ["pres_0"]
+    assert store.count_by_project("proj_1") == 5
+
+
+def test_evict_expired_removes_abandoned_uploads_and_files(store, tmp_path):
+    pdf = tmp_path / "deck.pdf"
+    image = tmp_path / "deck_001.png"
+    pdf.write_bytes(b"%PDF")
+    image.write_bytes(b"png")
+
+    store.create(_record(
+        "pres_old", "2026-01-01T00:00:00", status="uploaded", pdf_path=str(pdf),
+        slides_data=[{"slide_number": 1, "image_path": str(image)}],
+    ))
+    store.create(_record("pres_done", "2026-01-02T00:00:00", status="uploaded"))
+    store.update("pres_done", {"status": "script_generated"})
+
+    assert store.evict_expired(now=time.time() + 120) == 1
+    assert store.get("pres_old") is None
+    assert store.get("pres_done") is not None
+    assert not pdf.exists() and not image.exists()
@@ -0,0 +1,82 @@
+"""
+RemotionService 멀티포맷 업로드 테스트 (포맷별 트랜스코딩 결과를 CloudinaryService.upload_video 로 await 업로드)
+"""
+import asyncio
+from typing import Optional
+
+import pytest
+
+from app.services import remotion_service
+from app.services.remotion_service import RemotionService
+
+
+class StubCloudinary:
+    """CloudinaryService.upload_video 와 같은 시그니처의 async 스텁"""
+
+    def __init__(self):
+        self.uploads = []
+
+    async def upload_video(
+        self,
+        video_path: str,
+        public_id: Optional[str] = None,
+        folder: str = "videos",
+        user_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        eager_transformations=None,
+    ):
+        self.uploads.append((video_path, public_id, folder))
+        return {"public_id": public_id, "secure_url": f"https://cdn.test/{folder}/{public_id}.mp4"}
+
+
+class StubTranscoder:
+    def __init__(self, failed=()):
+        self.failed = set(failed)
+
+    def transcode(self, master_path, targets, output_dir):
+        return {name: None if name in self.failed else f"{output_dir}/{name}.mp4" for name in targets}
+
+
+def _service(tmp_path, monkeypatch, transcoder):
+    service = RemotionService.__new__(RemotionService)
+    service.cloudinary = StubCloudinary()
+    service.output_dir = tmp_path
+    service.progress = []
+
+    async def send_progress(content_id, status, progress, message):
+        service.progress.append(status)
+
+    service._send_progress = send_progress
+    monkeypatch.setattr(remotion_service, "get_format_transcoder", lambda: transcoder)
+    master = tmp_path / "master.mp4"
+    master.write_bytes(b"master")
+    return service, str(master)
+
+
+TARGETS = {"YouTube": (1920, 1080), "TikTok": (1080, 1920)}
+
+
+def test_transcoded_formats_are_uploaded(tmp_path, monkeypatch):
+    service, master = _service(tmp_path, monkeypatch, StubTranscoder())
+
+    result = asyncio.run(service._transcode_and_upload(7, master, TARGETS, 42.0))
+
+    assert [(public_id, folder) for _, public_id, folder in service.cloudinary.uploads] == [
+        ("video_7_youtube", "omnivibe/content_7"),
+        ("video_7_tiktok", "omnivibe/content_7"),
+    ]
+    assert result["cloudinary_url"] == "https://cdn.test/omnivibe/content_7/video_7_youtube.mp4"
+    assert result["outputs"]["TikTok"]["resolution"] == "1080x1920"
+    assert service.progress[-1] == "completed"
+
+
+def test_failed_transcode_is_skipped_and_all_failed_raises(tmp_path, monkeypatch):
+    service, master = _service(tmp_path, monkeypatch, StubTranscoder(failed={"YouTube"}))
+    result = asyncio.run(service._transcode_and_upload(7, master, TARGETS, 42.0))
+
+    assert len(service.cloudinary.uploads) == 1
+    assert result["platform"] == "TikTok" and result["outputs"]["YouTube"] == {"status": "failed"}
+
+    service, master = _service(tmp_path, monkeypatch, StubTranscoder(failed=set(TARGETS)))
+    with pytest.raises(RuntimeError):
+        asyncio.run(service._transcode_and_upload(7, master, TARGETS, 42.0))
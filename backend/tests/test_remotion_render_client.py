@@ -0,0 +1,81 @@
+"""
+Remotion Render Client 테스트 (NDJSON 프로토콜, 프레임 진행률, 서버 미기동 fallback)
+"""
+import asyncio
+import json
+
+import pytest
+
+from app.services.remotion_render_client import (
+    RemotionRenderClient,
+    RemotionRenderError,
+    RemotionRenderUnavailable,
+    RenderProgress,
+)
+
+
+def _serve(socket_path, replies):
+    """요청 한 줄을 받으면 준비된 응답들을 돌려주는 가짜 렌더 서버"""
+    received = []
+
+    async def handle(reader, writer):
+        received.append(json.loads(await reader.readline()))
+        for reply in replies(received[-1]):
+            writer.write((json.dumps(reply) + "\n").encode())
+            await writer.drain()
+        writer.close()
+
+    return received, asyncio.start_unix_server(handle, path=socket_path)
+
+
+def test_render_streams_real_frame_progress(tmp_path):
+    socket_path = str(tmp_path / "render.sock")
+    received, start_server = _serve(socket_path, lambda job: [
+        {"type": "progress", "renderedFrames": 300, "encodedFrames": 0, "totalFrames": 900},
+        {"type": "progress", "renderedFrames": 900, "encodedFrames": 900, "totalFrames": 900},
+        {"type": "done", "outputPath": job["outputPath"], "totalFrames": 900, "elapsedMs": 1200},
+    ])
+    updates = []
+
+    async def scenario():
+        server = await start_server
+        async with server:
+            client = RemotionRenderClient(socket_path)
+            return await client.render(
+                "youtube", "/tmp/out.mp4", {"blocks": []},
+                on_progress=updates.append, scale=1.5, crf=None,
+            )
+
+    result = asyncio.run(scenario())
+
+    assert result == {"output_path": "/tmp/out.mp4", "total_frames": 900, "elapsed_ms": 1200}
+    job = received[-1]
+    assert job["type"] == "render" and job["compositionId"] == "youtube"
+    assert job["scale"] == 1.5 and "crf" not in job
+    assert [u.fraction for u in updates] == [pytest.approx(0.3), 1.0]
+
+
+def test_render_error_and_unavailable(tmp_path):
+    socket_path = str(tmp_path / "render.sock")
+    _, start_server = _serve(socket_path, lambda job: [{"type": "error", "message": "boom"}])
+
+    async def scenario():
+        server = await start_server
+        async with server:
+            await RemotionRenderClient(socket_path).render("youtube", "/tmp/out.mp4", {})
+
+    with pytest.raises(RemotionRenderError, match="boom"):
+        asyncio.run(scenario())
+
+    missing = RemotionRenderClient(str(tmp_path / "missing.sock"))
+    assert asyncio.run(missing.ping()) is None
+    with pytest.raises(RemotionRenderUnavailable):
+        asyncio.run(missing.render("youtube", "/tmp/out.mp4", {}))
+
+
+def test_progress_eta_from_frame_rate():
+    progress = RenderProgress(rendered_frames=300, encoded_frames=200, total_frames=900, elapsed_seconds=10.0)
+
+    assert progress.fraction == pytest.approx(0.9 * 300 / 900 + 0.1 * 200 / 900, abs=1e-4)
+    assert progress.frames_per_second == 30.0
+    assert progress.as_metadata()["eta_seconds"] == 20.0
@@ -0,0 +1,163 @@
+"""RenderArtifactCache 단위 테스트 — ffmpeg 없이 파일 producer 로 단계 재사용 검증."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.render_artifact_cache import RenderArtifactCache, RenderCacheReport
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 헬퍼
+# ─────────────────────────────────────────────────────────────────────────────
+
+class FileProducer:
+    """입력 파일들을 이어붙여 output 에 쓰는 가짜 렌더 단계."""
+
+    def __init__(self, inputs, output):
+        self.inputs = inputs
+        self.output = output
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        data = b"".join(Path(p).read_bytes() for p in self.inputs)
+        Path(self.output).write_bytes(data)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> RenderArtifactCache:
+    return RenderArtifactCache(root_dir=str(tmp_path / "store"), max_bytes=10_000)
+
+
+def _write(tmp_path: Path, name: str, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_second_run_is_hit_and_output_restored(cache, tmp_path):
+    clip = _write(tmp_path, "clip.mp4", b"video")
+    out1 = str(tmp_path / "out1.mp4")
+    out2 = str(tmp_path / "out2.mp4")
+
+    producer = FileProducer([clip], out1)
+    assert cache.run_stage("audio_mix", out1, producer, [clip], {"bgm_volume": 0.2}) is False
+
+    producer2 = FileProducer([clip], out2)
+    report = RenderCacheReport()
+    assert cache.run_stage("audio_mix", out2, producer2, [clip], {"bgm_volume": 0.2}, report) is True
+
+    assert producer2.calls == 0
+    assert Path(out2).read_bytes() == b"video"
+    assert report.to_dict()["stages"]["audio_mix"]["hits"] == 1
+
+
+def test_report_resumes_from_serializable_summary():
+    """LangGraph state 에는 to_dict() 요약만 두고 노드마다 from_dict 로 이어서 기록"""
+    first = RenderCacheReport()
+    first.record("veo_clip", hit=True, elapsed=0.1, saved=30.0)
+    summary = json.loads(json.dumps(first.to_dict()))
+
+    second = RenderCacheReport.from_dict(summary)
+    second.record("veo_clip", hit=False, elapsed=2.0)
+    second.record("lipsync", hit=True, elapsed=0.2, saved=12.0)
+
+    merged = second.to_dict()
+    assert merged["stages"]["veo_clip"] == {
+        "hits": 1, "misses": 1, "elapsed_seconds": 2.1, "saved_seconds": 30.0,
+    }
+    assert (merged["hits"], merged["misses"], merged["saved_seconds"]) == (2, 1, 42.0)
+    assert first.to_dict()["stages"]["veo_clip"]["misses"] == 0
+    assert RenderCacheReport.from_dict(None).to_dict()["hits"] == 0
+
+
+def test_param_change_is_miss(cache, tmp_path):
+    clip = _write(tmp_path, "clip.mp4", b"video")
+    out = str(tmp_path / "out.mp4")
+
+    cache.run_stage("audio_mix", out, FileProducer([clip], out), [clip], {"bgm_volume": 0.2})
+    producer = FileProducer([clip], out)
+    cache.run_stage("audio_mix", out, producer, [clip], {"bgm_volume": 0.5})
+
+    assert producer.calls == 1
+
+
+def test_content_addressed_across_paths(cache, tmp_path):
+    a = _write(tmp_path, "a.mp4", b"same")
+    b = _write(tmp_path, "b.mp4", b"same")
+
+    assert cache.compute_key("slide_clip", [a]) == cache.compute_key("slide_clip", [b])
+
+    Path(b).write_bytes(b"changed")
+    assert cache.compute_key("slide_clip", [a]) != cache.compute_key("slide_clip", [b])
+
+
+def test_only_downstream_stages_recompute(cache, tmp_path):
+    """자막만 바뀌면 병합/오디오 단계는 hit, 자막 burn 만 miss."""
+    clips = [_write(tmp_path, f"c{i}.mp4", f"clip{i}".encode()) for i in range(3)]
+    srt_v1 = _write(tmp_path, "v1.srt", b"1\nhello")
+    srt_v2 = _write(tmp_path, "v2.srt", b"1\nworld")
+
+    def render(srt, tag):
+        report = RenderCacheReport()
+        merged = str(tmp_path / f"merged_{tag}.mp4")
+        mixed = str(tmp_path / f"mixed_{tag}.mp4")
+        final = str(tmp_path / f"final_{tag}.mp4")
+        cache.run_stage("merge_clips", merged, FileProducer(clips, merged), clips, {}, report)
+        cache.run_stage("audio_mix", mixed, FileProducer([merged], mixed), [merged], {}, report)
+        cache.run_stage("subtitle_burn", final, FileProducer([mixed, srt], final), [mixed, srt], {}, report)
+        return report.to_dict()["stages"]
+
+    render(srt_v1, "a")
+    stages = render(srt_v2, "b")
+
+    assert stages["merge_clips"]["hits"] == 1
+    assert stages["audio_mix"]["hits"] == 1
+    assert stages["subtitle_burn"]["misses"] == 1
+
+
+def test_eviction_keeps_store_under_budget(tmp_path):
+    cache = RenderArtifactCache(root_dir=str(tmp_path / "store"), max_bytes=2500)
+
+    for i in range(5):
+        src = _write(tmp_path, f"in{i}.bin", bytes([i]) * 1000)
+        out = str(tmp_path / f"out{i}.bin")
+        cache.run_stage("slide_clip", out, FileProducer([src], out), [src])
+
+    stored = [
+        p for p in (tmp_path / "store").rglob("*")
+        if p.is_file() and not p.name.endswith(".meta.json")
+    ]
+    assert sum(p.stat().st_size for p in stored) <= 2500
+
+
+def test_disabled_cache_always_runs_producer(tmp_path):
+    cache = RenderArtifactCache(root_dir=str(tmp_path / "store"), enabled=False)
+    src = _write(tmp_path, "in.bin", b"x")
+    out = str(tmp_path / "out.bin")
+
+    for _ in range(2):
+        producer = FileProducer([src], out)
+        cache.run_stage("slide_clip", out, producer, [src])
+        assert producer.calls == 1
+
+
+async def test_async_stage(cache, tmp_path):
+    src = _write(tmp_path, "in.bin", b"x")
+    out = str(tmp_path / "out.bin")
+    calls = []
+
+    async def producer():
+        calls.append(1)
+        Path(out).write_bytes(b"y")
+
+    assert await cache.arun_stage("concat", out, producer, [src]) is False
+    assert await cache.arun_stage("concat", out, producer, [src]) is True
+    assert len(calls) == 1
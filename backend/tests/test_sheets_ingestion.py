@@ -0,0 +1,117 @@
+"""
+SheetsIngestion 테스트 (batchGet, 리비전 캐시, 내용 해시 fallback, 변경 행만 방출)
+"""
+import asyncio
+import threading
+
+from app.services.sheets_ingestion import SheetsIngestion
+
+
+class FakeRequest:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+
+class FakeSheets:
+    """spreadsheets().values().batchGet(...) 만 흉내 내는 Sheets 리소스"""
+
+    def __init__(self, tabs):
+        self.tabs = tabs
+        self.batch_calls = []
+        self.threads = set()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def batchGet(self, spreadsheetId, ranges, majorDimension):
+        def run():
+            self.batch_calls.append(list(ranges))
+            self.threads.add(threading.get_ident())
+            return {"valueRanges": [
+                {"range": f"'{r.split('!')[0]}'!A1:Z1000", "values": self.tabs.get(r.split("!")[0], [])}
+                for r in ranges
+            ]}
+        return FakeRequest(run)
+
+
+class FakeDrive:
+    def __init__(self, version=1):
+        self.version = version
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields, supportsAllDrives):
+        return FakeRequest(lambda: {"version": str(self.version)})
+
+
+SCHEDULE = [
+    ["캠페인명", "소제목", "플랫폼", "상태"],
+    ["봄 캠페인", "소개편", "YouTube", "대기"],
+    ["봄 캠페인", "후기편", "TikTok", "대기"],
+]
+
+
+def test_batch_get_off_loop_and_revision_cache():
+    sheets = FakeSheets({"전략": [["캠페인명", "봄 캠페인"]], "스케줄": SCHEDULE})
+    drive = FakeDrive(version=7)
+    ingestion = SheetsIngestion(sheets, drive=drive)
+
+    async def scenario():
+        first = await ingestion.fetch_ranges("sheet1", ["전략!A:Z", "스케줄!A:Z"])
+        again = await ingestion.fetch_ranges("sheet1", ["스케줄!A:Z", "전략!A:Z"])
+        drive.version = 8
+        await ingestion.fetch_range("sheet1", "스케줄!A:Z")
+        return first, again
+
+    first, again = asyncio.run(scenario())
+
+    assert first["스케줄!A:Z"] == SCHEDULE and again == first
+    assert sheets.batch_calls == [["전략!A:Z", "스케줄!A:Z"], ["스케줄!A:Z"]]
+    assert threading.get_ident() not in sheets.threads  # 이벤트 루프 스레드에서 실행되지 않음
+    assert ingestion.get_stats()["revision_hits"] == 1
+
+
+def test_changed_rows_emits_only_changes(tmp_path):
+    tabs = {"스케줄": [row[:] for row in SCHEDULE]}
+    ingestion = SheetsIngestion(FakeSheets(tabs), cache_dir=str(tmp_path))
+    keys = ["캠페인명", "소제목"]
+
+    first = asyncio.run(ingestion.changed_rows("sheet1", "스케줄!A:Z", keys))
+    assert [r["소제목"] for r in first.changed] == ["소개편", "후기편"]
+
+    unchanged = asyncio.run(ingestion.changed_rows("sheet1", "스케줄!A:Z", keys))
+    assert not unchanged.has_changes and unchanged.total_rows == 2
+
+    # 중간 삽입 + 기존 행 수정 + 삭제: 키 기준이라 밀린 행은 변경으로 잡히지 않음
+    tabs["스케줄"] = [
+        SCHEDULE[0],
+        ["봄 캠페인", "예고편", "YouTube", "대기"],
+        ["봄 캠페인", "소개편", "YouTube", "완료"],
+    ]
+    # 새 인스턴스도 디스크 상태로 이어서 비교
+    restarted = SheetsIngestion(FakeSheets(tabs), cache_dir=str(tmp_path))
+    changes = asyncio.run(restarted.changed_rows("sheet1", "스케줄!A:Z", keys))
+
+    assert [(r["소제목"], r["상태"], r["_row"]) for r in changes.changed] == [
+        ("예고편", "대기", 2),
+        ("소개편", "완료", 3),
+    ]
+    assert changes.removed == ["봄 캠페인|후기편"]
+
+
+def test_unchanged_revision_skips_sheets_call():
+    sheets = FakeSheets({"스케줄": SCHEDULE})
+    ingestion = SheetsIngestion(sheets, drive=FakeDrive(version=3))
+
+    asyncio.run(ingestion.changed_rows("sheet1", "스케줄!A:Z"))
+    changes = asyncio.run(ingestion.changed_rows("sheet1", "스케줄!A:Z"))
+
+    assert len(sheets.batch_calls) == 1
+    assert not changes.has_changes and changes.revision == "3"
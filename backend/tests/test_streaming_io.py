@@ -0,0 +1,70 @@
+"""
+Streaming I/O 테스트 (청크 저장, 해시, 크기 제한)
+"""
+import hashlib
+import io
+
+import pytest
+
+from app.services.streaming_io import (
+    StreamSizeLimitError,
+    save_upload,
+    save_upload_content_addressed,
+    write_chunks_sync,
+)
+
+
+class FakeUpload:
+    """UploadFile 대역: read(size) 호출 크기를 기록"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.read_sizes = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self._buffer.read(size)
+
+
+async def test_save_upload_reads_in_chunks_and_hashes(tmp_path):
+    data = b"x" * 2500
+    upload = FakeUpload(data)
+
+    saved = await save_upload(upload, tmp_path / "out.bin", chunk_size=1000)
+
+    assert (tmp_path / "out.bin").read_bytes() == data
+    assert saved.size == 2500
+    assert saved.digest == hashlib.md5(data).hexdigest()
+    assert set(upload.read_sizes) == {1000}
+    assert not (tmp_path / "out.bin.part").exists()
+
+
+async def test_size_limit_aborts_and_removes_partial(tmp_path):
+    upload = FakeUpload(b"y" * 5000)
+
+    with pytest.raises(StreamSizeLimitError) as exc_info:
+        await save_upload(upload, tmp_path / "big.bin", max_bytes=3000, chunk_size=1000)
+
+    assert exc_info.value.received == 4000
+    assert len(upload.read_sizes) == 4  # 초과 시점에서 읽기 중단
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_content_addressed_name(tmp_path):
+    data = b"%PDF-1.4 sample"
+
+    saved = await save_upload_content_addressed(FakeUpload(data), tmp_path, "user_1_{hash}.pdf")
+
+    expected = tmp_path / f"user_1_{hashlib.md5(data).hexdigest()[:8]}.pdf"
+    assert saved.path == str(expected)
+    assert expected.read_bytes() == data
+    assert [p.name for p in tmp_path.iterdir()] == [expected.name]
+
+
+def test_write_chunks_sync_sha256(tmp_path):
+    chunks = [b"abc", b"def"]
+
+    saved = write_chunks_sync(iter(chunks), tmp_path / "nested" / "f.bin", hash_name="sha256")
+
+    assert saved.digest == hashlib.sha256(b"abcdef").hexdigest()
+    assert (tmp_path / "nested" / "f.bin").read_bytes() == b"abcdef"
@@ -0,0 +1,121 @@
+"""
+Subtitle Localization 테스트 (언어별 병렬 번역, 동시성 제한, 세그먼트 해시 캐시, SRT/VTT)
+"""
+import asyncio
+import sys
+import types
+
+from app.services import subtitle_localization
+from app.services.subtitle_localization import (
+    SubtitleLocalizer,
+    SubtitleTranslationCache,
+    build_srt,
+    build_vtt,
+    segments_digest,
+)
+from app.services.subtitle_service import SubtitleService
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": "안녕하세요"},
+    {"start": 2.5, "end": 3661.042, "text": "반갑습니다"},
+    {"start": 3661.042, "end": 3663.0, "text": "감사합니다"},
+]
+
+
+class FakeTranslator:
+    """호출 횟수와 최대 동시 실행 수를 기록하는 번역기"""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, texts, source_language, target_language):
+        self.calls.append((target_language, len(texts)))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return [f"[{target_language}] {t}" for t in texts], 100, 50
+
+
+def test_translates_languages_concurrently_with_limit(tmp_path):
+    translator = FakeTranslator()
+    localizer = SubtitleLocalizer(translator, concurrency=2, batch_size=2)
+
+    results = asyncio.run(localizer.localize(
+        SEGMENTS, ["ko", "en", "ja", "zh"], source_language="ko",
+        output_dir=str(tmp_path), stem="clip",
+    ))
+
+    # 원본 언어는 번역 없음, 나머지 3개 언어 × 2 배치
+    assert sorted(lang for lang, _ in translator.calls) == ["en", "en", "ja", "ja", "zh", "zh"]
+    assert translator.peak == 2
+    assert results["ko"]["segments"] == SEGMENTS
+    assert results["ja"]["segments"][1] == {"start": 2.5, "end": 3661.042, "text": "[ja] 반갑습니다"}
+    assert results["en"]["cost_usd"] > 0
+    assert (tmp_path / "clip_en.srt").read_text(encoding="utf-8").startswith("1\n00:00:00,000 --> 00:00:02,500")
+    assert (tmp_path / "clip_zh.vtt").exists()
+
+
+def test_cached_language_costs_nothing(tmp_path):
+    translator = FakeTranslator()
+    cache = SubtitleTranslationCache(str(tmp_path / "cache"))
+    localizer = SubtitleLocalizer(translator, cache=cache, model="test-model")
+    out_dir = str(tmp_path / "out")
+
+    first = asyncio.run(localizer.localize(SEGMENTS, ["en"], "ko", out_dir, "clip"))
+    again = asyncio.run(localizer.localize(SEGMENTS, ["en", "ja"], "ko", out_dir, "clip"))
+
+    assert [lang for lang, _ in translator.calls] == ["en", "ja"]
+    assert not first["en"]["cached"]
+    assert again["en"]["cached"] and again["en"]["cost_usd"] == 0.0
+    assert again["en"]["segments"] == first["en"]["segments"]
+
+    # 원본 세그먼트가 바뀌면 해시가 달라져 다시 번역
+    edited = [dict(SEGMENTS[0], text="안녕")] + SEGMENTS[1:]
+    assert segments_digest(edited) != segments_digest(SEGMENTS)
+    asyncio.run(localizer.localize(edited, ["en"], "ko", out_dir, "clip"))
+    assert [lang for lang, _ in translator.calls] == ["en", "ja", "en"]
+
+
+def test_failed_language_does_not_block_others(tmp_path):
+    async def translator(texts, source_language, target_language):
+        if target_language == "ja":
+            raise ValueError("line count mismatch")
+        return list(texts), 0, 0
+
+    results = asyncio.run(SubtitleLocalizer(translator).localize(
+        SEGMENTS, ["en", "ja"], "ko", str(tmp_path), "clip",
+    ))
+
+    assert results["ja"] == {"error": "line count mismatch"}
+    assert results["en"]["srt_path"].endswith("clip_en.srt")
+
+
+def test_srt_and_vtt_formats():
+    srt = build_srt(SEGMENTS)
+    vtt = build_vtt(SEGMENTS)
+
+    assert "2\n00:00:02,500 --> 01:01:01,042\n반갑습니다\n" in srt
+    assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\n안녕하세요\n")
+    assert "01:01:01.042 --> 01:01:03.000" in vtt
+    assert srt == SubtitleService._generate_srt_content(SEGMENTS)  # 포맷터 단일 구현
+
+
+def test_openai_client_is_cached_per_event_loop(monkeypatch):
+    class FakeAsyncOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(AsyncOpenAI=FakeAsyncOpenAI))
+    monkeypatch.setattr(subtitle_localization, "_openai_clients", subtitle_localization.weakref.WeakKeyDictionary())
+
+    async def pair():
+        return subtitle_localization._openai_client(), subtitle_localization._openai_client()
+
+    first_a, first_b = asyncio.run(pair())
+    second_a, _ = asyncio.run(pair())  # Celery 태스크마다 새 루프
+
+    assert first_a is first_b
+    assert second_a is not first_a
@@ -0,0 +1,72 @@
+"""
+TenantSlotLimiter 테스트 (테넌트별 동시 실행 제한, 만료 회수, fail-open)
+"""
+import time
+
+from app.tasks.tenant_slots import TenantSlotLimiter
+
+
+class FakeRedis:
+    """sorted set 명령만 흉내 내는 인메모리 Redis"""
+
+    def __init__(self):
+        self.zsets = {}
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if low <= score <= high]:
+            del zset[member]
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, seconds):
+        pass
+
+    def zrank(self, key, member):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        members = [m for m, _ in ordered]
+        return members.index(member) if member in members else None
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+
+def test_limit_is_per_tenant_and_release_frees_slot():
+    limiter = TenantSlotLimiter(FakeRedis(), limit=2)
+
+    assert limiter.acquire("acme", "t1")
+    assert limiter.acquire("acme", "t2")
+    assert not limiter.acquire("acme", "t3")
+    assert limiter.acquire("globex", "t4")  # 다른 테넌트는 영향 없음
+    assert limiter.active("acme") == 2
+
+    # 재시도로 다시 들어온 보유자는 유지
+    assert limiter.acquire("acme", "t1")
+
+    limiter.release("acme", "t2")
+    assert limiter.acquire("acme", "t3")
+    assert limiter.active("acme") == 2
+
+
+def test_expired_slots_are_reclaimed():
+    redis = FakeRedis()
+    limiter = TenantSlotLimiter(redis, limit=1, ttl_seconds=60)
+    assert limiter.acquire("acme", "crashed")
+
+    redis.zsets[limiter._key("acme")]["crashed"] = time.time() - 1
+    assert limiter.acquire("acme", "next")
+
+
+def test_fail_open_without_redis_or_limit():
+    class BrokenRedis(FakeRedis):
+        def zremrangebyscore(self, *args):
+            raise ConnectionError("down")
+
+    assert TenantSlotLimiter(BrokenRedis(), limit=1).acquire("acme", "t1")
+    assert TenantSlotLimiter(None, limit=1).acquire("acme", "t1")
+    unlimited = TenantSlotLimiter(FakeRedis(), limit=0)
+    assert all(unlimited.acquire("acme", f"t{i}") for i in range(10))
@@ -0,0 +1,91 @@
+"""
+WebSocket Fan-out 테스트 (동시 전송, 진행률 coalesce, drop-oldest, 타임아웃 축출)
+"""
+import asyncio
+import json
+
+from app.services.websocket_fanout import ClientChannel, fan_out
+
+
+class FakeSocket:
+    """send_text 기록 (delay 만큼 지연 — 느린 모바일 클라이언트)"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.received = []
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(json.loads(text))
+
+
+def _progress(task, value):
+    return {"type": "progress", "task_name": task, "progress": value}
+
+
+def test_slow_client_does_not_stall_others_and_is_evicted():
+    async def scenario():
+        fast, slow = FakeSocket(), FakeSocket(delay=10)
+        evicted = []
+        channels = [
+            ClientChannel(fast.send_text, send_timeout=0.05, name="fast"),
+            ClientChannel(slow.send_text, on_evict=lambda ch, reason: evicted.append(ch.name),
+                          send_timeout=0.05, name="slow"),
+        ]
+        for channel in channels:
+            channel.start()
+
+        assert fan_out(channels, {"type": "status", "status": "started"}) == 2
+        await asyncio.sleep(0.01)
+        assert fast.received == [{"type": "status", "status": "started"}]
+
+        await asyncio.sleep(0.1)
+        assert evicted == ["slow"] and channels[1].closed
+        assert fan_out(channels, {"type": "completed"}) == 1
+        await asyncio.sleep(0.01)
+        for channel in channels:
+            channel.close()
+        return fast.received
+
+    received = asyncio.run(scenario())
+    assert received[-1] == {"type": "completed"}
+
+
+def test_progress_is_coalesced_and_dropped_before_final_events():
+    async def scenario():
+        socket = FakeSocket()
+        channel = ClientChannel(socket.send_text, max_queue=3)
+
+        # 송신 태스크 시작 전 적재 — 같은 task 진행률은 최신 값으로 교체
+        for value in (0.1, 0.2, 0.3):
+            fan_out([channel], _progress("audio", value))
+        fan_out([channel], _progress("video", 0.5))
+        fan_out([channel], {"type": "error", "error": "boom"})
+        assert channel.pending == 3 and channel.stats["coalesced"] == 2
+
+        # 가득 찬 상태에서 완료 이벤트 → 가장 오래된 진행률(audio) 폐기
+        fan_out([channel], {"type": "completed"})
+        assert channel.stats["dropped"] == 1
+
+        channel.start()
+        await asyncio.sleep(0.01)
+        channel.close()
+        return socket.received
+
+    received = asyncio.run(scenario())
+    assert received == [
+        _progress("video", 0.5),
+        {"type": "error", "error": "boom"},
+        {"type": "completed"},
+    ]
+
+
+def test_queue_full_of_undroppable_messages_evicts():
+    evicted = []
+    channel = ClientChannel(FakeSocket().send_text, on_evict=lambda ch, reason: evicted.append(reason), max_queue=2)
+
+    assert channel.offer('{"type":"status"}')
+    assert channel.offer('{"type":"status"}')
+    assert not channel.offer('{"type":"completed"}')
+    assert channel.closed and evicted == ["outgoing queue full of undroppable messages"]
@@ -0,0 +1,101 @@
+"""
+YouTubeThumbnailLearner 테스트 (numpy 배치 패턴 분석, 동시 다운로드 + 배치 임베딩)
+
+CLIP / YouTube / OpenAI 클라이언트는 만들지 않고 다운로더·임베더만 스텁으로 교체한다.
+"""
+import asyncio
+import logging
+
+import pytest
+from PIL import Image
+
+from app.services.youtube_thumbnail_learner import YouTubeThumbnailLearner, analyze_patterns_batch
+
+
+def _image(size, colors):
+    """colors: [(rgb, 픽셀 수)] — 앞에서부터 채움 (나머지는 마지막 색)"""
+    image = Image.new("RGB", size, colors[-1][0])
+    pixels = [rgb for rgb, count in colors for _ in range(count)]
+    width = size[0]
+    for i, rgb in enumerate(pixels[: size[0] * size[1]]):
+        image.putpixel((i % width, i // width), rgb)
+    return image
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# analyze_patterns_batch
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_patterns_match_per_image_computation():
+    red, green, blue, white = (255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)
+    images = [
+        _image((4, 4), [(red, 8), (green, 5), (blue, 2), (white, 1)]),
+        _image((4, 4), [(blue, 10), (white, 6)]),
+        Image.new("RGB", (3, 2), (10, 20, 30)),  # 다른 해상도 → 별도 스택
+    ]
+
+    patterns = analyze_patterns_batch(images)
+
+    assert patterns[0]["dominant_colors"] == [red, green, blue]
+    assert patterns[1]["dominant_colors"] == [blue, white]
+    assert patterns[2]["dominant_colors"] == [(10, 20, 30)]
+    assert patterns[2]["resolution"] == "3x2" and patterns[2]["aspect_ratio"] == 1.5
+
+    for image, pattern in zip(images, patterns):
+        expected = sum(image.convert("L").getdata()) / (image.width * image.height)
+        assert pattern["brightness"] == pytest.approx(expected, abs=0.5)
+
+
+def test_patterns_convert_non_rgb_and_handle_empty():
+    assert analyze_patterns_batch([]) == []
+
+    gray = Image.new("L", (2, 2), 128)
+    assert analyze_patterns_batch([gray])[0]["dominant_colors"] == [(128, 128, 128)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _embed_and_analyze
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _learner(failed_urls=()):
+    learner = YouTubeThumbnailLearner.__new__(YouTubeThumbnailLearner)
+    learner.logger = logging.getLogger("test.thumbnail_learner")
+    learner.EMBED_BATCH_SIZE = 2
+    learner.embedded_batches = []
+
+    async def fetch(client, semaphore, url):
+        await asyncio.sleep(0)
+        if url in failed_urls:
+            return None
+        return Image.new("RGB", (2, 2), (int(url.rsplit("/", 1)[-1]), 0, 0))
+
+    def embed(images):
+        learner.embedded_batches.append([image.getpixel((0, 0))[0] for image in images])
+        return [[float(image.getpixel((0, 0))[0])] for image in images]
+
+    learner._fetch_thumbnail = fetch
+    learner._embed_images_sync = embed
+    return learner
+
+
+async def test_embed_and_analyze_runs_one_forward_per_batch():
+    learner = _learner()
+    urls = [f"https://img.test/{i}" for i in range(5)]
+
+    results = await learner._embed_and_analyze(urls)
+
+    assert learner.embedded_batches == [[0, 1], [2, 3], [4]]
+    assert [embedding for embedding, _ in results] == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+    assert results[3][1]["dominant_colors"] == [(3, 0, 0)]
+
+
+async def test_embed_and_analyze_skips_failed_fetches():
+    urls = [f"https://img.test/{i}" for i in range(5)]
+    learner = _learner(failed_urls={urls[1], urls[2], urls[3]})
+
+    results = await learner._embed_and_analyze(urls)
+
+    # 배치 [0, 1] 은 성공분만, [2, 3] 은 전부 실패라 forward 없음
+    assert learner.embedded_batches == [[0], [4]]
+    assert results[1] is None and results[2] is None and results[3] is None
+    assert results[0][0] == [0.0] and results[4][0] == [4.0]
@@ -3,7 +3,7 @@ Unit 테스트: Audio Correction Loop (Zero-Fault)
 """
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from app.services.audio_correction_loop import AudioCorrectionLoop
+from app.services.audio_correction_loop import AudioCorrectionLoop, split_sentences
 
 
 class TestAudioCorrectionLoop:
@@ -40,6 +40,107 @@ class TestAudioCorrectionLoop:
         assert similarity < 0.50
 
 
+class TestSentenceMode:
+    """문장 단위 모드 — 실패 문장만 재생성"""
+
+    def setup_method(self):
+        self.loop = AudioCorrectionLoop(
+            accuracy_threshold=0.95,
+            max_attempts=3,
+            enable_normalization=False,
+            enable_learning=False
+        )
+
+    def test_split_sentences(self):
+        text = "첫 번째 문장입니다. 두 번째 문장이에요!\n세 번째는 질문인가요? 네."
+        assert split_sentences(text) == [
+            "첫 번째 문장입니다.",
+            "두 번째 문장이에요!",
+            "세 번째는 질문인가요? 네.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_only_failing_sentence_is_regenerated(self):
+        sentences = ["첫 번째 문장입니다.", "두 번째 문장이에요.", "세 번째 문장입니다."]
+        tts_calls = []
+        # 두 번째 문장만 1차 시도에서 오인식
+        transcripts = {
+            "첫 번째 문장입니다.": ["첫 번째 문장입니다"],
+            "두 번째 문장이에요.": ["두 번째 문자이에요", "두 번째 문장이에요"],
+            "세 번째 문장입니다.": ["세 번째 문장입니다"],
+        }
+
+        async def fake_tts(text, voice_id=None, **kwargs):
+            tts_calls.append(text)
+            return text.encode()
+
+        async def fake_stt(audio_bytes, language="ko"):
+            return transcripts[audio_bytes.decode()].pop(0)
+
+        self.loop.tts = MagicMock()
+        self.loop.tts.generate_audio = AsyncMock(side_effect=fake_tts)
+        self.loop.stt = MagicMock()
+        self.loop.stt.transcribe = AsyncMock(side_effect=fake_stt)
+        self.loop._stitch_sentences = MagicMock(return_value=(b"joined", [{"end": 3.0}], []))
+
+        with patch("app.services.audio_correction_loop.PYDUB_AVAILABLE", True):
+            result = await self.loop.generate_verified_audio(
+                text=" ".join(sentences),
+                save_file=False,
+                sentence_mode=True
+            )
+
+        assert result["status"] == "success"
+        assert result["mode"] == "sentence"
+        assert result["tts_calls"] == 4
+        assert tts_calls.count("두 번째 문장이에요.") == 2
+        assert [s["attempts"] for s in result["sentences"]] == [1, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_word_timestamps_are_measured_on_stitched_audio(self):
+        sentence_timestamps = [
+            {"index": 0, "text": "첫 문장.", "start": 0.0, "end": 1.2},
+            {"index": 1, "text": "둘째 문장.", "start": 1.17, "end": 2.5},
+        ]
+        self.loop.stt = MagicMock()
+        self.loop.stt.transcribe_with_timestamps = AsyncMock(return_value={
+            "text": "첫 문장 둘째 문장",
+            "words": [
+                {"word": " 첫", "start": 0.0, "end": 0.4},
+                {"word": " 문장", "start": 0.45, "end": 1.1},
+                {"word": " 둘째", "start": 1.15, "end": 1.7},
+                {"word": " 문장", "start": 1.75, "end": 2.4},
+            ],
+        })
+
+        words = await self.loop._measure_word_timestamps(b"joined", "ko", sentence_timestamps)
+
+        self.loop.stt.transcribe_with_timestamps.assert_awaited_once_with(
+            audio_bytes=b"joined", language="ko", word_timestamps=True
+        )
+        assert [w["word"] for w in words] == ["첫", "문장", "둘째", "문장"]
+        assert [w["sentence_index"] for w in words] == [0, 0, 1, 1]
+        assert words[2]["start"] == 1.15
+
+    @pytest.mark.asyncio
+    async def test_word_timestamps_fall_back_to_estimates(self):
+        self.loop.tts = MagicMock()
+        self.loop.tts.generate_audio = AsyncMock(side_effect=lambda text, voice_id=None, **kw: text.encode())
+        self.loop.stt = MagicMock()
+        self.loop.stt.transcribe = AsyncMock(side_effect=lambda audio_bytes, language="ko": audio_bytes.decode())
+        self.loop.stt.transcribe_with_timestamps = AsyncMock(side_effect=RuntimeError("whisper down"))
+        estimated = [{"word": "첫", "start": 0.0, "end": 0.5, "sentence_index": 0}]
+        self.loop._stitch_sentences = MagicMock(return_value=(b"joined", [{"index": 0, "end": 3.0}], estimated))
+
+        with patch("app.services.audio_correction_loop.PYDUB_AVAILABLE", True):
+            result = await self.loop.generate_verified_audio(
+                text="첫 번째 문장입니다. 두 번째 문장이에요.",
+                save_file=False,
+                sentence_mode=True
+            )
+
+        assert result["word_timestamps"] == estimated
+        assert result["word_timestamps_source"] == "estimated"
 
 
 if __name__ == "__main__":
@@ -46,6 +46,7 @@ import SlidePlayer from "@/components/SlidePlayer";
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
 const STATUS_LABELS: Record<PresentationStatus, string> = {
+  [PresentationStatus.INGESTING]: "슬라이드 변환 중",
   [PresentationStatus.UPLOADED]: "업로드 완료",
   [PresentationStatus.SCRIPT_GENERATED]: "스크립트 생성 완료",
   [PresentationStatus.AUDIO_GENERATED]: "오디오 생성 완료",
@@ -173,6 +174,11 @@ export default function PresentationMode({
       setPresentationId(response.data.presentation_id);
       setPresentation(response.data);
       setSelectedSlideIndex(0);
+
+      // 슬라이드 변환은 백그라운드 — 완료될 때까지 상태 폴링
+      if (response.data.status === PresentationStatus.INGESTING) {
+        pollIngestStatus(response.data.presentation_id);
+      }
     } catch (err: any) {
       setError(err.response?.data?.detail || "파일 업로드에 실패했습니다.");
       console.error("Upload error:", err);
@@ -284,6 +290,26 @@ export default function PresentationMode({
     }
   };
 
+  const pollIngestStatus = (id: string) => {
+    const interval = setInterval(async () => {
+      try {
+        const response = await axios.get(`${API_BASE_URL}/api/v1/presentations/${id}`);
+        const data: Presentation = response.data;
+
+        if (data.status !== PresentationStatus.INGESTING) {
+          clearInterval(interval);
+          setPresentation(data);
+          if (data.status === PresentationStatus.FAILED) {
+            setError("슬라이드 변환에 실패했습니다.");
+          }
+        }
+      } catch (err) {
+        console.error("Poll ingest status error:", err);
+        clearInterval(interval);
+      }
+    }, 2000);
+  };
+
   const pollVideoStatus = async (id: string) => {
     const interval = setInterval(async () => {
       try {
@@ -15,6 +15,7 @@ export enum TransitionEffect {
 }
 
 export enum PresentationStatus {
+  INGESTING = "ingesting",
   UPLOADED = "uploaded",
   SCRIPT_GENERATED = "script_generated",
   AUDIO_GENERATED = "audio_generated",
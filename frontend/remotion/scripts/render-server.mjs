@@ -0,0 +1,188 @@
+#!/usr/bin/env node
+// 상주 Remotion 렌더 서버
+// 작업 디렉터리: frontend/
+// 사용법: node remotion/scripts/render-server.mjs  (npm run render-server)
+//
+// - 시작 시 한 번만 번들링 (remotion/index.ts), 브라우저 풀을 미리 띄워 둔다
+// - 로컬 유닉스 소켓으로 렌더 작업을 받는다 (NDJSON, 연결 1개 = 작업 1개)
+// - 실제 렌더/인코딩 프레임 수를 progress 이벤트로 스트리밍한다
+//
+// 프로토콜 (한 줄 = JSON 1개):
+//   → {"type":"ping"}
+//   ← {"type":"pong","serveUrl":...,"browsers":2,"idle":1,"queued":0}
+//   → {"type":"render","compositionId":"youtube","outputPath":"/tmp/a.mp4","inputProps":{...},
+//      "width":1920,"height":1080,"fps":30,"scale":1,"crf":18,"concurrency":4}
+//   ← {"type":"progress","renderedFrames":120,"encodedFrames":110,"totalFrames":900,"progress":0.13}
+//   ← {"type":"done","outputPath":"/tmp/a.mp4","totalFrames":900,"elapsedMs":41200}
+//   ← {"type":"error","message":"..."}
+//   → {"type":"rebundle"}  (소스 변경 후 재번들)
+
+import fs from 'node:fs';
+import net from 'node:net';
+import path from 'node:path';
+import { bundle } from '@remotion/bundler';
+import { openBrowser, renderMedia, selectComposition } from '@remotion/renderer';
+
+const SOCKET_PATH = process.env.REMOTION_RENDER_SOCKET || '/tmp/omnivibe-remotion.sock';
+const POOL_SIZE = Number(process.env.REMOTION_BROWSER_POOL || 2);
+const PROGRESS_INTERVAL_MS = 250;
+const ENTRY_POINT = path.resolve('remotion/index.ts');
+
+let serveUrl = null;
+const idleBrowsers = [];
+const waiters = [];
+let browserCount = 0;
+
+const log = (...args) => console.log(`[render-server ${new Date().toISOString()}]`, ...args);
+
+async function rebundle() {
+  const started = Date.now();
+  serveUrl = await bundle({ entryPoint: ENTRY_POINT });
+  log(`bundled in ${Date.now() - started}ms → ${serveUrl}`);
+}
+
+// ── 브라우저 풀 ─────────────────────────────────────────────────────────────
+
+async function launchBrowser() {
+  const browser = await openBrowser('chrome');
+  browserCount += 1;
+  return browser;
+}
+
+async function acquireBrowser() {
+  const browser = idleBrowsers.pop();
+  if (browser) return browser;
+  return new Promise((resolve) => waiters.push(resolve));
+}
+
+async function releaseBrowser(browser, broken) {
+  let next = browser;
+  if (broken) {
+    // 렌더 중 크래시한 브라우저는 교체
+    browserCount -= 1;
+    await browser.close({ silent: true }).catch(() => {});
+    next = await launchBrowser();
+  }
+  const waiter = waiters.shift();
+  if (waiter) waiter(next);
+  else idleBrowsers.push(next);
+}
+
+// ── 작업 처리 ───────────────────────────────────────────────────────────────
+
+async function render(job, send) {
+  const started = Date.now();
+  const browser = await acquireBrowser();
+  let broken = false;
+  try {
+    const composition = await selectComposition({
+      serveUrl,
+      id: job.compositionId,
+      inputProps: job.inputProps || {},
+      puppeteerInstance: browser,
+    });
+    const totalFrames = composition.durationInFrames;
+
+    let lastSent = 0;
+    await renderMedia({
+      serveUrl,
+      composition: {
+        ...composition,
+        width: job.width || composition.width,
+        height: job.height || composition.height,
+        fps: job.fps || composition.fps,
+      },
+      inputProps: job.inputProps || {},
+      codec: job.codec || 'h264',
+      crf: job.crf ?? null,
+      scale: job.scale || 1,
+      imageFormat: 'jpeg',
+      concurrency: job.concurrency || null,
+      outputLocation: job.outputPath,
+      overwrite: true,
+      puppeteerInstance: browser,
+      onProgress: ({ renderedFrames, encodedFrames, progress, stitchStage }) => {
+        const now = Date.now();
+        if (now - lastSent < PROGRESS_INTERVAL_MS && progress < 1) return;
+        lastSent = now;
+        send({ type: 'progress', renderedFrames, encodedFrames, totalFrames, progress, stage: stitchStage });
+      },
+    });
+
+    send({ type: 'done', outputPath: job.outputPath, totalFrames, elapsedMs: Date.now() - started });
+    log(`rendered ${job.compositionId} (${totalFrames} frames) in ${Date.now() - started}ms`);
+  } catch (err) {
+    broken = /Target closed|Session closed|browser has disconnected/i.test(String(err));
+    send({ type: 'error', message: String(err && err.stack ? err.stack : err) });
+    log(`render failed: ${err}`);
+  } finally {
+    await releaseBrowser(browser, broken);
+  }
+}
+
+function handleConnection(socket) {
+  let buffer = '';
+  const send = (message) => {
+    if (!socket.destroyed) socket.write(`${JSON.stringify(message)}\n`);
+  };
+
+  socket.setEncoding('utf8');
+  socket.on('data', async (chunk) => {
+    buffer += chunk;
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (!line) continue;
+
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (err) {
+        send({ type: 'error', message: `invalid JSON: ${err}` });
+        continue;
+      }
+
+      if (message.type === 'ping') {
+        send({ type: 'pong', serveUrl, browsers: browserCount, idle: idleBrowsers.length, queued: waiters.length });
+      } else if (message.type === 'rebundle') {
+        await rebundle();
+        send({ type: 'done', serveUrl });
+      } else if (message.type === 'render') {
+        await render(message, send);
+        socket.end();
+      } else {
+        send({ type: 'error', message: `unknown message type: ${message.type}` });
+      }
+    }
+  });
+  socket.on('error', (err) => log(`socket error: ${err.message}`));
+}
+
+// ── 시작 ────────────────────────────────────────────────────────────────────
+
+async function main() {
+  await rebundle();
+  for (let i = 0; i < POOL_SIZE; i += 1) {
+    idleBrowsers.push(await launchBrowser());
+  }
+
+  if (fs.existsSync(SOCKET_PATH)) fs.unlinkSync(SOCKET_PATH);
+  const server = net.createServer(handleConnection);
+  server.listen(SOCKET_PATH, () => log(`listening on ${SOCKET_PATH} (browsers=${POOL_SIZE})`));
+
+  const shutdown = async () => {
+    server.close();
+    await Promise.all(idleBrowsers.map((b) => b.close({ silent: true }).catch(() => {})));
+    if (fs.existsSync(SOCKET_PATH)) fs.unlinkSync(SOCKET_PATH);
+    process.exit(0);
+  };
+  process.on('SIGINT', shutdown);
+  process.on('SIGTERM', shutdown);
+  process.on('SIGHUP', () => rebundle().catch((err) => log(`rebundle failed: ${err}`)));
+}
+
+main().catch((err) => {
+  log(`fatal: ${err && err.stack ? err.stack : err}`);
+  process.exit(1);
+});